@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""Line stream stages to post-process generated source files.
+
+A stage transforms a stream of lines into another stream of lines. Stages
+are composed into a pipeline where every line passes through all stages in
+a single traversal. Stages that operate on a block of lines, such as
+the variable declarations of a function, only buffer the lines of that
+block.
+"""
+
+from __future__ import unicode_literals
+
+import abc
+
+import source_formatter
+
+
+class LineStage(object):
+  """Line stream stage interface."""
+
+  @abc.abstractmethod
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+
+
+class CorrectDescriptionSpellingStage(LineStage):
+  """Corrects the spelling of type or value descriptions.
+
+  For example "a item" is corrected to "an item".
+  """
+
+  def __init__(self, names):
+    """Initializes a correct description spelling stage.
+
+    Args:
+      names (list[str]): type or value names.
+    """
+    super(CorrectDescriptionSpellingStage, self).__init__()
+    self._descriptions = []
+
+    for name in names:
+      if not name or name[0] not in ('a', 'e', 'i', 'o', ''):
+        continue
+
+      name = name.replace('_', ' ')
+      description = (' a {0:s}'.format(name), ' an {0:s}'.format(name))
+      if description not in self._descriptions:
+        self._descriptions.append(description)
+
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+    if not self._descriptions:
+      for line in lines:
+        yield line
+      return
+
+    for line in lines:
+      for description, corrected_description in self._descriptions:
+        line = line.replace(description, corrected_description)
+      yield line
+
+
+class SortIncludeHeadersStage(LineStage):
+  """Sorts consecutive include headers of the project."""
+
+  def __init__(self, include_header_prefixes):
+    """Initializes a sort include headers stage.
+
+    Args:
+      include_header_prefixes (list[bytes]): prefixes of the include header
+          lines to sort, such as '#include "libyal_'.
+    """
+    super(SortIncludeHeadersStage, self).__init__()
+    self._include_header_prefixes = tuple(include_header_prefixes)
+
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+    include_headers = []
+
+    for line in lines:
+      if line.startswith(self._include_header_prefixes):
+        include_headers.append(line)
+        continue
+
+      if include_headers:
+        for include_header in sorted(include_headers):
+          yield include_header
+        include_headers = []
+
+      yield line
+
+    for include_header in sorted(include_headers):
+      yield include_header
+
+
+class SortVariableDeclarationsStage(LineStage):
+  """Sorts the variable declarations at the start of a block."""
+
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+    formatter = source_formatter.SourceFormatter()
+    for line in formatter.FormatSourceStream(lines):
+      yield line
+
+
+class VerticalAlignAssignmentStatementsStage(LineStage):
+  """Vertically aligns consecutive assignment statements."""
+
+  def _AlignAssignmentStatements(self, assignment_statements):
+    """Aligns assignment statements.
+
+    Args:
+      assignment_statements (list[bytes]): assignment statements.
+
+    Returns:
+      list[bytes]: aligned assignment statements.
+    """
+    if len(assignment_statements) == 1:
+      return assignment_statements
+
+    alignment_offset = 0
+    for assignment_statement in assignment_statements:
+      prefix, _, _ = assignment_statement.rpartition(b'=')
+      prefix = prefix.rstrip()
+      alignment_offset = max(alignment_offset, len(prefix) + 1)
+
+    aligned_assignment_statements = []
+    for assignment_statement in assignment_statements:
+      prefix, _, suffix = assignment_statement.rpartition(b'=')
+      prefix = prefix.rstrip()
+      alignment_length = alignment_offset - len(prefix)
+
+      aligned_assignment_statements.append(b'{0:s}{1:s}={2:s}'.format(
+          prefix, b' ' * alignment_length, suffix))
+
+    return aligned_assignment_statements
+
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+    assignment_statements = []
+
+    for line in lines:
+      if b' = ' in line:
+        assignment_statements.append(line)
+        continue
+
+      if assignment_statements:
+        for assignment_statement in self._AlignAssignmentStatements(
+            assignment_statements):
+          yield assignment_statement
+        assignment_statements = []
+
+      yield line
+
+    if assignment_statements:
+      for assignment_statement in self._AlignAssignmentStatements(
+          assignment_statements):
+        yield assignment_statement
+
+
+class VerticalAlignFunctionArgumentsStage(LineStage):
+  """Vertically aligns function arguments.
+
+  Note this is a very basic approach that should suffice for the Python
+  module source files.
+  """
+
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+    alignment_number_of_spaces = 0
+    alignment_number_of_tabs = 0
+    in_function_call = False
+
+    for line in lines:
+      if not line.startswith(b'\t'):
+        yield line
+        continue
+
+      stripped_line = line.rstrip()
+
+      if in_function_call:
+        if stripped_line.endswith(b')') or stripped_line.endswith(b');'):
+          in_function_call = False
+
+        stripped_line = line.lstrip()
+        line = b'{0:s}{1:s}{2:s}'.format(
+            b'\t' * alignment_number_of_tabs,
+            b' ' * alignment_number_of_spaces,
+            stripped_line)
+
+      elif stripped_line.endswith(b'('):
+        in_function_call = True
+        stripped_line = line.lstrip()
+
+        alignment_number_of_spaces = stripped_line.rfind(b' ')
+        if alignment_number_of_spaces == -1:
+          alignment_number_of_spaces = 1
+        else:
+          alignment_number_of_spaces += 2
+
+        alignment_number_of_tabs = len(line) - len(stripped_line)
+
+      yield line
+
+
+class VerticalAlignTabsStage(LineStage):
+  """Vertically aligns the last tab separated column.
+
+  The alignment is determined by all lines, hence this stage buffers all
+  lines.
+  """
+
+  def Process(self, lines):
+    """Processes a stream of lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Yields:
+      bytes: processed line.
+    """
+    lines = list(lines)
+
+    alignment_offset = 0
+    for line in lines:
+      if b'\t' not in line.lstrip(b'\t'):
+        continue
+
+      prefix, _, _ = line.rpartition(b'\t')
+      prefix = prefix.rstrip(b'\t')
+      formatted_prefix = prefix.replace(b'\t', b' ' * 8)
+
+      equal_sign_offset = len(formatted_prefix) + 8
+      equal_sign_offset, _ = divmod(equal_sign_offset, 8)
+      equal_sign_offset *= 8
+
+      alignment_offset = max(alignment_offset, equal_sign_offset)
+
+    for line in lines:
+      if b'\t' in line.lstrip(b'\t'):
+        prefix, _, suffix = line.rpartition(b'\t')
+        prefix = prefix.rstrip(b'\t')
+        formatted_prefix = prefix.replace(b'\t', b' ' * 8)
+
+        alignment_size = alignment_offset - len(formatted_prefix)
+        alignment_size, remainder = divmod(alignment_size, 8)
+        if remainder > 0:
+          alignment_size += 1
+
+        line = b'{0:s}{1:s}{2:s}'.format(
+            prefix, b'\t' * alignment_size, suffix)
+
+      yield line
+
+
+def ProcessLines(lines, stages):
+  """Processes lines with a pipeline of stages.
+
+  Args:
+    lines (iterable[bytes]): lines.
+    stages (list[LineStage]): stages in the order they apply.
+
+  Returns:
+    iterable[bytes]: processed lines.
+  """
+  for stage in stages:
+    lines = stage.Process(lines)
+  return lines
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""The source generation manifest."""
+
+from __future__ import unicode_literals
+
+import glob
+import hashlib
+import json
+import logging
+import os
+
+
+def CalculateFileHash(path):
+  """Calculates the hash of the content of a file.
+
+  Args:
+    path (str): path of the file.
+
+  Returns:
+    str: hexadecimal SHA-256 hash of the content of the file or None if
+        the file does not exist.
+  """
+  if not os.path.isfile(path):
+    return None
+
+  hash_context = hashlib.sha256()
+  with open(path, 'rb') as file_object:
+    data = file_object.read(65536)
+    while data:
+      hash_context.update(data)
+      data = file_object.read(65536)
+
+  return hash_context.hexdigest()
+
+
+def _WriteFile(path, data):
+  """Writes a file, replacing an existing file only after it was written.
+
+  Args:
+    path (str): path of the file.
+    data (bytes): data to write.
+  """
+  temporary_path = '{0:s}.{1:d}'.format(path, os.getpid())
+  with open(temporary_path, 'wb') as file_object:
+    file_object.write(data)
+
+  try:
+    os.rename(temporary_path, path)
+  except OSError:
+    # On Windows rename fails if the destination exists.
+    os.remove(path)
+    os.rename(temporary_path, path)
+
+
+class DependencyGraph(object):
+  """Dependency graph of the generated source files.
+
+  The graph maps the path of every output file to the paths of the files,
+  such as templates, project headers, Makefile.am files and the source
+  generation configuration, the output file was generated from. Build tools
+  such as make can use the graph to determine which output files are out of
+  date.
+
+  Paths within the base directory are relative to the base directory, other
+  paths are absolute.
+  """
+
+  def __init__(self, base_directory):
+    """Initializes a dependency graph.
+
+    Args:
+      base_directory (str): path of the base directory, such as the directory
+          of the project.
+    """
+    super(DependencyGraph, self).__init__()
+    self._base_directory = os.path.abspath(base_directory)
+    self._dependencies = {}
+
+  def _EscapeMakefilePath(self, path):
+    """Escapes a path for use in a Makefile rule.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      str: escaped path.
+    """
+    path = path.replace('$', '$$')
+    path = path.replace('#', '\\#')
+    return path.replace(' ', '\\ ')
+
+  def _NormalizePath(self, path):
+    """Normalizes a path.
+
+    Args:
+      path (str): path, which is either absolute or relative to the current
+          working directory.
+
+    Returns:
+      str: path relative to the base directory if within the base directory,
+          otherwise the absolute path.
+    """
+    path = os.path.abspath(path)
+    if path.startswith(self._base_directory + os.sep):
+      path = path[len(self._base_directory) + 1:]
+    return path
+
+  def AddGenerator(self, inputs, output_paths, input_paths=None):
+    """Adds the inputs and outputs of a generator.
+
+    Files that were read for a specific output file are only dependencies of
+    that output file, other files that were read are dependencies of all
+    output files of the generator. Output files of the generator are not
+    dependencies of each other.
+
+    Args:
+      inputs (GeneratorInputs): inputs of the generator.
+      output_paths (list[str]): paths of the outputs of the generator.
+      input_paths (Optional[list[str]]): paths of the files that all outputs
+          depend on, such as the source generation configuration, which are
+          not part of the inputs of the generator.
+    """
+    output_specific_paths = set()
+    for paths in inputs.output_files.values():
+      output_specific_paths.update(paths)
+
+    shared_paths = inputs.files.difference(output_specific_paths)
+    shared_paths.update(input_paths or [])
+
+    shared_paths = set([self._NormalizePath(path) for path in shared_paths])
+    normalized_output_paths = set([
+        self._NormalizePath(path) for path in output_paths])
+
+    for output_path in output_paths:
+      paths = set(shared_paths)
+      paths.update([
+          self._NormalizePath(path)
+          for path in inputs.output_files.get(output_path, [])])
+      paths.difference_update(normalized_output_paths)
+
+      output_path = self._NormalizePath(output_path)
+      self._dependencies.setdefault(output_path, set()).update(paths)
+
+  def GetDependencies(self):
+    """Retrieves the dependencies.
+
+    Returns:
+      dict[str, list[str]]: sorted paths of the dependencies per path of
+          an output file.
+    """
+    return {
+        output_path: sorted(paths)
+        for output_path, paths in self._dependencies.items()}
+
+  def WriteJSON(self, path):
+    """Writes the dependency graph as JSON.
+
+    Args:
+      path (str): path of the file to write to.
+    """
+    json_dict = {'dependencies': self.GetDependencies()}
+    json_string = json.dumps(json_dict, indent=2, sort_keys=True)
+
+    _WriteFile(path, json_string.encode('utf-8'))
+
+  def WriteMakefile(self, path):
+    """Writes the dependency graph as Makefile rules.
+
+    Every dependency also gets a rule without recipe, so make does not fail
+    when a dependency, such as a template, is removed.
+
+    Args:
+      path (str): path of the file to write to.
+    """
+    lines = ['# Generated by source-generate.py, do not edit.', '']
+
+    dependencies = self.GetDependencies()
+    input_paths = set()
+    for output_path, paths in sorted(dependencies.items()):
+      rule = ['{0:s}:'.format(self._EscapeMakefilePath(output_path))]
+      rule.extend([
+          self._EscapeMakefilePath(input_path) for input_path in paths])
+      lines.extend([' \\\n\t'.join(rule), ''])
+
+      input_paths.update(paths)
+
+    for input_path in sorted(input_paths.difference(dependencies.keys())):
+      lines.extend([
+          '{0:s}:'.format(self._EscapeMakefilePath(input_path)), ''])
+
+    _WriteFile(path, '\n'.join(lines).encode('utf-8'))
+
+
+class GeneratorInputs(object):
+  """Inputs of a generator.
+
+  Attributes:
+    directories (dict[str, list[str]]): names of the directory entries per
+        path of a directory that was listed.
+    files (set[str]): paths of the files that were read.
+    globs (dict[str, list[str]]): matching paths per glob pattern.
+    output_files (dict[str, set[str]]): paths of the files that were read
+        for a specific output file, per path of the output file.
+    paths (dict[str, bool]): existence per path that was checked.
+  """
+
+  def __init__(self):
+    """Initializes generator inputs."""
+    super(GeneratorInputs, self).__init__()
+    self.directories = {}
+    self.files = set()
+    self.globs = {}
+    self.output_files = {}
+    self.paths = {}
+
+  def AddDirectory(self, path, names):
+    """Adds a directory listing.
+
+    Args:
+      path (str): path of the directory.
+      names (list[str]): names of the directory entries.
+    """
+    self.directories[path] = sorted(names)
+
+  def AddFile(self, path, output_path=None):
+    """Adds a file that was read.
+
+    Args:
+      path (str): path of the file.
+      output_path (Optional[str]): path of the output file the file was read
+          for, where None represents all output files of the generator.
+    """
+    self.files.add(path)
+
+    if output_path:
+      self.output_files.setdefault(output_path, set()).add(path)
+
+  def AddGlob(self, pattern, paths):
+    """Adds the result of a glob.
+
+    Args:
+      pattern (str): glob pattern.
+      paths (list[str]): paths that match the glob pattern.
+    """
+    self.globs[pattern] = sorted(paths)
+
+  def AddPath(self, path, exists):
+    """Adds a path of which the existence was checked.
+
+    Args:
+      path (str): path.
+      exists (bool): True if the path exists.
+    """
+    self.paths[path] = exists
+
+  def Merge(self, inputs):
+    """Merges the inputs of another generator or generator task.
+
+    Args:
+      inputs (GeneratorInputs): inputs to merge.
+    """
+    self.directories.update(inputs.directories)
+    self.files.update(inputs.files)
+    self.globs.update(inputs.globs)
+    self.paths.update(inputs.paths)
+
+    for output_path, paths in inputs.output_files.items():
+      self.output_files.setdefault(output_path, set()).update(paths)
+
+
+class GenerationManifest(object):
+  """Source generation manifest.
+
+  The manifest maps, per generator, the outputs that were written to the
+  hashes of the inputs the outputs were generated from. The manifest is used
+  to determine if a generator needs to run again.
+  """
+
+  _FORMAT_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a source generation manifest.
+
+    Args:
+      path (str): path of the manifest file.
+    """
+    super(GenerationManifest, self).__init__()
+    self._generators = {}
+    self._path = path
+
+  def GetPaths(self):
+    """Retrieves the paths of the inputs and outputs of all generators.
+
+    Returns:
+      set[str]: paths of the directories that were listed, the files that
+          were read, the directories of glob patterns, the paths of which
+          the existence was checked and the outputs.
+    """
+    paths = set()
+    for generator_values in self._generators.values():
+      inputs = generator_values.get('inputs', {})
+
+      paths.update(inputs.get('directories', {}).keys())
+      paths.update(inputs.get('files', {}).keys())
+      paths.update(inputs.get('paths', {}).keys())
+      paths.update(generator_values.get('outputs', {}).keys())
+
+      for pattern in inputs.get('globs', {}).keys():
+        paths.add(os.path.dirname(pattern) or '.')
+
+    return paths
+
+  def IsUpToDate(self, generator_name, generation_key):
+    """Determines if the outputs of a generator are up to date.
+
+    Args:
+      generator_name (str): name of the generator.
+      generation_key (str): key that identifies the values, such as
+          the configuration and the date, the generator depends on.
+
+    Returns:
+      bool: True if the inputs and outputs of the generator have not changed
+          since the manifest was last updated.
+    """
+    generator_values = self._generators.get(generator_name, None)
+    if not generator_values:
+      return False
+
+    if generator_values.get('key', None) != generation_key:
+      return False
+
+    inputs = generator_values.get('inputs', {})
+
+    for path, names in inputs.get('directories', {}).items():
+      if not os.path.isdir(path) or sorted(os.listdir(path)) != names:
+        return False
+
+    for path, file_hash in inputs.get('files', {}).items():
+      if CalculateFileHash(path) != file_hash:
+        return False
+
+    for pattern, paths in inputs.get('globs', {}).items():
+      if sorted(glob.glob(pattern)) != paths:
+        return False
+
+    for path, exists in inputs.get('paths', {}).items():
+      if os.path.exists(path) != exists:
+        return False
+
+    for path, file_hash in generator_values.get('outputs', {}).items():
+      if CalculateFileHash(path) != file_hash:
+        return False
+
+    return True
+
+  def Read(self):
+    """Reads the manifest from file.
+
+    A missing, outdated or corrupt manifest file results in an empty manifest.
+    """
+    self._generators = {}
+
+    if not os.path.exists(self._path):
+      return
+
+    try:
+      with open(self._path, 'rb') as file_object:
+        json_dict = json.loads(file_object.read().decode('utf-8'))
+
+    except (IOError, ValueError) as exception:
+      logging.warning('Unable to read manifest: {0:s} with error: {1!s}'.format(
+          self._path, exception))
+      return
+
+    if json_dict.get('format_version', None) == self._FORMAT_VERSION:
+      self._generators = json_dict.get('generators', {})
+
+  def Update(self, generator_name, generation_key, inputs, output_paths):
+    """Updates the manifest with the inputs and outputs of a generator.
+
+    Args:
+      generator_name (str): name of the generator.
+      generation_key (str): key that identifies the values, such as
+          the configuration and the date, the generator depends on.
+      inputs (GeneratorInputs): inputs of the generator.
+      output_paths (list[str]): paths of the outputs of the generator.
+    """
+    # Outputs will exist the next time the generator runs.
+    paths = dict(inputs.paths)
+    for path in output_paths:
+      if path in paths:
+        paths[path] = True
+
+    # Outputs that are also inputs are covered by the output hashes.
+    files = {
+        path: CalculateFileHash(path) for path in inputs.files
+        if path not in output_paths}
+
+    directories = {}
+    for path in inputs.directories.keys():
+      if os.path.isdir(path):
+        directories[path] = sorted(os.listdir(path))
+
+    globs = {
+        pattern: sorted(glob.glob(pattern)) for pattern in inputs.globs.keys()}
+
+    self._generators[generator_name] = {
+        'inputs': {
+            'directories': directories,
+            'files': files,
+            'globs': globs,
+            'paths': paths},
+        'key': generation_key,
+        'outputs': {
+            path: CalculateFileHash(path) for path in output_paths}}
+
+  def Write(self):
+    """Writes the manifest to file."""
+    json_dict = {
+        'format_version': self._FORMAT_VERSION,
+        'generators': self._generators}
+
+    json_string = json.dumps(json_dict, indent=2, sort_keys=True)
+
+    _WriteFile(self._path, json_string.encode('utf-8'))
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio project and solution file writer interfaces."""
+
+import abc
+
+
+class VSProjectFileWriter(object):
+  """Visual Studio project file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project configuration."""
+    super(VSProjectFileWriter, self).__init__()
+    self._file = None
+
+  def Open(self, filename):
+    """Opens the project file.
+
+    Args:
+      filename (str): path of the file.
+    """
+    # Using binary mode to make sure to write Windows/DOS end of lines.
+    self._file = open(filename, 'wb')
+
+  def Close(self):
+    """Closes the project file."""
+    self._file.close()
+
+  def WriteLine(self, line):
+    """Writes a line."""
+    # TODO: handle encoding properly.
+    self._file.write('{0:s}\r\n'.format(line))
+
+  def WriteLines(self, lines):
+    """Writes lines."""
+    for line in lines:
+      self.WriteLine(line)
+
+  @abc.abstractmethod
+  def WriteHeader(self):
+    """Writes a file header."""
+
+  @abc.abstractmethod
+  def WriteFooter(self):
+    """Writes a file footer."""
+
+
+class VSSolutionFileWriter(object):
+  """Visual Studio solution file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project configuration."""
+    super(VSSolutionFileWriter, self).__init__()
+    self._file = None
+
+  def Open(self, filename):
+    """Opens the solution file.
+
+    Args:
+      filename (str): path of the solution file.
+    """
+    # Using binary mode to make sure to write Windows/DOS end of lines.
+    self._file = open(filename, 'wb')
+
+  def Close(self):
+    """Closes the solution file."""
+    self._file.close()
+
+  @abc.abstractmethod
+  def WriteHeader(self):
+    """Writes a file header."""
+
+  @abc.abstractmethod
+  def WriteProject(self, solution_project):
+    """Writes a project section.
+
+    Args:
+      solution_project (VSSolutionProject): project.
+    """
+
+  def WriteLine(self, line):
+    """Writes a line."""
+    self._file.write('{0:s}\r\n'.format(line))
+
+  def WriteLines(self, lines):
+    """Writes lines."""
+    for line in lines:
+      self.WriteLine(line)
+
+  def WriteProjects(self, solution_projects):
+    """Writes the projects.
+
+    Args:
+      solution_projects (list[VSSolutionProject]): projects.
+    """
+    for solution_project in solution_projects:
+      self.WriteProject(solution_project)
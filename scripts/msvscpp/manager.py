@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio file writers manager."""
+
+import importlib
+
+
+class WritersManager(object):
+  """Visual Studio file writers manager.
+
+  The manager maps the output Visual Studio versions, such as "2010", to
+  the project and solution file writer classes. The module that defines
+  the writers of a version is only imported when a writer of the version
+  is first retrieved.
+  """
+
+  # The output versions with the name of the module and the names of
+  # the project and solution file writer classes.
+  _WRITERS = [
+      ('2008', 'vs2008', 'VS2008ProjectFileWriter', 'VS2008SolutionFileWriter'),
+      ('2010', 'vs2010', 'VS2010ProjectFileWriter', 'VS2010SolutionFileWriter'),
+      ('2012', 'vs2012', 'VS2012ProjectFileWriter', 'VS2012SolutionFileWriter'),
+      ('2013', 'vs2013', 'VS2013ProjectFileWriter', 'VS2013SolutionFileWriter'),
+      ('2015', 'vs2015', 'VS2015ProjectFileWriter', 'VS2015SolutionFileWriter')]
+
+  @classmethod
+  def _GetWritersModule(cls, output_version):
+    """Imports the module that defines the writers of an output version.
+
+    Args:
+      output_version (str): output Visual Studio version.
+
+    Returns:
+      tuple[module, str, str]: module and the names of the project and
+          solution file writer classes.
+
+    Raises:
+      KeyError: if there are no writers for the output version.
+    """
+    for version, module_name, project_class_name, solution_class_name in (
+        cls._WRITERS):
+      if version == output_version:
+        break
+    else:
+      raise KeyError(
+          'No writers for output version: {0:s}'.format(output_version))
+
+    # The package is determined from the name of this module, since it is
+    # imported both as msvscpp and as scripts.msvscpp.
+    package_name, _, _ = __name__.rpartition('.')
+    module = importlib.import_module('{0:s}.{1:s}'.format(
+        package_name, module_name))
+
+    return module, project_class_name, solution_class_name
+
+  @classmethod
+  def GetOutputVersions(cls):
+    """Retrieves the output Visual Studio versions.
+
+    Returns:
+      list[str]: output Visual Studio versions.
+    """
+    return [version for version, _, _, _ in cls._WRITERS]
+
+  @classmethod
+  def GetProjectFileWriter(cls, output_version):
+    """Retrieves a project file writer for an output version.
+
+    Args:
+      output_version (str): output Visual Studio version.
+
+    Returns:
+      VSProjectFileWriter: project file writer.
+
+    Raises:
+      KeyError: if there are no writers for the output version.
+    """
+    module, class_name, _ = cls._GetWritersModule(output_version)
+    return getattr(module, class_name)()
+
+  @classmethod
+  def GetSolutionFileWriter(cls, output_version):
+    """Retrieves a solution file writer for an output version.
+
+    Args:
+      output_version (str): output Visual Studio version.
+
+    Returns:
+      VSSolutionFileWriter: solution file writer.
+
+    Raises:
+      KeyError: if there are no writers for the output version.
+    """
+    module, _, class_name = cls._GetWritersModule(output_version)
+    return getattr(module, class_name)()
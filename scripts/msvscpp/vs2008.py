@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio 2008 project and solution file writers."""
+
+from msvscpp import interface
+
+
+class VS2008ProjectFileWriter(interface.VSProjectFileWriter):
+  """Visual Studio 2008 project file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project file writer."""
+    super(VS2008ProjectFileWriter, self).__init__()
+    self._version = 2008
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self.WriteLine('<?xml version="1.0" encoding="Windows-1252"?>')
+
+  def WriteProjectConfigurations(self, unused_project_configurations):
+    """Writes the project configurations.
+
+    Args:
+      project_configurations (VSConfigurations): configurations.
+    """
+    return
+
+  def WriteProjectInformation(self, project_information):
+    """Writes the project information.
+
+    Args:
+      project_information (VSProjectInformation): project information.
+    """
+    self.WriteLines([
+        '<VisualStudioProject',
+        '\tProjectType="Visual C++"',
+        '\tVersion="9,00"'])
+
+    self.WriteLine('\tName="{0:s}"'.format(project_information.name))
+
+    self.WriteLine('\tProjectGUID="{{{0:s}}}"'.format(
+        project_information.guid.upper()))
+
+    self.WriteLine(
+        '\tRootNamespace="{0:s}"'.format(project_information.root_name_space))
+
+    if project_information.keyword:
+      self.WriteLine(
+          '\tKeyword="{0:s}"'.format(project_information.keyword))
+
+    # Also seen 196613.
+    self.WriteLines([
+        '\tTargetFrameworkVersion="131072"',
+        '\t>'])
+
+    # TODO: handle platforms.
+    self.WriteLines([
+        '\t<Platforms>',
+        '\t\t<Platform',
+        '\t\t\tName="Win32"',
+        '\t\t/>',
+        '\t</Platforms>'])
+
+    self.WriteLines([
+        '\t<ToolFiles>',
+        '\t</ToolFiles>'])
+
+  def _WriteConfiguration(self, project_configuration):
+    """Writes the project configuration.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine('\t\t<Configuration')
+
+    self.WriteLine('\t\t\tName="{0:s}|{1:s}"'.format(
+        project_configuration.name, project_configuration.platform))
+
+    self.WriteLines([
+        '\t\t\tOutputDirectory="$(SolutionDir)$(ConfigurationName)"',
+        '\t\t\tIntermediateDirectory="$(ConfigurationName)"'])
+
+    self.WriteLine('\t\t\tConfigurationType="{0:s}"'.format(
+        project_configuration.output_type))
+
+    self.WriteLine('\t\t\tCharacterSet="{0:s}"'.format(
+        project_configuration.character_set))
+
+    if project_configuration.managed_extensions:
+      self.WriteLine('\t\t\tManagedExtensions="{0:s}"'.format(
+          project_configuration.managed_extensions))
+
+    if project_configuration.whole_program_optimization:
+      self.WriteLine('\t\t\tWholeProgramOptimization="{0:s}"'.format(
+          project_configuration.whole_program_optimization))
+
+    self.WriteLine('\t\t\t>')
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCPreBuildEventTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCCustomBuildTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCXMLDataGeneratorTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCWebServiceProxyGeneratorTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCMIDLTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCCLCompilerTool"'])
+
+    if project_configuration.optimization:
+      self.WriteLine('\t\t\t\tOptimization="{0:s}"'.format(
+          project_configuration.optimization))
+
+    self.WriteLine('\t\t\t\tAdditionalIncludeDirectories="{0:s}"'.format(
+        project_configuration.include_directories))
+
+    self.WriteLine('\t\t\t\tPreprocessorDefinitions="{0:s}"'.format(
+        project_configuration.preprocessor_definitions))
+
+    if project_configuration.basic_runtime_checks:
+      self.WriteLine('\t\t\t\tBasicRuntimeChecks="{0:s}"'.format(
+          project_configuration.basic_runtime_checks))
+
+    if project_configuration.smaller_type_check:
+      self.WriteLine('\t\t\t\tSmallerTypeCheck="{0:s}"'.format(
+          project_configuration.smaller_type_check))
+
+    self.WriteLine('\t\t\t\tRuntimeLibrary="{0:s}"'.format(
+        project_configuration.runtime_library))
+
+    if project_configuration.precompiled_header:
+      self.WriteLine('\t\t\t\tUsePrecompiledHeader="{0:s}"'.format(
+          project_configuration.precompiled_header))
+
+    self.WriteLine('\t\t\t\tWarningLevel="{0:s}"'.format(
+        project_configuration.warning_level))
+
+    if project_configuration.warning_as_error:
+      self.WriteLine('\t\t\t\tWarnAsError="{0:s}"'.format(
+          project_configuration.warning_as_error))
+
+    if project_configuration.detect_64bit_portability_problems:
+      self.WriteLine('\t\t\t\tDetect64BitPortabilityProblems="{0:s}"'.format(
+          project_configuration.detect_64bit_portability_problems))
+
+    if project_configuration.debug_information_format:
+      self.WriteLine('\t\t\t\tDebugInformationFormat="{0:s}"'.format(
+          project_configuration.debug_information_format))
+
+    self.WriteLine('\t\t\t\tCompileAs="{0:s}"'.format(
+        project_configuration.compile_as))
+
+    self.WriteLine('\t\t\t/>')
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCManagedResourceCompilerTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCResourceCompilerTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCPreLinkEventTool"',
+        '\t\t\t/>'])
+
+    # TODO: add librarian values set?
+    if project_configuration.librarian_output_file:
+      self.WriteLines([
+          '\t\t\t<Tool',
+          '\t\t\t\tName="VCLibrarianTool"'])
+
+      self.WriteLine('\t\t\t\tOutputFile="{0:s}"'.format(
+          project_configuration.librarian_output_file))
+
+      self.WriteLine('\t\t\t\tModuleDefinitionFile=""')
+
+      self.WriteLine('\t\t\t\tIgnoreAllDefaultLibraries="{0:s}"'.format(
+          project_configuration.librarian_ignore_defaults))
+
+      self.WriteLine('\t\t\t/>')
+
+    if project_configuration.linker_values_set:
+      self.WriteLines([
+          '\t\t\t<Tool',
+          '\t\t\t\tName="VCLinkerTool"'])
+
+      if project_configuration.additional_dependencies:
+        self.WriteLine('\t\t\t\tAdditionalDependencies="{0:s}"'.format(
+            ' '.join(sorted(project_configuration.additional_dependencies))))
+
+      if project_configuration.linker_output_file:
+        self.WriteLine('\t\t\t\tOutputFile="{0:s}"'.format(
+            project_configuration.linker_output_file))
+
+      if project_configuration.link_incremental:
+        self.WriteLine('\t\t\t\tLinkIncremental="{0:s}"'.format(
+            project_configuration.link_incremental))
+
+      library_directories = '&quot;$(OutDir)&quot;'
+      if project_configuration.library_directories:
+        library_directories = '{0:s};{1:s}'.format(
+            library_directories, project_configuration.library_directories)
+
+      self.WriteLine('\t\t\t\tAdditionalLibraryDirectories="{0:s}"'.format(
+          library_directories))
+
+      if project_configuration.generate_debug_information:
+        self.WriteLine('\t\t\t\tGenerateDebugInformation="{0:s}"'.format(
+            project_configuration.generate_debug_information))
+
+      if project_configuration.sub_system:
+        self.WriteLine('\t\t\t\tSubSystem="{0:s}"'.format(
+            project_configuration.sub_system))
+
+      if project_configuration.optimize_references:
+        self.WriteLine('\t\t\t\tOptimizeReferences="{0:s}"'.format(
+            project_configuration.optimize_references))
+
+      if project_configuration.enable_comdat_folding:
+        self.WriteLine('\t\t\t\tEnableCOMDATFolding="{0:s}"'.format(
+            project_configuration.enable_comdat_folding))
+
+      if project_configuration.randomized_base_address:
+        self.WriteLine('\t\t\t\tRandomizedBaseAddress="{0:s}"'.format(
+            project_configuration.randomized_base_address))
+
+      if project_configuration.data_execution_prevention:
+        self.WriteLine('\t\t\t\tDataExecutionPrevention="{0:s}"'.format(
+            project_configuration.data_execution_prevention))
+
+      if project_configuration.target_machine:
+        self.WriteLine('\t\t\t\tTargetMachine="{0:s}"'.format(
+            project_configuration.target_machine))
+
+      if project_configuration.import_library:
+        self.WriteLine('\t\t\t\tImportLibrary="{0:s}"'.format(
+            project_configuration.import_library))
+
+      self.WriteLine('\t\t\t/>')
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCALinkTool"',
+        '\t\t\t/>'])
+
+    if project_configuration.linker_values_set:
+      self.WriteLines([
+          '\t\t\t<Tool',
+          '\t\t\t\tName="VCManifestTool"',
+          '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCXDCMakeTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCBscMakeTool"',
+        '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCFxCopTool"',
+        '\t\t\t/>'])
+
+    if project_configuration.linker_values_set:
+      self.WriteLines([
+          '\t\t\t<Tool',
+          '\t\t\t\tName="VCAppVerifierTool"',
+          '\t\t\t/>'])
+
+    self.WriteLines([
+        '\t\t\t<Tool',
+        '\t\t\t\tName="VCPostBuildEventTool"',
+        '\t\t\t/>'])
+
+    self.WriteLine('\t\t</Configuration>')
+
+  def WriteConfigurations(self, project_configurations):
+    """Writes the configurations.
+
+    Args:
+      project_configurations (VSConfigurations): configurations.
+    """
+    self.WriteLine('\t<Configurations>')
+
+    for project_configuration in project_configurations.GetSorted():
+      self._WriteConfiguration(project_configuration)
+
+    self.WriteLine('\t</Configurations>')
+
+    self.WriteLines([
+        '\t<References>',
+        '\t</References>'])
+
+  def _WriteSourceFiles(self, source_files):
+    """Writes the source files.
+
+    Args:
+      source_files (list[str]): source filenames.
+    """
+    self.WriteLines([
+        '\t\t<Filter',
+        '\t\t\tName="Source Files"',
+        '\t\t\tFilter="cpp;c;cc;cxx;def;odl;idl;hpj;bat;asm;asmx"',
+        '\t\t\tUniqueIdentifier="{4FC737F1-C7A5-4376-A066-2A32D752A2FF}"',
+        '\t\t\t>'])
+
+    for filename in source_files:
+      self.WriteLine('\t\t\t<File')
+
+      self.WriteLine('\t\t\t\tRelativePath="{0:s}"'.format(filename))
+
+      self.WriteLines([
+          '\t\t\t\t>',
+          '\t\t\t</File>'])
+
+    self.WriteLine('\t\t</Filter>')
+
+  def _WriteHeaderFiles(self, header_files):
+    """Writes the header files.
+
+    Args:
+      header_files (list[str]): header filenames.
+    """
+    self.WriteLines([
+        '\t\t<Filter',
+        '\t\t\tName="Header Files"',
+        '\t\t\tFilter="h;hpp;hxx;hm;inl;inc;xsd"',
+        '\t\t\tUniqueIdentifier="{93995380-89BD-4b04-88EB-625FBE52EBFB}"',
+        '\t\t\t>'])
+
+    for filename in header_files:
+      self.WriteLine('\t\t\t<File')
+
+      self.WriteLine('\t\t\t\tRelativePath="{0:s}"'.format(filename))
+
+      self.WriteLines([
+          '\t\t\t\t>',
+          '\t\t\t</File>'])
+
+    self.WriteLine('\t\t</Filter>')
+
+  def _WriteResourceFiles(self, resource_files):
+    """Writes the resource files.
+
+    Args:
+      resource_files (list[str]): resource filenames.
+    """
+    self.WriteLines([
+        '\t\t<Filter',
+        '\t\t\tName="Resource Files"',
+        ('\t\t\tFilter="rc;ico;cur;bmp;dlg;rc2;rct;bin;rgs;gif;jpg;jpeg;jpe;'
+         'resx;tiff;tif;png;wav"'),
+        '\t\t\tUniqueIdentifier="{67DA6AB6-F800-4c08-8B7A-83BB121AAD01}"',
+        '\t\t\t>'])
+
+    for filename in resource_files:
+      self.WriteLine('\t\t\t<File')
+
+      self.WriteLine('\t\t\t\tRelativePath="{0:s}"'.format(filename))
+
+      self.WriteLines([
+          '\t\t\t\t>',
+          '\t\t\t</File>'])
+
+    self.WriteLine('\t\t</Filter>')
+
+  def WriteFiles(self, source_files, header_files, resource_files):
+    """Writes the files.
+
+    Args:
+      source_files (list[str]): source filenames.
+      header_files (list[str]): header filenames.
+      resource_files (list[str]): resource filenames.
+    """
+    self.WriteLine('\t<Files>')
+
+    self._WriteSourceFiles(source_files)
+    self._WriteHeaderFiles(header_files)
+    self._WriteResourceFiles(resource_files)
+
+    self.WriteLine('\t</Files>')
+
+    self.WriteLines([
+        '\t<Globals>',
+        '\t</Globals>'])
+
+  def WriteDependencies(
+      self, unused_dependencies, unused_solution_projects_by_guid):
+    """Writes the dependencies.
+
+    Args:
+      dependencies (list[str]): GUIDs of the dependencies.
+      solution_projects_by_guid (dict[str, VSSolutionProject]): projects
+          per lower case GUID.
+    """
+    return
+
+  def WriteFooter(self):
+    """Writes a file footer."""
+    self.WriteLine('</VisualStudioProject>')
+
+
+class VS2008SolutionFileWriter(interface.VSSolutionFileWriter):
+  """Visual Studio 2008 solution file writer."""
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self.WriteLines([
+        '\xef\xbb\xbf',
+        'Microsoft Visual Studio Solution File, Format Version 10.00',
+        '# Visual C++ Express 2008'])
+
+  def WriteProject(self, solution_project):
+    """Writes a project section.
+
+    Args:
+      solution_project (VSSolutionProject): project.
+    """
+    solution_project_filename = '{0:s}.vcproj'.format(
+        solution_project.filename)
+
+    self.WriteLine((
+        'Project("{{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}}") = "{0:s}", '
+        '"{1:s}", "{{{2:s}}}"').format(
+            solution_project.name, solution_project_filename,
+            solution_project.guid.upper()))
+
+    if len(solution_project.dependencies) > 0:
+      self.WriteLine(
+          '\tProjectSection(ProjectDependencies) = postProject')
+
+      for dependency_guid in solution_project.dependencies:
+        self.WriteLine('\t\t{{{0:s}}} = {{{0:s}}}'.format(
+            dependency_guid.upper()))
+
+      self.WriteLine('\tEndProjectSection')
+
+    self.WriteLine('EndProject')
+
+  def WriteConfigurations(self, solution_configurations, solution_projects):
+    """Writes the configurations.
+
+    Args:
+      solution_configurations (VSConfigurations): configurations.
+      solution_projects (list[VSSolutionProject]): projects.
+    """
+    self.WriteLine('Global')
+
+    if solution_configurations.number_of_configurations > 0:
+      self.WriteLine(
+          '\tGlobalSection(SolutionConfigurationPlatforms) = preSolution')
+
+      for configuration_platform in sorted(solution_configurations.platforms):
+        for configuration_name in sorted(solution_configurations.names):
+          configuration = solution_configurations.GetByIdentifier(
+              configuration_name, configuration_platform)
+
+          self.WriteLine('\t\t{0:s}|{1:s} = {0:s}|{1:s}'.format(
+              configuration.name, configuration.platform))
+
+      self.WriteLine('\tEndGlobalSection')
+
+    if solution_configurations.number_of_configurations > 0:
+      self.WriteLine(
+          '\tGlobalSection(ProjectConfigurationPlatforms) = postSolution')
+
+      for configuration_platform in sorted(solution_configurations.platforms):
+        for solution_project in solution_projects:
+          for configuration_name in sorted(solution_configurations.names):
+            configuration = solution_configurations.GetByIdentifier(
+                configuration_name, configuration_platform)
+
+            self.WriteLine((
+                '\t\t{{{0:s}}}.{1:s}|{2:s}.ActiveCfg = '
+                '{1:s}|{2:s}').format(
+                    solution_project.guid.upper(), configuration.name,
+                    configuration.platform))
+            self.WriteLine((
+                '\t\t{{{0:s}}}.{1:s}|{2:s}.Build.0 = {1:s}|{2:s}').format(
+                    solution_project.guid.upper(), configuration.name,
+                    configuration.platform))
+
+      self.WriteLine('\tEndGlobalSection')
+
+    self.WriteLines([
+        '\tGlobalSection(SolutionProperties) = preSolution',
+        '\t\tHideSolutionNode = FALSE',
+        '\tEndGlobalSection',
+        'EndGlobal'])
@@ -0,0 +1,665 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio 2010 project and solution file writers."""
+
+import re
+
+from msvscpp import interface
+
+
+class VS2010ProjectFileWriter(interface.VSProjectFileWriter):
+  """Visual Studio 2010 project file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project file writer."""
+    super(VS2010ProjectFileWriter, self).__init__()
+    self._project_file_version = '10.0.40219.1'
+    self._tools_version = '4.0'
+    self._version = 2010
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self._file.write('\xef\xbb\xbf')
+    self.WriteLines([
+        '<?xml version="1.0" encoding="utf-8"?>',
+        ('<Project DefaultTargets="Build" ToolsVersion="{0:s}" '
+         'xmlns="http://schemas.microsoft.com/developer/msbuild/2003">').format(
+             self._tools_version)])
+
+  def WriteProjectConfigurations(self, project_configurations):
+    """Writes the project configurations.
+
+    Args:
+      project_configurations (VSConfigurations): configurations.
+    """
+    self.WriteLine('  <ItemGroup Label="ProjectConfigurations">')
+
+    for project_configuration in project_configurations.GetSorted():
+      self.WriteLine('    <ProjectConfiguration Include="{0:s}|{1:s}">'.format(
+          project_configuration.name, project_configuration.platform))
+
+      self.WriteLine('      <Configuration>{0:s}</Configuration>'.format(
+          project_configuration.name))
+
+      self.WriteLine('      <Platform>{0:s}</Platform>'.format(
+          project_configuration.platform))
+
+      self.WriteLine('    </ProjectConfiguration>')
+
+    self.WriteLine('  </ItemGroup>')
+
+  def WriteProjectInformation(self, project_information):
+    """Writes the project information.
+
+    Args:
+      project_information (VSProjectInformation): project information.
+    """
+    self.WriteLine('  <PropertyGroup Label="Globals">')
+
+    self.WriteLine('    <ProjectGuid>{{{0:s}}}</ProjectGuid>'.format(
+        project_information.guid))
+
+    self.WriteLine('    <RootNamespace>{0:s}</RootNamespace>'.format(
+        project_information.root_name_space))
+
+    if project_information.keyword:
+      self.WriteLine('    <Keyword>{0:s}</Keyword>'.format(
+          project_information.keyword))
+
+    self.WriteLine('  </PropertyGroup>')
+
+  def _WriteConfigurationPropertyGroup(self, project_configuration):
+    """Writes the configuration property group.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine((
+        '  <PropertyGroup Condition="\'$(Configuration)|$(Platform)\'=='
+        '\'{0:s}|{1:s}\'" Label="Configuration">').format(
+            project_configuration.name, project_configuration.platform))
+
+    self.WriteLine('    <ConfigurationType>{0:s}</ConfigurationType>'.format(
+        project_configuration.output_type_string))
+
+    if project_configuration.character_set:
+      self.WriteLine('    <CharacterSet>{0:s}</CharacterSet>'.format(
+          project_configuration.character_set_string))
+
+    if project_configuration.managed_extensions == '1':
+      self.WriteLine('    <CLRSupport>true</CLRSupport>')
+
+    if project_configuration.whole_program_optimization:
+      self.WriteLine((
+          '    <WholeProgramOptimization>{0:s}'
+          '</WholeProgramOptimization>').format(
+              project_configuration.whole_program_optimization_string))
+
+    platform_toolset = project_configuration.GetPlatformToolset(self._version)
+    if platform_toolset:
+      self.WriteLine('    <PlatformToolset>{0:s}</PlatformToolset>'.format(
+          platform_toolset))
+
+    self.WriteLine('  </PropertyGroup>')
+
+  def _WriteOutIntDirConditions(
+      self, configuration_name, project_configurations):
+    """Writes the OutDir and IntDir conditions.
+
+    Args:
+      configuration_name (str): name of the configuration.
+      project_configurations (VSConfigurations): configurations.
+    """
+    for configuration_platform in sorted(project_configurations.platforms):
+      project_configuration = project_configurations.GetByIdentifier(
+          configuration_name, configuration_platform)
+
+      self.WriteLine((
+          '    <OutDir Condition="\'$(Configuration)|$(Platform)\'=='
+          '\'{0:s}|{1:s}\'">$(SolutionDir)$(Configuration)\\'
+          '</OutDir>').format(
+              project_configuration.name, project_configuration.platform))
+
+    for configuration_platform in sorted(project_configurations.platforms):
+      project_configuration = project_configurations.GetByIdentifier(
+          configuration_name, configuration_platform)
+
+      self.WriteLine((
+          '    <IntDir Condition="\'$(Configuration)|$(Platform)\'=='
+          '\'{0:s}|{1:s}\'">$(Configuration)\\</IntDir>').format(
+              project_configuration.name, project_configuration.platform))
+
+  def _WriteOutIntDirPropertyGroups(self, project_configurations):
+    """Writes the OutDir and IntDir property groups.
+
+    Args:
+      project_configurations (VSConfigurations): configurations.
+    """
+    self.WriteLines([
+        '  <PropertyGroup>',
+        '    <_ProjectFileVersion>{0:s}</_ProjectFileVersion>'.format(
+            self._project_file_version)])
+
+    # Mimic Visual Studio behavior and output the configurations
+    # in platforms by name.
+    for configuration_name in sorted(project_configurations.names):
+      self._WriteOutIntDirConditions(configuration_name, project_configurations)
+
+      for configuration_platform in sorted(project_configurations.platforms):
+        project_configuration = project_configurations.GetByIdentifier(
+            configuration_name, configuration_platform)
+
+        if project_configuration.link_incremental != '':
+          self.WriteLine((
+              '    <LinkIncremental Condition="\'$(Configuration)|'
+              '$(Platform)\'==\'{0:s}|{1:s}\'">{2:s}</LinkIncremental>').format(
+                  project_configuration.name, project_configuration.platform,
+                  project_configuration.link_incremental_string))
+
+    self.WriteLine('  </PropertyGroup>')
+
+  def _WriteClCompileSection(self, project_configuration):
+    """Writes the CLCompile section.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    include_directories = re.sub(
+        r'&quot;', r'', project_configuration.include_directories)
+
+    if include_directories and include_directories[-1] != ';':
+      include_directories = '{0:s};'.format(
+          include_directories)
+
+    include_directories = '{0:s}%(AdditionalIncludeDirectories)'.format(
+        include_directories)
+
+    preprocessor_definitions = project_configuration.preprocessor_definitions
+
+    if preprocessor_definitions and preprocessor_definitions[-1] != ';':
+      preprocessor_definitions = '{0:s};'.format(preprocessor_definitions)
+
+    preprocessor_definitions = '{0:s}%(PreprocessorDefinitions)'.format(
+        preprocessor_definitions)
+
+    self.WriteLine('    <ClCompile>')
+
+    if project_configuration.optimization != '':
+      self.WriteLine('      <Optimization>{0:s}</Optimization>'.format(
+          project_configuration.optimization_string))
+
+    if project_configuration.enable_intrinsic_functions != '':
+      self.WriteLine((
+          '      <IntrinsicFunctions>{0:s}</IntrinsicFunctions>').format(
+              project_configuration.enable_intrinsic_functions))
+
+    if project_configuration.whole_program_optimization:
+      self.WriteLine((
+          '      <WholeProgramOptimization>{0:s}'
+          '</WholeProgramOptimization>').format(
+              project_configuration.whole_program_optimization_string))
+
+    self.WriteLine((
+        '      <AdditionalIncludeDirectories>{0:s}'
+        '</AdditionalIncludeDirectories>').format(include_directories))
+
+    self.WriteLine((
+        '      <PreprocessorDefinitions>{0:s}'
+        '</PreprocessorDefinitions>').format(preprocessor_definitions))
+
+    if project_configuration.basic_runtime_checks != '':
+      self.WriteLine((
+          '      <BasicRuntimeChecks>{0:s}'
+          '</BasicRuntimeChecks>').format(
+              project_configuration.basic_runtime_checks_string))
+
+    if project_configuration.smaller_type_check != '':
+      self.WriteLine((
+          '      <SmallerTypeCheck>{0:s}</SmallerTypeCheck>').format(
+              project_configuration.smaller_type_check))
+
+    self.WriteLine((
+        '      <RuntimeLibrary>{0:s}</RuntimeLibrary>').format(
+            project_configuration.runtime_librarian_string))
+
+    if project_configuration.enable_function_level_linking != '':
+      self.WriteLine((
+          '      <FunctionLevelLinking>{0:s}</FunctionLevelLinking>').format(
+              project_configuration.enable_function_level_linking))
+
+    if project_configuration.precompiled_header != '':
+      # A value of 0 is represented by a new line.
+      if project_configuration.precompiled_header == '0':
+        self.WriteLines([
+            '      <PrecompiledHeader>',
+            '      </PrecompiledHeader>'])
+      else:
+        self.WriteLine((
+            '      <PrecompiledHeader>{0:s}</PrecompiledHeader>').format(
+                project_configuration.precompiled_header_string))
+
+    self.WriteLine('      <WarningLevel>{0:s}</WarningLevel>'.format(
+        project_configuration.warning_level_string))
+
+    if project_configuration.warning_as_error:
+      self.WriteLine((
+          '      <TreatWarningAsError>{0:s}'
+          '</TreatWarningAsError>').format(
+              project_configuration.warning_as_error))
+
+    if project_configuration.debug_information_format != '':
+      # A value of 0 is represented by a new line.
+      if project_configuration.debug_information_format == '0':
+        self.WriteLines([
+            '      <DebugInformationFormat>',
+            '      </DebugInformationFormat>'])
+      else:
+        self.WriteLine((
+            '      <DebugInformationFormat>{0:s}'
+            '</DebugInformationFormat>').format(
+                project_configuration.debug_information_format_string))
+
+    if project_configuration.compile_as:
+      self.WriteLine('      <CompileAs>{0:s}</CompileAs>'.format(
+          project_configuration.compile_as_string))
+
+    self.WriteLine('    </ClCompile>')
+
+  def _WriteLibrarianSection(self, project_configuration):
+    """Writes the librarian section.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    librarian_output_file = re.sub(
+        r'[$][(]OutDir[)]\\', r'$(OutDir)',
+        project_configuration.librarian_output_file)
+
+    self.WriteLines([
+        '    <Lib>',
+        '      <OutputFile>{0:s}</OutputFile>'.format(librarian_output_file)])
+
+    if project_configuration.module_definition_file != '':
+      self.WriteLine((
+          '      <ModuleDefinitionFile>{0:s}'
+          '</ModuleDefinitionFile>').format(
+              project_configuration.module_definition_file))
+    else:
+      self.WriteLines([
+          '      <ModuleDefinitionFile>',
+          '      </ModuleDefinitionFile>'])
+
+    if project_configuration.librarian_ignore_defaults != '':
+      self.WriteLine((
+          '      <IgnoreAllDefaultLibraries>{0:s}'
+          '</IgnoreAllDefaultLibraries>').format(
+              project_configuration.librarian_ignore_defaults))
+
+    self.WriteLine('    </Lib>')
+
+  def _WriteLinkerSection(self, project_configuration):
+    """Writes the linker section.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine('    <Link>')
+
+    # Visual Studio will convert an empty additional dependencies value.
+    if project_configuration.additional_dependencies:
+      additional_dependencies = ';'.join(
+          sorted(project_configuration.additional_dependencies))
+
+      additional_dependencies = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)', additional_dependencies)
+
+      if additional_dependencies and additional_dependencies[-1] != ';':
+        additional_dependencies = '{0:s};'.format(additional_dependencies)
+
+      additional_dependencies = '{0:s}%(AdditionalDependencies)'.format(
+          additional_dependencies)
+
+      self.WriteLine((
+          '      <AdditionalDependencies>{0:s}'
+          '</AdditionalDependencies>').format(
+              additional_dependencies))
+
+    if project_configuration.linker_output_file:
+      linker_output_file = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)',
+          project_configuration.linker_output_file)
+
+      self.WriteLine('      <OutputFile>{0:s}</OutputFile>'.format(
+          linker_output_file))
+
+      if project_configuration.module_definition_file != '':
+        self.WriteLine((
+            '      <ModuleDefinitionFile>{0:s}'
+            '</ModuleDefinitionFile>').format(
+                project_configuration.module_definition_file))
+
+    if project_configuration.library_directories:
+      library_directories = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)',
+          project_configuration.library_directories)
+      library_directories = re.sub(
+          r'&quot;', r'', library_directories)
+
+      if library_directories and library_directories[-1] != ';':
+        library_directories = '{0:s};'.format(library_directories)
+
+      library_directories = '{0:s}%(AdditionalLibraryDirectories)'.format(
+          library_directories)
+
+      self.WriteLine((
+          '      <AdditionalLibraryDirectories>{0:s}'
+          '</AdditionalLibraryDirectories>').format(
+              library_directories))
+
+    if project_configuration.generate_debug_information != '':
+      self.WriteLine((
+          '      <GenerateDebugInformation>{0:s}'
+          '</GenerateDebugInformation>').format(
+              project_configuration.generate_debug_information))
+
+    if project_configuration.sub_system != '':
+      self.WriteLine('      <SubSystem>{0:s}</SubSystem>'.format(
+          project_configuration.sub_system_string))
+
+    if project_configuration.optimize_references == '0':
+      self.WriteLines([
+          '      <OptimizeReferences>',
+          '      </OptimizeReferences>'])
+
+    elif project_configuration.optimize_references != '':
+      self.WriteLine((
+          '      <OptimizeReferences>{0:s}</OptimizeReferences>').format(
+              project_configuration.optimize_references_string))
+
+    if project_configuration.enable_comdat_folding == '0':
+      self.WriteLines([
+          '      <EnableCOMDATFolding>',
+          '      </EnableCOMDATFolding>'])
+
+    elif project_configuration.enable_comdat_folding != '':
+      self.WriteLine((
+          '      <EnableCOMDATFolding>{0:s}</EnableCOMDATFolding>').format(
+              project_configuration.enable_comdat_folding_string))
+
+    if project_configuration.randomized_base_address != '':
+      self.WriteLine((
+          '      <RandomizedBaseAddress>{0:s}'
+          '</RandomizedBaseAddress>').format(
+              project_configuration.randomized_base_address_string))
+
+    if project_configuration.fixed_base_address == '0':
+      self.WriteLines([
+          '      <FixedBaseAddress>',
+          '      </FixedBaseAddress>'])
+
+    if project_configuration.data_execution_prevention != '':
+      # A value of 0 is represented by a new line.
+      if project_configuration.data_execution_prevention == '0':
+        self.WriteLines([
+            '      <DataExecutionPrevention>',
+            '      </DataExecutionPrevention>'])
+      else:
+        self.WriteLine((
+            '      <DataExecutionPrevention>{0:s}'
+            '</DataExecutionPrevention>').format(
+                project_configuration.data_execution_prevention_string))
+
+    if project_configuration.import_library:
+      import_library = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)',
+          project_configuration.import_library)
+
+      self.WriteLine('      <ImportLibrary>{0:s}</ImportLibrary>'.format(
+          import_library))
+
+    if project_configuration.target_machine != '':
+      self.WriteLine('      <TargetMachine>{0:s}</TargetMachine>'.format(
+          project_configuration.target_machine_string))
+
+    self.WriteLine('    </Link>')
+
+  def _WriteItemDefinitionGroup(self, project_configuration):
+    """Writes the item definition group.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine((
+        '  <ItemDefinitionGroup Condition="\'$(Configuration)|'
+        '$(Platform)\'==\'{0:s}|{1:s}\'">').format(
+            project_configuration.name, project_configuration.platform))
+
+    # Write the compiler specific section.
+    self._WriteClCompileSection(project_configuration)
+
+    # Write the librarian specific section.
+    if project_configuration.librarian_output_file:
+      self._WriteLibrarianSection(project_configuration)
+
+    # Write the linker specific section.
+    if project_configuration.linker_values_set:
+      self._WriteLinkerSection(project_configuration)
+
+    self.WriteLine('  </ItemDefinitionGroup>')
+
+  def WriteConfigurations(self, project_configurations):
+    """Writes the configurations.
+
+    Args:
+      project_configurations (VSConfigurations): configurations.
+    """
+    self.WriteLine(
+        '  <Import Project="$(VCTargetsPath)\\Microsoft.Cpp.Default.props" />')
+
+    # Mimic Visual Studio behavior and output the configurations
+    # in reverse order of name.
+    for project_configuration in project_configurations.GetSorted(reverse=True):
+      self._WriteConfigurationPropertyGroup(project_configuration)
+
+    self.WriteLines([
+        '  <Import Project="$(VCTargetsPath)\\Microsoft.Cpp.props" />',
+        '  <ImportGroup Label="ExtensionSettings">',
+        '  </ImportGroup>'])
+
+    # Mimic Visual Studio behavior and output the configurations
+    # in reverse of name.
+    for project_configuration in project_configurations.GetSorted(reverse=True):
+      self.WriteLines([
+          ('  <ImportGroup Condition="\'$(Configuration)|$(Platform)\'=='
+           '\'{0:s}|{1:s}\'" Label="PropertySheets">'.format(
+               project_configuration.name, project_configuration.platform)),
+          ('    <Import Project="$(UserRootDir)\\Microsoft.Cpp.$(Platform)'
+           '.user.props" Condition="exists(\'$(UserRootDir)\\Microsoft.Cpp'
+           '.$(Platform).user.props\')" Label="LocalAppDataPlatform" />'),
+          '  </ImportGroup>'])
+
+    self.WriteLine('  <PropertyGroup Label="UserMacros" />')
+
+    self._WriteOutIntDirPropertyGroups(project_configurations)
+
+    for project_configuration in project_configurations.GetSorted():
+      self._WriteItemDefinitionGroup(project_configuration)
+
+  def _WriteSourceFiles(self, source_files):
+    """Writes the source files.
+
+    Args:
+      source_files (list[str]): source filenames.
+    """
+    if len(source_files) > 0:
+      self.WriteLine('  <ItemGroup>')
+
+      for filename in source_files:
+        self.WriteLine('    <ClCompile Include="{0:s}" />'.format(filename))
+
+      self.WriteLine('  </ItemGroup>')
+
+  def _WriteHeaderFiles(self, header_files):
+    """Writes the header files.
+
+    Args:
+      header_files (list[str]): header filenames.
+    """
+    if len(header_files) > 0:
+      self.WriteLine('  <ItemGroup>')
+
+      for filename in header_files:
+        self.WriteLine('    <ClInclude Include="{0:s}" />'.format(filename))
+
+      self.WriteLine('  </ItemGroup>')
+
+  def _WriteResourceFiles(self, resource_files):
+    """Writes the resource files.
+
+    Args:
+      resource_files (list[str]): resource filenames.
+    """
+    if len(resource_files) > 0:
+      self.WriteLine('  <ItemGroup>')
+
+      for filename in resource_files:
+        self.WriteLine('    <ResourceCompile Include="{0:s}" />'.format(
+            filename))
+
+      self.WriteLine('  </ItemGroup>')
+
+  def WriteFiles(self, source_files, header_files, resource_files):
+    """Writes the files.
+
+    Args:
+      source_files (list[str]): source filenames.
+      header_files (list[str]): header filenames.
+      resource_files (list[str]): resource filenames.
+    """
+    self._WriteSourceFiles(source_files)
+    self._WriteHeaderFiles(header_files)
+    self._WriteResourceFiles(resource_files)
+
+  def WriteDependencies(self, dependencies, solution_projects_by_guid):
+    """Writes the dependencies.
+
+    Args:
+      dependencies (list[str]): GUIDs of the dependencies.
+      solution_projects_by_guid (dict[str, VSSolutionProject]): projects
+          per lower case GUID.
+    """
+    if len(dependencies) > 0:
+      self.WriteLine('  <ItemGroup>')
+
+      dependencies_by_name = {}
+
+      # Mimic Visual Studio behavior and ouput the depencies in order
+      # of name (perhaps filename?).
+      for dependency_guid in dependencies:
+        dependency_project = solution_projects_by_guid[dependency_guid]
+
+        dependencies_by_name[dependency_project.name] = dependency_project
+
+      for dependency_name in sorted(dependencies_by_name.keys()):
+        dependency_project = dependencies_by_name[dependency_name]
+
+        dependency_filename = '..\\{0:s}.vcxproj'.format(
+            dependency_project.filename)
+
+        dependency_guid = dependency_project.guid.lower()
+
+        self.WriteLines([
+            ('    <ProjectReference Include="{0:s}">').format(
+                dependency_filename),
+            '      <Project>{{{0:s}}}</Project>'.format(dependency_guid),
+            '      <ReferenceOutputAssembly>false</ReferenceOutputAssembly>',
+            '    </ProjectReference>'])
+
+      self.WriteLine('  </ItemGroup>')
+
+  def WriteFooter(self):
+    """Writes a file footer."""
+    self.WriteLines([
+        '  <Import Project="$(VCTargetsPath)\\Microsoft.Cpp.targets" />',
+        '  <ImportGroup Label="ExtensionTargets">',
+        '  </ImportGroup>'])
+
+    # The last line has no \r\n.
+    self._file.write('</Project>')
+
+
+class VS2010SolutionFileWriter(interface.VSSolutionFileWriter):
+  """Visual Studio 2010 solution file writer."""
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self.WriteLines([
+        '\xef\xbb\xbf',
+        'Microsoft Visual Studio Solution File, Format Version 11.00',
+        '# Visual C++ Express 2010'])
+
+  def WriteProject(self, solution_project):
+    """Writes a project section.
+
+    Args:
+      solution_project (VSSolutionProject): project.
+    """
+    solution_project_filename = '{0:s}.vcxproj'.format(
+        solution_project.filename)
+
+    self.WriteLine((
+        'Project("{{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}}") = "{0:s}", '
+        '"{1:s}", "{{{2:s}}}"').format(
+            solution_project.name, solution_project_filename,
+            solution_project.guid.upper()))
+
+    self.WriteLine('EndProject')
+
+  def WriteConfigurations(self, solution_configurations, solution_projects):
+    """Writes the configurations.
+
+    Args:
+      solution_configurations (VSConfigurations): configurations.
+      solution_projects (list[VSSolutionProject]): projects.
+    """
+    self.WriteLine('Global')
+
+    if solution_configurations.number_of_configurations > 0:
+      self.WriteLine(
+          '\tGlobalSection(SolutionConfigurationPlatforms) = preSolution')
+
+      for configuration_platform in sorted(solution_configurations.platforms):
+        for configuration_name in sorted(solution_configurations.names):
+          configuration = solution_configurations.GetByIdentifier(
+              configuration_name, configuration_platform)
+
+          self.WriteLine('\t\t{0:s}|{1:s} = {0:s}|{1:s}'.format(
+              configuration.name, configuration.platform))
+
+      self.WriteLine('\tEndGlobalSection')
+
+    if solution_configurations.number_of_configurations > 0:
+      self.WriteLine(
+          '\tGlobalSection(ProjectConfigurationPlatforms) = postSolution')
+
+      for configuration_platform in sorted(solution_configurations.platforms):
+        for solution_project in solution_projects:
+          for configuration_name in sorted(solution_configurations.names):
+            configuration = solution_configurations.GetByIdentifier(
+                configuration_name, configuration_platform)
+
+            self.WriteLine((
+                '\t\t{{{0:s}}}.{1:s}|{2:s}.ActiveCfg = {1:s}|{2:s}').format(
+                    solution_project.guid.upper(), configuration.name,
+                    configuration.platform))
+            self.WriteLine((
+                '\t\t{{{0:s}}}.{1:s}|{2:s}.Build.0 = {1:s}|{2:s}').format(
+                    solution_project.guid.upper(), configuration.name,
+                    configuration.platform))
+
+      self.WriteLine('\tEndGlobalSection')
+
+    self.WriteLines([
+        '\tGlobalSection(SolutionProperties) = preSolution',
+        '\t\tHideSolutionNode = FALSE',
+        '\tEndGlobalSection',
+        'EndGlobal'])
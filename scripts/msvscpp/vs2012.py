@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio 2012 project and solution file writers."""
+
+import re
+
+from msvscpp import vs2010
+
+
+class VS2012ProjectFileWriter(vs2010.VS2010ProjectFileWriter):
+  """Visual Studio 2012 project file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project file writer."""
+    super(VS2012ProjectFileWriter, self).__init__()
+    self._project_file_version = '11.0.61030.0'
+    self._tools_version = '4.0'
+    self._version = 2012
+
+  def _WriteConfigurationPropertyGroup(self, project_configuration):
+    """Writes the configuration property group.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine((
+        '  <PropertyGroup Condition="\'$(Configuration)|$(Platform)\'=='
+        '\'{0:s}|{1:s}\'" Label="Configuration">').format(
+            project_configuration.name, project_configuration.platform))
+
+    self.WriteLine('    <ConfigurationType>{0:s}</ConfigurationType>'.format(
+        project_configuration.output_type_string))
+
+    platform_toolset = project_configuration.GetPlatformToolset(self._version)
+    if platform_toolset:
+      self.WriteLine('    <PlatformToolset>{0:s}</PlatformToolset>'.format(
+          platform_toolset))
+
+    if project_configuration.character_set:
+      self.WriteLine('    <CharacterSet>{0:s}</CharacterSet>'.format(
+          project_configuration.character_set_string))
+
+    if project_configuration.managed_extensions == '1':
+      self.WriteLine('    <CLRSupport>true</CLRSupport>')
+
+    if project_configuration.whole_program_optimization:
+      self.WriteLine((
+          '    <WholeProgramOptimization>{0:s}'
+          '</WholeProgramOptimization>').format(
+              project_configuration.whole_program_optimization_string))
+
+    self.WriteLine('  </PropertyGroup>')
+
+  def _WriteOutIntDirConditions(
+      self, configuration_name, project_configurations):
+    """Writes the OutDir and IntDir conditions.
+
+    Args:
+      configuration_name (str): name of the configuration.
+      project_configurations (VSConfigurations): configurations.
+    """
+    for configuration_platform in sorted(project_configurations.platforms):
+      project_configuration = project_configurations.GetByIdentifier(
+          configuration_name, configuration_platform)
+
+      self.WriteLines([
+          ('  <PropertyGroup Condition="\'$(Configuration)|$(Platform)\'=='
+           '\'{0:s}|{1:s}\'">').format(
+               project_configuration.name, project_configuration.platform),
+          '    <OutDir>$(SolutionDir)$(Configuration)\\</OutDir>',
+          '    <IntDir>$(Configuration)\\</IntDir>'])
+
+      if project_configuration.linker_values_set:
+        self.WriteLine('    <LinkIncremental>false</LinkIncremental>')
+
+      self.WriteLine('  </PropertyGroup>')
+
+  def _WriteOutIntDirPropertyGroups(self, project_configurations):
+    """Writes the OutDir and IntDir property groups.
+
+    Args:
+      project_configurations (VSConfigurations): configurations.
+    """
+    self.WriteLines([
+        '  <PropertyGroup>',
+        '    <_ProjectFileVersion>{0:s}</_ProjectFileVersion>'.format(
+            self._project_file_version),
+        '  </PropertyGroup>'])
+
+    # Mimic Visual Studio behavior and output the configurations
+    # in platforms by name.
+    for configuration_name in sorted(project_configurations.names):
+      self._WriteOutIntDirConditions(configuration_name, project_configurations)
+
+      # for configuration_platform in sorted(project_configurations.platforms):
+      #   project_configuration = project_configurations.GetByIdentifier(
+      #       configuration_name, configuration_platform)
+
+      #   if project_configuration.link_incremental != '':
+      #     self.WriteLine((
+      #         '    <LinkIncremental Condition="\'$(Configuration)|'
+      #         '$(Platform)\'==\'{0:s}|{1:s}\'">{2:s}'
+      #         '</LinkIncremental>').format(
+      #             project_configuration.name, project_configuration.platform,
+      #             project_configuration.link_incremental_string))
+
+  def _WriteClCompileSection(self, project_configuration):
+    """Writes the CLCompile section.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    include_directories = re.sub(
+        r'&quot;', r'', project_configuration.include_directories)
+
+    if include_directories and include_directories[-1] != ';':
+      include_directories = '{0:s};'.format(
+          include_directories)
+
+    include_directories = '{0:s}%(AdditionalIncludeDirectories)'.format(
+        include_directories)
+
+    preprocessor_definitions = project_configuration.preprocessor_definitions
+
+    if preprocessor_definitions and preprocessor_definitions[-1] != ';':
+      preprocessor_definitions = '{0:s};'.format(preprocessor_definitions)
+
+    preprocessor_definitions = '{0:s}%(PreprocessorDefinitions)'.format(
+        preprocessor_definitions)
+
+    self.WriteLine('    <ClCompile>')
+
+    if project_configuration.optimization != '':
+      self.WriteLine('      <Optimization>{0:s}</Optimization>'.format(
+          project_configuration.optimization_string))
+
+    if project_configuration.enable_intrinsic_functions != '':
+      self.WriteLine((
+          '      <IntrinsicFunctions>{0:s}</IntrinsicFunctions>').format(
+              project_configuration.enable_intrinsic_functions))
+
+    self.WriteLine((
+        '      <AdditionalIncludeDirectories>{0:s}'
+        '</AdditionalIncludeDirectories>').format(include_directories))
+
+    self.WriteLine((
+        '      <PreprocessorDefinitions>{0:s}'
+        '</PreprocessorDefinitions>').format(preprocessor_definitions))
+
+    if project_configuration.basic_runtime_checks != '':
+      self.WriteLine((
+          '      <BasicRuntimeChecks>{0:s}'
+          '</BasicRuntimeChecks>').format(
+              project_configuration.basic_runtime_checks_string))
+
+    if project_configuration.smaller_type_check != '':
+      self.WriteLine((
+          '      <SmallerTypeCheck>{0:s}</SmallerTypeCheck>').format(
+              project_configuration.smaller_type_check))
+
+    self.WriteLine((
+        '      <RuntimeLibrary>{0:s}</RuntimeLibrary>').format(
+            project_configuration.runtime_librarian_string))
+
+    if project_configuration.enable_function_level_linking != '':
+      self.WriteLine((
+          '      <FunctionLevelLinking>{0:s}</FunctionLevelLinking>').format(
+              project_configuration.enable_function_level_linking))
+
+    if project_configuration.precompiled_header != '':
+      # A value of 0 is represented by an empty XML tag.
+      if project_configuration.precompiled_header == '0':
+        self.WriteLine('      <PrecompiledHeader />')
+      else:
+        self.WriteLine((
+            '      <PrecompiledHeader>{0:s}</PrecompiledHeader>').format(
+                project_configuration.precompiled_header_string))
+
+    self.WriteLine('      <WarningLevel>{0:s}</WarningLevel>'.format(
+        project_configuration.warning_level_string))
+
+    if project_configuration.warning_as_error:
+      self.WriteLine((
+          '      <TreatWarningAsError>{0:s}'
+          '</TreatWarningAsError>').format(
+              project_configuration.warning_as_error))
+
+    if project_configuration.debug_information_format != '':
+      # A value of 0 is represented by an empty XML tag.
+      if project_configuration.debug_information_format == '0':
+        self.WriteLine('      <DebugInformationFormat />')
+      else:
+        self.WriteLine((
+            '      <DebugInformationFormat>{0:s}'
+            '</DebugInformationFormat>').format(
+                project_configuration.debug_information_format_string))
+
+    if project_configuration.compile_as:
+      self.WriteLine('      <CompileAs>{0:s}</CompileAs>'.format(
+          project_configuration.compile_as_string))
+
+    self.WriteLine('    </ClCompile>')
+
+  def _WriteLibrarianSection(self, project_configuration):
+    """Writes the librarian section.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    librarian_output_file = re.sub(
+        r'[$][(]OutDir[)]\\', r'$(OutDir)',
+        project_configuration.librarian_output_file)
+
+    self.WriteLines([
+        '    <Lib>',
+        '      <OutputFile>{0:s}</OutputFile>'.format(librarian_output_file)])
+
+    if project_configuration.module_definition_file != '':
+      self.WriteLine((
+          '      <ModuleDefinitionFile>{0:s}'
+          '</ModuleDefinitionFile>').format(
+              project_configuration.module_definition_file))
+    else:
+      self.WriteLine('      <ModuleDefinitionFile />')
+
+    if project_configuration.librarian_ignore_defaults != '':
+      self.WriteLine((
+          '      <IgnoreAllDefaultLibraries>{0:s}'
+          '</IgnoreAllDefaultLibraries>').format(
+              project_configuration.librarian_ignore_defaults))
+
+    self.WriteLine('    </Lib>')
+
+  def _WriteLinkerSection(self, project_configuration):
+    """Writes the linker section.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine('    <Link>')
+
+    # Visual Studio will convert an empty additional dependencies value.
+    if project_configuration.additional_dependencies:
+      additional_dependencies = ';'.join(
+          sorted(project_configuration.additional_dependencies))
+
+      additional_dependencies = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)', additional_dependencies)
+
+      if additional_dependencies and additional_dependencies[-1] != ';':
+        additional_dependencies = '{0:s};'.format(additional_dependencies)
+
+      additional_dependencies = (
+          '{0:s}%(AdditionalDependencies)').format(
+              additional_dependencies)
+
+      self.WriteLine((
+          '      <AdditionalDependencies>{0:s}'
+          '</AdditionalDependencies>').format(
+              additional_dependencies))
+
+    if project_configuration.linker_output_file:
+      linker_output_file = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)',
+          project_configuration.linker_output_file)
+
+      self.WriteLine('      <OutputFile>{0:s}</OutputFile>'.format(
+          linker_output_file))
+
+      if project_configuration.module_definition_file != '':
+        self.WriteLine((
+            '      <ModuleDefinitionFile>{0:s}'
+            '</ModuleDefinitionFile>').format(
+                project_configuration.module_definition_file))
+
+    if project_configuration.library_directories:
+      library_directories = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)',
+          project_configuration.library_directories)
+      library_directories = re.sub(
+          r'&quot;', r'', library_directories)
+
+      if library_directories and library_directories[-1] != ';':
+        library_directories = '{0:s};'.format(library_directories)
+
+      library_directories = (
+          '{0:s}%(AdditionalLibraryDirectories)').format(
+              library_directories)
+
+      self.WriteLine((
+          '      <AdditionalLibraryDirectories>{0:s}'
+          '</AdditionalLibraryDirectories>').format(
+              library_directories))
+
+    if project_configuration.generate_debug_information != '':
+      self.WriteLine((
+          '      <GenerateDebugInformation>{0:s}'
+          '</GenerateDebugInformation>').format(
+              project_configuration.generate_debug_information))
+
+    if project_configuration.sub_system != '':
+      self.WriteLine('      <SubSystem>{0:s}</SubSystem>'.format(
+          project_configuration.sub_system_string))
+
+    if project_configuration.optimize_references == '0':
+      self.WriteLine('      <OptimizeReferences />')
+
+    elif project_configuration.optimize_references != '':
+      self.WriteLine((
+          '      <OptimizeReferences>{0:s}</OptimizeReferences>').format(
+              project_configuration.optimize_references_string))
+
+    if project_configuration.enable_comdat_folding == '0':
+      self.WriteLine('      <EnableCOMDATFolding />')
+
+    elif project_configuration.enable_comdat_folding != '':
+      self.WriteLine((
+          '      <EnableCOMDATFolding>{0:s}</EnableCOMDATFolding>').format(
+              project_configuration.enable_comdat_folding_string))
+
+    if project_configuration.randomized_base_address != '':
+      self.WriteLine((
+          '      <RandomizedBaseAddress>{0:s}'
+          '</RandomizedBaseAddress>').format(
+              project_configuration.randomized_base_address_string))
+
+    if project_configuration.fixed_base_address == '0':
+      # A value of 0 is represented by an empty XML tag.
+      self.WriteLine('      <FixedBaseAddress />')
+
+    if project_configuration.data_execution_prevention != '':
+      # A value of 0 is represented by an empty XML tag.
+      if project_configuration.data_execution_prevention == '0':
+        self.WriteLine('      <DataExecutionPrevention />')
+      else:
+        self.WriteLine((
+            '      <DataExecutionPrevention>{0:s}'
+            '</DataExecutionPrevention>').format(
+                project_configuration.data_execution_prevention_string))
+
+    if (project_configuration.target_machine != '' and
+        project_configuration.linker_values_set):
+      self.WriteLine('      <TargetMachine>{0:s}</TargetMachine>'.format(
+          project_configuration.target_machine_string))
+
+    if project_configuration.import_library:
+      import_library = re.sub(
+          r'[$][(]OutDir[)]\\', r'$(OutDir)',
+          project_configuration.import_library)
+
+      self.WriteLine('      <ImportLibrary>{0:s}</ImportLibrary>'.format(
+          import_library))
+
+    self.WriteLine('    </Link>')
+
+  def _WriteItemDefinitionGroup(self, project_configuration):
+    """Writes the item definition group.
+
+    Args:
+      project_configuration (VSProjectConfiguration): configuration.
+    """
+    self.WriteLine((
+        '  <ItemDefinitionGroup Condition="\'$(Configuration)|'
+        '$(Platform)\'==\'{0:s}|{1:s}\'">').format(
+            project_configuration.name, project_configuration.platform))
+
+    # Write the compiler specific section.
+    self._WriteClCompileSection(project_configuration)
+
+    # Write the librarian specific section.
+    if project_configuration.librarian_output_file:
+      self._WriteLibrarianSection(project_configuration)
+
+    # Write the linker specific section.
+    if project_configuration.linker_values_set:
+      self._WriteLinkerSection(project_configuration)
+
+    self.WriteLine('  </ItemDefinitionGroup>')
+
+
+class VS2012SolutionFileWriter(vs2010.VS2010SolutionFileWriter):
+  """Visual Studio 2012 solution file writer."""
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self.WriteLines([
+        '\xef\xbb\xbf',
+        'Microsoft Visual Studio Solution File, Format Version 12.00',
+        '# Visual Studio Express 2012 for Windows Desktop'])
+
+  def WriteProject(self, solution_project):
+    """Writes a project section.
+
+    Args:
+      solution_project (VSSolutionProject): project.
+    """
+    solution_project_filename = '{0:s}.vcxproj'.format(
+        solution_project.filename)
+
+    self.WriteLine((
+        'Project("{{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}}") = "{0:s}", '
+        '"{1:s}", "{{{2:s}}}"').format(
+            solution_project.name, solution_project_filename,
+            solution_project.guid.upper()))
+
+    # TODO: what about:
+    # '\tProjectSection(ProjectDependencies) = postProject'
+    # '\t\t{%GUID%} = {%GUID}'
+    # '\tEndProjectSection'
+
+    self.WriteLine('EndProject')
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio 2013 project and solution file writers."""
+
+from msvscpp import vs2010
+
+
+class VS2013ProjectFileWriter(vs2010.VS2010ProjectFileWriter):
+  """Visual Studio 2013 project file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project file writer."""
+    super(VS2013ProjectFileWriter, self).__init__()
+    self._project_file_version = '12.0.21005.1'
+    self._tools_version = '12.0'
+    self._version = 2013
+
+
+class VS2013SolutionFileWriter(vs2010.VS2010SolutionFileWriter):
+  """Visual Studio 2013 solution file writer."""
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self.WriteLines([
+        '\xef\xbb\xbf',
+        'Microsoft Visual Studio Solution File, Format Version 12.00',
+        '# Visual Studio Express 2013 for Windows Desktop',
+        'VisualStudioVersion = 12.0.21005.1'
+        'MinimumVisualStudioVersion = 10.0.40219.1'])
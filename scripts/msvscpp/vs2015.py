@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""The Visual Studio 2015 project and solution file writers."""
+
+from msvscpp import vs2010
+from msvscpp import vs2012
+
+
+class VS2015ProjectFileWriter(vs2012.VS2012ProjectFileWriter):
+  """Visual Studio 2015 project file writer."""
+
+  def __init__(self):
+    """Initializes a Visual Studio project file writer."""
+    super(VS2015ProjectFileWriter, self).__init__()
+    self._project_file_version = '14.0.25431.1'
+    self._tools_version = '14.0'
+    self._version = 2015
+
+  def _WriteOutIntDirConditions(
+      self, configuration_name, project_configurations):
+    """Writes the OutDir and IntDir conditions.
+
+    Args:
+      configuration_name (str): name of the configuration.
+      project_configurations (VSConfigurations): configurations.
+    """
+    for configuration_platform in sorted(project_configurations.platforms):
+      project_configuration = project_configurations.GetByIdentifier(
+          configuration_name, configuration_platform)
+
+      self.WriteLines([
+          ('  <PropertyGroup Condition="\'$(Configuration)|$(Platform)\'=='
+           '\'{0:s}|{1:s}\'">').format(
+               project_configuration.name, project_configuration.platform),
+          '    <OutDir>$(SolutionDir)$(Configuration)\\</OutDir>',
+          '    <IntDir>$(Configuration)\\</IntDir>'])
+
+      self.WriteLine('  </PropertyGroup>')
+
+
+class VS2015SolutionFileWriter(vs2010.VS2010SolutionFileWriter):
+  """Visual Studio 2015 solution file writer."""
+
+  def WriteHeader(self):
+    """Writes a file header."""
+    self.WriteLines([
+        '\xef\xbb\xbf',
+        'Microsoft Visual Studio Solution File, Format Version 12.00',
+        '# Visual Studio 14',
+        'VisualStudioVersion = 14.0.25420.1',
+        'MinimumVisualStudioVersion = 10.0.40219.1'])
@@ -0,0 +1,672 @@
+# -*- coding: utf-8 -*-
+"""The output writers of the source generation."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import difflib
+import io
+import os
+import stat
+import struct
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+
+try:
+  import Queue as queue
+except ImportError:
+  import queue  # pylint: disable=import-error
+
+
+_READ_BUFFER_SIZE = 65536
+
+
+def _ContainsData(file_path, file_data):
+  """Determines if a file contains the data.
+
+  The comparison stops at the first part of the file that differs.
+
+  Args:
+    file_path (str): path of the file.
+    file_data (bytes): data.
+
+  Returns:
+    bool: True if the file contains the data.
+  """
+  if (not os.path.isfile(file_path) or
+      os.path.getsize(file_path) != len(file_data)):
+    return False
+
+  with open(file_path, 'rb') as file_object:
+    data_offset = 0
+    while data_offset < len(file_data):
+      read_data = file_object.read(_READ_BUFFER_SIZE)
+      if not read_data:
+        return False
+
+      data_end_offset = data_offset + len(read_data)
+      if read_data != file_data[data_offset:data_end_offset]:
+        return False
+
+      data_offset = data_end_offset
+
+  return True
+
+
+def _GetArchivePath(file_path):
+  """Retrieves the path of a file in an archive.
+
+  Args:
+    file_path (str): path of the file.
+
+  Returns:
+    str: path of the file in the archive, with "/" as path segment separator.
+  """
+  path_segments = [
+      path_segment for path_segment in file_path.split(os.sep)
+      if path_segment not in ('', '.')]
+  return '/'.join(path_segments)
+
+
+def _GetFileMode(executable):
+  """Retrieves the mode of a file in an archive.
+
+  Args:
+    executable (bool): True if the file should be executable.
+
+  Returns:
+    int: mode of the file.
+  """
+  if executable:
+    return 0o755
+
+  return 0o644
+
+
+def _GetStdoutStream():
+  """Retrieves the stream to write binary data to stdout.
+
+  Returns:
+    file: stdout stream.
+  """
+  # On Python 3 binary data is written to the buffer of stdout.
+  return getattr(sys.stdout, 'buffer', sys.stdout)
+
+
+class CheckWriter(object):
+  """Check output writer.
+
+  The check output writer does not write any files, instead it determines
+  which files would change if the data was written.
+
+  Attributes:
+    changed_paths (list[str]): paths of the files that would change.
+  """
+
+  def __init__(self, show_differences=True):
+    """Initialize an output writer.
+
+    Args:
+      show_differences (Optional[bool]): True if a unified diff of
+          the changes should be printed.
+    """
+    super(CheckWriter, self).__init__()
+    self._show_differences = show_differences
+    self.changed_paths = []
+
+  def _PrintDifferences(self, file_path, file_data):
+    """Prints a unified diff of the changes of a file.
+
+    Args:
+      file_path (str): path of the file.
+      file_data (bytes): data.
+    """
+    existing_lines = []
+    if os.path.isfile(file_path):
+      with open(file_path, 'rb') as file_object:
+        existing_lines = file_object.readlines()
+
+    lines = io.BytesIO(file_data).readlines()
+
+    for line in difflib.unified_diff(
+        existing_lines, lines, fromfile=b'a/{0:s}'.format(file_path),
+        tofile=b'b/{0:s}'.format(file_path)):
+      if not line.endswith(b'\n'):
+        line = b'{0:s}\n\\ No newline at end of file\n'.format(line)
+      print(line, end='')
+
+  def Close(self):
+    """Closes the output writer."""
+    return
+
+  def Flush(self):
+    """Flushes the files written so far."""
+    return
+
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Checks if the data would change the file.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+    """
+    if access_mode == 'ab' and os.path.isfile(file_path):
+      with open(file_path, 'rb') as file_object:
+        file_data = b''.join([file_object.read(), file_data])
+
+    if not _ContainsData(file_path, file_data):
+      self.changed_paths.append(file_path)
+
+      if self._show_differences:
+        self._PrintDifferences(file_path, file_data)
+
+    elif executable and not os.stat(file_path).st_mode & stat.S_IEXEC:
+      self.changed_paths.append(file_path)
+
+      if self._show_differences:
+        print('File is not executable: {0:s}'.format(file_path))
+
+
+class FileWriter(object):
+  """File output writer.
+
+  A file is written to a temporary file in the directory of the output file,
+  which replaces the output file when the writer is flushed, hence an output
+  file is never partially written. Files that already contain the data are
+  not written again. The data of the files written since the previous flush
+  is synchronized to disk before any output file is replaced, instead of per
+  file.
+
+  Optionally the files are written by a background thread, so that rendering
+  the files and writing them overlap.
+  """
+
+  def __init__(self, output_directory, background=False, skip_unchanged=True):
+    """Initialize an output writer.
+
+    Args:
+      output_directory (str): path of the output directory, which relative
+          paths of the files are relative to.
+      background (Optional[bool]): True if the files should be written by
+          a background thread.
+      skip_unchanged (Optional[bool]): True if files that already contain
+          the data should not be written.
+    """
+    super(FileWriter, self).__init__()
+    self._background_thread = None
+    self._error = None
+    self._output_directory = output_directory
+    self._queue = None
+    self._skip_unchanged = skip_unchanged
+    self._temporary_paths = {}
+
+    # The umask can only be determined by changing it.
+    umask = os.umask(0o022)
+    os.umask(umask)
+    self._file_mode = 0o666 & ~umask
+
+    if background:
+      self._queue = queue.Queue()
+      self._background_thread = threading.Thread(
+          name='FileWriter', target=self._WriteQueuedFiles)
+      self._background_thread.daemon = True
+      self._background_thread.start()
+
+  def _GetOutputPath(self, file_path):
+    """Retrieves the output path of a file.
+
+    Args:
+      file_path (str): path of the file.
+
+    Returns:
+      str: path of the file in the output directory.
+    """
+    if os.path.isabs(file_path):
+      return file_path
+
+    return os.path.join(self._output_directory, file_path)
+
+  def _RemoveTemporaryFiles(self):
+    """Removes the temporary files that were not flushed."""
+    for temporary_path in self._temporary_paths.values():
+      try:
+        os.remove(temporary_path)
+      except OSError:
+        pass
+
+    self._temporary_paths = {}
+
+  def _SynchronizeDirectory(self, path):
+    """Synchronizes the entries of a directory to disk.
+
+    Args:
+      path (str): path of the directory.
+    """
+    try:
+      file_descriptor = os.open(path, os.O_RDONLY)
+    except OSError:
+      # Directories cannot be opened on every platform, such as Windows.
+      return
+
+    try:
+      os.fsync(file_descriptor)
+    except OSError:
+      pass
+    finally:
+      os.close(file_descriptor)
+
+  def _WriteFile(self, file_path, file_data, access_mode, executable):
+    """Writes the data to a temporary file.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (str): output file access mode.
+      executable (bool): True if the file should be executable.
+    """
+    output_path = self._GetOutputPath(file_path)
+
+    # A file that was written since the previous flush is only available in
+    # its temporary file.
+    temporary_path = self._temporary_paths.get(output_path, None)
+
+    if access_mode == 'ab':
+      existing_path = temporary_path or output_path
+      if os.path.isfile(existing_path):
+        with open(existing_path, 'rb') as file_object:
+          file_data = b''.join([file_object.read(), file_data])
+
+    if (self._skip_unchanged and not temporary_path and
+        _ContainsData(output_path, file_data)):
+      if executable:
+        stat_object = os.stat(output_path)
+        if not stat_object.st_mode & stat.S_IEXEC:
+          os.chmod(output_path, stat_object.st_mode | stat.S_IEXEC)
+      return
+
+    directory_name, file_name = os.path.split(output_path)
+    if directory_name and not os.path.isdir(directory_name):
+      os.makedirs(directory_name)
+
+    file_descriptor, new_temporary_path = tempfile.mkstemp(
+        dir=directory_name or '.', prefix='.{0:s}.'.format(file_name),
+        suffix='.tmp')
+    with os.fdopen(file_descriptor, 'wb') as file_object:
+      file_object.write(file_data)
+
+    # The temporary file is created with mode 0600, hence the mode of
+    # the existing file or the default mode is applied.
+    if os.path.isfile(output_path):
+      file_mode = stat.S_IMODE(os.stat(output_path).st_mode)
+    else:
+      file_mode = self._file_mode
+
+    if executable:
+      file_mode |= stat.S_IEXEC
+
+    os.chmod(new_temporary_path, file_mode)
+
+    if temporary_path:
+      os.remove(temporary_path)
+
+    self._temporary_paths[output_path] = new_temporary_path
+
+  def _WriteQueuedFiles(self):
+    """Writes the queued files, runs in the background thread."""
+    while True:
+      arguments = self._queue.get()
+      try:
+        if arguments is None:
+          break
+
+        # After an error the remaining files are discarded.
+        if not self._error:
+          self._WriteFile(*arguments)
+
+      # pylint: disable=broad-except
+      except Exception as exception:
+        self._error = exception
+
+      finally:
+        self._queue.task_done()
+
+  def Close(self):
+    """Closes the output writer.
+
+    Flushes the files written so far and stops the background thread.
+
+    Raises:
+      IOError: if a file could not be written.
+      OSError: if a file could not be written.
+    """
+    if self._background_thread:
+      self._queue.put(None)
+      self._background_thread.join()
+      self._background_thread = None
+
+    self.Flush()
+
+  def Flush(self):
+    """Flushes the files written so far.
+
+    Waits for the background thread to write the queued files, synchronizes
+    the temporary files to disk and replaces the output files.
+
+    Raises:
+      IOError: if a file could not be written.
+      OSError: if a file could not be written.
+    """
+    if self._queue:
+      self._queue.join()
+
+    if self._error:
+      error = self._error
+      self._error = None
+      self._RemoveTemporaryFiles()
+      raise error  # pylint: disable=raising-bad-type
+
+    # Synchronizing the temporary files together before any output file is
+    # replaced allows the file system to batch the writes.
+    for temporary_path in self._temporary_paths.values():
+      with open(temporary_path, 'rb') as file_object:
+        os.fsync(file_object.fileno())
+
+    directory_names = set()
+    for output_path, temporary_path in sorted(self._temporary_paths.items()):
+      try:
+        os.rename(temporary_path, output_path)
+      except OSError:
+        # On Windows rename fails if the destination exists.
+        os.remove(output_path)
+        os.rename(temporary_path, output_path)
+
+      directory_names.add(os.path.dirname(output_path) or '.')
+
+    self._temporary_paths = {}
+
+    for directory_name in sorted(directory_names):
+      self._SynchronizeDirectory(directory_name)
+
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Writes the data to file.
+
+    The file is written when the writer is flushed.
+
+    Args:
+      file_path (str): path of the file to write, relative to the output
+          directory.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+    """
+    arguments = (file_path, file_data, access_mode, executable)
+    if self._queue:
+      self._queue.put(arguments)
+    else:
+      self._WriteFile(*arguments)
+
+
+class StdoutWriter(object):
+  """Stdout output writer."""
+
+  def __init__(self):
+    """Initialize the output writer."""
+    super(StdoutWriter, self).__init__()
+
+  def Close(self):
+    """Closes the output writer."""
+    return
+
+  def Flush(self):
+    """Flushes the files written so far."""
+    return
+
+  # pylint: disable=unused-argument
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Writes the data to stdout (without the default trailing newline).
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+    """
+    print('-' * 80)
+    print('{0: ^80}'.format(file_path))
+    print('-' * 80)
+    print('')
+    print(file_data, end='')
+
+
+class MemoryWriter(object):
+  """Memory output writer.
+
+  The memory output writer keeps the files, so that they can be written to
+  another output writer later, for example by the parent of a worker process.
+
+  Attributes:
+    files (list[tuple[str, bytes, str, bool]]): path, data, access mode and
+        executable indicator per file.
+  """
+
+  def __init__(self):
+    """Initialize the output writer."""
+    super(MemoryWriter, self).__init__()
+    self.files = []
+
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Writes the data to memory.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+    """
+    self.files.append((file_path, file_data, access_mode, executable))
+
+  def WriteTo(self, output_writer):
+    """Writes the files to another output writer.
+
+    Args:
+      output_writer (OutputWriter): output writer.
+    """
+    for file_path, file_data, access_mode, executable in self.files:
+      output_writer.WriteFile(
+          file_path, file_data, access_mode=access_mode, executable=executable)
+
+
+class StreamWriter(object):
+  """Length-prefixed stream output writer.
+
+  The files are written one after the other to a single stream, as they are
+  written to the output writer, hence only the data of a single file is
+  kept in memory. Every file is stored as a record that consists of:
+  * a 16-byte header that contains the size of the path (32-bit),
+    the mode (32-bit) and the size of the data (64-bit), in big-endian;
+  * the path, relative to the project directory, UTF-8 encoded and with
+    "/" as path segment separator;
+  * the data.
+  """
+
+  _RECORD_HEADER = struct.Struct(b'>IIQ')
+
+  def __init__(self, path=None):
+    """Initialize the output writer.
+
+    Args:
+      path (Optional[str]): path of the file to write the stream to, where
+          None represents stdout.
+    """
+    super(StreamWriter, self).__init__()
+    self._file_object = None
+    self._stream = _GetStdoutStream()
+
+    if path:
+      self._file_object = open(path, 'wb')
+      self._stream = self._file_object
+
+  def Close(self):
+    """Closes the output writer."""
+    if self._file_object:
+      self._file_object.close()
+      self._file_object = None
+    else:
+      self._stream.flush()
+
+  def Flush(self):
+    """Flushes the files written so far."""
+    self._stream.flush()
+
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Writes the data to the stream.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+
+    Raises:
+      ValueError: if the access mode is not supported.
+    """
+    if access_mode != 'wb':
+      raise ValueError('Unsupported access mode: {0:s}'.format(access_mode))
+
+    path = _GetArchivePath(file_path).encode('utf-8')
+    record_header = self._RECORD_HEADER.pack(
+        len(path), _GetFileMode(executable), len(file_data))
+
+    self._stream.write(record_header)
+    self._stream.write(path)
+    self._stream.write(file_data)
+
+
+class TarWriter(object):
+  """Tar archive output writer.
+
+  The files are streamed into the archive as they are written to the output
+  writer, hence only the data of a single file is kept in memory.
+  """
+
+  def __init__(self, path=None, compression=None):
+    """Initialize the output writer.
+
+    Args:
+      path (Optional[str]): path of the archive, where None represents
+          stdout.
+      compression (Optional[str]): compression of the archive, such as "gz",
+          where None represents no compression.
+    """
+    super(TarWriter, self).__init__()
+    self._file_object = None
+    self._modification_time = int(time.time())
+
+    stream = _GetStdoutStream()
+    if path:
+      self._file_object = open(path, 'wb')
+      stream = self._file_object
+
+    # The stream mode of tarfile does not seek, hence the archive can be
+    # written to a pipe.
+    self._tar_file = tarfile.open(
+        fileobj=stream, mode=str('w|{0:s}'.format(compression or '')))
+
+  def Close(self):
+    """Closes the output writer."""
+    self._tar_file.close()
+
+    if self._file_object:
+      self._file_object.close()
+      self._file_object = None
+    else:
+      _GetStdoutStream().flush()
+
+  def Flush(self):
+    """Flushes the files written so far."""
+    return
+
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Writes the data to the archive.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+
+    Raises:
+      ValueError: if the access mode is not supported.
+    """
+    if access_mode != 'wb':
+      raise ValueError('Unsupported access mode: {0:s}'.format(access_mode))
+
+    tar_info = tarfile.TarInfo(name=_GetArchivePath(file_path))
+    tar_info.mode = _GetFileMode(executable)
+    tar_info.mtime = self._modification_time
+    tar_info.size = len(file_data)
+
+    self._tar_file.addfile(tar_info, fileobj=io.BytesIO(file_data))
+
+
+class ZipWriter(object):
+  """Zip archive output writer.
+
+  The files are compressed into the archive as they are written to the output
+  writer, hence only the data of a single file and the central directory are
+  kept in memory.
+  """
+
+  def __init__(self, path):
+    """Initialize the output writer.
+
+    Args:
+      path (str): path of the archive.
+    """
+    super(ZipWriter, self).__init__()
+    self._date_time = time.localtime()[:6]
+    self._zip_file = zipfile.ZipFile(
+        path, 'w', compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+
+  def Close(self):
+    """Closes the output writer."""
+    self._zip_file.close()
+
+  def Flush(self):
+    """Flushes the files written so far."""
+    return
+
+  def WriteFile(
+      self, file_path, file_data, access_mode='wb', executable=False):
+    """Writes the data to the archive.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): data to write.
+      access_mode (Optional[str]): output file access mode.
+      executable (Optional[bool]): True if the file should be executable.
+
+    Raises:
+      ValueError: if the access mode is not supported.
+    """
+    if access_mode != 'wb':
+      raise ValueError('Unsupported access mode: {0:s}'.format(access_mode))
+
+    zip_info = zipfile.ZipInfo(
+        filename=_GetArchivePath(file_path), date_time=self._date_time)
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    zip_info.external_attr = (stat.S_IFREG | _GetFileMode(executable)) << 16
+
+    self._zip_file.writestr(zip_info, file_data)
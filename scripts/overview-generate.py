@@ -11,7 +11,6 @@ import glob
 import json
 import logging
 import os
-import string
 import sys
 
 try:
@@ -19,6 +18,8 @@ try:
 except ImportError:
   import configparser  # pylint: disable=import-error
 
+import template_string
+
 
 class Project(object):
   """Project definition.
@@ -364,8 +365,8 @@ class WikiPageGenerator(object):
           maps to the name of a template variable.
       output_writer (OutputWriter): an output writer.
     """
-    template_string = self._ReadTemplateFile(template_filename)
-    output_data = template_string.substitute(template_mappings)
+    template_string_object = self._ReadTemplateFile(template_filename)
+    output_data = template_string_object.Substitute(template_mappings)
     output_writer.Write(output_data)
 
   def _ReadTemplateFile(self, filename):
@@ -375,13 +376,11 @@ class WikiPageGenerator(object):
       filename (str): name of the file containing the template string.
 
     Returns:
-      string.Template: a template string.
+      CompiledTemplate: a compiled template string.
     """
     path = os.path.join(self._template_directory, filename)
-    file_object = open(path, 'rb')
-    file_data = file_object.read()
-    file_object.close()
-    return string.Template(file_data)
+    template_file_cache = template_string.GetTemplateFileCache()
+    return template_file_cache.GetTemplate(path)
 
   @abc.abstractmethod
   def Generate(self, projects, output_writer):
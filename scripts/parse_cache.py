@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""The parse cache."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import logging
+import os
+import threading
+
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle
+
+
+class ParseCache(object):
+  """Parse cache.
+
+  The cache stores the parsed representation of source files, such as
+  the library include header and the library Makefile.am, so that a source
+  file only needs to be parsed again when its content or the parser changes.
+
+  The parsed representations are kept in memory and, if a cache directory is
+  set, on disk so that subsequent runs can reuse them.
+
+  A parser is a class that is initialized with the path of the source file
+  and that defines a Read method that takes the project configuration and a
+  PARSER_VERSION class attribute that is changed when the parsed
+  representation changes.
+
+  Attributes:
+    number_of_hits (int): number of source files that did not need to be
+        parsed.
+    number_of_misses (int): number of source files that needed to be parsed.
+  """
+
+  _FORMAT_VERSION = 2
+
+  def __init__(self):
+    """Initializes a parse cache."""
+    super(ParseCache, self).__init__()
+    self._directory = None
+    self._lock = threading.Lock()
+    self._parsed_files = {}
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def _GetCacheKey(self, parser_class, path, library_name, file_data):
+    """Determines the cache key of a parsed source file.
+
+    Args:
+      parser_class (type): parser class.
+      path (str): path of the source file.
+      library_name (str): name of the library, which the parsers depend on.
+      file_data (bytes): content of the source file.
+
+    Returns:
+      str: cache key.
+    """
+    key_string = '\n'.join([
+        '{0:d}'.format(self._FORMAT_VERSION),
+        parser_class.__name__,
+        '{0:d}'.format(parser_class.PARSER_VERSION),
+        os.path.abspath(path),
+        library_name])
+
+    hash_context = hashlib.sha256()
+    hash_context.update(key_string.encode('utf-8'))
+    hash_context.update(file_data)
+    return hash_context.hexdigest()
+
+  def _ReadCacheFile(self, cache_key):
+    """Reads a parsed source file from the cache directory.
+
+    Args:
+      cache_key (str): cache key.
+
+    Returns:
+      bytes: serialized parsed source file or None if not available.
+    """
+    if not self._directory:
+      return None
+
+    cache_file_path = os.path.join(
+        self._directory, '{0:s}.pickle'.format(cache_key))
+
+    try:
+      with open(cache_file_path, 'rb') as file_object:
+        return file_object.read()
+
+    except IOError:
+      return None
+
+  def _WriteCacheFile(self, cache_key, serialized_data):
+    """Writes a parsed source file to the cache directory.
+
+    Args:
+      cache_key (str): cache key.
+      serialized_data (bytes): serialized parsed source file.
+    """
+    if not self._directory:
+      return
+
+    cache_file_path = os.path.join(
+        self._directory, '{0:s}.pickle'.format(cache_key))
+    temporary_path = '{0:s}.{1:d}'.format(cache_file_path, os.getpid())
+
+    try:
+      if not os.path.isdir(self._directory):
+        os.makedirs(self._directory)
+
+      with open(temporary_path, 'wb') as file_object:
+        file_object.write(serialized_data)
+
+      # Since the cache file is named after its content, an existing cache
+      # file can be left as-is.
+      if os.path.exists(cache_file_path):
+        os.remove(temporary_path)
+      else:
+        os.rename(temporary_path, cache_file_path)
+
+    except (IOError, OSError) as exception:
+      logging.warning((
+          'Unable to write parse cache file: {0:s} with error: '
+          '{1!s}').format(cache_file_path, exception))
+
+  def Empty(self):
+    """Empties the in-memory cache."""
+    with self._lock:
+      self._parsed_files = {}
+      self.number_of_hits = 0
+      self.number_of_misses = 0
+
+  def GetDirectory(self):
+    """Retrieves the cache directory.
+
+    Returns:
+      str: path of the cache directory or None if only cached in memory.
+    """
+    return self._directory
+
+  def ReadFile(self, parser_class, path, project_configuration):
+    """Reads a parsed source file.
+
+    Every call returns a new object, hence the caller can change the parsed
+    source file without affecting other callers.
+
+    Args:
+      parser_class (type): parser class.
+      path (str): path of the source file.
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      object: parsed source file, which is an instance of the parser class.
+    """
+    with open(path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    cache_key = self._GetCacheKey(
+        parser_class, path, project_configuration.library_name, file_data)
+
+    with self._lock:
+      serialized_data = self._parsed_files.get(cache_key, None)
+
+    if serialized_data is None:
+      serialized_data = self._ReadCacheFile(cache_key)
+
+    if serialized_data is not None:
+      try:
+        parsed_file = pickle.loads(serialized_data)
+      except Exception:  # pylint: disable=broad-except
+        # A corrupt or outdated cache file is parsed again.
+        parsed_file = None
+
+      if isinstance(parsed_file, parser_class):
+        with self._lock:
+          self._parsed_files[cache_key] = serialized_data
+          self.number_of_hits += 1
+
+        return parsed_file
+
+    parsed_file = parser_class(path)
+    parsed_file.Read(project_configuration)
+
+    serialized_data = pickle.dumps(parsed_file, pickle.HIGHEST_PROTOCOL)
+
+    with self._lock:
+      self._parsed_files[cache_key] = serialized_data
+      self.number_of_misses += 1
+
+    self._WriteCacheFile(cache_key, serialized_data)
+
+    return parsed_file
+
+  def SetDirectory(self, directory):
+    """Sets the cache directory.
+
+    Args:
+      directory (str): path of the cache directory or None to only cache in
+          memory.
+    """
+    self._directory = directory
+
+
+_PARSE_CACHE = ParseCache()
+
+
+def GetParseCache():
+  """Retrieves the parse cache shared within the process.
+
+  Returns:
+    ParseCache: parse cache.
+  """
+  return _PARSE_CACHE
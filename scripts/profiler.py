@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""The generation profiler."""
+
+from __future__ import unicode_literals
+
+import collections
+import json
+import threading
+
+
+class GenerationProfiler(object):
+  """Generation profiler.
+
+  The profiler keeps counters, such as the number of template substitutions
+  and the time spent on them, per generator, per output file and per
+  template.
+
+  Measurements recorded by other processes, such as the worker processes of
+  a process pool, can be merged into the profiler.
+
+  Attributes:
+    enabled (bool): True if measurements should be recorded.
+  """
+
+  # The counters that determine the order of the entries in the text report.
+  _SORT_COUNTERS = {
+      'generators': ('wall_time', ),
+      'output_files': ('substitution_time', 'post_processing_time'),
+      'templates': ('template_read_time', 'substitution_time')}
+
+  _SECTIONS = [
+      ('generators', 'Generators'),
+      ('output_files', 'Output files'),
+      ('templates', 'Templates')]
+
+  _COUNTERS = [
+      ('wall_time', 'wall time'),
+      ('template_reads', 'template reads'),
+      ('template_read_time', 'template read time'),
+      ('substitutions', 'substitutions'),
+      ('substitution_time', 'substitution time'),
+      ('post_processing_time', 'post-processing time'),
+      ('file_opens', 'file opens'),
+      ('bytes_written', 'bytes written'),
+      ('write_time', 'write time')]
+
+  def __init__(self):
+    """Initializes a generation profiler."""
+    super(GenerationProfiler, self).__init__()
+    self._lock = threading.Lock()
+    self._measurements = {}
+    self.enabled = False
+
+    self.Empty()
+
+  def _GetSortKey(self, section_name, counters):
+    """Determines the sort key of an entry in the text report.
+
+    Args:
+      section_name (str): name of the section.
+      counters (dict[str, object]): counters of the entry.
+
+    Returns:
+      float: sort key.
+    """
+    return sum(
+        counters.get(counter_name, 0)
+        for counter_name in self._SORT_COUNTERS[section_name])
+
+  def Empty(self):
+    """Empties the profiler."""
+    with self._lock:
+      self._measurements = {
+          section_name: collections.defaultdict(collections.Counter)
+          for section_name, _ in self._SECTIONS}
+
+  def GetJSONReport(self):
+    """Retrieves a report of the measurements as JSON.
+
+    Returns:
+      str: JSON report.
+    """
+    return json.dumps(
+        self.GetMeasurements(), indent=2, separators=(',', ': '),
+        sort_keys=True)
+
+  def GetMeasurements(self):
+    """Retrieves the measurements.
+
+    Returns:
+      dict[str, dict[str, dict[str, object]]]: counters per entry name per
+          section name, where the section name is "generators",
+          "output_files" or "templates".
+    """
+    with self._lock:
+      return {
+          section_name: {
+              name: dict(counters) for name, counters in entries.items()}
+          for section_name, entries in self._measurements.items()}
+
+  def GetTextReport(self, maximum_number_of_entries=20):
+    """Retrieves a report of the measurements as text.
+
+    The entries of every section are sorted by the time spent on them.
+
+    Args:
+      maximum_number_of_entries (Optional[int]): maximum number of entries
+          to report per section, where None represents all entries.
+
+    Returns:
+      str: text report.
+    """
+    measurements = self.GetMeasurements()
+
+    lines = []
+    for section_name, section_description in self._SECTIONS:
+      entries = sorted(
+          measurements[section_name].items(),
+          key=lambda item: self._GetSortKey(section_name, item[1]),
+          reverse=True)
+
+      number_of_entries = len(entries)
+      if maximum_number_of_entries is not None:
+        entries = entries[:maximum_number_of_entries]
+
+      lines.append('{0:s} ({1:d} of {2:d}):'.format(
+          section_description, len(entries), number_of_entries))
+
+      for name, counters in entries:
+        lines.append('  {0:s}'.format(name))
+
+        for counter_name, counter_description in self._COUNTERS:
+          value = counters.get(counter_name, None)
+          if value is None:
+            continue
+
+          if isinstance(value, float):
+            value_string = '{0:.3f}s'.format(value)
+          else:
+            value_string = '{0:d}'.format(value)
+
+          lines.append('    {0:s}: {1:s}'.format(
+              counter_description, value_string))
+
+      lines.append('')
+
+    return '\n'.join(lines)
+
+  def Merge(self, measurements):
+    """Merges measurements into the profiler.
+
+    Args:
+      measurements (dict[str, dict[str, dict[str, object]]]): counters per
+          entry name per section name, as returned by GetMeasurements.
+    """
+    with self._lock:
+      for section_name, entries in measurements.items():
+        section = self._measurements[section_name]
+        for name, counters in entries.items():
+          section[name].update(counters)
+
+  def Record(
+      self, generator_name, output_filename=None, template_filename=None,
+      **counters):
+    """Records measurements.
+
+    The counters are added to the counters of the generator and, if set,
+    of the output file and of the template.
+
+    Args:
+      generator_name (str): name of the generator, such as
+          TestsSourceFileGenerator.
+      output_filename (Optional[str]): name of the output file.
+      template_filename (Optional[str]): name of the template file.
+      counters (dict[str, object]): values to add per counter name, such as
+          substitutions=1.
+    """
+    if not self.enabled:
+      return
+
+    with self._lock:
+      self._measurements['generators'][generator_name].update(counters)
+
+      if output_filename:
+        self._measurements['output_files'][output_filename].update(counters)
+
+      if template_filename:
+        self._measurements['templates'][template_filename].update(counters)
+
+
+_GENERATION_PROFILER = GenerationProfiler()
+
+
+def GetGenerationProfiler():
+  """Retrieves the generation profiler shared within the process.
+
+  Returns:
+    GenerationProfiler: generation profiler.
+  """
+  return _GENERATION_PROFILER
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""The project model."""
+
+from __future__ import unicode_literals
+
+import os
+import threading
+
+import parse_cache
+
+
+class ProjectModel(object):
+  """Project model.
+
+  The project model keeps the parsed source files of a project, such as
+  the library include header, the type specific library headers and
+  the Makefile.am files, so that the generators within a process parse each
+  source file only once.
+
+  A parsed source file is invalidated when the modification time or size of
+  the source file changes or when it is invalidated explicitly, for example
+  after a generator has written the source file.
+
+  The parsed source files are shared and should not be changed.
+
+  Attributes:
+    number_of_bytes_saved (int): number of bytes of source files that did not
+        need to be read and parsed again.
+    number_of_hits (int): number of source files that did not need to be
+        read and parsed again.
+    number_of_misses (int): number of source files that needed to be read.
+  """
+
+  def __init__(self):
+    """Initializes a project model."""
+    super(ProjectModel, self).__init__()
+    self._lock = threading.Lock()
+    self._source_files = {}
+    self.number_of_bytes_saved = 0
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def Empty(self):
+    """Empties the project model."""
+    with self._lock:
+      self._source_files = {}
+      self.number_of_bytes_saved = 0
+      self.number_of_hits = 0
+      self.number_of_misses = 0
+
+  def GetSourceFile(self, parser_class, path, project_configuration):
+    """Retrieves a parsed source file.
+
+    Args:
+      parser_class (type): parser class, such as LibraryHeaderFile.
+      path (str): path of the source file.
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      object: parsed source file, which is an instance of the parser class.
+
+    Raises:
+      IOError: if the source file cannot be read.
+      OSError: if the source file cannot be read.
+    """
+    path = os.path.abspath(path)
+    stat_object = os.stat(path)
+    file_identifier = (stat_object.st_mtime, stat_object.st_size)
+
+    lookup_key = (
+        parser_class.__name__, path, project_configuration.library_name)
+
+    with self._lock:
+      cached_file_identifier, source_file = self._source_files.get(
+          lookup_key, (None, None))
+      if cached_file_identifier == file_identifier:
+        self.number_of_bytes_saved += stat_object.st_size
+        self.number_of_hits += 1
+        return source_file
+
+    source_file = parse_cache.GetParseCache().ReadFile(
+        parser_class, path, project_configuration)
+
+    with self._lock:
+      self._source_files[lookup_key] = (file_identifier, source_file)
+      self.number_of_misses += 1
+
+    return source_file
+
+  def Invalidate(self, path=None):
+    """Invalidates parsed source files.
+
+    Args:
+      path (Optional[str]): path of the source file to invalidate or None to
+          invalidate all source files.
+    """
+    with self._lock:
+      if path is None:
+        self._source_files = {}
+        return
+
+      path = os.path.abspath(path)
+      for lookup_key in list(self._source_files.keys()):
+        if lookup_key[1] == path:
+          del self._source_files[lookup_key]
+
+
+_PROJECT_MODEL = ProjectModel()
+
+
+def GetProjectModel():
+  """Retrieves the project model shared within the process.
+
+  Returns:
+    ProjectModel: project model.
+  """
+  return _PROJECT_MODEL
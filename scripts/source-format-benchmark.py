@@ -0,0 +1,281 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the source formatter."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import random
+import sys
+import time
+
+import source_formatter
+
+
+class MultiPassSourceFormatter(source_formatter.SourceFormatter):
+  """C source formatter that formats in multiple passes.
+
+  This is the formatter before the rule engine was introduced, where
+  the alignment offset is determined in a separate pass over the lines and
+  every declaration group is aligned in an additional pass. It is used as
+  a reference.
+  """
+
+  def FormatSource(self, lines):
+    """Formats lines of C source.
+
+    Args:
+      lines (list[str]): lines of C source.
+
+    Returns:
+      list[str]: formatted lines of C source.
+    """
+    alignment_offset = self.VerticalAlignEqualSignsDetermineOffset(lines)
+
+    in_declaration_block = False
+    formatted_lines = []
+    declaration_lines = []
+    for line in lines:
+      striped_line = line.strip()
+      if in_declaration_block:
+        if striped_line.endswith(b'};'):
+          in_declaration_block = False
+        formatted_lines.append(line)
+        continue
+
+      if striped_line.endswith(b' = {'):
+        in_declaration_block = True
+        formatted_lines.append(line)
+        continue
+
+      if (striped_line and
+          not striped_line.startswith(b'#') and
+          not striped_line.startswith(b'/*') and
+          not striped_line.startswith(b'*/')):
+        declaration_lines.append(line)
+        continue
+
+      declaration_lines.sort(key=self.GetVariableDeclarationSortKey)
+      declaration_lines = self.VerticalAlignEqualSigns(
+          declaration_lines, alignment_offset)
+
+      formatted_lines.extend(declaration_lines)
+      formatted_lines.append(line)
+      declaration_lines = []
+
+    if declaration_lines:
+      declaration_lines.sort(key=self.GetVariableDeclarationSortKey)
+      declaration_lines = self.VerticalAlignEqualSigns(
+          declaration_lines, alignment_offset)
+
+      formatted_lines.extend(declaration_lines)
+      declaration_lines = []
+
+    return formatted_lines
+
+
+class SourceFormatterBenchmark(object):
+  """Source formatter benchmark.
+
+  The formatters are timed on synthetic blocks of variable declarations,
+  such as those at the start of the functions of generated source files.
+  """
+
+  _TYPES = [
+      b'char', b'int', b'libcerror_error_t', b'libyal_file_t',
+      b'libyal_internal_file_t', b'size_t', b'ssize_t', b'uint8_t',
+      b'uint32_t', b'uint64_t', b'wchar_t']
+
+  def __init__(self, repetitions=3):
+    """Initializes a source formatter benchmark.
+
+    Args:
+      repetitions (Optional[int]): number of times every measurement is
+          repeated.
+    """
+    super(SourceFormatterBenchmark, self).__init__()
+    self._repetitions = repetitions
+
+  def _GetDeclarationBlocks(self, number_of_blocks, number_of_declarations):
+    """Generates synthetic blocks of variable declarations.
+
+    Args:
+      number_of_blocks (int): number of blocks.
+      number_of_declarations (int): number of declarations per block.
+
+    Returns:
+      list[list[bytes]]: lines of the blocks.
+    """
+    # A fixed seed makes the blocks the same for every run.
+    random_generator = random.Random(number_of_declarations)
+
+    blocks = []
+    for _ in range(number_of_blocks):
+      lines = []
+      for declaration_index in range(number_of_declarations):
+        if declaration_index % 8 == 7:
+          lines.extend([
+              b'#if defined( HAVE_DEBUG_OUTPUT )\n',
+              b'\tint debug_value{0:d} = 0;\n'.format(declaration_index),
+              b'#endif\n'])
+          continue
+
+        type_name = random_generator.choice(self._TYPES)
+        name = b'value{0:d}'.format(declaration_index)
+        if random_generator.random() < 0.3:
+          lines.append(b'\t{0:s} *{1:s} = NULL;\n'.format(type_name, name))
+        elif random_generator.random() < 0.2:
+          lines.append(b'\t{0:s} {1:s};\n'.format(type_name, name))
+        else:
+          lines.append(b'\t{0:s} {1:s} = 0;\n'.format(type_name, name))
+
+      blocks.append(lines)
+
+    return blocks
+
+  def _MeasureFunction(self, function, inputs):
+    """Measures the time to format inputs.
+
+    Args:
+      function (function): function that formats an input.
+      inputs (list[object]): inputs, such as lines of a block.
+
+    Returns:
+      tuple[list[float], list[object]]: times, in seconds, and formatted
+          inputs.
+    """
+    times = []
+    for _ in range(self._repetitions):
+      start_time = time.time()
+      outputs = [function(formatter_input) for formatter_input in inputs]
+      times.append(time.time() - start_time)
+
+    return sorted(times), outputs
+
+  def Run(self, number_of_blocks, number_of_declarations):
+    """Runs the benchmark.
+
+    Args:
+      number_of_blocks (int): number of blocks.
+      number_of_declarations (int): number of declarations per block.
+
+    Returns:
+      list[dict[str, object]]: results per formatter.
+
+    Raises:
+      RuntimeError: if the formatters format the blocks differently.
+    """
+    blocks = self._GetDeclarationBlocks(
+        number_of_blocks, number_of_declarations)
+    blocks_data = [b''.join(lines) for lines in blocks]
+
+    multi_pass_formatter = MultiPassSourceFormatter()
+    formatter = source_formatter.SourceFormatter()
+
+    results = []
+    expected_blocks = None
+    for name, function, inputs in (
+        ('multi-pass', multi_pass_formatter.FormatSource, blocks),
+        ('rule engine', formatter.FormatSource, blocks),
+        ('buffer', formatter.FormatSourceData, blocks_data)):
+      times, outputs = self._MeasureFunction(function, inputs)
+
+      formatted_blocks = [
+          output.splitlines(True) if isinstance(output, bytes) else output
+          for output in outputs]
+
+      if expected_blocks is None:
+        expected_blocks = formatted_blocks
+      elif formatted_blocks != expected_blocks:
+        raise RuntimeError(
+            'Formatter: {0:s} formats the blocks differently.'.format(name))
+
+      results.append({
+          'median': times[len(times) // 2],
+          'minimum': times[0],
+          'name': name,
+          'number_of_blocks': number_of_blocks,
+          'number_of_declarations': number_of_declarations})
+
+    return results
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the source formatter on synthetic variable declarations.'))
+
+  argument_parser.add_argument(
+      '-n', '--number-of-blocks', dest='number_of_blocks', action='store',
+      type=int, default=2000, help='number of blocks of declarations.')
+
+  argument_parser.add_argument(
+      '-r', '--repetitions', dest='repetitions', action='store', type=int,
+      default=3, help='number of times every measurement is repeated.')
+
+  argument_parser.add_argument(
+      '-s', '--sizes', dest='sizes', action='store', default='4,16,64',
+      help='comma separated numbers of declarations per block.')
+
+  options = argument_parser.parse_args()
+
+  sizes = []
+  for size in options.sizes.split(','):
+    try:
+      sizes.append(int(size, 10))
+    except ValueError:
+      print('Unsupported size: {0:s}.'.format(size))
+      print('')
+      return False
+
+    if sizes[-1] < 1:
+      print('Unsupported size: {0:s}.'.format(size))
+      print('')
+      return False
+
+  if options.number_of_blocks < 1:
+    print('Unsupported number of blocks: {0:d}.'.format(
+        options.number_of_blocks))
+    print('')
+    return False
+
+  if options.repetitions < 1:
+    print('Unsupported number of repetitions: {0:d}.'.format(
+        options.repetitions))
+    print('')
+    return False
+
+  benchmark = SourceFormatterBenchmark(repetitions=options.repetitions)
+
+  results = []
+  for number_of_declarations in sizes:
+    try:
+      results.extend(benchmark.Run(
+          options.number_of_blocks, number_of_declarations))
+    except RuntimeError as exception:
+      print('{0!s}'.format(exception))
+      print('')
+      return False
+
+  print('{0:<12s} {1:>6s} {2:>10s} {3:>10s}'.format(
+      'Formatter', 'Size', 'Minimum', 'Median'))
+  for result in results:
+    print('{0:<12s} {1:>6d} {2:>9.3f}s {3:>9.3f}s'.format(
+        result['name'], result['number_of_declarations'], result['minimum'],
+        result['median']))
+
+  print('')
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
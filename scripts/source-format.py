@@ -3,13 +3,186 @@
 """Script to format source of the libyal libraries."""
 
 from __future__ import print_function
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
 import sys
 
+import line_stages
+import output_writers
 import source_formatter
 
 
-if __name__ == '__main__':
-  formatter = source_formatter.SourceFormatter()
-  lines = formatter.FormatSource(sys.stdin.readlines())
+def _FormatFile(path):
+  """Formats a C source file.
+
+  The variable declarations at the start of the functions are sorted and
+  their equal signs aligned, in the same way as in generated source files.
+
+  Args:
+    path (str): path of the C source file.
+
+  Returns:
+    tuple[str, bytes, bool]: path and formatted data of the C source file and
+        True if the C source file could be read, where the formatted data is
+        None if the C source file is already formatted or cannot be read.
+  """
+  try:
+    with open(path, 'rb') as file_object:
+      lines = file_object.readlines()
+
+  except IOError as exception:
+    logging.error('Unable to read file: {0:s} with error: {1!s}'.format(
+        path, exception))
+    return path, None, False
+
+  file_data = b''.join(lines)
+
+  stages = [line_stages.SortVariableDeclarationsStage()]
+  formatted_data = b''.join(line_stages.ProcessLines(lines, stages))
+
+  if formatted_data == file_data:
+    return path, None, True
+
+  return path, formatted_data, True
+
+
+def _GetSourceFilePaths(paths):
+  """Retrieves the paths of the C source files to format.
+
+  Args:
+    paths (list[str]): paths of C source files and directories, where
+        the .c files in a directory and its subdirectories are formatted.
+
+  Returns:
+    list[str]: paths of the C source files.
+  """
+  source_file_paths = []
+  for path in paths:
+    if not os.path.isdir(path):
+      source_file_paths.append(path)
+      continue
+
+    for directory_path, directory_names, file_names in os.walk(path):
+      # Skip hidden directories, such as .git.
+      directory_names[:] = sorted([
+          directory_name for directory_name in directory_names
+          if not directory_name.startswith('.')])
+
+      for file_name in sorted(file_names):
+        if file_name.endswith('.c'):
+          source_file_paths.append(os.path.join(directory_path, file_name))
+
+  return source_file_paths
+
+
+def _InitializeWorkerProcess():
+  """Initializes a worker process of the process pool."""
+  # The main process handles keyboard interrupts and terminates the worker
+  # processes.
+  signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Formats source of the libyal libraries. Without paths the source is '
+      'read from stdin and the formatted source is written to stdout.'))
+
+  argument_parser.add_argument(
+      '-j', '--jobs', dest='jobs', action='store', type=int, default=1,
+      metavar='JOBS', help=(
+          'number of worker processes to format with, where 0 represents '
+          'the number of CPUs.'))
 
-  print(b''.join(lines), end=b'')
+  argument_parser.add_argument(
+      'paths', nargs='*', action='store', metavar='PATH', default=None,
+      help=(
+          'path of a C source file or of a directory of which the .c files '
+          'are formatted. The files are only written if their formatted '
+          'source differs.'))
+
+  options = argument_parser.parse_args()
+
+  if options.jobs < 0:
+    print('Unsupported number of jobs: {0:d}.'.format(options.jobs))
+    print('')
+    return False
+
+  if not options.paths:
+    formatter = source_formatter.SourceFormatter()
+    lines = formatter.FormatSource(sys.stdin.readlines())
+
+    print(b''.join(lines), end=b'')
+    return True
+
+  logging.basicConfig(
+      level=logging.INFO, format='[%(levelname)s] %(message)s')
+
+  source_file_paths = _GetSourceFilePaths(options.paths)
+
+  process_pool = None
+  if options.jobs != 1 and len(source_file_paths) > 1:
+    process_pool = multiprocessing.Pool(
+        options.jobs or None, initializer=_InitializeWorkerProcess)
+
+  # The output writer replaces the files atomically and retains their mode.
+  output_writer = output_writers.FileWriter(os.getcwd())
+
+  number_of_formatted_files = 0
+  number_of_unreadable_files = 0
+  try:
+    if process_pool:
+      formatted_files = process_pool.imap(
+          _FormatFile, source_file_paths, chunksize=16)
+    else:
+      formatted_files = (
+          _FormatFile(path) for path in source_file_paths)
+
+    for path, formatted_data, is_readable in formatted_files:
+      if not is_readable:
+        number_of_unreadable_files += 1
+
+      elif formatted_data is not None:
+        output_writer.WriteFile(path, formatted_data)
+        number_of_formatted_files += 1
+
+        logging.info('Formatted: {0:s}'.format(path))
+
+  except KeyboardInterrupt:
+    if process_pool:
+      process_pool.terminate()
+      process_pool.join()
+      process_pool = None
+
+    raise
+
+  finally:
+    if process_pool:
+      process_pool.close()
+      process_pool.join()
+
+    output_writer.Close()
+
+  logging.info('Formatted {0:d} of {1:d} files.'.format(
+      number_of_formatted_files, len(source_file_paths)))
+
+  if number_of_unreadable_files:
+    logging.error('Unable to read {0:d} files.'.format(
+        number_of_unreadable_files))
+    return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
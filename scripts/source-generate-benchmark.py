@@ -0,0 +1,416 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the source generators on synthetic projects."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import datetime
+import imp
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import parse_cache
+import project_model
+import synthetic_project
+import template_string
+
+from msvscpp import manager as msvscpp_manager
+from source_generators import manager
+from source_generators import symbol_table
+
+
+class SourceGeneratorsBenchmark(object):
+  """Source generators benchmark.
+
+  Every category of source generators is timed on synthetic projects of
+  different sizes, with cold caches, where the template file cache, the
+  template cache directory, the parse cache, the project model and
+  the symbol tables are empty, and with warm caches.
+
+  Since several generators update source files that already exist, every
+  project is generated once before the categories are timed.
+
+  The time to import the generators of every category, and the Visual
+  Studio file writers of every output version, is measured in a separate
+  Python process, so that the modules are not already imported.
+  """
+
+  # Script to measure the time to import the modules that are needed to
+  # retrieve a class from a manager.
+  _IMPORT_TIME_SCRIPT = '\n'.join([
+      'import time',
+      'start_time = time.time()',
+      'from {0:s} import manager',
+      'manager.{1:s}',
+      'print(time.time() - start_time)'])
+
+  def __init__(self, projects_directory, repetitions=3):
+    """Initializes a source generators benchmark.
+
+    Args:
+      projects_directory (str): path of the directory to write the synthetic
+          projects to.
+      repetitions (Optional[int]): number of times every measurement is
+          repeated.
+    """
+    super(SourceGeneratorsBenchmark, self).__init__()
+    self._parse_cache_directory = os.path.join(
+        projects_directory, 'parse-cache')
+    self._projects_directory = projects_directory
+    self._repetitions = repetitions
+    self._template_cache_directory = os.path.join(
+        projects_directory, 'template-cache')
+    self._source_generate = self._ImportSourceGenerate()
+
+  def _EmptyCaches(self):
+    """Empties the caches of the source generators."""
+    template_string.GetTemplateFileCache().Empty()
+    parse_cache.GetParseCache().Empty()
+    project_model.GetProjectModel().Empty()
+    symbol_table.GetProjectIndexer().Empty()
+
+    for cache_directory in (
+        self._parse_cache_directory, self._template_cache_directory):
+      if os.path.isdir(cache_directory):
+        shutil.rmtree(cache_directory)
+
+  def _GenerateCategory(self, category):
+    """Generates the source files of a category in the current directory.
+
+    Args:
+      category (str): category of the source generators, where None
+          represents all categories.
+
+    Returns:
+      float: time spent generating, in seconds.
+    """
+    generators = None
+    if category:
+      generators = [category]
+
+    start_time = time.time()
+    self._source_generate.GenerateProject(
+        'source.conf', self._projects_directory, generators=generators,
+        output_directory='.')
+    return time.time() - start_time
+
+  def _ImportSourceGenerate(self):
+    """Imports the source-generate.py script as a module.
+
+    Returns:
+      module: source-generate.py module.
+    """
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'source-generate.py')
+    return imp.load_source('source_generate_script', path)
+
+  def _MeasureImportTime(self, package_name, expression):
+    """Measures the time to import the modules needed by a manager expression.
+
+    Args:
+      package_name (str): name of the package that contains the manager.
+      expression (str): expression to evaluate on the manager module.
+
+    Returns:
+      float: time spent importing, in seconds.
+    """
+    script = self._IMPORT_TIME_SCRIPT.format(package_name, expression)
+    output = subprocess.check_output(
+        [sys.executable, '-c', script],
+        cwd=os.path.dirname(os.path.abspath(__file__)))
+    return float(output.strip())
+
+  def MeasureImportTimes(self, categories=None):
+    """Measures the time to import the generators and the file writers.
+
+    Args:
+      categories (Optional[list[str]]): categories to measure, where None
+          represents all categories.
+
+    Returns:
+      list[dict[str, object]]: results per category and output version.
+    """
+    imports = []
+    if not categories:
+      categories = manager.SourceGeneratorsManager.GetCategories()
+
+    for category in categories:
+      expression = 'SourceGeneratorsManager.GetGeneratorClass({0!r})'.format(
+          str(category))
+      imports.append((category, 'source_generators', expression))
+
+    for output_version in msvscpp_manager.WritersManager.GetOutputVersions():
+      expression = 'WritersManager.GetProjectFileWriter({0!r})'.format(
+          str(output_version))
+      imports.append(('vs{0:s}'.format(output_version), 'msvscpp', expression))
+
+    results = []
+    for name, package_name, expression in imports:
+      times = sorted([
+          self._MeasureImportTime(package_name, expression)
+          for _ in range(self._repetitions)])
+
+      results.append({
+          'median': times[len(times) // 2],
+          'minimum': times[0],
+          'name': name,
+          'times': times})
+
+    return results
+
+  def Run(self, number_of_types, number_of_functions, categories=None):
+    """Runs the benchmark on a synthetic project.
+
+    Args:
+      number_of_types (int): number of types of the synthetic project.
+      number_of_functions (int): number of functions per type.
+      categories (Optional[list[str]]): categories to time, where None
+          represents all categories.
+
+    Returns:
+      list[dict[str, object]]: results per category and cache state.
+    """
+    project = synthetic_project.SyntheticProject(
+        'libsyn{0:d}x{1:d}'.format(number_of_types, number_of_functions),
+        number_of_types, number_of_functions)
+    project_path = project.Write(self._projects_directory)
+
+    parse_cache.GetParseCache().SetDirectory(self._parse_cache_directory)
+    template_string.GetTemplateFileCache().SetDirectory(
+        self._template_cache_directory)
+
+    current_working_directory = os.getcwd()
+    os.chdir(project_path)
+
+    results = []
+    try:
+      self._EmptyCaches()
+      self._GenerateCategory(None)
+
+      for category in (
+          categories or manager.SourceGeneratorsManager.GetCategories()):
+        for cache_state in ('cold', 'warm'):
+          if cache_state == 'warm':
+            self._GenerateCategory(category)
+
+          times = []
+          for _ in range(self._repetitions):
+            if cache_state == 'cold':
+              self._EmptyCaches()
+
+            times.append(self._GenerateCategory(category))
+
+          times = sorted(times)
+          results.append({
+              'cache': cache_state,
+              'category': category,
+              'median': times[len(times) // 2],
+              'minimum': times[0],
+              'number_of_functions': number_of_functions,
+              'number_of_types': number_of_types,
+              'times': times})
+
+    finally:
+      os.chdir(current_working_directory)
+
+    return results
+
+
+def CompareResults(results, baseline_results, threshold):
+  """Compares results with baseline results.
+
+  Args:
+    results (list[dict[str, object]]): results.
+    baseline_results (list[dict[str, object]]): baseline results.
+    threshold (float): ratio of the median times of a result and its
+        baseline result above which the result is considered a regression.
+
+  Returns:
+    list[tuple[dict[str, object], float]]: results that are considered
+        a regression and the ratio of the median times.
+  """
+  baseline_medians = {}
+  for result in baseline_results:
+    lookup_key = (
+        result['category'], result['cache'], result['number_of_types'],
+        result['number_of_functions'])
+    baseline_medians[lookup_key] = result['median']
+
+  regressions = []
+  for result in results:
+    lookup_key = (
+        result['category'], result['cache'], result['number_of_types'],
+        result['number_of_functions'])
+    baseline_median = baseline_medians.get(lookup_key, None)
+    if not baseline_median:
+      continue
+
+    ratio = result['median'] / baseline_median
+    if ratio > threshold:
+      regressions.append((result, ratio))
+
+  return regressions
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the source generators on synthetic projects.'))
+
+  argument_parser.add_argument(
+      '--baseline', dest='baseline_file', action='store', metavar='FILE',
+      default=None, help=(
+          'results of a previous run to compare with. Exits with a non-zero '
+          'status if a median time regressed more than the threshold.'))
+
+  argument_parser.add_argument(
+      '-g', '--generators', dest='generators', action='store', default='all',
+      help='names of the generators to benchmark.')
+
+  argument_parser.add_argument(
+      '-o', '--output', dest='output_file', action='store', metavar='FILE',
+      default='source-generate-benchmark.json',
+      help='path of the file to write the results to as JSON.')
+
+  argument_parser.add_argument(
+      '-r', '--repetitions', dest='repetitions', action='store', type=int,
+      default=3, help='number of times every measurement is repeated.')
+
+  argument_parser.add_argument(
+      '-s', '--sizes', dest='sizes', action='store', default='4x4,16x8,32x16',
+      help=(
+          'comma separated sizes of the synthetic projects, where a size is '
+          'formatted as: NUMBER_OF_TYPESxNUMBER_OF_FUNCTIONS.'))
+
+  argument_parser.add_argument(
+      '--threshold', dest='threshold', action='store', type=float,
+      default=1.2, help=(
+          'ratio of a median time and its baseline median time above which '
+          'it is considered a regression.'))
+
+  options = argument_parser.parse_args()
+
+  sizes = []
+  for size in options.sizes.split(','):
+    try:
+      number_of_types, _, number_of_functions = size.partition('x')
+      sizes.append((int(number_of_types, 10), int(number_of_functions, 10)))
+    except ValueError:
+      print('Unsupported size: {0:s}.'.format(size))
+      print('')
+      return False
+
+    if sizes[-1][0] < 1:
+      print('Unsupported size: {0:s}.'.format(size))
+      print('')
+      return False
+
+  if options.repetitions < 1:
+    print('Unsupported number of repetitions: {0:d}.'.format(
+        options.repetitions))
+    print('')
+    return False
+
+  baseline_results = None
+  if options.baseline_file:
+    if not os.path.exists(options.baseline_file):
+      print('No such baseline file: {0:s}.'.format(options.baseline_file))
+      print('')
+      return False
+
+    with open(options.baseline_file, 'rb') as file_object:
+      baseline_results = json.loads(file_object.read().decode('utf-8'))
+
+  # Only report errors, since the generators log the project information
+  # on every run.
+  logging.basicConfig(
+      level=logging.ERROR, format='[%(levelname)s] %(message)s')
+
+  if options.generators == 'all':
+    categories = None
+  else:
+    categories = options.generators.split(',')
+
+  projects_directory = tempfile.mkdtemp()
+
+  results = []
+  try:
+    benchmark = SourceGeneratorsBenchmark(
+        projects_directory, repetitions=options.repetitions)
+
+    import_results = benchmark.MeasureImportTimes(categories=categories)
+
+    for number_of_types, number_of_functions in sizes:
+      results.extend(benchmark.Run(
+          number_of_types, number_of_functions, categories=categories))
+
+  finally:
+    shutil.rmtree(projects_directory, True)
+
+  print('{0:<10s} {1:<5s} {2:>9s} {3:>10s} {4:>10s}'.format(
+      'Category', 'Cache', 'Size', 'Minimum', 'Median'))
+  for result in results:
+    size = '{0:d}x{1:d}'.format(
+        result['number_of_types'], result['number_of_functions'])
+    print('{0:<10s} {1:<5s} {2:>9s} {3:>9.3f}s {4:>9.3f}s'.format(
+        result['category'], result['cache'], size, result['minimum'],
+        result['median']))
+
+  print('')
+
+  print('{0:<10s} {1:>10s} {2:>10s}'.format('Import', 'Minimum', 'Median'))
+  for result in import_results:
+    print('{0:<10s} {1:>9.3f}s {2:>9.3f}s'.format(
+        result['name'], result['minimum'], result['median']))
+
+  print('')
+
+  output_data = {
+      'date': datetime.datetime.utcnow().isoformat(),
+      'import_results': import_results,
+      'platform': platform.platform(),
+      'python_version': platform.python_version(),
+      'repetitions': options.repetitions,
+      'results': results}
+
+  with open(options.output_file, 'wb') as file_object:
+    json_string = json.dumps(
+        output_data, indent=2, separators=(',', ': '), sort_keys=True)
+    file_object.write(json_string.encode('utf-8'))
+
+  if baseline_results:
+    regressions = CompareResults(
+        results, baseline_results['results'], options.threshold)
+
+    for result, ratio in regressions:
+      print((
+          'Regression: {0:s} with {1:s} cache on {2:d}x{3:d} is {4:.2f} '
+          'times slower than the baseline.').format(
+              result['category'], result['cache'], result['number_of_types'],
+              result['number_of_functions'], ratio))
+
+    if regressions:
+      print('')
+      return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
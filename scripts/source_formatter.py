@@ -4,16 +4,92 @@
 from __future__ import print_function
 
 
-# TODO: have the SourceFormatter use the GroupModifier to detect a group
-# of lines it applies to and then make the necessary changes.
 class GroupModifier(object):
-  """Group of lines modifier."""
+  """Group of lines modifier.
+
+  A group modifier is a rule that changes a group of consecutive lines, such
+  as the variable declarations at the start of a function. The rule engine
+  only determines if a line starts a group for the lines that pass
+  the prefilter, which consists of:
+  * FIRST_BYTES, the stripped line starts with one of the bytes;
+  * SUBSTRING, the line contains the substring;
+  * REGULAR_EXPRESSION, the compiled regular expression matches the line;
+  where a prefilter of None matches every line.
+  """
+
+  FIRST_BYTES = None
+  REGULAR_EXPRESSION = None
+  SUBSTRING = None
+
+  def IsGroupLine(self, stripped_line, group_lines):
+    """Determines if a line, that passed the prefilter, is part of a group.
+
+    Args:
+      stripped_line (bytes): line without leading and trailing whitespace.
+      group_lines (list[bytes]): lines of the group so far, where an empty
+          list indicates the line would start a group.
+
+    Returns:
+      bool: True if the line starts or continues the group.
+    """
+    return True
+
+  def ModifyGroup(self, lines):
+    """Modifies a group of lines.
+
+    Args:
+      lines (list[bytes]): lines of the group.
+
+    Returns:
+      list[bytes]: modified lines of the group.
+    """
+    return lines
 
 
-# TODO: have the SourceFormatter use the LineModifier to detect a line
-# it applies to and then make the necessary changes.
 class LineModifier(object):
-  """Line modifier."""
+  """Line modifier.
+
+  A line modifier is a rule that changes individual lines, such as aligning
+  the equal sign of a variable declaration. The rule engine only passes lines
+  to the modifier that pass the prefilter, which consists of:
+  * FIRST_BYTES, the stripped line starts with one of the bytes;
+  * SUBSTRING, the line contains the substring;
+  * REGULAR_EXPRESSION, the compiled regular expression matches the line;
+  where a prefilter of None matches every line.
+
+  The lines are analyzed while the rule engine passes over the lines and
+  only modified afterwards, hence the modification of a line can depend on
+  all lines, such as the alignment offset of the equal signs.
+  """
+
+  FIRST_BYTES = None
+  REGULAR_EXPRESSION = None
+  SUBSTRING = None
+
+  def AnalyzeLine(self, line, stripped_line):
+    """Analyzes a line that passed the prefilter.
+
+    Args:
+      line (bytes): line.
+      stripped_line (bytes): line without leading and trailing whitespace.
+
+    Returns:
+      object: analysis of the line, which is passed to ModifyLine, or None
+          if the modifier does not apply to the line.
+    """
+    return line
+
+  def ModifyLine(self, line, analysis):
+    """Modifies a line the modifier applies to.
+
+    Args:
+      line (bytes): line.
+      analysis (object): analysis of the line.
+
+    Returns:
+      bytes: modified line.
+    """
+    return line
 
 
 class Variable(object):
@@ -43,6 +119,12 @@ class Variable(object):
       b'char',
       b'void']
 
+  # Sort ranking per type, where types without a specific sort ranking have
+  # a sort ranking of 0.
+  _TYPE_SORT_RANKINGS = dict(
+      (variable_type, sort_ranking) for sort_ranking, variable_type in
+      enumerate(_TYPE_SORT_RANKING, 1))
+
   def __init__(self, declaration):
     """Initializes a C variable.
 
@@ -58,54 +140,379 @@ class Variable(object):
     if is_pointer:
       _, _, name = name.rpartition(b'*')
 
-    try:
-      variable_type_sort_ranking = (
-          1 + self._TYPE_SORT_RANKING.index(variable_type))
-    except ValueError:
-      variable_type_sort_ranking = 0
+    variable_type_sort_ranking = self._TYPE_SORT_RANKINGS.get(
+        variable_type, 0)
+
+    # If no specific sort ranking use alphabetically ordering without
+    # the trailing '_t'.
+    variable_type_sort_name, _, _ = variable_type.rpartition(b'_t')
+
+    # TODO: handle modifiers like const, static
 
     super(Variable, self).__init__()
     self.is_pointer = is_pointer
     self.name = name
     self.modifiers = modifiers
+    self.sort_key = (
+        not is_pointer, variable_type_sort_ranking, variable_type_sort_name,
+        name)
     self.type = variable_type
     self.type_sort_ranking = variable_type_sort_ranking
 
   def Compare(self, variable):
     """Compares the variable with another variable.
 
+    Pointers are ranked before other variables, followed by the sort ranking
+    of the type, the type name and the variable name.
+
+    Args:
+      variable (Variable): variable to compare with.
+
     Returns:
       int: -1 if self should be ranked earlier, 0 if both variables are
           ranked equally, 1 if self should be ranked later
     """
-    if self.is_pointer and not variable.is_pointer:
-      return -1
+    return cmp(self.sort_key, variable.sort_key)
 
-    if not self.is_pointer and variable.is_pointer:
-      return 1
 
-    if self.type_sort_ranking < variable.type_sort_ranking:
-      return -1
+class EqualSignsLineModifier(LineModifier):
+  """Vertically aligns the equal signs of variable declarations."""
 
-    if self.type_sort_ranking > variable.type_sort_ranking:
-      return 1
+  SUBSTRING = b'='
 
-    # If no specific sort ranking use alphabetically ordering without
-    # the trailing '_t'.
-    self_type, _, _ = self.type.rpartition(b'_t')
-    variable_type, _, _ = variable.type.rpartition(b'_t')
-    variable_type_sort_ranking = cmp(self_type, variable_type)
-    if variable_type_sort_ranking != 0:
-      return variable_type_sort_ranking
+  def __init__(self):
+    """Initializes an equal signs line modifier."""
+    super(EqualSignsLineModifier, self).__init__()
+    self.alignment_offset = None
 
-    # TODO: handle modifiers like const, static
+  def AnalyzeLine(self, line, stripped_line):
+    """Analyzes a line that passed the prefilter.
+
+    Args:
+      line (bytes): line.
+      stripped_line (bytes): line without leading and trailing whitespace.
+
+    Returns:
+      tuple[bytes, bytes, int]: part of the line before and after the equal
+          sign and the width of the part before the equal sign, or None if
+          the line is not a variable declaration with an equal sign.
+    """
+    if (stripped_line.endswith(b' = {') or
+        stripped_line.startswith((b'#', b'/*', b'*/'))):
+      return None
+
+    prefix, _, suffix = line.rpartition(b'=')
+    prefix = prefix.rstrip()
+    formatted_prefix = prefix.replace(b'\t', ' ' * 8)
+
+    prefix_width = len(formatted_prefix)
+
+    equal_sign_offset = prefix_width + 1
+
+    if self.alignment_offset is None:
+      self.alignment_offset = equal_sign_offset
+    else:
+      self.alignment_offset = max(self.alignment_offset, equal_sign_offset)
+
+    return prefix, suffix, prefix_width
+
+  def ModifyLine(self, line, analysis):
+    """Modifies a line the modifier applies to.
+
+    Args:
+      line (bytes): line.
+      analysis (tuple[bytes, bytes, int]): part of the line before and after
+          the equal sign and the width of the part before the equal sign.
+
+    Returns:
+      bytes: modified line.
+    """
+    prefix, suffix, prefix_width = analysis
+
+    alignment_size = self.alignment_offset - prefix_width
+    alignment = b' ' * alignment_size
+
+    return b'{0:s}{1:s}={2:s}'.format(prefix, alignment, suffix)
+
+
+class InitializerBlockGroupModifier(GroupModifier):
+  """Leaves initializer blocks, such as of an array, as-is."""
+
+  SUBSTRING = b' = {'
+
+  def IsGroupLine(self, stripped_line, group_lines):
+    """Determines if a line, that passed the prefilter, is part of a group.
+
+    Args:
+      stripped_line (bytes): line without leading and trailing whitespace.
+      group_lines (list[bytes]): lines of the group so far, where an empty
+          list indicates the line would start a group.
+
+    Returns:
+      bool: True if the line starts or continues the group.
+    """
+    if not group_lines:
+      return stripped_line.endswith(b' = {')
+
+    # The group ends with the line that closes the initializer block.
+    return not group_lines[-1].rstrip().endswith(b'};')
+
+
+class VariableDeclarationsGroupModifier(GroupModifier):
+  """Sorts consecutive variable declarations."""
+
+  def IsGroupLine(self, stripped_line, group_lines):
+    """Determines if a line, that passed the prefilter, is part of a group.
+
+    Args:
+      stripped_line (bytes): line without leading and trailing whitespace.
+      group_lines (list[bytes]): lines of the group so far, where an empty
+          list indicates the line would start a group.
+
+    Returns:
+      bool: True if the line starts or continues the group.
+    """
+    return bool(
+        stripped_line and
+        not stripped_line.startswith((b'#', b'/*', b'*/')) and
+        not stripped_line.endswith(b' = {'))
+
+  def ModifyGroup(self, lines):
+    """Modifies a group of lines.
+
+    Args:
+      lines (list[bytes]): lines of the group.
+
+    Returns:
+      list[bytes]: modified lines of the group.
+    """
+    return sorted(lines, key=lambda line: Variable(line).sort_key)
+
+
+class RuleEngine(object):
+  """Rule engine that applies group and line modifiers in a single pass.
+
+  The prefilters of the modifiers are combined into a table of the modifiers
+  to consider per first byte of the stripped line, hence most lines are only
+  checked against the modifiers that can apply to them and adding modifiers
+  does not add passes over the lines.
+  """
+
+  def __init__(self, group_modifiers=None, line_modifiers=None):
+    """Initializes a rule engine.
+
+    Args:
+      group_modifiers (Optional[list[GroupModifier]]): group modifiers, in
+          order of precedence.
+      line_modifiers (Optional[list[LineModifier]]): line modifiers, in
+          the order they apply.
+    """
+    super(RuleEngine, self).__init__()
+    self._group_modifiers_per_first_byte, self._group_modifiers = (
+        self._GetDispatchTable(group_modifiers or []))
+    self._line_modifiers_per_first_byte, self._line_modifiers = (
+        self._GetDispatchTable(line_modifiers or []))
+
+  def _AnalyzeLines(self, lines, modified_lines, line_modifications):
+    """Appends lines to the modified lines and analyzes them.
+
+    Args:
+      lines (list[bytes]): lines.
+      modified_lines (list[bytes]): modified lines.
+      line_modifications (list[tuple[int, LineModifier, object]]): index of
+          the modified line, the line modifier to apply to it and
+          the analysis of the line.
+    """
+    line_modifiers_per_first_byte = self._line_modifiers_per_first_byte
+    other_line_modifiers = self._line_modifiers
+
+    for line in lines:
+      stripped_line = line.strip()
+
+      for line_modifier, substring, regular_expression in (
+          line_modifiers_per_first_byte.get(
+              stripped_line[:1], other_line_modifiers)):
+        if substring and substring not in line:
+          continue
+
+        if regular_expression and not regular_expression.search(line):
+          continue
+
+        analysis = line_modifier.AnalyzeLine(line, stripped_line)
+        if analysis is not None:
+          line_modifications.append(
+              (len(modified_lines), line_modifier, analysis))
+
+      modified_lines.append(line)
+
+  def _GetDispatchTable(self, modifiers):
+    """Determines the modifiers to consider per first byte.
+
+    Args:
+      modifiers (list[object]): group or line modifiers.
+
+    Returns:
+      tuple: contains:
+        dict[bytes, list[tuple[object, bytes, re.RegexObject]]]: modifiers
+            to consider per first byte and their substring and regular
+            expression prefilters.
+        list[tuple[object, bytes, re.RegexObject]]: modifiers to consider
+            for other first bytes and their substring and regular expression
+            prefilters.
+    """
+    first_bytes = set()
+    for modifier in modifiers:
+      first_bytes.update(modifier.FIRST_BYTES or [])
+
+    modifiers_per_first_byte = {}
+    for first_byte in first_bytes:
+      modifiers_per_first_byte[first_byte] = [
+          (modifier, modifier.SUBSTRING, modifier.REGULAR_EXPRESSION)
+          for modifier in modifiers
+          if not modifier.FIRST_BYTES or first_byte in modifier.FIRST_BYTES]
+
+    other_modifiers = [
+        (modifier, modifier.SUBSTRING, modifier.REGULAR_EXPRESSION)
+        for modifier in modifiers if not modifier.FIRST_BYTES]
+
+    return modifiers_per_first_byte, other_modifiers
+
+  def ModifyLines(self, lines):
+    """Modifies lines.
+
+    Args:
+      lines (iterable[bytes]): lines.
+
+    Returns:
+      list[bytes]: modified lines.
+    """
+    group_modifiers_per_first_byte = self._group_modifiers_per_first_byte
+    other_group_modifiers = self._group_modifiers
+
+    group_modifier = None
+    group_lines = []
+    line_modifications = []
+    modified_lines = []
+
+    for line in lines:
+      stripped_line = line.strip()
+
+      if group_modifier:
+        if group_modifier.IsGroupLine(stripped_line, group_lines):
+          group_lines.append(line)
+          continue
 
-    return cmp(self.name, variable.name)
+        self._AnalyzeLines(
+            group_modifier.ModifyGroup(group_lines), modified_lines,
+            line_modifications)
+
+        group_modifier = None
+        group_lines = []
+
+      for modifier, substring, regular_expression in (
+          group_modifiers_per_first_byte.get(
+              stripped_line[:1], other_group_modifiers)):
+        if substring and substring not in line:
+          continue
+
+        if regular_expression and not regular_expression.search(line):
+          continue
+
+        if modifier.IsGroupLine(stripped_line, group_lines):
+          group_modifier = modifier
+          group_lines.append(line)
+          break
+
+      else:
+        self._AnalyzeLines([line], modified_lines, line_modifications)
+
+    if group_modifier:
+      self._AnalyzeLines(
+          group_modifier.ModifyGroup(group_lines), modified_lines,
+          line_modifications)
+
+    # The line modifiers are applied after all lines have been analyzed.
+    for line_index, line_modifier, analysis in line_modifications:
+      modified_lines[line_index] = line_modifier.ModifyLine(
+          modified_lines[line_index], analysis)
+
+    return modified_lines
 
 
 class SourceFormatter(object):
   """C source formatter."""
 
+  # The maximum number of lines of a declaration block, which bounds
+  # the number of lines the streaming formatter keeps in memory.
+  _MAXIMUM_DECLARATION_BLOCK_SIZE = 1024
+
+  _WHITESPACE = b' \t\n\r\x0b\x0c'
+
+  def _GetSortKey(self, data, start_offset, end_offset):
+    """Retrieves the sort key of a C variable declaration in a buffer.
+
+    The sort key is determined in the same way as by Variable, but only
+    the type and name are copied out of the buffer.
+
+    Args:
+      data (bytes): buffer.
+      start_offset (int): start offset of the part of the declaration before
+          the first equal sign, without leading and trailing whitespace.
+      end_offset (int): end offset of the part of the declaration before
+          the first equal sign, without leading and trailing whitespace.
+
+    Returns:
+      tuple: sort key.
+    """
+    name_offset = data.rfind(b' ', start_offset, end_offset) + 1
+    if not name_offset:
+      name_offset = start_offset
+      type_offset = type_end_offset = start_offset
+    else:
+      type_end_offset = name_offset - 1
+      type_offset = data.rfind(b' ', start_offset, type_end_offset) + 1
+      if not type_offset:
+        type_offset = start_offset
+
+    is_pointer = data.startswith(b'*', name_offset, end_offset)
+    if is_pointer:
+      name_offset = data.rfind(b'*', name_offset, end_offset) + 1
+
+    variable_type = data[type_offset:type_end_offset]
+
+    sort_name_end_offset = data.rfind(b'_t', type_offset, type_end_offset)
+    if sort_name_end_offset == -1:
+      variable_type_sort_name = b''
+    else:
+      variable_type_sort_name = data[type_offset:sort_name_end_offset]
+
+    # pylint: disable=protected-access
+    type_sort_rankings = Variable._TYPE_SORT_RANKINGS
+
+    return (
+        not is_pointer, type_sort_rankings.get(variable_type, 0),
+        variable_type_sort_name, data[name_offset:end_offset])
+
+  def _SplitLines(self, data):
+    """Splits a buffer into lines.
+
+    Args:
+      data (bytes): buffer.
+
+    Returns:
+      list[bytes]: lines including the end-of-line characters.
+    """
+    data_size = len(data)
+
+    lines = []
+    start_offset = 0
+    while start_offset < data_size:
+      end_offset = data.find(b'\n', start_offset) + 1 or data_size
+      lines.append(data[start_offset:end_offset])
+      start_offset = end_offset
+
+    return lines
+
   def CompareVariableDeclarations(
       self, first_variable_declaration, second_variable_declaration):
     """Compares two C variable declarations.
@@ -123,6 +530,21 @@ class SourceFormatter(object):
     second_variable = Variable(second_variable_declaration)
     return first_variable.Compare(second_variable)
 
+  def GetVariableDeclarationSortKey(self, variable_declaration):
+    """Retrieves the sort key of a C variable declaration.
+
+    Sorting by key only determines the sort key of every declaration once,
+    instead of for every comparison.
+
+    Args:
+      variable_declaration (str): C variable declaration.
+
+    Returns:
+      tuple: sort key, which ranks in the same way as
+          CompareVariableDeclarations.
+    """
+    return Variable(variable_declaration).sort_key
+
   def VerticalAlignEqualSigns(self, lines, alignment_offset):
     """Vertically aligns the equal signs.
 
@@ -183,51 +605,205 @@ class SourceFormatter(object):
   def FormatSource(self, lines):
     """Formats lines of C source.
 
+    The variable declarations are sorted and their equal signs vertically
+    aligned.
+
     Args:
       lines (list[str]): lines of C source.
 
     Returns:
       list[str]: formatted lines of C source.
     """
-    alignment_offset = self.VerticalAlignEqualSignsDetermineOffset(lines)
+    rule_engine = RuleEngine(
+        group_modifiers=[
+            InitializerBlockGroupModifier(),
+            VariableDeclarationsGroupModifier()],
+        line_modifiers=[EqualSignsLineModifier()])
+
+    return rule_engine.ModifyLines(lines)
+
+  def FormatSourceData(self, data):
+    """Formats C source in a buffer.
+
+    The C source is formatted in the same way as by FormatSource, but
+    the lines are only referenced by their offsets in the buffer. Every line
+    is analyzed once, where the widths, with tabs expanded, and sort keys are
+    determined from the buffer directly, and the formatted C source is
+    joined from slices of the buffer at once. Hence few temporary objects
+    are created per line.
+
+    Args:
+      data (bytes): C source.
+
+    Returns:
+      bytes: formatted C source.
+    """
+    whitespace = self._WHITESPACE
+    data_size = len(data)
 
-    in_declaration_block = False
-    formatted_lines = []
+    alignment_offset = 0
     declaration_lines = []
-    for line in lines:
-      striped_line = line.strip()
-      if in_declaration_block:
-        if striped_line.endswith(b'};'):
-          in_declaration_block = False
-        formatted_lines.append(line)
-        continue
+    in_initializer_block = False
+    lines = []
+
+    start_offset = 0
+    while start_offset < data_size:
+      end_offset = data.find(b'\n', start_offset) + 1 or data_size
+
+      stripped_start_offset = start_offset
+      while (stripped_start_offset < end_offset and
+             data[stripped_start_offset] in whitespace):
+        stripped_start_offset += 1
+
+      stripped_end_offset = end_offset
+      while (stripped_end_offset > stripped_start_offset and
+             data[stripped_end_offset - 1] in whitespace):
+        stripped_end_offset -= 1
+
+      is_initializer_start = data.endswith(
+          b' = {', stripped_start_offset, stripped_end_offset)
+      is_preprocessor_or_comment = data.startswith(
+          (b'#', b'/*', b'*/'), stripped_start_offset, stripped_end_offset)
+
+      # A line is represented by its start and end offset and, if its equal
+      # sign is aligned, the end offset of the part before the equal sign
+      # without trailing whitespace, the offset of the equal sign and
+      # the width of the part before the equal sign.
+      equal_sign_offset = data.rfind(
+          b'=', stripped_start_offset, stripped_end_offset)
+      if (equal_sign_offset == -1 or is_initializer_start or
+          is_preprocessor_or_comment):
+        line = (start_offset, end_offset, None, None, None)
 
-      if striped_line.endswith(b' = {'):
-        in_declaration_block = True
-        formatted_lines.append(line)
-        continue
+      else:
+        prefix_end_offset = equal_sign_offset
+        while (prefix_end_offset > start_offset and
+               data[prefix_end_offset - 1] in whitespace):
+          prefix_end_offset -= 1
+
+        prefix_width = prefix_end_offset - start_offset + 7 * data.count(
+            b'\t', start_offset, prefix_end_offset)
+        if prefix_width >= alignment_offset:
+          alignment_offset = prefix_width + 1
+
+        line = (
+            start_offset, end_offset, prefix_end_offset, equal_sign_offset,
+            prefix_width)
+
+      if in_initializer_block:
+        lines.append(line)
+        in_initializer_block = not data.endswith(
+            b'};', stripped_start_offset, stripped_end_offset)
+
+      elif (stripped_start_offset < stripped_end_offset and
+            not is_initializer_start and not is_preprocessor_or_comment):
+        # The sort key is determined by the part before the first equal sign.
+        if equal_sign_offset == -1:
+          key_end_offset = stripped_end_offset
+        else:
+          key_end_offset = data.find(
+              b'=', stripped_start_offset, equal_sign_offset)
+          if key_end_offset == -1:
+            key_end_offset = prefix_end_offset
+          else:
+            while (key_end_offset > stripped_start_offset and
+                   data[key_end_offset - 1] in whitespace):
+              key_end_offset -= 1
+
+          key_end_offset = max(key_end_offset, stripped_start_offset)
+
+        sort_key = self._GetSortKey(
+            data, stripped_start_offset, key_end_offset)
+
+        # Lines with the same sort key remain in order of their start offset.
+        declaration_lines.append((sort_key, line))
 
-      if (striped_line and
-          not striped_line.startswith(b'#') and
-          not striped_line.startswith(b'/*') and
-          not striped_line.startswith(b'*/')):
-        declaration_lines.append(line)
-        continue
+      else:
+        if declaration_lines:
+          declaration_lines.sort()
+          lines.extend([
+              declaration_line for _, declaration_line in declaration_lines])
+          declaration_lines = []
 
-      declaration_lines.sort(self.CompareVariableDeclarations)
-      declaration_lines = self.VerticalAlignEqualSigns(
-          declaration_lines, alignment_offset)
+        lines.append(line)
+        in_initializer_block = is_initializer_start
 
-      formatted_lines.extend(declaration_lines)
-      formatted_lines.append(line)
-      declaration_lines = []
+      start_offset = end_offset
 
     if declaration_lines:
-      declaration_lines.sort(self.CompareVariableDeclarations)
-      declaration_lines = self.VerticalAlignEqualSigns(
-          declaration_lines, alignment_offset)
+      declaration_lines.sort()
+      lines.extend([
+          declaration_line for _, declaration_line in declaration_lines])
+
+    data_slices = []
+    for (start_offset, end_offset, prefix_end_offset, equal_sign_offset,
+         prefix_width) in lines:
+      if prefix_end_offset is None:
+        data_slices.append(data[start_offset:end_offset])
+      else:
+        data_slices.extend([
+            data[start_offset:prefix_end_offset],
+            b' ' * (alignment_offset - prefix_width),
+            data[equal_sign_offset:end_offset]])
+
+    return b''.join(data_slices)
+
+  def FormatSourceStream(self, lines, maximum_block_size=None):
+    """Formats a stream of lines of C source.
 
-      formatted_lines.extend(declaration_lines)
-      declaration_lines = []
+    Only the variable declarations at the start of a block, such as of
+    a function, are formatted. Every declaration block is formatted when it
+    ends, hence the alignment offset is determined per declaration block
+    and formatted lines are yielded before the end of the stream. At most
+    one declaration block is kept in memory.
+
+    Args:
+      lines (iterable[bytes]): lines of C source including the end-of-line
+          characters, such as a file object.
+      maximum_block_size (Optional[int]): maximum number of lines of
+          a declaration block, where None represents the default. Larger
+          blocks are not considered declaration blocks and are not
+          formatted.
+
+    Yields:
+      bytes: formatted line of C source.
+    """
+    maximum_block_size = (
+        maximum_block_size or self._MAXIMUM_DECLARATION_BLOCK_SIZE)
 
-    return formatted_lines
+    declaration_lines = None
+    for line in lines:
+      stripped_line = line.rstrip()
+      if stripped_line == b'{':
+        if declaration_lines:
+          for declaration_line in declaration_lines:
+            yield declaration_line
+
+        yield line
+        declaration_lines = []
+
+      elif declaration_lines is not None:
+        if (b'(' not in stripped_line or
+            stripped_line.startswith(b'#if defined(')):
+          declaration_lines.append(line)
+
+          if len(declaration_lines) > maximum_block_size:
+            for declaration_line in declaration_lines:
+              yield declaration_line
+
+            declaration_lines = None
+
+        else:
+          data = self.FormatSourceData(b''.join(declaration_lines))
+          for declaration_line in self._SplitLines(data):
+            yield declaration_line
+
+          yield line
+          declaration_lines = None
+
+      else:
+        yield line
+
+    if declaration_lines:
+      for declaration_line in declaration_lines:
+        yield declaration_line
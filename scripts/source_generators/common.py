@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""The common source files generator."""
+
+from __future__ import unicode_literals
+
+import os
+
+from source_generators import interface
+
+
+class CommonSourceFileGenerator(interface.SourceFileGenerator):
+  """Common source files."""
+
+  def Generate(self, project_configuration, output_writer):
+    """Generates common source files.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      output_writer (OutputWriter): output writer.
+    """
+    template_mappings = self._GetTemplateMappings(
+        project_configuration,
+        authors_separator=',\n *                          ')
+    template_mappings['authors'] = 'Joachim Metz <joachim.metz@gmail.com>'
+
+    for directory_entry in self._ListDirectory(self._template_directory):
+      template_filename = os.path.join(
+          self._template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      output_filename = os.path.join('common', directory_entry)
+
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
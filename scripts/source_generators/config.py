@@ -0,0 +1,1291 @@
+# -*- coding: utf-8 -*-
+"""The configuration files generator."""
+
+from __future__ import unicode_literals
+
+import logging
+import os
+
+from source_generators import interface
+
+
+class ConfigurationFileGenerator(interface.SourceFileGenerator):
+  """Configuration files generator."""
+
+  def _GenerateAppVeyorYML(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates the appveyor.yml configuration file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'appveyor.yml')
+
+    template_filename = os.path.join(
+        template_directory, 'environment-header.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(
+          template_directory, 'environment-python.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(
+        template_directory, 'environment-footer.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasDependencyDokan():
+      template_filename = os.path.join(template_directory, 'install-dokan.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if (project_configuration.HasDependencyLex() or
+        project_configuration.HasDependencyYacc()):
+      template_filename = os.path.join(
+          template_directory, 'install-winflexbison.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if 'zlib' in project_configuration.library_build_dependencies:
+      template_filename = os.path.join(template_directory, 'install-zlib.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    cygwin_build_dependencies = self._GetCygwinBuildDependencies(
+        project_configuration)
+
+    if cygwin_build_dependencies:
+      cygwin_build_dependencies = ' '.join([
+          '-P {0:s}'.format(name) for name in cygwin_build_dependencies])
+      template_mappings['cygwin_build_dependencies'] = cygwin_build_dependencies
+
+      template_filename = os.path.join(template_directory, 'install-cygwin.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['cygwin_build_dependencies']
+
+    mingw_msys_build_dependencies = self._GetMinGWMSYSBuildDependencies(
+        project_configuration)
+
+    if mingw_msys_build_dependencies:
+      mingw_msys_build_dependencies = ' '.join(mingw_msys_build_dependencies)
+      template_mappings['mingw_msys_build_dependencies'] = (
+          mingw_msys_build_dependencies)
+
+      template_filename = os.path.join(
+          template_directory, 'install-mingw-msys.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['mingw_msys_build_dependencies']
+
+    mingw_msys2_build_dependencies = self._GetMinGWMSYS2BuildDependencies(
+        project_configuration)
+
+    if mingw_msys2_build_dependencies:
+      mingw_msys2_build_dependencies = ' '.join(mingw_msys2_build_dependencies)
+      template_mappings['mingw_msys2_build_dependencies'] = (
+          mingw_msys2_build_dependencies)
+
+      template_filename = os.path.join(
+          template_directory, 'install-mingw-msys2.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['mingw_msys2_build_dependencies']
+
+    template_filename = os.path.join(
+        template_directory, 'build_script-header.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    # TODO: make this configuration driven
+    if project_configuration.library_name == 'libevt':
+      template_filename = os.path.join(
+          template_directory, 'build_script-vs2017-nuget.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+    else:
+      template_filename = os.path.join(
+          template_directory, 'build_script-vs2017.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(
+          template_directory, 'build_script-python.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(
+        template_directory, 'build_script-footer.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'test_script.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'after_test.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    # TODO: make this configuration driven
+    if project_configuration.library_name == 'libevt':
+      template_filename = os.path.join(template_directory, 'deploy.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+  def _GenerateCodecovYML(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates the .codecov.yml configuration file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, '.codecov.yml')
+
+    makefile_am_file = self._GetMainMakefileAM(project_configuration)
+
+    ignore_paths = list(makefile_am_file.libraries)
+    ignore_paths.append('tests')
+
+    template_mappings['codecov_ignore'] = '\n'.join([
+        '    - "{0:s}/*"'.format(path) for path in sorted(ignore_paths)])
+
+    template_filename = os.path.join(
+        template_directory, 'body.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+  def _GenerateConfigureAC(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates the configure.ac configuration file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    # TODO: change indentation of templates.
+
+    include_header_file = self._GetLibraryIncludeHeaderFile(
+        project_configuration)
+
+    makefile_am_file = self._GetMainMakefileAM(project_configuration)
+
+    libraries = list(makefile_am_file.libraries)
+    library_dependencies = list(makefile_am_file.library_dependencies)
+
+    libcrypto_index = len(library_dependencies)
+    if 'libcaes' in library_dependencies:
+      libcrypto_index = min(
+          libcrypto_index, library_dependencies.index('libcaes'))
+
+    if 'libhmac' in library_dependencies:
+      libcrypto_index = min(
+          libcrypto_index, library_dependencies.index('libhmac'))
+
+    if 'crypto' in project_configuration.library_build_dependencies:
+      if libcrypto_index == len(library_dependencies):
+        libraries.append('libcrypto')
+        library_dependencies.append('libcrypto')
+
+    if 'sgutils' in project_configuration.library_build_dependencies:
+      libraries.append('sgutils2')
+      library_dependencies.append('sgutils2')
+
+    # Have zlib checked before libcrypto.
+    if 'zlib' in project_configuration.library_build_dependencies:
+      if libcrypto_index < len(library_dependencies):
+        libraries.insert(libcrypto_index, 'zlib')
+        library_dependencies.insert(libcrypto_index, 'zlib')
+      else:
+        libraries.append('zlib')
+        library_dependencies.append('zlib')
+
+    template_directory = os.path.join(self._template_directory, 'configure.ac')
+
+    template_filename = os.path.join(template_directory, 'header.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'programs.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'compiler_language.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'build_features.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if (include_header_file and include_header_file.have_wide_character_type or
+        project_configuration.HasTools()):
+      template_filename = os.path.join(
+          template_directory, 'check_wide_character_support.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasDebugOutput():
+      template_filename = os.path.join(
+          template_directory, 'check_debug_output.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(
+        template_directory, 'check_types_support.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(
+        template_directory, 'check_common_support.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if library_dependencies:
+      for name in library_dependencies:
+        template_mappings['local_library_name'] = name
+        template_mappings['local_library_name_upper_case'] = name.upper()
+
+        template_filename = os.path.join(
+            template_directory, 'check_dependency_support.ac')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer,
+            output_filename, access_mode='ab')
+
+      # TODO: add additional zlib checks
+      # if project_configuration.library_name == 'libvmdk':
+      #   AX_ZLIB_CHECK_UNCOMPRESS
+
+      del template_mappings['local_library_name']
+      del template_mappings['local_library_name_upper_case']
+
+    template_filename = os.path.join( template_directory, 'check_library_support.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(
+          template_directory, 'check_python_support.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasJavaBindings():
+      template_filename = os.path.join(
+          template_directory, 'check_java_support.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasTools():
+      tools_dependencies = list(makefile_am_file.tools_dependencies)
+      if 'fuse' in project_configuration.tools_build_dependencies:
+        tools_dependencies.append('libfuse')
+
+      if tools_dependencies:
+        for name in tools_dependencies:
+          template_mappings['local_library_name'] = name
+          template_mappings['local_library_name_upper_case'] = name.upper()
+
+          template_filename = os.path.join(
+              template_directory, 'check_dependency_support.ac')
+          self._GenerateSection(
+              template_filename, template_mappings, output_writer,
+              output_filename, access_mode='ab')
+
+        del template_mappings['local_library_name']
+        del template_mappings['local_library_name_upper_case']
+
+      template_filename = os.path.join(
+          template_directory, 'check_tools_support.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer,
+          output_filename, access_mode='ab')
+
+    template_filename = os.path.join( template_directory, 'check_tests_support.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'dll_support.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'compiler_flags.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if library_dependencies:
+      local_library_tests = []
+      for name in library_dependencies:
+        if name in makefile_am_file.library_dependencies:
+          local_library_test = 'test "x$ac_cv_{0:s}" = xyes'.format(name)
+        else:
+          local_library_test = 'test "x$ac_cv_{0:s}" != xno'.format(name)
+
+        local_library_tests.append(local_library_test)
+
+      if 'libcaes' in library_dependencies or 'libhmac' in library_dependencies:
+        local_library_tests.append('test "x$ac_cv_libcrypto" != xno')
+
+      template_mappings['local_library_tests'] = ' || '.join(
+          local_library_tests)
+
+      template_filename = os.path.join(
+          template_directory, 'spec_requires_library.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['local_library_tests']
+
+    if project_configuration.HasTools():
+      tools_dependencies = list(makefile_am_file.tools_dependencies)
+      if 'fuse' in project_configuration.tools_build_dependencies:
+        tools_dependencies.append('libfuse')
+
+      if tools_dependencies:
+        local_library_tests = []
+        for name in tools_dependencies:
+          if name == 'libfuse':
+            local_library_test = 'test "x$ac_cv_{0:s}" != xno'.format(name)
+          else:
+            local_library_test = 'test "x$ac_cv_{0:s}" = xyes'.format(name)
+
+          local_library_tests.append(local_library_test)
+
+        template_mappings['local_library_tests'] = ' || '.join(
+            local_library_tests)
+
+        template_filename = os.path.join(
+            template_directory, 'spec_requires_tools.ac')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer, output_filename,
+            access_mode='ab')
+
+        del template_mappings['local_library_tests']
+
+    template_filename = os.path.join(template_directory, 'dates.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(
+        template_directory, 'config_files_start.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if makefile_am_file.library_dependencies:
+      for name in makefile_am_file.library_dependencies:
+        template_mappings['local_library_name'] = name
+
+        template_filename = os.path.join(
+            template_directory, 'config_files_dependency.ac')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer,
+            output_filename, access_mode='ab')
+
+      del template_mappings['local_library_name']
+
+    template_filename = os.path.join(
+        template_directory, 'config_files_library.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(
+          template_directory, 'config_files_python.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasDotNetBindings():
+      template_filename = os.path.join(
+          template_directory, 'config_files_dotnet.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasJavaBindings():
+      template_filename = os.path.join(
+          template_directory, 'config_files_java.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasTools():
+      if makefile_am_file.tools_dependencies:
+        for name in makefile_am_file.tools_dependencies:
+          template_mappings['local_library_name'] = name
+
+          template_filename = os.path.join(
+              template_directory, 'config_files_dependency.ac')
+          self._GenerateSection(
+              template_filename, template_mappings, output_writer,
+              output_filename, access_mode='ab')
+
+        del template_mappings['local_library_name']
+
+      template_filename = os.path.join(
+          template_directory, 'config_files_tools.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer,
+          output_filename, access_mode='ab')
+
+    # TODO: add support for Makefile in documents (libuna)
+
+    template_filename = os.path.join(
+        template_directory, 'config_files_common.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasDotNetBindings():
+      template_filename = os.path.join(
+          template_directory, 'config_files_dotnet_rc.ac')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'config_files_end.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    maximum_description_length = 0
+
+    build_information = []
+    for name in libraries:
+      if name not in ('libcrypto', 'zlib'):
+        description = '{0:s} support'.format(name)
+        value = '$ac_cv_{0:s}'.format(name)
+        build_information.append((description, value))
+
+        maximum_description_length = max(
+            maximum_description_length, len(description))
+
+      if name == 'libcaes':
+        description = 'AES support'
+        build_information.append((description, '$ac_cv_libcaes_aes'))
+
+        maximum_description_length = max(
+            maximum_description_length, len(description))
+
+      elif name == 'libhmac':
+        description = 'SHA256 support'
+        build_information.append((description, '$ac_cv_libhmac_sha256'))
+
+        maximum_description_length = max(
+            maximum_description_length, len(description))
+
+      elif name == 'zlib':
+        description = 'DEFLATE compression support'
+        # TODO: determine deflate function via configuration setting? 
+        if project_configuration.library_name == 'libvmdk':
+          build_information.append((description, '$ac_cv_uncompress'))
+        else:
+          build_information.append((description, '$ac_cv_inflate'))
+
+        maximum_description_length = max(
+            maximum_description_length, len(description))
+
+    if 'fuse' in project_configuration.tools_build_dependencies:
+      description = 'FUSE support'
+      build_information.append((description, '$ac_cv_libfuse'))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+    features_information = []
+    if (project_configuration.library_name == 'libcthreads' or
+        'libcthreads' in makefile_am_file.libraries):
+      description = 'Multi-threading support'
+      value = '$ac_cv_libcthreads_multi_threading'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+    if (include_header_file and include_header_file.have_wide_character_type or
+        project_configuration.HasTools()):
+      description = 'Wide character type support'
+      value = '$ac_cv_enable_wide_character_type'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+    if project_configuration.HasTools():
+      description = '{0:s} are build as static executables'.format(
+          project_configuration.tools_directory)
+      value = '$ac_cv_enable_static_executables'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+    if project_configuration.HasPythonModule():
+      description = 'Python ({0:s}) support'.format(
+          project_configuration.python_module_name)
+      value = '$ac_cv_enable_python'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+      description = 'Python version 2 ({0:s}) support'.format(
+          project_configuration.python_module_name)
+      value = '$ac_cv_enable_python2'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+      description = 'Python version 3 ({0:s}) support'.format(
+          project_configuration.python_module_name)
+      value = '$ac_cv_enable_python3'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+    if project_configuration.HasDebugOutput():
+      description = 'Verbose output'
+      value = '$ac_cv_enable_verbose_output'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+      description = 'Debug output'
+      value = '$ac_cv_enable_debug_output'
+      features_information.append((description, value))
+
+      maximum_description_length = max(
+          maximum_description_length, len(description))
+
+    notice_message = []
+
+    if build_information:
+      notice_message.append('Building:')
+
+      for description, value in build_information:
+        padding_length = maximum_description_length - len(description)
+        padding = ' ' * padding_length
+
+        notice_line = '   {0:s}: {1:s}{2:s}'.format(description, padding, value)
+        notice_message.append(notice_line)
+
+      notice_message.append('')
+
+    if features_information:
+      notice_message.append('Features:')
+
+      for description, value in features_information:
+        padding_length = maximum_description_length - len(description)
+        padding = ' ' * padding_length
+
+        notice_line = '   {0:s}: {1:s}{2:s}'.format(description, padding, value)
+        notice_message.append(notice_line)
+
+    template_mappings['notice_message'] = '\n'.join(notice_message)
+
+    template_filename = os.path.join(template_directory, 'footer.ac')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateDpkg(
+      self, project_configuration, template_mappings, output_writer,
+      output_directory):
+    """Generates the dpkg packaging files.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_directory (str): path of the output directory.
+    """
+    # TODO: add support for projects without Python bindings.
+    # TODO: fix lintian issues.
+
+    template_directory = os.path.join(self._template_directory, 'dpkg')
+
+    for directory_entry in self._ListDirectory(template_directory):
+      template_filename = os.path.join(template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      if (directory_entry.startswith('control') or
+          directory_entry.startswith('rules')):
+        continue
+
+      if directory_entry.endswith('.install'):
+        if (not project_configuration.HasPythonModule() and
+            '-python' in directory_entry):
+          continue
+
+        if (not project_configuration.HasTools() and
+            '-tools' in directory_entry):
+          continue
+
+      output_filename = directory_entry
+      if output_filename.startswith('libyal'):
+        output_filename = '{0:s}{1:s}'.format(
+            project_configuration.library_name, output_filename[6:])
+
+      output_filename = os.path.join(output_directory, output_filename)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
+
+    dpkg_build_dependencies = self._GetDpkgBuildDependenciesDpkgControl(
+        project_configuration)
+
+    template_mappings['dpkg_build_dependencies'] = ', '.join(dpkg_build_dependencies)
+
+    template_filename = os.path.join(template_directory, 'control')
+    output_filename = os.path.join(output_directory, 'control')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    if project_configuration.HasTools():
+      template_filename = os.path.join(template_directory, 'control-tools')
+      output_filename = os.path.join(output_directory, 'control')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(template_directory, 'control-python')
+      output_filename = os.path.join(output_directory, 'control')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if (project_configuration.HasPythonModule() and
+        project_configuration.HasTools()):
+      template_filename = 'rules-with-python-and-tools'
+    elif project_configuration.HasPythonModule():
+      template_filename = 'rules-with-python'
+    elif project_configuration.HasTools():
+      template_filename = 'rules-with-tools'
+    else:
+      template_filename = 'rules'
+
+    template_filename = os.path.join(template_directory, template_filename)
+    output_filename = os.path.join(output_directory, 'rules')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_directory = os.path.join(
+        self._template_directory, 'dpkg', 'source')
+    output_directory = os.path.join(output_directory, 'source')
+
+    for directory_entry in self._ListDirectory(template_directory):
+      template_filename = os.path.join(template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      output_filename = os.path.join(output_directory, directory_entry)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
+
+  def _GenerateGitignore(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates the .gitignore configuration file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    include_header_file = self._GetLibraryIncludeHeaderFile(
+        project_configuration)
+
+    template_directory = os.path.join(self._template_directory, '.gitignore')
+
+    template_filename = os.path.join(template_directory, 'header')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'library')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    # TODO: add support for lex yacc BUILT_SOURCES
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(template_directory, 'python_module')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasDotNetBindings():
+      template_filename = os.path.join(template_directory, 'dotnet_bindings')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasJavaBindings():
+      template_filename = os.path.join(template_directory, 'java_bindings')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasTools():
+      tools_executables = []
+      for name in sorted(project_configuration.tools_names):
+        tools_executable = '/{0:s}/{1:s}'.format(
+            project_configuration.tools_directory, name)
+        tools_executables.append(tools_executable)
+
+      template_mappings['tools_executables'] = '\n'.join(tools_executables)
+
+      template_filename = os.path.join(template_directory, 'tools')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['tools_executables']
+
+    source_glob = '{0:s}_test_*.c'.format(
+        project_configuration.library_name_suffix)
+    source_glob = os.path.join('tests', source_glob)
+
+    tests_files = ['/tests/tmp*']
+    if self._PathExists(os.path.join('tests', 'input')):
+      tests_files.append('/tests/input')
+
+    for source_file in sorted(self._Glob(source_glob)):
+      if (source_file.endswith('_functions.c') or
+          source_file.endswith('_getopt.c') or
+          source_file.endswith('_memory.c') or
+          source_file.endswith('_rwlock.c')):
+        continue
+
+      source_file = '/{0:s}'.format(source_file[:-2])
+      tests_files.append(source_file)
+
+    template_mappings['tests_files'] = '\n'.join(sorted(tests_files))
+
+    template_filename = os.path.join(template_directory, 'tests')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    makefile_am_file = self._GetMainMakefileAM(project_configuration)
+
+    libraries = [
+        '/{0:s}'.format(name) for name in sorted(makefile_am_file.libraries)]
+
+    if libraries:
+      template_mappings['local_libraries'] = '\n'.join(libraries)
+
+      template_filename = os.path.join(template_directory, 'local_libraries')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['local_libraries']
+
+  def _GenerateRpmSpec(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates the RPM spec file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    makefile_am_file = self._GetMainMakefileAM(project_configuration)
+
+    template_directory = os.path.join(
+        self._template_directory, 'libyal.spec.in')
+
+    template_filename = os.path.join(template_directory, 'header.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    library_dependencies = list(makefile_am_file.library_dependencies)
+
+    if 'crypto' in project_configuration.library_build_dependencies:
+      library_dependencies.append('libcrypto')
+    if 'zlib' in project_configuration.library_build_dependencies:
+      library_dependencies.append('zlib')
+
+    if library_dependencies:
+      spec_requires = []
+      spec_build_requires = []
+      for name in sorted(library_dependencies):
+        requires = '@ax_{0:s}_spec_requires@'.format(name)
+        spec_requires.append(requires)
+
+        build_requires = '@ax_{0:s}_spec_build_requires@'.format(name)
+        spec_build_requires.append(build_requires)
+
+      template_mappings['spec_requires'] = ' '.join(spec_requires)
+      template_mappings['spec_build_requires'] = ' '.join(spec_build_requires)
+
+      template_filename = os.path.join(template_directory, 'requires.in')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['spec_requires']
+      del template_mappings['spec_build_requires']
+
+    template_filename = os.path.join(template_directory, 'package.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(template_directory, 'package-python.in')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasTools():
+      requires_library = '{0:s} = %{{version}}-%{{release}}'.format(
+          project_configuration.library_name)
+
+      tools_dependencies = list(makefile_am_file.tools_dependencies)
+      if 'crypto' in project_configuration.tools_build_dependencies:
+        tools_dependencies.append('libcrypto')
+      if 'fuse' in project_configuration.tools_build_dependencies:
+        tools_dependencies.append('libfuse')
+
+      spec_requires = [requires_library]
+      spec_build_requires = []
+      for name in sorted(tools_dependencies):
+        requires = '@ax_{0:s}_spec_requires@'.format(name)
+        spec_requires.append(requires)
+
+        build_requires = '@ax_{0:s}_spec_build_requires@'.format(name)
+        spec_build_requires.append(build_requires)
+
+      template_mappings['spec_requires'] = ' '.join(spec_requires)
+
+      template_filename = os.path.join(
+          template_directory, 'package-tools-header.in')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['spec_requires']
+
+      if tools_dependencies:
+        template_mappings['spec_build_requires'] = ' '.join(spec_build_requires)
+
+        template_filename = os.path.join(
+            template_directory, 'package-tools-requires.in')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer,
+            output_filename, access_mode='ab')
+
+        del template_mappings['spec_build_requires']
+
+      template_filename = os.path.join(
+          template_directory, 'package-tools-footer.in')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'prep.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(template_directory, 'build-python.in')
+    else:
+      template_filename = os.path.join(template_directory, 'build.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'install.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'files.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.HasPythonModule():
+      template_filename = os.path.join(template_directory, 'files-python.in')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.HasTools():
+      template_filename = os.path.join(template_directory, 'files-tools.in')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'changelog.in')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateTravisYML(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates the .travis.yml configuration file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, '.travis.yml')
+
+    dpkg_build_dependencies = self._GetDpkgBuildDependencies(
+        project_configuration)
+
+    template_filename = os.path.join(
+        template_directory, 'header.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    if project_configuration.coverty_scan_token:
+      template_mappings['coverty_scan_token'] = (
+          project_configuration.coverty_scan_token)
+
+      template_filename = os.path.join(template_directory, 'env.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      del template_mappings['coverty_scan_token']
+
+    template_filename = os.path.join(template_directory, 'matrix-header.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.coverty_scan_token:
+      template_filename = os.path.join(template_directory, 'matrix-coverty.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'matrix-footer.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_mappings['dpkg_build_dependencies'] = ' '.join(
+        dpkg_build_dependencies)
+
+    template_filename = os.path.join(template_directory, 'before_install.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.coverty_scan_token:
+      template_filename = os.path.join(
+          template_directory, 'before_install-coverity.yml')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'install.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.coverty_scan_token:
+      template_filename = 'script-coverity.yml'
+    else:
+      template_filename = 'script.yml'
+
+    template_filename = os.path.join(template_directory, template_filename)
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'after_success.yml')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GetDpkgBuildDependencies(self, project_configuration):
+    """Retrieves the dpkg build dependencies.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      list[str]: dpkg build dependencies.
+    """
+    dpkg_build_dependencies = ['autopoint']
+
+    if 'zlib' in project_configuration.library_build_dependencies:
+      dpkg_build_dependencies.append('zlib1g-dev')
+
+    if ('crypto' in project_configuration.library_build_dependencies or
+        'crypto' in project_configuration.tools_build_dependencies):
+      dpkg_build_dependencies.append('libssl-dev')
+
+    if 'fuse' in project_configuration.tools_build_dependencies:
+      dpkg_build_dependencies.append('libfuse-dev')
+
+    if 'sgutils' in project_configuration.library_build_dependencies:
+      dpkg_build_dependencies.append('libsgutils2-dev')
+
+    dpkg_build_dependencies.extend(
+        project_configuration.dpkg_build_dependencies)
+
+    return dpkg_build_dependencies
+
+  def _GetDpkgBuildDependenciesDpkgControl(self, project_configuration):
+    """Retrieves the dpkg build dependencies for the dpkg/control file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      list[str]: dpkg build dependencies.
+    """
+    dpkg_build_dependencies = ['debhelper (>= 9)', 'dh-autoreconf', 'pkg-config']
+
+    if 'zlib' in project_configuration.library_build_dependencies:
+      dpkg_build_dependencies.append('zlib1g-dev')
+    if ('crypto' in project_configuration.library_build_dependencies or
+        'crypto' in project_configuration.tools_build_dependencies):
+      dpkg_build_dependencies.append('libssl-dev')
+
+    if project_configuration.HasPythonModule():
+      dpkg_build_dependencies.extend(['python-dev', 'python3-dev'])
+
+    if 'fuse' in project_configuration.tools_build_dependencies:
+      dpkg_build_dependencies.append('libfuse-dev')
+
+    if 'sgutils' in project_configuration.library_build_dependencies:
+      dpkg_build_dependencies.append('libsgutils2-dev')
+
+    if project_configuration.dpkg_build_dependencies:
+      dpkg_build_dependencies.extend(project_configuration.dpkg_build_dependencies)
+
+    return dpkg_build_dependencies
+
+  def _GetCygwinBuildDependencies(self, project_configuration):
+    """Retrieves the Cygwin build dependencies.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    cygwin_build_dependencies = list(
+        project_configuration.cygwin_build_dependencies)
+
+    if project_configuration.HasDependencyYacc():
+      cygwin_build_dependencies.append('bison')
+    if project_configuration.HasDependencyLex():
+      cygwin_build_dependencies.append('flex')
+
+    if 'zlib' in project_configuration.library_build_dependencies:
+      cygwin_build_dependencies.append('zlib-devel')
+    if project_configuration.HasDependencyBzip2():
+      cygwin_build_dependencies.append('bzip2-devel')
+    if ('crypto' in project_configuration.library_build_dependencies or
+        'crypto' in project_configuration.tools_build_dependencies):
+      cygwin_build_dependencies.append('openssl-devel')
+
+    if project_configuration.HasPythonModule():
+      cygwin_build_dependencies.append('python2-devel')
+      cygwin_build_dependencies.append('python3-devel')
+
+    return cygwin_build_dependencies
+
+  def _GetMinGWMSYSBuildDependencies(self, project_configuration):
+    """Retrieves the MinGW-MSYS build dependencies.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    mingw_msys_build_dependencies = list(
+        project_configuration.mingw_msys_build_dependencies)
+
+    # TODO: add support for other dependencies.
+    if 'zlib' in project_configuration.library_build_dependencies:
+      mingw_msys_build_dependencies.append('libz-dev')
+
+    return mingw_msys_build_dependencies
+
+  def _GetMinGWMSYS2BuildDependencies(self, project_configuration):
+    """Retrieves the MinGW-MSYS2 build dependencies.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    mingw_msys2_build_dependencies = list(
+        project_configuration.mingw_msys2_build_dependencies)
+
+    if project_configuration.HasDependencyYacc():
+      mingw_msys2_build_dependencies.append('msys/bison')
+    if project_configuration.HasDependencyLex():
+      mingw_msys2_build_dependencies.append('msys/flex')
+
+    # TODO: add support for other dependencies.
+    if 'zlib' in project_configuration.library_build_dependencies:
+      mingw_msys2_build_dependencies.append('msys/zlib-devel')
+
+    return mingw_msys2_build_dependencies
+
+  def Generate(self, project_configuration, output_writer):
+    """Generates configuration files.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      output_writer (OutputWriter): output writer.
+    """
+    # TODO: generate spec file, what about Python versus non-Python?
+
+    makefile_am_file = self._GetLibraryMakefileAM(project_configuration)
+
+    if not makefile_am_file:
+      logging.warning(
+          'Missing: {0:s} skipping generation of configuration files.'.format(
+              self._library_makefile_am_path))
+      return
+
+    pc_libs_private = []
+    for library in sorted(makefile_am_file.libraries):
+      if library == 'libdl':
+        continue
+
+      pc_lib_private = '@ax_{0:s}_pc_libs_private@'.format(library)
+      pc_libs_private.append(pc_lib_private)
+
+    template_mappings = self._GetTemplateMappings(
+        project_configuration,
+        authors_separator=',\n *                          ')
+
+    template_mappings['authors'] = 'Joachim Metz <joachim.metz@gmail.com>'
+
+    template_mappings['pc_libs_private'] = ' '.join(pc_libs_private)
+
+    for directory_entry in self._ListDirectory(self._template_directory):
+      template_filename = os.path.join(
+          self._template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      if directory_entry == 'libyal.nuspec':
+        output_filename = '{0:s}.nuspec'.format(
+            project_configuration.library_name)
+
+        # TODO: for now only generate a nuspec file when exists.
+        if not os.path.isfile(output_filename):
+          logging.warning('Skipping: {0:s}'.format(output_filename))
+          continue
+
+      elif directory_entry == 'libyal.pc.in':
+        output_filename = '{0:s}.pc.in'.format(
+            project_configuration.library_name)
+
+      else:
+        output_filename = directory_entry
+
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
+
+    del template_mappings['pc_libs_private']
+
+    self._GenerateCodecovYML(
+        project_configuration, template_mappings, output_writer, '.codecov.yml')
+
+    self._GenerateGitignore(
+        project_configuration, template_mappings, output_writer, '.gitignore')
+
+    self._GenerateTravisYML(
+        project_configuration, template_mappings, output_writer, '.travis.yml')
+
+    self._GenerateAppVeyorYML(
+        project_configuration, template_mappings, output_writer, 'appveyor.yml')
+
+    self._GenerateConfigureAC(
+        project_configuration, template_mappings, output_writer, 'configure.ac')
+
+    self._GenerateDpkg(
+        project_configuration, template_mappings, output_writer, 'dpkg')
+
+    output_filename = '{0:s}.spec.in'.format(project_configuration.library_name)
+    self._GenerateRpmSpec(
+        project_configuration, template_mappings, output_writer,
+        output_filename)
@@ -0,0 +1,963 @@
+# -*- coding: utf-8 -*-
+"""The source file generator interface."""
+
+from __future__ import unicode_literals
+
+import abc
+import collections
+import datetime
+import glob
+import io
+import logging
+import os
+import time
+import weakref
+
+import line_stages
+import manifest
+import profiler
+import project_model
+import template_string
+
+from source_generators import mappings
+from source_generators import source_files
+from source_generators import symbol_table
+
+
+class OutputDocument(object):
+  """In-memory output document.
+
+  The sections of an output file are collected in memory so that the
+  post-processing passes can be applied to a buffer and the output file
+  only needs to be written once.
+
+  Attributes:
+    is_executable (bool): True if the output file should be executable.
+    path (str): path of the output file.
+  """
+
+  def __init__(self, path):
+    """Initializes an output document.
+
+    Args:
+      path (str): path of the output file.
+    """
+    super(OutputDocument, self).__init__()
+    self._segments = []
+    self.is_executable = False
+    self.path = path
+
+  def AppendData(self, data):
+    """Appends data to the output document.
+
+    Args:
+      data (bytes): data to append.
+    """
+    if not isinstance(data, bytes):
+      data = data.encode('utf-8')
+
+    self._segments.append(data)
+
+  def GetData(self):
+    """Retrieves the data of the output document.
+
+    Returns:
+      bytes: data of the output document.
+    """
+    if len(self._segments) > 1:
+      self._segments = [b''.join(self._segments)]
+
+    if not self._segments:
+      return b''
+
+    return self._segments[0]
+
+  def GetLines(self):
+    """Retrieves the lines of the output document.
+
+    Returns:
+      list[bytes]: lines of the output document including the end-of-line
+          characters.
+    """
+    return io.BytesIO(self.GetData()).readlines()
+
+  def SetData(self, data):
+    """Sets the data of the output document.
+
+    Args:
+      data (bytes): data of the output document.
+    """
+    self._segments = []
+    self.AppendData(data)
+
+  def SetLines(self, lines):
+    """Sets the lines of the output document.
+
+    Args:
+      lines (list[bytes]): lines of the output document including
+          the end-of-line characters.
+    """
+    self.SetData(b''.join(lines))
+
+
+class SourceFileGenerator(object):
+  """Source files generator.
+
+  Attributes:
+    USES_PROCESS_POOL (bool): True if the generator can distribute its work
+        over a process pool.
+  """
+
+  USES_PROCESS_POOL = False
+
+  # The template mappings of the project configurations, which are shared by
+  # the generators within a process.
+  _project_template_mappings = weakref.WeakKeyDictionary()
+
+  def __init__(
+      self, projects_directory, template_directory, experimental=False):
+    """Initialize a source file generator.
+
+    Args:
+      projects_directory (str): path of the projects directory.
+      template_directory (str): path of the template directory.
+      experimental (bool): True if experimental features should be enabled.
+    """
+    super(SourceFileGenerator, self).__init__()
+    self._definitions_include_header_file = None
+    self._definitions_include_header_path = None
+    self._experimental = experimental
+    self._has_tests = None
+    self._inputs = manifest.GeneratorInputs()
+    self._library_include_header_file = None
+    self._library_include_header_path = None
+    self._library_makefile_am_file = None
+    self._library_makefile_am_path = None
+    self._library_path = None
+    self._output_documents = collections.OrderedDict()
+    self._output_filenames = []
+    self._process_pool = None
+    self._projects_directory = projects_directory
+    self._python_module_path = None
+    self._symbol_table = None
+    self._template_directory = template_directory
+    self._tests_path = None
+    self._tools_path = None
+    self._types_include_header_file = None
+    self._types_include_header_path = None
+
+  def __getstate__(self):
+    """Retrieves the state of the generator for pickling.
+
+    Returns:
+      dict[str, object]: state of the generator.
+    """
+    state = dict(self.__dict__)
+    state['_output_documents'] = collections.OrderedDict()
+    state['_process_pool'] = None
+    return state
+
+  def _AppendOutputData(self, output_filename, output_data):
+    """Appends data to an output document.
+
+    If the output document has not been generated before the existing output
+    file, if any, is used as the start of the output document, in the same
+    way as opening the output file in append mode would.
+
+    Args:
+      output_filename (str): name of the output file.
+      output_data (bytes): data to append.
+    """
+    output_document = self._output_documents.get(output_filename, None)
+    if not output_document:
+      output_document = OutputDocument(output_filename)
+      if self._PathExists(output_filename):
+        self._inputs.AddFile(output_filename)
+        self._RecordProfile(output_filename=output_filename, file_opens=1)
+        with open(output_filename, 'rb') as file_object:
+          output_document.SetData(file_object.read())
+
+      self._output_documents[output_filename] = output_document
+
+    output_document.AppendData(output_data)
+
+  def _GenerateSection(
+      self, template_filename, template_mappings, output_writer,
+      output_filename, access_mode='wb'):
+    """Generates a section from template filename.
+
+    Args:
+      template_filename (str): name of the template file.
+      template_mappings (dict[str, str]): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): name of the output file.
+      access_mode (Optional[str]): output file access mode.
+    """
+    template_string_object = self._ReadTemplateFile(
+        template_filename, output_filename=output_filename)
+
+    start_time = time.time()
+    try:
+      # The template mappings are reduced to the placeholders of the template
+      # first, which reports all missing placeholders at once.
+      template_mappings = template_string_object.GetMappings(
+          template_mappings)
+      output_data = template_string_object.Substitute(template_mappings)
+    except KeyError as exception:
+      logging.error((
+          'Unable to format template: {0:s} with missing placeholders: '
+          '{1!s}').format(template_filename, exception.args[0]))
+      return
+    except ValueError as exception:
+      logging.error(
+          'Unable to format template: {0:s} with error: {1!s}'.format(
+              template_filename, exception))
+      return
+
+    self._RecordProfile(
+        output_filename=output_filename, template_filename=template_filename,
+        substitutions=1, substitution_time=time.time() - start_time)
+
+    if access_mode == 'wb':
+      self._output_documents[output_filename] = OutputDocument(output_filename)
+
+    self._AppendOutputData(output_filename, output_data)
+
+  def _GetDefinitionsIncludeHeaderFile(self, project_configuration):
+    """Retrieves the definitions include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      DefinitionsIncludeHeaderFile: definitions include header file or None if
+          the definitions include header file cannot be found.
+    """
+    if not self._definitions_include_header_file:
+      self._definitions_include_header_path = os.path.join(
+          self._projects_directory, project_configuration.library_name,
+          'include', project_configuration.library_name, 'definitions.h.in')
+
+      if self._PathExists(self._definitions_include_header_path):
+        self._definitions_include_header_file = self._ReadSourceFile(
+            source_files.DefinitionsIncludeHeaderFile,
+            self._definitions_include_header_path, project_configuration)
+
+    return self._definitions_include_header_file
+
+  def _GetLibraryIncludeHeaderFile(self, project_configuration):
+    """Retrieves the library include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      LibraryIncludeHeaderFile: library include header file or None if
+          the library include header file cannot be found.
+    """
+    if not self._library_include_header_file:
+      self._library_include_header_path = '{0:s}.h.in'.format(
+          project_configuration.library_name)
+      self._library_include_header_path = os.path.join(
+          self._projects_directory, project_configuration.library_name,
+          'include', self._library_include_header_path)
+
+      if self._PathExists(self._library_include_header_path):
+        self._library_include_header_file = self._ReadSourceFile(
+            source_files.LibraryIncludeHeaderFile,
+            self._library_include_header_path, project_configuration)
+
+    return self._library_include_header_file
+
+  def _GetLibraryMakefileAM(self, project_configuration):
+    """Retrieves the library Makefile.am file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      LibraryMakefileAMFile: library Makefile.am file or None if
+          the library Makefile.am file cannot be found.
+    """
+    if not self._library_makefile_am_file:
+      self._library_makefile_am_path = os.path.join(
+          self._projects_directory, project_configuration.library_name,
+          project_configuration.library_name, 'Makefile.am')
+
+      if self._PathExists(self._library_makefile_am_path):
+        self._library_makefile_am_file = self._ReadSourceFile(
+            source_files.LibraryMakefileAMFile, self._library_makefile_am_path,
+            project_configuration)
+
+    return self._library_makefile_am_file
+
+  def _GetMainMakefileAM(self, project_configuration):
+    """Retrieves the main Makefile.am file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      MainMakefileAMFile: main Makefile.am file or None if the main
+          Makefile.am file cannot be found.
+    """
+    makefile_am_path = os.path.join(
+        self._projects_directory, project_configuration.library_name,
+        'Makefile.am')
+
+    return self._ReadSourceFile(
+        source_files.MainMakefileAMFile, makefile_am_path,
+        project_configuration)
+
+  def _GetProjectTemplateMappings(
+      self, project_configuration, authors_separator):
+    """Retrieves the template mappings of a project configuration.
+
+    The template mappings are determined once per project configuration,
+    authors separator and date, and are frozen so that they can be shared.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      authors_separator (str): authors separator.
+
+    Returns:
+      TemplateMappings: template mappings, where the key maps to the name
+          of a template variable.
+
+    Raises:
+      ValueError: if the year of creation value is out of bounds.
+    """
+    date = datetime.date.today()
+    library_version = time.strftime('%Y%m%d', time.gmtime())
+
+    lookup_key = (authors_separator, date, library_version)
+
+    project_template_mappings = self._project_template_mappings.setdefault(
+        project_configuration, {})
+    template_mappings = project_template_mappings.get(lookup_key, None)
+    if template_mappings:
+      return template_mappings
+
+    if project_configuration.project_year_of_creation > date.year:
+      raise ValueError('Year of creation value out of bounds.')
+
+    if project_configuration.project_year_of_creation == date.year:
+      project_copyright = '{0:d}'.format(
+          project_configuration.project_year_of_creation)
+    else:
+      project_copyright = '{0:d}-{1:d}'.format(
+          project_configuration.project_year_of_creation, date.year)
+
+    if project_configuration.python_module_year_of_creation == date.year:
+      python_module_copyright = '{0:d}'.format(
+          project_configuration.python_module_year_of_creation)
+    else:
+      python_module_copyright = '{0:d}-{1:d}'.format(
+          project_configuration.python_module_year_of_creation, date.year)
+
+    authors = authors_separator.join(project_configuration.project_authors)
+    python_module_authors = authors_separator.join(
+        project_configuration.python_module_authors)
+    tools_authors = authors_separator.join(project_configuration.tools_authors)
+    tests_authors = authors_separator.join(project_configuration.tests_authors)
+
+    library_description_lower_case = '{0:s}{1:s}'.format(
+        project_configuration.library_description[0].lower(),
+        project_configuration.library_description[1:])
+
+    template_mappings = mappings.TemplateMappings(mappings={
+        'authors': authors,
+        'copyright': project_copyright,
+
+        'library_name': project_configuration.library_name,
+        'library_name_upper_case': project_configuration.library_name.upper(),
+        'library_name_suffix': project_configuration.library_name_suffix,
+        'library_name_suffix_upper_case': (
+            project_configuration.library_name_suffix.upper()),
+        'library_description': project_configuration.library_description,
+        'library_description_lower_case': library_description_lower_case,
+        'library_version': library_version,
+
+        'python_module_authors': python_module_authors,
+        'python_module_name': project_configuration.python_module_name,
+        'python_module_name_upper_case': (
+            project_configuration.python_module_name.upper()),
+        'python_module_copyright': python_module_copyright,
+
+        'tools_authors': tools_authors,
+        'tools_name': project_configuration.tools_directory,
+        'tools_name_upper_case': project_configuration.tools_directory.upper(),
+        'tools_description': project_configuration.tools_description,
+
+        'tests_authors': tests_authors,
+    })
+    template_mappings.Freeze()
+
+    project_template_mappings[lookup_key] = template_mappings
+
+    return template_mappings
+
+  def _GetSortIncludeHeadersStage(self, project_configuration):
+    """Retrieves a stage that sorts the include headers of the project.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      SortIncludeHeadersStage: sort include headers stage.
+    """
+    library_include_header_start = b'#include "{0:s}_'.format(
+        project_configuration.library_name)
+
+    python_module_include_header_start = b'#include "{0:s}_'.format(
+        project_configuration.python_module_name)
+
+    test_include_header_start = b'#include "{0:s}_test_'.format(
+        project_configuration.library_name_suffix)
+
+    return line_stages.SortIncludeHeadersStage([
+        library_include_header_start, python_module_include_header_start,
+        test_include_header_start])
+
+  def _GetSymbolTable(self, project_configuration):
+    """Retrieves the symbol table of the library headers.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      ProjectSymbolTable: symbol table.
+    """
+    if not self._symbol_table:
+      if not self._library_path:
+        self._library_path = os.path.join(
+            self._projects_directory, project_configuration.library_name,
+            project_configuration.library_name)
+
+      project_indexer = symbol_table.GetProjectIndexer()
+      self._symbol_table = project_indexer.GetSymbolTable(
+          self._library_path, project_configuration)
+
+    return self._symbol_table
+
+  def _GetSymbolTableHeaderFile(self, project_configuration, header_file_name):
+    """Retrieves a library header file from the symbol table.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      header_file_name (str): name of the header file, such as
+          "libyal_file.h".
+
+    Returns:
+      LibraryHeaderFile: library header file or None if the library header
+          file cannot be read.
+    """
+    library_symbol_table = self._GetSymbolTable(project_configuration)
+    header_file = library_symbol_table.GetHeaderFile(header_file_name)
+
+    header_file_path = os.path.join(self._library_path, header_file_name)
+    if header_file:
+      self._inputs.AddFile(header_file_path)
+    else:
+      self._inputs.AddPath(header_file_path, False)
+
+    return header_file
+
+  def _GetTemplateMappings(self, project_configuration, authors_separator=', '):
+    """Retrieves the template mappings.
+
+    Every call returns a new overlay of the template mappings of the project
+    configuration, hence the caller can change the template mappings without
+    affecting other callers.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      authors_separator (Optional[str]): authors separator.
+
+    Returns:
+      TemplateMappings: template mappings, where the key maps to the name
+          of a template variable.
+
+    Raises:
+      ValueError: if the year of creation value is out of bounds.
+    """
+    template_mappings = self._GetProjectTemplateMappings(
+        project_configuration, authors_separator)
+    return template_mappings.CreateOverlay()
+
+  def _GetTypeLibraryHeaderFile(self, project_configuration, type_name):
+    """Retrieves a type specific library include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      type_name (str): name of the type.
+
+    Returns:
+      LibraryHeaderFile: library header file or None if the library header file
+          cannot be read.
+    """
+    header_file_name = '{0:s}_{1:s}.h'.format(
+        project_configuration.library_name, type_name)
+
+    header_file = self._GetSymbolTableHeaderFile(
+        project_configuration, header_file_name)
+    if not header_file:
+      logging.warning('Unable to read header file: {0:s}'.format(
+          os.path.join(self._library_path, header_file_name)))
+
+    return header_file
+
+  def _GetTypesIncludeHeaderFile(self, project_configuration):
+    """Retrieves the types include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      TypesIncludeHeaderFile: types include header file or None if
+          the types include header file cannot be found.
+    """
+    if not self._types_include_header_file:
+      self._types_include_header_path = os.path.join(
+          self._projects_directory, project_configuration.library_name,
+          'include', project_configuration.library_name, 'types.h.in')
+
+      if self._PathExists(self._types_include_header_path):
+        self._types_include_header_file = self._ReadSourceFile(
+            source_files.TypesIncludeHeaderFile,
+            self._types_include_header_path, project_configuration)
+
+    return self._types_include_header_file
+
+  def _Glob(self, pattern):
+    """Retrieves the paths that match a glob pattern.
+
+    Args:
+      pattern (str): glob pattern.
+
+    Returns:
+      list[str]: paths that match the glob pattern.
+    """
+    paths = glob.glob(pattern)
+    self._inputs.AddGlob(pattern, paths)
+    return paths
+
+  def _HasGlob(self, project_configuration, type_name):
+    """Determines if the type has a glob function.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      type_name (str): name of type.
+
+    Returns:
+      bool: True if the type needs a glob function.
+    """
+    # TODO: determine needs_glog based on function prototypes
+    if (type_name == 'handle' and project_configuration.library_name in (
+        'libewf', 'libsmraw')):
+      return True
+
+    return False
+
+  def _HasTests(self, project_configuration):
+    """Determines if the project has tests.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      bool: True if the tests path exits.
+    """
+    if not self._tests_path:
+      self._tests_path = os.path.join(
+          self._projects_directory, project_configuration.library_name,
+          'tests')
+
+      self._has_tests = self._PathExists(self._tests_path)
+
+    return self._has_tests
+
+  def _ListDirectory(self, path):
+    """Retrieves the names of the entries of a directory.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: names of the directory entries.
+    """
+    names = os.listdir(path)
+    self._inputs.AddDirectory(path, names)
+    return names
+
+  def _PathExists(self, path):
+    """Determines if a path exists.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      bool: True if the path exists.
+    """
+    exists = os.path.exists(path)
+    self._inputs.AddPath(path, exists)
+    return exists
+
+  def _ReadOutputLines(self, output_filename):
+    """Reads the lines of an output file.
+
+    The lines are read from the output document if the output file has been
+    generated, otherwise from the existing output file.
+
+    Args:
+      output_filename (str): name of the output file.
+
+    Returns:
+      list[bytes]: lines of the output file including the end-of-line
+          characters.
+    """
+    output_document = self._output_documents.get(output_filename, None)
+    if output_document:
+      return output_document.GetLines()
+
+    self._inputs.AddFile(output_filename)
+    self._RecordProfile(output_filename=output_filename, file_opens=1)
+    with open(output_filename, 'rb') as file_object:
+      return file_object.readlines()
+
+  def _PostProcessOutputFile(self, output_filename, stages):
+    """Post-processes an output file.
+
+    The lines of the output file pass through all stages in a single
+    traversal.
+
+    Args:
+      output_filename (str): path of the output file.
+      stages (list[LineStage]): stages in the order they apply.
+    """
+    start_time = time.time()
+
+    lines = self._ReadOutputLines(output_filename)
+    output_lines = list(line_stages.ProcessLines(lines, stages))
+    self._WriteOutputLines(output_filename, output_lines)
+
+    self._RecordProfile(
+        output_filename=output_filename,
+        post_processing_time=time.time() - start_time)
+
+  def _ReadSourceFile(self, parser_class, path, project_configuration):
+    """Reads a parsed source file.
+
+    Args:
+      parser_class (type): parser class, such as LibraryIncludeHeaderFile.
+      path (str): path of the source file.
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      object: parsed source file, which is an instance of the parser class.
+    """
+    self._inputs.AddFile(path)
+    return project_model.GetProjectModel().GetSourceFile(
+        parser_class, path, project_configuration)
+
+  def _ReadTemplateFile(self, filename, output_filename=None):
+    """Reads a template string from file.
+
+    Args:
+      filename (str): name of the file containing the template string.
+      output_filename (Optional[str]): name of the output file the template
+          is read for, where None represents all output files of
+          the generator.
+
+    Returns:
+      CompiledTemplate: compiled template string.
+    """
+    self._inputs.AddFile(filename, output_path=output_filename)
+
+    start_time = time.time()
+
+    template_file_cache = template_string.GetTemplateFileCache()
+    template_string_object = template_file_cache.GetTemplate(filename)
+
+    self._RecordProfile(
+        template_filename=filename, template_reads=1,
+        template_read_time=time.time() - start_time)
+
+    return template_string_object
+
+  def _RecordProfile(
+      self, output_filename=None, template_filename=None, **counters):
+    """Records measurements of the generator in the generation profiler.
+
+    Args:
+      output_filename (Optional[str]): name of the output file.
+      template_filename (Optional[str]): path of the template file.
+      counters (dict[str, object]): values to add per counter name, such as
+          substitutions=1.
+    """
+    generation_profiler = profiler.GetGenerationProfiler()
+    if not generation_profiler.enabled:
+      return
+
+    if template_filename:
+      # The template directory is named after the category of the generator.
+      template_filename = os.path.relpath(
+          template_filename, os.path.dirname(self._template_directory))
+
+    generation_profiler.Record(
+        self.__class__.__name__, output_filename=output_filename,
+        template_filename=template_filename, **counters)
+
+  def _RunTasks(self, method_name, tasks):
+    """Runs tasks, in parallel if a process pool is set.
+
+    Output documents and inputs of the tasks are merged in the order of
+    the tasks, hence the result is the same as when the tasks are run
+    sequentially. The generator and the arguments of the tasks are passed to
+    the worker processes, hence the arguments cannot contain an output writer.
+    The tasks only fill in output documents, which are written by
+    WriteOutputFiles.
+
+    Args:
+      method_name (str): name of the method of the generator to run per task.
+      tasks (list[tuple[object]]): arguments of the method per task.
+
+    Returns:
+      list[object]: return values of the method per task.
+    """
+    if not self._process_pool:
+      method = getattr(self, method_name)
+      return [method(*arguments) for arguments in tasks]
+
+    async_results = [
+        self._process_pool.apply_async(
+            _RunGeneratorTask, (self, os.getcwd(), method_name, arguments))
+        for arguments in tasks]
+
+    generation_profiler = profiler.GetGenerationProfiler()
+
+    results = []
+    for async_result in async_results:
+      result, output_documents, inputs, measurements = async_result.get()
+      for output_filename, output_document in output_documents.items():
+        self._output_documents[output_filename] = output_document
+      self._inputs.Merge(inputs)
+      generation_profiler.Merge(measurements)
+      results.append(result)
+
+    return results
+
+  def _SetOutputFileExecutable(self, output_filename):
+    """Marks an output file as executable.
+
+    Args:
+      output_filename (str): name of the output file.
+    """
+    output_document = self._output_documents.get(output_filename, None)
+    if output_document:
+      output_document.is_executable = True
+
+  def _SetSequenceTypeNameInTemplateMappings(
+      self, template_mappings, type_name):
+    """Sets the sequence type name in template mappings.
+
+    The description, camel case and upper case variants of the sequence type
+    name are derived when they are first looked up.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): sequence type name.
+    """
+    template_mappings['sequence_type_name'] = type_name or ''
+
+  def _SetSequenceValueNameInTemplateMappings(
+      self, template_mappings, value_name):
+    """Sets the sequence value name in template mappings.
+
+    The description and upper case variant of the sequence value name are
+    derived when they are first looked up.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      value_name (str): sequence value name.
+    """
+    template_mappings['sequence_value_name'] = value_name or ''
+
+  def _SetTypeFunctionInTemplateMappings(
+      self, template_mappings, type_function):
+    """Sets the type function in template mappings.
+
+    The upper case variant of the type function is derived when it is first
+    looked up.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_function (str): type function.
+    """
+    template_mappings['type_function'] = type_function or ''
+
+  def _SetTypeNameInTemplateMappings(self, template_mappings, type_name):
+    """Sets the type name in template mappings.
+
+    The description, camel case and upper case variants of the type name are
+    derived when they are first looked up.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): type name.
+    """
+    template_mappings['type_name'] = type_name or ''
+
+  def _SetValueNameInTemplateMappings(self, template_mappings, value_name):
+    """Sets value name in template mappings.
+
+    The description and upper case variant of the value name are derived when
+    they are first looked up.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      value_name (str): value name.
+    """
+    template_mappings['value_name'] = value_name or ''
+
+  def _SetValueTypeInTemplateMappings(self, template_mappings, value_type):
+    """Sets value type in template mappings.
+
+    The description and upper case variant of the value type are derived when
+    they are first looked up.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the type of a template variable.
+      value_type (str): value type.
+    """
+    template_mappings['value_type'] = value_type or ''
+
+  def _WriteOutputFile(self, output_writer, output_filename):
+    """Writes an output document to the output writer.
+
+    Args:
+      output_writer (OutputWriter): output writer.
+      output_filename (str): name of the output file.
+    """
+    output_document = self._output_documents.pop(output_filename, None)
+    if output_document:
+      output_data = output_document.GetData()
+      output_writer.WriteFile(
+          output_filename, output_data,
+          executable=output_document.is_executable)
+      self._output_filenames.append(output_filename)
+
+      self._RecordProfile(
+          output_filename=output_filename, bytes_written=len(output_data))
+
+  def _WriteOutputLines(self, output_filename, lines):
+    """Writes the lines of an output file to its output document.
+
+    Args:
+      output_filename (str): name of the output file.
+      lines (list[bytes]): lines of the output file including the end-of-line
+          characters.
+    """
+    output_document = self._output_documents.get(output_filename, None)
+    if not output_document:
+      output_document = OutputDocument(output_filename)
+      self._output_documents[output_filename] = output_document
+
+    output_document.SetLines(lines)
+
+  @abc.abstractmethod
+  def Generate(self, project_configuration, output_writer):
+    """Generates the source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      output_writer (OutputWriter): output writer.
+    """
+
+  def GetInputs(self):
+    """Retrieves the inputs the generator has used.
+
+    Returns:
+      GeneratorInputs: inputs of the generator.
+    """
+    return self._inputs
+
+  def GetOutputFilenames(self):
+    """Retrieves the names of the output files the generator has written.
+
+    Returns:
+      list[str]: names of the output files.
+    """
+    return self._output_filenames
+
+  def RunTask(self, method_name, arguments):
+    """Runs a task of the generator.
+
+    Args:
+      method_name (str): name of the method of the generator to run.
+      arguments (tuple[object]): arguments of the method.
+
+    Returns:
+      tuple[object, OrderedDict[str, OutputDocument], GeneratorInputs]:
+          return value of the method, output documents and inputs of the task.
+    """
+    self._inputs = manifest.GeneratorInputs()
+    self._output_documents = collections.OrderedDict()
+
+    method = getattr(self, method_name)
+    result = method(*arguments)
+
+    return result, self._output_documents, self._inputs
+
+  def SetProcessPool(self, process_pool):
+    """Sets the process pool to distribute work over.
+
+    Args:
+      process_pool (multiprocessing.Pool): process pool or None to run
+          sequentially.
+    """
+    self._process_pool = process_pool
+
+  def WriteOutputFiles(self, output_writer):
+    """Writes the generated output documents to the output writer.
+
+    Args:
+      output_writer (OutputWriter): output writer.
+    """
+    for output_filename in list(self._output_documents.keys()):
+      self._WriteOutputFile(output_writer, output_filename)
+
+
+def _RunGeneratorTask(source_file, working_directory, method_name, arguments):
+  """Runs a task of a source file generator in a worker process.
+
+  Args:
+    source_file (SourceFileGenerator): source file generator.
+    working_directory (str): path of the directory of the project, which
+        the paths of the source files are relative to.
+    method_name (str): name of the method of the generator to run.
+    arguments (tuple[object]): arguments of the method.
+
+  Returns:
+    tuple[object, OrderedDict[str, OutputDocument], GeneratorInputs,
+        dict[str, object]]: return value of the method, output documents and
+        inputs of the task and measurements of the generation profiler in
+        the worker process.
+  """
+  os.chdir(working_directory)
+
+  generation_profiler = profiler.GetGenerationProfiler()
+  generation_profiler.Empty()
+
+  result, output_documents, inputs = source_file.RunTask(
+      method_name, arguments)
+
+  return (
+      result, output_documents, inputs, generation_profiler.GetMeasurements())
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""The source generators manager."""
+
+from __future__ import unicode_literals
+
+import importlib
+import os
+
+
+class SourceGeneratorsManager(object):
+  """Source generators manager.
+
+  The manager maps the categories of source files, such as "include", to
+  the source file generator classes that generate them. The module that
+  defines a generator class is only imported when the generator class is
+  first retrieved, hence generating a single category does not import
+  the other generators.
+  """
+
+  # The categories in the order they are generated, with the name of
+  # the module and class of the generator and the path of the template
+  # directory, relative to data/source.
+  _GENERATORS = [
+      ('common', 'common', 'CommonSourceFileGenerator', 'common'),
+      ('config', 'config', 'ConfigurationFileGenerator', 'config'),
+      ('documents', 'documents', 'DocumentsFileGenerator', 'documents'),
+      ('include', 'include', 'IncludeSourceFileGenerator', 'include'),
+      ('libyal', 'libyal', 'LibrarySourceFileGenerator', 'libyal'),
+      ('pyyal', 'pyyal', 'PythonModuleSourceFileGenerator', 'pyyal'),
+      ('scripts', 'scripts', 'ScriptFileGenerator', 'scripts'),
+      ('tests', 'tests', 'TestsSourceFileGenerator', 'tests'),
+      ('yaltools', 'yaltools', 'ToolsSourceFileGenerator', 'yaltools'),
+      ('libyal.3', 'man_pages', 'LibraryManPageGenerator',
+       'manuals/libyal.3')]
+
+  _generator_classes = {}
+
+  @classmethod
+  def GetCategories(cls):
+    """Retrieves the categories of the source generators.
+
+    Returns:
+      list[str]: categories in the order they are generated.
+    """
+    return [category for category, _, _, _ in cls._GENERATORS]
+
+  @classmethod
+  def GetGeneratorClass(cls, category):
+    """Retrieves the source file generator class of a category.
+
+    Args:
+      category (str): category, such as "include".
+
+    Returns:
+      type: source file generator class.
+
+    Raises:
+      KeyError: if there is no generator for the category.
+    """
+    generator_class = cls._generator_classes.get(category, None)
+    if not generator_class:
+      for generator_category, module_name, class_name, _ in cls._GENERATORS:
+        if generator_category == category:
+          break
+      else:
+        raise KeyError('No generator for category: {0:s}'.format(category))
+
+      # The package is determined from the name of this module, since it is
+      # imported both as source_generators and as scripts.source_generators.
+      package_name, _, _ = __name__.rpartition('.')
+      module = importlib.import_module('{0:s}.{1:s}'.format(
+          package_name, module_name))
+
+      generator_class = getattr(module, class_name)
+      cls._generator_classes[category] = generator_class
+
+    return generator_class
+
+  @classmethod
+  def GetTemplateDirectory(cls, category, sources_directory):
+    """Retrieves the path of the template directory of a category.
+
+    Args:
+      category (str): category, such as "include".
+      sources_directory (str): path of the directory that contains
+          the templates of all categories, such as data/source.
+
+    Returns:
+      str: path of the template directory.
+
+    Raises:
+      KeyError: if there is no generator for the category.
+    """
+    for generator_category, _, _, template_path in cls._GENERATORS:
+      if generator_category == category:
+        return os.path.join(sources_directory, *template_path.split('/'))
+
+    raise KeyError('No generator for category: {0:s}'.format(category))
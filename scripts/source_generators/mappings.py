@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""The layered template mappings."""
+
+from __future__ import unicode_literals
+
+
+def _GetCamelCase(value):
+  """Retrieves the camel case variant of a name.
+
+  Args:
+    value (str): name, such as "file_entry".
+
+  Returns:
+    str: camel case variant, such as "FileEntry".
+  """
+  return ''.join([word.title() for word in value.split('_')])
+
+
+def _GetDescription(value):
+  """Retrieves the description of a name.
+
+  Args:
+    value (str): name, such as "file_entry".
+
+  Returns:
+    str: description, such as "file entry".
+  """
+  return value.replace('_', ' ')
+
+
+def _GetUpperCase(value):
+  """Retrieves the upper case variant of a name.
+
+  Args:
+    value (str): name, such as "file_entry".
+
+  Returns:
+    str: upper case variant, such as "FILE_ENTRY".
+  """
+  return value.upper()
+
+
+class TemplateMappings(object):
+  """Layered template mappings.
+
+  The template mappings consist of layers, where a lookup checks the layers
+  from the most recently created overlay down to the base layer. Setting
+  or deleting a mapping only changes the top layer, hence an overlay can
+  hold the mappings of a type, value or function scope without changing
+  the template mappings it was created from. A frozen layer cannot be
+  changed and can be shared.
+
+  The derived mappings, such as the upper case variant of the type name,
+  are determined from their source mapping when they are first looked up,
+  unless the same layer sets them explicitly.
+  """
+
+  # The derived mappings, where the key maps to the key of the source
+  # mapping and the function that derives the value.
+  _DERIVED_MAPPINGS = {
+      'sequence_type_description': ('sequence_type_name', _GetDescription),
+      'sequence_type_name_camel_case': ('sequence_type_name', _GetCamelCase),
+      'sequence_type_name_upper_case': ('sequence_type_name', _GetUpperCase),
+      'sequence_value_description': ('sequence_value_name', _GetDescription),
+      'sequence_value_name_upper_case': (
+          'sequence_value_name', _GetUpperCase),
+      'type_description': ('type_name', _GetDescription),
+      'type_function_upper_case': ('type_function', _GetUpperCase),
+      'type_name_camel_case': ('type_name', _GetCamelCase),
+      'type_name_upper_case': ('type_name', _GetUpperCase),
+      'value_description': ('value_name', _GetDescription),
+      'value_name_upper_case': ('value_name', _GetUpperCase),
+      'value_type_description': ('value_type', _GetDescription),
+      'value_type_upper_case': ('value_type', _GetUpperCase)}
+
+  # Marks a mapping that is not defined in a layer.
+  _MISSING = object()
+
+  def __init__(self, mappings=None, parent=None):
+    """Initializes template mappings.
+
+    Args:
+      mappings (Optional[dict[str, str]]): mappings of the layer, where
+          the key maps to the name of a template variable.
+      parent (Optional[TemplateMappings]): template mappings the layer is
+          an overlay of, where None represents a base layer.
+    """
+    super(TemplateMappings, self).__init__()
+    self._deleted_keys = set()
+    self._derived_mappings = {}
+    self._frozen = False
+    self._mappings = dict(mappings or {})
+    self._parent = parent
+
+  def __contains__(self, key):
+    """Determines if a template mapping is defined.
+
+    Args:
+      key (str): name of the template variable.
+
+    Returns:
+      bool: True if the template mapping is defined.
+    """
+    try:
+      self[key]  # pylint: disable=pointless-statement
+    except KeyError:
+      return False
+
+    return True
+
+  def __delitem__(self, key):
+    """Deletes a template mapping from the top layer.
+
+    Args:
+      key (str): name of the template variable.
+
+    Raises:
+      KeyError: if the template mapping is not defined.
+      TypeError: if the template mappings are frozen.
+    """
+    if self._frozen:
+      raise TypeError('Template mappings are frozen.')
+
+    if key not in self:
+      raise KeyError(key)
+
+    self._mappings.pop(key, None)
+    self._deleted_keys.add(key)
+    self._derived_mappings = {}
+
+  def __getitem__(self, key):
+    """Retrieves a template mapping.
+
+    Args:
+      key (str): name of the template variable.
+
+    Returns:
+      str: value of the template variable.
+
+    Raises:
+      KeyError: if the template mapping is not defined.
+    """
+    source_key, derive_function = self._DERIVED_MAPPINGS.get(
+        key, (None, None))
+
+    template_mappings = self
+    while template_mappings is not None:
+      # pylint: disable=protected-access
+      value = template_mappings._mappings.get(key, self._MISSING)
+      if value is not self._MISSING:
+        return value
+
+      if key in template_mappings._deleted_keys:
+        break
+
+      if source_key:
+        value = template_mappings._derived_mappings.get(key, self._MISSING)
+        if value is not self._MISSING:
+          return value
+
+        if source_key in template_mappings._deleted_keys:
+          break
+
+        value = template_mappings._mappings.get(source_key, self._MISSING)
+        if value is not self._MISSING:
+          value = derive_function(value)
+          template_mappings._derived_mappings[key] = value
+          return value
+
+      template_mappings = template_mappings._parent
+
+    raise KeyError(key)
+
+  def __setitem__(self, key, value):
+    """Sets a template mapping in the top layer.
+
+    Args:
+      key (str): name of the template variable.
+      value (str): value of the template variable.
+
+    Raises:
+      TypeError: if the template mappings are frozen.
+    """
+    if self._frozen:
+      raise TypeError('Template mappings are frozen.')
+
+    self._deleted_keys.discard(key)
+    self._mappings[key] = value
+    self._derived_mappings = {}
+
+  def CreateOverlay(self, mappings=None):
+    """Creates an overlay of the template mappings.
+
+    Args:
+      mappings (Optional[dict[str, str]]): mappings of the overlay, where
+          the key maps to the name of a template variable.
+
+    Returns:
+      TemplateMappings: template mappings of the overlay.
+    """
+    return TemplateMappings(mappings=mappings, parent=self)
+
+  def Freeze(self):
+    """Prevents the top layer from being changed."""
+    self._frozen = True
+
+  @classmethod
+  def GetDerivedKeys(cls):
+    """Retrieves the keys of the derived template mappings.
+
+    Returns:
+      list[str]: keys of the derived template mappings, such as
+          "type_name_upper_case".
+    """
+    return sorted(cls._DERIVED_MAPPINGS.keys())
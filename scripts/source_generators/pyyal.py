@@ -0,0 +1,1970 @@
+# -*- coding: utf-8 -*-
+"""The Python module source files generator."""
+
+from __future__ import unicode_literals
+
+import collections
+import logging
+import os
+
+import definitions
+import line_stages
+import sources
+
+from source_generators import interface
+
+
+class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
+  """Python module source files generator."""
+
+  USES_PROCESS_POOL = True
+
+  def _CopyFunctionToOutputFile(self, lines, search_string, output_filename):
+    """Copies a function to the output file.
+
+    Args:
+      lines (list[bytes]): lines of the input file to copy from.
+      search_string (bytes): string to search the input for.
+      output_filename (str): path of the output file.
+
+    Returns:
+      bool: True if the function was found and copied, False otherwise.
+    """
+    function_index = None
+    for index, line in enumerate(lines):
+      if line.startswith(search_string):
+        # TODO: improve this to determine start of comment based on lines.
+        function_index = index - 3
+        break
+
+    if function_index is None:
+      return False
+
+    function_lines = []
+
+    line = lines[function_index]
+    while not line.startswith(b'}'):
+      function_lines.append(line)
+
+      function_index += 1
+      line = lines[function_index]
+
+    function_lines.append(line)
+    function_lines.append(lines[function_index + 1])
+
+    self._AppendOutputData(output_filename, b''.join(function_lines))
+
+    return True
+
+  def _GenerateDefinitionsHeaderFile(
+      self, project_configuration, template_mappings, definitions_name,
+      enum_declaration, output_writer):
+    """Generates a Python definitions object header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      definitions_name (str): name of definitions.
+      enum_declaration (EnumDeclaration): enumeration type declaration.
+      output_writer (OutputWriter): output writer.
+    """
+    output_filename = '{0:s}_{1:s}.h'.format(
+        project_configuration.python_module_name, definitions_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    template_directory = os.path.join(
+        self._template_directory, 'pyyal_definitions')
+
+    template_mappings['definitions_name'] = definitions_name
+    template_mappings['definitions_name_upper_case'] = definitions_name.upper()
+    template_mappings['definitions_description'] = definitions_name.replace(
+        '_', ' ')
+
+    template_filename = os.path.join(template_directory, 'pyyal_definitions.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    self._PostProcessOutputFile(output_filename, [
+        line_stages.CorrectDescriptionSpellingStage([definitions_name]),
+        self._GetSortIncludeHeadersStage(project_configuration)])
+
+  def _GenerateDefinitionsSourceFile(
+      self, project_configuration, template_mappings, definitions_name,
+      enum_declaration, output_writer):
+    """Generates a Python definitions object source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      definitions_name (str): name of definitions.
+      enum_declaration (EnumDeclaration): enumeration type declaration.
+      output_writer (OutputWriter): output writer.
+    """
+    output_filename = '{0:s}_{1:s}.c'.format(
+        project_configuration.python_module_name, definitions_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    template_directory = os.path.join(
+        self._template_directory, 'pyyal_definitions')
+
+    template_mappings['definitions_name'] = definitions_name
+    template_mappings['definitions_name_upper_case'] = definitions_name.upper()
+    template_mappings['definitions_description'] = definitions_name.replace(
+        '_', ' ')
+
+    template_mappings['definition_name'] = definitions_name[:-1]
+    template_mappings['definition_name_upper_case'] = (
+        definitions_name[:-1].upper())
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    constant_name_prefix = '{0:s}_{1:s}_'.format(
+        project_configuration.library_name, definitions_name[:-1])
+    constant_name_prefix_length = len(constant_name_prefix)
+
+    description_names = []
+    for constant_name in enum_declaration.constants.keys():
+      constant_name = constant_name.lower()
+      if not constant_name.startswith(constant_name_prefix):
+        continue
+
+      constant_name = constant_name[constant_name_prefix_length:]
+
+      if constant_name in ('undefined', 'unknown'):
+        continue
+
+      template_mappings['constant_name'] = constant_name
+      template_mappings['constant_name_upper_case'] = constant_name.upper()
+
+      template_filename = os.path.join(template_directory, 'constant.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      description_names.append(constant_name)
+
+    template_filename = os.path.join(template_directory, 'footer.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    description_names.append(definitions_name)
+
+    self._PostProcessOutputFile(output_filename, [
+        line_stages.CorrectDescriptionSpellingStage(description_names),
+        self._GetSortIncludeHeadersStage(project_configuration),
+        line_stages.SortVariableDeclarationsStage(),
+        line_stages.VerticalAlignFunctionArgumentsStage()])
+
+  def _GenerateModuleHeaderFile(
+      self, project_configuration, template_mappings, include_header_file,
+      output_writer):
+    """Generates a Python module header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      include_header_file (LibraryIncludeHeaderFile): library include header
+          file.
+      output_writer (OutputWriter): output writer.
+    """
+    signature_type = include_header_file.GetCheckSignatureType()
+
+    has_glob = self._HasGlob(project_configuration, signature_type)
+
+    template_directory = os.path.join(self._template_directory, 'pyyal_module')
+
+    output_filename = '{0:s}.h'.format(project_configuration.python_module_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    template_filename = os.path.join(template_directory, 'header.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'get_version.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if signature_type:
+      template_filename = os.path.join(template_directory, 'check_signature.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if has_glob:
+      template_filename = os.path.join(template_directory, 'glob.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'init.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'footer.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateModuleSourceFile(
+      self, project_configuration, template_mappings, include_header_file,
+      python_module_types, output_writer):
+    """Generates a Python module source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      include_header_file (LibraryIncludeHeaderFile): library include header
+          file.
+      python_module_types (set[str]): names of Python module types.
+      output_writer (OutputWriter): output writer.
+    """
+    signature_type = include_header_file.GetCheckSignatureType()
+
+    has_glob = self._HasGlob(project_configuration, signature_type)
+
+    template_directory = os.path.join(self._template_directory, 'pyyal_module')
+
+    output_filename = '{0:s}.c'.format(project_configuration.python_module_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes-start.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if signature_type:
+      template_filename = os.path.join(
+          template_directory, 'includes-file_object_io_handle.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    for type_name in sorted(python_module_types):
+      self._SetTypeNameInTemplateMappings(template_mappings, type_name)
+
+      template_filename = os.path.join(
+          template_directory, 'includes-type_object.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'includes-end.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if signature_type:
+      template_filename = os.path.join(template_directory, 'bfio.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(
+        template_directory, 'module_methods-start.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if signature_type:
+      template_filename = os.path.join(
+          template_directory, 'module_methods-check_signature.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if has_glob:
+      template_filename = os.path.join(
+          template_directory, 'module_methods-glob.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: add condition
+    #  template_filename = os.path.join(
+    #      template_directory, 'module_methods-open.c')
+    #  self._GenerateSection(
+    #      template_filename, template_mappings, output_writer, output_filename,
+    #      access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'module_methods-end.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'get_version.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if signature_type:
+      template_filename = os.path.join(template_directory, 'check_signature.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: add condition
+    # template_filename = os.path.join(template_directory, 'glob.c')
+    # self._GenerateSection(
+    #     template_filename, template_mappings, output_writer, output_filename,
+    #     access_mode='ab')
+
+    # TODO: add condition
+    # template_filename = os.path.join(template_directory, 'open.c')
+    # self._GenerateSection(
+    #     template_filename, template_mappings, output_writer, output_filename,
+    #     access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'module_definition.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'init-start.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    for type_name in sorted(python_module_types):
+      self._SetTypeNameInTemplateMappings(template_mappings, type_name)
+
+      template_filename = os.path.join(template_directory, 'init-type_object.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'init-end.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    self._PostProcessOutputFile(output_filename, [
+        self._GetSortIncludeHeadersStage(project_configuration)])
+
+  def _GenerateSequenceTypeHeaderFile(
+      self, project_configuration, template_mappings, type_name, output_writer):
+    """Generates a Python sequence type object header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      output_writer (OutputWriter): output writer.
+    """
+    sequence_type_name = self._GetSequenceName(type_name)
+
+    output_filename = '{0:s}_{1:s}.h'.format(
+        project_configuration.python_module_name, sequence_type_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    template_directory = os.path.join(
+        self._template_directory, 'pyyal_sequence_type')
+
+    self._SetSequenceTypeNameInTemplateMappings(
+        template_mappings, sequence_type_name)
+
+    template_filename = os.path.join(
+        template_directory, 'pyyal_sequence_type.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    self._PostProcessOutputFile(output_filename, [
+        line_stages.CorrectDescriptionSpellingStage(
+            [sequence_type_name, type_name]),
+        self._GetSortIncludeHeadersStage(project_configuration)])
+
+  def _GenerateSequenceTypeSourceFile(
+      self, project_configuration, template_mappings, type_name, output_writer,
+      type_is_object=False):
+    """Generates a Python sequence type object source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      output_writer (OutputWriter): output writer.
+      type_is_object (Optional[bool]): True if the type is an object.
+    """
+    sequence_type_name = self._GetSequenceName(type_name)
+
+    output_filename = '{0:s}_{1:s}.c'.format(
+        project_configuration.python_module_name, sequence_type_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    template_directory = os.path.join(
+        self._template_directory, 'pyyal_sequence_type')
+
+    python_module_include_names = set([
+        project_configuration.library_name, sequence_type_name, 'libcerror',
+        'python'])
+
+    if type_is_object:
+      python_module_include_names.add(type_name)
+
+    python_module_includes = []
+    for include_name in sorted(python_module_include_names):
+      include = '#include "{0:s}_{1:s}.h"'.format(
+          project_configuration.python_module_name, include_name)
+      python_module_includes.append(include)
+
+    self._SetSequenceTypeNameInTemplateMappings(
+        template_mappings, sequence_type_name)
+
+    template_mappings['python_module_includes'] = '\n'.join(
+        python_module_includes)
+
+    template_filename = os.path.join(
+        template_directory, 'pyyal_sequence_type.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    self._PostProcessOutputFile(output_filename, [
+        line_stages.CorrectDescriptionSpellingStage(
+            [type_name, sequence_type_name]),
+        self._GetSortIncludeHeadersStage(project_configuration),
+        line_stages.VerticalAlignAssignmentStatementsStage(),
+        line_stages.VerticalAlignFunctionArgumentsStage(),
+        line_stages.SortVariableDeclarationsStage()])
+
+  def _GenerateType(
+      self, project_configuration, template_mappings, type_name,
+      output_writer, is_pseudo_type=False):
+    """Generates the Python type object source and header files of a type.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      output_writer (OutputWriter): output writer.
+      is_pseudo_type (Optional[bool]): True if type is a pseudo type.
+
+    Returns:
+      set[tuple[str, bool]]: names of the sequence types of the type and
+          if the sequence type is an object or None if the type has no
+          function prototypes.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    self._SetTypeNameInTemplateMappings(template_mappings, type_name)
+
+    python_function_prototypes = self._GetPythonTypeObjectFunctionPrototypes(
+        project_configuration, type_name, is_pseudo_type=is_pseudo_type)
+
+    if not python_function_prototypes:
+      logging.warning((
+          'Missing function prototypes for type: {0:s} skipping '
+          'generation of Python type object source and header '
+          'files.').format(type_name))
+      return None
+
+    sequence_types = set([])
+    for type_function, python_function_prototype in iter(
+        python_function_prototypes.items()):
+
+      sequence_type_name, type_is_object = self._GetSequenceType(
+          python_function_prototype)
+      if sequence_type_name:
+        sequence_types.add((sequence_type_name, type_is_object))
+
+    self._GenerateTypeSourceFile(
+        project_configuration, template_mappings, type_name,
+        python_function_prototypes, output_writer,
+        is_pseudo_type=is_pseudo_type)
+
+    self._GenerateTypeHeaderFile(
+        project_configuration, template_mappings, type_name,
+        python_function_prototypes, output_writer,
+        is_pseudo_type=is_pseudo_type)
+
+    return sequence_types
+
+  def _GenerateTypeHeaderFile(
+      self, project_configuration, template_mappings, type_name,
+      python_function_prototypes, output_writer, is_pseudo_type=False):
+    """Generates a Python type object header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      python_function_prototypes
+          (dict[str, PythonTypeObjectFunctionPrototype]): Python type object
+          function prototypes per name.
+      output_writer (OutputWriter): output writer.
+      is_pseudo_type (Optional[bool]): True if type is a pseudo type.
+    """
+    output_filename = '{0:s}_{1:s}.h'.format(
+        project_configuration.python_module_name, type_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    open_support = 'open' in python_function_prototypes
+    with_parent = (
+        'initialize' not in python_function_prototypes and
+        'free' in python_function_prototypes)
+
+    if is_pseudo_type:
+      template_directory = os.path.join(
+          self._template_directory, 'pyyal_pseudo_type')
+    else:
+      template_directory = os.path.join(self._template_directory, 'pyyal_type')
+
+    if is_pseudo_type:
+      # TODO: determine base type.
+      template_mappings['base_type_name'] = 'item'
+      # TODO: determine base type.
+      template_mappings['base_type_description'] = 'item'
+      # TODO: determine base indicator.
+      template_mappings['base_type_indicator'] = ''
+
+    template_filename = os.path.join(template_directory, 'header.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    if open_support:
+      template_filename = 'includes_with_input.h'
+    else:
+      template_filename = 'includes.h'
+
+    template_filename = os.path.join(template_directory, template_filename)
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if open_support:
+      template_filename = 'typedef_with_input.h'
+    elif with_parent:
+      template_filename = 'typedef_with_parent.h'
+    else:
+      template_filename = 'typedef.h'
+
+    template_filename = os.path.join(template_directory, template_filename)
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    python_type_prefix = '{0:s}_{1:s}'.format(
+        project_configuration.python_module_name, type_name)
+
+    if not is_pseudo_type:
+      if with_parent:
+        template_filename = os.path.join(template_directory, 'new_with_parent.h')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer, output_filename,
+            access_mode='ab')
+
+      if open_support:
+        template_filename = os.path.join(template_directory, 'new_open.h')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer, output_filename,
+            access_mode='ab')
+
+      # TODO: make open with file object object generated conditionally?
+      # if 'open_file_object' in python_function_prototypes:
+
+      template_filename = os.path.join(template_directory, 'init.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      template_filename = os.path.join(template_directory, 'free.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    description_names = []
+    for type_function, python_function_prototype in iter(
+        python_function_prototypes.items()):
+
+      if type_function in ('free', 'initialize'):
+        continue
+
+      value_name = python_function_prototype.value_name
+
+      template_filename = '{0:s}.h'.format(type_function)
+      template_filename = os.path.join(template_directory, template_filename)
+      if not self._PathExists(template_filename):
+        template_filename = None
+        if python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_GET):
+
+          if python_function_prototype.DataTypeIsDatetime():
+            template_filename = 'get_datetime_value.h'
+
+        elif python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_GET_BY_INDEX):
+
+          value_name_prefix = ''
+          if value_name.startswith('recovered_'):
+            value_name_prefix = 'recovered_'
+            value_name = value_name[10:]
+
+          template_filename = 'get_{0:s}{1:s}_value_by_index.h'.format(
+              value_name_prefix, python_function_prototype.data_type)
+
+          sequence_value_name = self._GetSequenceName(value_name)
+          self._SetSequenceValueNameInTemplateMappings(
+              template_mappings, sequence_value_name)
+
+        if not template_filename:
+          if python_function_prototype.arguments:
+            template_filename = 'type_object_function_with_args.h'
+          else:
+            template_filename = 'type_object_function.h'
+
+        if template_filename:
+          template_filename = os.path.join(template_directory, template_filename)
+
+      if not template_filename or not self._PathExists(template_filename):
+        logging.warning((
+            'Unable to generate Python type object header for: {0:s}.{1:s} '
+            'missing template: {1:s}').format(
+                type_name, type_function, template_filename))
+        continue
+
+      self._SetTypeFunctionInTemplateMappings(template_mappings, type_function)
+      self._SetValueNameInTemplateMappings(template_mappings, value_name)
+
+      template_filename = os.path.join(template_directory, template_filename)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      description_names.append(value_name)
+
+    template_filename = os.path.join(template_directory, 'footer.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    description_names.append(type_name)
+
+    self._PostProcessOutputFile(output_filename, [
+        line_stages.CorrectDescriptionSpellingStage(description_names),
+        self._GetSortIncludeHeadersStage(project_configuration)])
+
+  def _GenerateTypeSourceFile(
+      self, project_configuration, template_mappings, type_name,
+      python_function_prototypes, output_writer, is_pseudo_type=False):
+    """Generates a Python type object source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      python_function_prototypes
+          (dict[str, PythonTypeObjectFunctionPrototype]): Python type object
+          function prototypes per name.
+      output_writer (OutputWriter): output writer.
+      is_pseudo_type (Optional[bool]): True if type is a pseudo type.
+    """
+    output_filename = '{0:s}_{1:s}.c'.format(
+        project_configuration.python_module_name, type_name)
+    output_filename = os.path.join(
+        project_configuration.python_module_name, output_filename)
+
+    lines = []
+    if self._PathExists(output_filename):
+      self._inputs.AddFile(output_filename)
+      self._RecordProfile(output_filename=output_filename, file_opens=1)
+      with open(output_filename, 'rb') as file_object:
+        lines = file_object.readlines()
+
+    bfio_support = 'open_file_object' in python_function_prototypes
+    codepage_support = 'get_ascii_codepage' in python_function_prototypes
+    open_support = 'open' in python_function_prototypes
+    with_parent = (
+        'initialize' not in python_function_prototypes and
+        'free' in python_function_prototypes)
+
+    python_module_include_names = set([
+        project_configuration.library_name, type_name, 'error', 'libcerror',
+        'python', 'unused'])
+
+    if bfio_support:
+      python_module_include_names.update(
+          set(['file_object_io_handle', 'libbfio']))
+
+    if codepage_support:
+      python_module_include_names.update(set(['codepage', 'libclocale']))
+
+    for python_function_prototype in python_function_prototypes.values():
+      if python_function_prototype.data_type in (
+          definitions.DATA_TYPE_FAT_DATE_TIME,
+          definitions.DATA_TYPE_POSIX_TIME):
+        python_module_include_names.update(set(['datetime']))
+
+      if python_function_prototype.data_type in (
+          definitions.DATA_TYPE_FILETIME,
+          definitions.DATA_TYPE_FLOATINGTIME):
+        python_module_include_names.update(set(['datetime', 'integer']))
+
+      elif python_function_prototype.data_type == definitions.DATA_TYPE_GUID:
+        python_module_include_names.add('guid')
+
+      elif python_function_prototype.data_type in (
+          definitions.DATA_TYPE_SIZE64,
+          definitions.DATA_TYPE_OFF64,
+          definitions.DATA_TYPE_UINT64):
+        python_module_include_names.add('integer')
+
+      elif python_function_prototype.data_type == definitions.DATA_TYPE_OBJECT:
+        python_module_include_names.add(python_function_prototype.object_type)
+
+        if python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_GET_BY_INDEX):
+          sequence_type_name = self._GetSequenceName(
+              python_function_prototype.object_type)
+          python_module_include_names.add(sequence_type_name)
+
+      elif python_function_prototype.data_type == definitions.DATA_TYPE_STRING:
+        if python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_GET_BY_INDEX):
+          sequence_type_name = python_function_prototype.arguments[0]
+
+          sequence_type_prefix, _, sequence_type_suffix = (
+              sequence_type_name.rpartition('_'))
+
+          if sequence_type_suffix in ('entry', 'index'):
+            sequence_type_name = sequence_type_prefix
+
+          sequence_type_name = self._GetSequenceName(sequence_type_name)
+          python_module_include_names.add(sequence_type_name)
+
+    if is_pseudo_type:
+      template_directory = os.path.join(
+          self._template_directory, 'pyyal_pseudo_type')
+    else:
+      template_directory = os.path.join(self._template_directory, 'pyyal_type')
+
+    if is_pseudo_type:
+      # TODO: determine base type.
+      template_mappings['base_type_name'] = 'item'
+      # TODO: determine base type.
+      template_mappings['base_type_description'] = 'item'
+      # TODO: determine base indicator.
+      template_mappings['base_type_indicator'] = ''
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    # TODO: include header of sub types
+
+    python_module_includes = []
+    for include_name in sorted(python_module_include_names):
+      include = '#include "{0:s}_{1:s}.h"'.format(
+          project_configuration.python_module_name, include_name)
+      python_module_includes.append(include)
+
+    template_mappings['python_module_includes'] = '\n'.join(
+        python_module_includes)
+
+    if codepage_support:
+      template_filename = 'includes_with_codepage.c'
+    else:
+      template_filename = 'includes.c'
+
+    template_filename = os.path.join(template_directory, template_filename)
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if bfio_support:
+      template_filename = os.path.join(template_directory, 'have_bfio.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    self._GenerateTypeSourceFileTypeObjectMethods(
+        project_configuration, template_mappings, type_name,
+        python_function_prototypes, output_writer, output_filename)
+
+    self._GenerateTypeSourceFileTypeObjectGetSetDefinitions(
+        project_configuration, template_mappings, type_name,
+        python_function_prototypes, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'type_object.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if not is_pseudo_type:
+      if with_parent:
+        template_filename = os.path.join(template_directory, 'new_with_parent.c')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer, output_filename,
+            access_mode='ab')
+
+      if open_support:
+        template_filename = os.path.join(template_directory, 'new_open.c')
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer, output_filename,
+            access_mode='ab')
+
+      if with_parent:
+        template_filename = 'init_with_parent.c'
+      else:
+        template_filename = 'init.c'
+
+      template_filename = os.path.join(template_directory, template_filename)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+      if with_parent:
+        template_filename = 'free_with_parent.c'
+      else:
+        template_filename = 'free.c'
+
+      template_filename = os.path.join(template_directory, template_filename)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    generate_get_value_type_object = False
+    value_type_objects = set([])
+
+    for type_function, python_function_prototype in iter(
+        python_function_prototypes.items()):
+
+      if type_function in ('free', 'initialize'):
+        continue
+
+      # TODO: use prefix in template?
+      value_name, value_name_prefix = (
+          python_function_prototype.GetValueNameAndPrefix())
+
+      # TODO: add get_cache_directory template
+
+      if type_function == 'get_format_version':
+        self._SetValueTypeInTemplateMappings(
+            template_mappings, python_function_prototype.value_type)
+
+      template_filename = '{0:s}.c'.format(type_function)
+      template_filename = os.path.join(template_directory, template_filename)
+      if not self._PathExists(template_filename):
+        template_filename = None
+
+        # TODO: make more generic.
+        if type_function == 'set_key':
+          template_filename = 'set_key_with_mode.c'
+
+        elif type_function == 'set_keys':
+          template_filename = 'set_keys_with_mode.c'
+
+        elif type_function == 'set_password':
+          template_filename = 'set_{0:s}_value.c'.format('string')
+
+        elif python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_COPY_FROM):
+          template_filename = 'copy_from_{0:s}_value.c'.format(
+              python_function_prototype.data_type)
+
+        elif python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_COPY):
+          template_filename = 'copy_{0:s}_value.c'.format(
+              python_function_prototype.data_type)
+
+        elif python_function_prototype.function_type in (
+            definitions.FUNCTION_TYPE_GET,
+            definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
+            definitions.FUNCTION_TYPE_GET_BY_INDEX,
+            definitions.FUNCTION_TYPE_GET_BY_NAME,
+            definitions.FUNCTION_TYPE_GET_BY_PATH):
+
+          if value_name.startswith('recovered_'):
+            value_name_prefix = 'recovered_'
+            value_name = value_name[10:]
+
+          elif value_name_prefix:
+            value_name_prefix = '{0:s}_'.format(value_name_prefix)
+
+          else:
+            value_name_prefix = ''
+
+          if python_function_prototype.function_type == (
+              definitions.FUNCTION_TYPE_GET):
+            if not python_function_prototype.arguments:
+              if value_name.startswith('number_of_recovered_'):
+                value_name = value_name[20:]
+                template_filename = 'get_number_of_recovered_{0:s}_value.c'.format(
+                    python_function_prototype.data_type)
+
+              else:
+                template_filename = 'get_{0:s}{1:s}_value.c'.format(
+                    value_name_prefix, python_function_prototype.data_type)
+
+          elif python_function_prototype.function_type == (
+              definitions.FUNCTION_TYPE_GET_BY_INDEX):
+
+            template_filename = 'get_{0:s}{1:s}_value_by_index.c'.format(
+                value_name_prefix, python_function_prototype.data_type)
+
+            if python_function_prototype.object_type:
+              sequence_type_name = self._GetSequenceName(
+                  python_function_prototype.object_type)
+              self._SetSequenceTypeNameInTemplateMappings(
+                  template_mappings, sequence_type_name)
+
+            sequence_value_name = self._GetSequenceName(value_name)
+            self._SetSequenceValueNameInTemplateMappings(
+                template_mappings, sequence_value_name)
+
+          elif python_function_prototype.function_type in (
+              definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
+              definitions.FUNCTION_TYPE_GET_BY_NAME,
+              definitions.FUNCTION_TYPE_GET_BY_PATH):
+
+            _, _, type_function_suffix = type_function.partition('_by_')
+
+            template_filename = 'get_{0:s}{1:s}_value_by_{2:s}.c'.format(
+                value_name_prefix, python_function_prototype.data_type,
+                type_function_suffix)
+
+          if python_function_prototype.data_type == (
+              definitions.DATA_TYPE_OBJECT):
+            if value_name_prefix != 'root_':
+              value_name_prefix = ''
+
+            if python_function_prototype.value_type not in value_type_objects:
+              generate_get_value_type_object = True
+              value_type_objects.add(python_function_prototype.value_type)
+
+          if python_function_prototype.object_type:
+            self._SetValueTypeInTemplateMappings(
+                template_mappings, python_function_prototype.object_type)
+
+        elif python_function_prototype.function_type == (
+            definitions.FUNCTION_TYPE_IS):
+          template_filename = 'is_value.c'
+
+        if template_filename:
+          template_filename = os.path.join(template_directory, template_filename)
+
+      if not template_filename or not self._PathExists(template_filename):
+        logging.warning((
+            'Unable to generate Python type object source code for: '
+            '{0:s}.{1:s} missing template: {1:s}').format(
+                type_name, type_function, template_filename))
+        continue
+
+      self._SetValueNameInTemplateMappings(template_mappings, value_name)
+
+      if generate_get_value_type_object:
+        search_string = (
+            'PyTypeObject *{0:s}_{1:s}_get_{2:s}_type_object(').format(
+                project_configuration.python_module_name, type_name,
+                value_name)
+
+        search_string = search_string.encode('ascii')
+        result = self._CopyFunctionToOutputFile(
+            lines, search_string, output_filename)
+
+        if not result:
+          additional_template_filename = 'get_value_type_object.c'
+          additional_template_filename = os.path.join(
+              template_directory, additional_template_filename)
+          self._GenerateSection(
+              additional_template_filename, template_mappings, output_writer,
+              output_filename, access_mode='ab')
+
+        generate_get_value_type_object = False
+
+      result = False
+      if type_function in (
+          'get_data_as_datetime', 'get_data_as_floating_point',
+          'get_data_as_integer'):
+        search_string = (
+            'PyObject *{0:s}_{1:s}_{2:s}(').format(
+                project_configuration.python_module_name, type_name,
+                type_function)
+
+        search_string = search_string.encode('ascii')
+        result = self._CopyFunctionToOutputFile(
+            lines, search_string, output_filename)
+
+      if not result:
+        self._GenerateSection(
+            template_filename, template_mappings, output_writer, output_filename,
+            access_mode='ab')
+
+    self._PostProcessOutputFile(output_filename, [
+        line_stages.CorrectDescriptionSpellingStage([type_name]),
+        self._GetSortIncludeHeadersStage(project_configuration),
+        line_stages.VerticalAlignAssignmentStatementsStage(),
+        line_stages.VerticalAlignFunctionArgumentsStage(),
+        line_stages.SortVariableDeclarationsStage()])
+
+  def _GenerateTypeSourceFileTypeObjectMethods(
+      self, project_configuration, template_mappings, type_name,
+      python_function_prototypes, output_writer, output_filename):
+    """Generates the type object methods for a Python type source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      python_function_prototypes
+          (dict[str, PythonTypeObjectFunctionPrototype]): Python type object
+          function prototypes per name.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_directory = os.path.join(self._template_directory, 'pyyal_type')
+
+    python_type_object_methods = []
+    python_type_object_get_set_definitions = []
+    for type_function, python_function_prototype in iter(
+        python_function_prototypes.items()):
+
+      if type_function in ('free', 'initialize'):
+        continue
+
+      if not python_function_prototype.arguments:
+        arguments_flags = 'METH_NOARGS'
+      else:
+        arguments_flags = 'METH_VARARGS | METH_KEYWORDS'
+
+      arguments_string = ', '.join(python_function_prototype.arguments)
+      data_type = python_function_prototype.GetDataTypeDescription()
+      python_type_object_methods.extend([
+          '',
+          '\t{{ "{0:s}",'.format(type_function),
+          '\t  (PyCFunction) {0:s},'.format(python_function_prototype.name),
+          '\t  {0:s},'.format(arguments_flags),
+          '\t  "{0:s}({1:s}) -> {2:s}\\n"'.format(
+              type_function, arguments_string, data_type),
+          '\t  "\\n"'])
+
+      if (type_function == 'get_offset' and
+          'read_buffer' in python_function_prototypes and
+          'seek_offset' in python_function_prototypes):
+
+        description = ['Retrieves the current offset within the data.']
+      else:
+        description = python_function_prototype.GetDescription()
+
+      for index, line in enumerate(description):
+        # Correct xml => XML in description for pyevtx.
+        line = line.replace(' xml ', ' XML ')
+
+        if index < len(description) - 1:
+          python_type_object_methods.append('\t  "{0:s}\\n"'.format(line))
+        else:
+          python_type_object_methods.append('\t  "{0:s}" }},'.format(line))
+
+      if (type_function == 'get_offset' and
+          'read_buffer' in python_function_prototypes and
+          'seek_offset' in python_function_prototypes):
+
+        python_type_object_methods.extend([
+            '',
+            '\t{ "read",',
+            '\t  (PyCFunction) {0:s}_{1:s}_read_buffer,'.format(
+                project_configuration.python_module_name, type_name),
+            '\t  METH_VARARGS | METH_KEYWORDS,',
+            '\t  "read(size) -> String\\n"',
+            '\t  "\\n"',
+            '\t  "Reads a buffer of data." },',
+            '',
+            '\t{ "seek",',
+            '\t  (PyCFunction) {0:s}_{1:s}_seek_offset,'.format(
+                project_configuration.python_module_name, type_name),
+            '\t  METH_VARARGS | METH_KEYWORDS,',
+            '\t  "seek(offset, whence) -> None\\n"',
+            '\t  "\\n"',
+            '\t  "Seeks an offset within the data." },',
+            '',
+            '\t{ "tell",',
+            '\t  (PyCFunction) {0:s}_{1:s}_get_offset,'.format(
+                project_configuration.python_module_name, type_name),
+            '\t  METH_NOARGS,',
+            '\t  "tell() -> Integer\\n"',
+            '\t  "\\n"',
+            '\t  "Retrieves the current offset within the data." },'])
+
+      elif (python_function_prototype.DataTypeIsDatetime() and
+            type_function != 'get_data_as_datetime'):
+        python_type_object_methods.extend([
+            '',
+            '\t{{ "{0:s}_as_integer",'.format(type_function),
+            '\t  (PyCFunction) {0:s}_as_integer,'.format(
+                python_function_prototype.name),
+            '\t  METH_NOARGS,',
+            '\t  "{0:s}_as_integer({1:s}) -> Integer or None\\n"'.format(
+                type_function, arguments_string),
+            '\t  "\\n"'])
+
+        if python_function_prototype.data_type == (
+            definitions.DATA_TYPE_FAT_DATE_TIME):
+          description[0] = (
+              '{0:s} as a 32-bit integer containing a FAT date time '
+              'value.').format(description[0][:-1])
+
+        elif python_function_prototype.data_type == (
+            definitions.DATA_TYPE_FILETIME):
+          description[0] = (
+              '{0:s} as a 64-bit integer containing a FILETIME value.').format(
+                  description[0][:-1])
+
+        elif python_function_prototype.data_type == (
+            definitions.DATA_TYPE_FLOATINGTIME):
+          description[0] = (
+              '{0:s} as a 64-bit integer containing a floatingtime value.').format(
+                  description[0][:-1])
+
+        elif python_function_prototype.data_type == (
+            definitions.DATA_TYPE_POSIX_TIME):
+          description[0] = (
+              '{0:s} as a 32-bit integer containing a POSIX timestamp '
+              'value.').format(description[0][:-1])
+
+        for index, line in enumerate(description):
+          if index < len(description) - 1:
+            python_type_object_methods.append('\t  "{0:s}\\n"'.format(line))
+          else:
+            python_type_object_methods.append('\t  "{0:s}" }},'.format(line))
+
+      elif (python_function_prototype.arguments and
+            python_function_prototype.data_type in (
+                definitions.DATA_TYPE_OBJECT,
+                definitions.DATA_TYPE_STRING)):
+          # TODO: add method for the sequence object.
+        pass
+
+    python_type_object_methods.extend([
+        '',
+        '\t/* Sentinel */',
+        '\t{ NULL, NULL, 0, NULL }'])
+
+    template_mappings['python_type_object_methods'] = '\n'.join(
+        python_type_object_methods)
+
+    template_filename = os.path.join(
+        template_directory, 'type_object_methods.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateTypeSourceFileTypeObjectGetSetDefinitions(
+      self, project_configuration, template_mappings, type_name,
+      python_function_prototypes, output_writer, output_filename):
+    """Generates the type object definitions for a Python type source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      type_name (str): name of type.
+      python_function_prototypes
+          (dict[str, PythonTypeObjectFunctionPrototype]): Python type object
+          function prototypes per name.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_directory = os.path.join(self._template_directory, 'pyyal_type')
+
+    python_type_object_get_set_definitions = []
+    for type_function, python_function_prototype in iter(
+        python_function_prototypes.items()):
+
+      if python_function_prototype.function_type not in (
+          definitions.FUNCTION_TYPE_COPY,
+          definitions.FUNCTION_TYPE_GET,
+          definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
+          definitions.FUNCTION_TYPE_GET_BY_INDEX,
+          definitions.FUNCTION_TYPE_GET_BY_NAME,
+          definitions.FUNCTION_TYPE_GET_BY_PATH):
+        continue
+
+      if (type_function.endswith('_by_name') or
+          type_function.endswith('_by_path')):
+        continue
+
+      if (type_function == 'get_offset' and
+          'read_buffer' in python_function_prototypes and
+          'seek_offset' in python_function_prototypes):
+        continue
+
+      if type_function != 'get_ascii_codepage':
+        setter_function = '0'
+      else:
+        setter_function = (
+            '{0:s}_{1:s}_set_ascii_codepage_setter').format(
+                project_configuration.python_module_name, type_name)
+
+      description = python_function_prototype.GetAttributeDescription()
+
+      # Correct xml => XML in description for pyevtx.
+      description = description.replace(' xml ', ' XML ')
+
+      # TODO: fix libcreg getter name keies instead of keys.
+
+      if not python_function_prototype.arguments:
+        python_type_object_get_set_definitions.extend([
+            '',
+            '\t{{ "{0:s}",'.format(type_function[4:]),
+            '\t  (getter) {0:s},'.format(python_function_prototype.name),
+            '\t  (setter) {0:s},'.format(setter_function),
+            '\t  "{0:s}",'.format(description),
+            '\t  NULL },'])
+
+      if (python_function_prototype.arguments and
+          python_function_prototype.data_type in (
+              definitions.DATA_TYPE_OBJECT,
+              definitions.DATA_TYPE_STRING)):
+
+        sequence_type_function = self._GetSequenceName(type_function[4:])
+        sequence_type_getter = self._GetSequenceName(
+            python_function_prototype.name)
+        sequence_type_description = self._GetSequenceName(description[:-1])
+
+        python_type_object_get_set_definitions.extend([
+            '',
+            '\t{{ "{0:s}",'.format(sequence_type_function),
+            '\t  (getter) {0:s},'.format(sequence_type_getter),
+            '\t  (setter) {0:s},'.format(setter_function),
+            '\t  "{0:s}.",'.format(sequence_type_description),
+            '\t  NULL },'])
+
+      if type_function == 'get_cache_directory':
+        sequence_type_function = self._GetSequenceName(type_function[4:])
+        sequence_type_getter = self._GetSequenceName(
+            python_function_prototype.name)
+        sequence_type_description = self._GetSequenceName(description[:-1])
+
+        python_type_object_get_set_definitions.extend([
+            '',
+            '\t{{ "{0:s}",'.format(sequence_type_function),
+            '\t  (getter) {0:s},'.format(sequence_type_getter),
+            '\t  (setter) {0:s},'.format(setter_function),
+            '\t  "{0:s}.",'.format(sequence_type_description),
+            '\t  NULL },'])
+
+    python_type_object_get_set_definitions.extend([
+        '',
+        '\t/* Sentinel */',
+        '\t{ NULL, NULL, NULL, NULL, NULL }'])
+
+    template_mappings['python_type_object_get_set_definitions'] = '\n'.join(
+        python_type_object_get_set_definitions)
+
+    template_filename = os.path.join(
+        template_directory, 'type_object_get_set_definitions.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GetPythonTypeObjectFunctionPrototype(
+      self, project_configuration, type_name, type_function, function_prototype,
+      is_pseudo_type=False):
+    """Determines the Python type object function prototypes.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      type_name (str): type name.
+      type_function (str): type function.
+      function_prototype (FunctionPrototype): C function prototype.
+      is_pseudo_type (Optional[bool]): True if type is a pseudo type.
+
+    Returns:
+      PythonTypeObjectFunctionPrototype: Python type object function prototype
+          or None.
+    """
+    if len(function_prototype.arguments) < 2:
+      logging.warning('Unsupported function prototype: {0:s}'.format(
+          function_prototype.name))
+      return
+
+    if type_function in ('free', 'initialize'):
+      self_argument = '{0:s}_{1:s}_t **{1:s}'.format(
+          project_configuration.library_name, type_name)
+
+    elif is_pseudo_type:
+      base_type_name = 'item'
+      self_argument = '{0:s}_{1:s}_t *{2:s}'.format(
+          project_configuration.library_name, base_type_name, type_name)
+
+    else:
+      self_argument = '{0:s}_{1:s}_t *{1:s}'.format(
+          project_configuration.library_name, type_name)
+
+    function_argument = function_prototype.arguments[0]
+    function_argument_string = function_argument.CopyToString()
+    if function_argument_string != self_argument:
+      logging.warning('Unsupported function prototype: {0:s}'.format(
+          function_prototype.name))
+      return
+
+    function_argument = function_prototype.arguments[-1]
+    function_argument_string = function_argument.CopyToString()
+    if function_argument_string != 'libcerror_error_t **error':
+      logging.warning('Unsupported function prototype: {0:s}'.format(
+          function_prototype.name))
+      return
+
+    # TODO: add support for glob functions
+    # TODO: add support for has, is functions
+
+    arguments = []
+    function_type = None
+    object_type = None
+    data_type = definitions.DATA_TYPE_NONE
+    value_type = None
+
+    # TODO: add override for
+    # if (type_function == 'copy_link_target_identifier_data' and
+    #    project_configuration.library_name == 'liblnk'):
+
+    if (type_function == 'get_cache_directory_name' and
+        project_configuration.library_name == 'libmsiecf'):
+      type_function = 'get_cache_directory'
+
+      arguments = ['cache_directory_index']
+      function_type = definitions.FUNCTION_TYPE_GET_BY_INDEX
+      data_type = definitions.DATA_TYPE_NARROW_STRING
+
+    elif type_function == 'close':
+      function_type = definitions.FUNCTION_TYPE_CLOSE
+
+    elif type_function.startswith('copy_from'):
+      function_type = definitions.FUNCTION_TYPE_COPY_FROM
+
+      value_argument_index = 1
+
+      function_argument = function_prototype.arguments[value_argument_index]
+      value_argument_string = function_argument.CopyToString()
+
+      _, _, argument_name = value_argument_string.rpartition(' ')
+      argument_name.lstrip('*')
+      arguments.append(argument_name)
+
+      function_argument = function_prototype.arguments[
+          value_argument_index + 1]
+      value_size_argument_string = function_argument.CopyToString()
+
+      if (value_argument_string == 'const uint8_t *byte_stream' and
+          value_size_argument_string == 'size_t byte_stream_size'):
+        data_type = definitions.DATA_TYPE_BINARY_DATA
+
+      elif (value_argument_string == 'const uint8_t *data' and
+            value_size_argument_string == 'size_t data_size'):
+        data_type = definitions.DATA_TYPE_BINARY_DATA
+
+    elif type_function.startswith('copy_'):
+      function_type = definitions.FUNCTION_TYPE_COPY
+      data_type = definitions.DATA_TYPE_BINARY_DATA
+
+      # TODO: change copy to or add copy_to
+
+    elif type_function == 'free':
+      function_type = definitions.FUNCTION_TYPE_FREE
+
+    elif type_function.startswith('get_'):
+      function_type = definitions.FUNCTION_TYPE_GET
+
+      if type_function == 'get_ascii_codepage':
+        # TODO: replace this by definitions.DATA_TYPE_NARROW_STRING ?
+        data_type = 'String'
+
+      elif type_function == 'get_format_version':
+        function_argument = function_prototype.arguments[1]
+        value_argument_string = function_argument.CopyToString()
+
+        data_type = definitions.DATA_TYPE_STRING
+        value_type, _, _ = value_argument_string.partition(' ')
+
+      else:
+        type_function_prefix, _, type_function_suffix = (
+            type_function.partition('_by_'))
+
+        value_argument_index = 1
+
+        function_argument = function_prototype.arguments[value_argument_index]
+        value_argument_string = function_argument.CopyToString()
+
+        _, _, value_argument_suffix = value_argument_string.rpartition('_')
+
+        # Not all get_by_index functions have the suffix _by_index so we need
+        # to detect them based on the function arguments.
+        if (value_argument_string.startswith('int ') and
+            value_argument_suffix in ('entry', 'index')):
+          function_type = definitions.FUNCTION_TYPE_GET_BY_INDEX
+
+          _, _, argument_name = value_argument_string.rpartition(' ')
+
+          arguments.append(argument_name)
+          value_argument_index = 2
+
+        elif type_function_suffix == 'identifier':
+          function_type = definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER
+
+          arguments.append(type_function_suffix)
+          value_argument_index = 2
+
+        elif type_function_suffix in ('utf8_name', 'utf8_path'):
+          type_function_suffix = type_function_suffix[5:]
+
+          if value_argument_string != 'const uint8_t *utf8_string':
+            logging.warning('Unsupported function prototype: {0:s}'.format(
+                function_prototype.name))
+            return
+
+          function_argument = function_prototype.arguments[2]
+          function_argument_string = function_argument.CopyToString()
+
+          if function_argument_string != 'size_t utf8_string_length':
+            logging.warning('Unsupported function prototype: {0:s}'.format(
+                function_prototype.name))
+            return
+
+          if type_function_suffix == 'name':
+            function_type = definitions.FUNCTION_TYPE_GET_BY_NAME
+          else:
+            function_type = definitions.FUNCTION_TYPE_GET_BY_PATH
+
+          arguments.append(type_function_suffix)
+          value_argument_index = 3
+
+        if value_argument_index != 1:
+          function_argument = function_prototype.arguments[value_argument_index]
+          value_argument_string = function_argument.CopyToString()
+
+        if value_argument_index + 1 < len(function_prototype.arguments):
+          function_argument = function_prototype.arguments[
+              value_argument_index + 1]
+          value_size_argument_string = function_argument.CopyToString()
+
+          if value_argument_string == 'uint64_t *filetime':
+            data_type = definitions.DATA_TYPE_FILETIME
+
+          elif value_argument_string == 'uint64_t *floatingtime':
+            data_type = definitions.DATA_TYPE_FLOATINGTIME
+
+          elif value_argument_string == 'uint32_t *fat_date_time':
+            data_type = definitions.DATA_TYPE_FAT_DATE_TIME
+
+          elif value_argument_string == 'uint32_t *posix_time':
+            data_type = definitions.DATA_TYPE_POSIX_TIME
+
+          elif (value_argument_string == 'uint8_t *data' and
+                value_size_argument_string == 'size_t data_size'):
+            data_type = definitions.DATA_TYPE_BINARY_DATA
+
+          elif (value_argument_string == 'uint8_t *guid_data' and
+                value_size_argument_string == 'size_t guid_data_size'):
+            data_type = definitions.DATA_TYPE_GUID
+
+          elif (value_argument_string == 'uint8_t *utf8_string' and
+                value_size_argument_string == 'size_t utf8_string_size'):
+            data_type = definitions.DATA_TYPE_STRING
+
+          elif (value_argument_string == 'char *string' and
+                value_size_argument_string == 'size_t string_size'):
+            data_type = definitions.DATA_TYPE_NARROW_STRING
+
+          elif value_argument_string.startswith('double *'):
+            data_type = definitions.DATA_TYPE_DOUBLE
+
+          elif value_argument_string.startswith('float *'):
+            data_type = definitions.DATA_TYPE_FLOAT
+
+          elif value_argument_string.startswith('int *'):
+            data_type = definitions.DATA_TYPE_INT
+
+          elif value_argument_string.startswith('int32_t *'):
+            data_type = definitions.DATA_TYPE_INT32
+
+          elif value_argument_string.startswith('off64_t *'):
+            data_type = definitions.DATA_TYPE_OFF64
+
+          elif value_argument_string.startswith('size32_t *'):
+            data_type = definitions.DATA_TYPE_SIZE32
+
+          elif value_argument_string.startswith('size64_t *'):
+            data_type = definitions.DATA_TYPE_SIZE64
+
+          elif value_argument_string.startswith('uint8_t *'):
+            data_type = definitions.DATA_TYPE_UINT8
+
+          elif value_argument_string.startswith('uint16_t *'):
+            data_type = definitions.DATA_TYPE_UINT16
+
+          elif value_argument_string.startswith('uint32_t *'):
+            data_type = definitions.DATA_TYPE_UINT32
+
+          elif value_argument_string.startswith('uint64_t *'):
+            data_type = definitions.DATA_TYPE_UINT64
+
+          elif value_argument_string.startswith(
+              project_configuration.library_name):
+            data_type = definitions.DATA_TYPE_OBJECT
+
+            object_type, _, _ = value_argument_string.partition(' ')
+            _, _, object_type = object_type.partition('_')
+            object_type = object_type[:-2]
+
+    elif type_function == 'initialize':
+      function_type = definitions.FUNCTION_TYPE_INITIALIZE
+
+    elif type_function.startswith('is_'):
+      function_type = definitions.FUNCTION_TYPE_IS
+      data_type = definitions.DATA_TYPE_BOOLEAN
+
+    elif type_function == 'open' or type_function.startswith('open_'):
+      function_type = definitions.FUNCTION_TYPE_OPEN
+
+      if type_function == 'open':
+        arguments = ['filename', 'mode=\'r\'']
+
+      elif type_function == 'open_file_io_handle':
+        arguments = ['file_object', 'mode=\'r\'']
+
+    elif type_function.startswith('read_'):
+      function_type = definitions.FUNCTION_TYPE_READ
+
+      if type_function == 'read_buffer':
+        data_type = definitions.DATA_TYPE_BINARY_DATA
+        arguments = ['size']
+
+      elif type_function == 'read_buffer_at_offset':
+        data_type = definitions.DATA_TYPE_BINARY_DATA
+        arguments = ['size', 'offset']
+
+    elif type_function.startswith('seek_'):
+      function_type = definitions.FUNCTION_TYPE_SEEK
+
+      if type_function == 'seek_offset':
+        arguments = ['offset', 'whence']
+
+    elif type_function.startswith('set_'):
+      function_type = definitions.FUNCTION_TYPE_SET
+
+      # TODO: make more generic.
+      if type_function == 'set_ascii_codepage':
+        arguments = ['codepage']
+
+      elif type_function == 'set_parent_file':
+        arguments = ['parent_file']
+
+      elif type_function == 'set_key':
+        arguments = ['mode', 'key']
+
+      elif type_function == 'set_keys':
+        arguments = ['mode', 'key', 'tweak_key']
+
+      elif type_function in (
+          'set_password', 'set_recovery_password', 'set_utf8_password'):
+        arguments = ['password']
+
+      else:
+        value_argument_index = 1
+
+        function_argument = function_prototype.arguments[value_argument_index]
+        value_argument_string = function_argument.CopyToString()
+
+        _, _, argument_name = value_argument_string.rpartition(' ')
+        argument_name.lstrip('*')
+        arguments.append(argument_name)
+
+        function_argument = function_prototype.arguments[
+            value_argument_index + 1]
+        value_size_argument_string = function_argument.CopyToString()
+
+        if (value_argument_string == 'uint8_t *data' and
+            value_size_argument_string == 'size_t data_size'):
+          data_type = definitions.DATA_TYPE_BINARY_DATA
+
+        elif (value_argument_string == 'uint8_t *utf8_string' and
+              value_size_argument_string == 'size_t utf8_string_size'):
+          data_type = definitions.DATA_TYPE_STRING
+
+        elif (value_argument_string == 'char *string' and
+              value_size_argument_string == 'size_t string_size'):
+          data_type = definitions.DATA_TYPE_NARROW_STRING
+
+        elif value_argument_string.startswith(
+            project_configuration.library_name):
+          data_type = definitions.DATA_TYPE_OBJECT
+
+          object_type, _, _ = value_argument_string.partition(' ')
+          _, _, object_type = object_type.partition('_')
+          object_type = object_type[:-2]
+
+    elif type_function == 'signal_abort':
+      function_type = definitions.FUNCTION_TYPE_UTILITY
+
+    # elif type_function.startswith('write_'):
+    #   function_type = definitions.FUNCTION_TYPE_WRITE
+
+    python_function_prototype = sources.PythonTypeObjectFunctionPrototype(
+        project_configuration.python_module_name, type_name, type_function)
+
+    python_function_prototype.arguments = arguments
+    python_function_prototype.data_type = data_type
+    python_function_prototype.function_type = function_type
+    python_function_prototype.object_type = object_type
+    python_function_prototype.value_type = value_type
+
+    return python_function_prototype
+
+  def _GetPythonTypeObjectFunctionPrototypes(
+      self, project_configuration, type_name, is_pseudo_type=False):
+    """Determines the Python type object function prototypes.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      type_name (str): name of type.
+      is_pseudo_type (Optional[bool]): True if type is a pseudo type.
+
+    Returns:
+      dict[str, PythonTypeObjectFunctionPrototype]: Python type object
+          function prototypes per name.
+    """
+    # TODO: handle types in non-matching header files.
+    header_file = self._GetTypeLibraryHeaderFile(
+        project_configuration, type_name)
+    if not header_file:
+      return None
+
+    function_name_prefix = '{0:s}_{1:s}_'.format(
+        project_configuration.library_name, type_name)
+    function_name_prefix_length = len(function_name_prefix)
+
+    functions_per_name = header_file.functions_per_name
+
+    python_function_prototypes = collections.OrderedDict()
+    for function_name, function_prototype in iter(functions_per_name.items()):
+      if not function_prototype.have_extern:
+        continue
+
+      if not function_name.startswith(function_name_prefix):
+        logging.warning('Skipping unsupported API function: {0:s}'.format(
+            function_name))
+        continue
+
+      type_function = function_name[function_name_prefix_length:]
+      # Skip functions that are a wide character variant of another function.
+      if type_function.endswith('_wide'):
+        continue
+
+      # Skip functions that retrieves the size of binary data.
+      if (type_function.startswith('get_') and
+          type_function.endswith('_data_size')):
+        continue
+
+      # Skip functions that retrieve the size of an UTF-8 string.
+      if (type_function.startswith('get_utf8_') and
+          type_function.endswith('_size')):
+        continue
+
+      if (type_function.startswith('get_') and
+          type_function.endswith('_utf8_string_size')):
+        continue
+
+      # Skip functions that are a UTF-16 variant of another function.
+      if (type_function.startswith('get_utf16_') or
+          type_function.startswith('set_utf16_') or
+          (type_function.startswith('get_') and (
+              type_function.endswith('_by_utf16_name') or
+              type_function.endswith('_by_utf16_path') or
+              type_function.endswith('_utf16_string') or
+              type_function.endswith('_utf16_string_size')))):
+        continue
+
+      # TODO: ignore these functions for now.
+      if (type_function == 'get_flags' and
+          project_configuration.library_name not in (
+              'libfwnt', )):
+        continue
+
+      # TODO: improve check only to apply for types with pseudo types.
+      if (type_function == 'get_type' and
+          project_configuration.library_name in (
+              'libmsiecf', 'libolecf', 'libpff')):
+        continue
+
+      # TODO: remove when removed after deprecation.
+      if (type_function.startswith('get_value_') and
+          type_function != 'get_value_type' and
+          project_configuration.library_name in (
+              'libolecf', )):
+        continue
+
+      if (type_function == 'get_version' and
+          project_configuration.library_name in (
+              'libevt', 'libevtx')):
+        continue
+
+      if (type_function.startswith('write_buffer') and
+          project_configuration.library_name not in (
+              'libewf', )):
+        continue
+
+      if type_function in (
+          'get_offset_range', 'get_number_of_unallocated_blocks',
+          'get_unallocated_block'):
+        continue
+
+      python_function_prototype = self._GetPythonTypeObjectFunctionPrototype(
+          project_configuration, type_name, type_function, function_prototype,
+          is_pseudo_type=is_pseudo_type)
+
+      if (not python_function_prototype or
+          not python_function_prototype.function_type):
+        logging.warning('Skipping unsupported type function: {0:s}'.format(
+            function_name))
+        continue
+
+      # TODO: Skip functions that retrieve the size of a narrow string.
+
+      type_function = python_function_prototype.type_function
+      python_function_prototypes[type_function] = python_function_prototype
+
+    return python_function_prototypes
+
+  def _GetSequenceName(self, name):
+    """Determines the sequence type or value name.
+
+    Args:
+      name (str): name of type or value.
+
+    Returns:
+      str: sequence type or value name.
+    """
+    if name == 'key':
+      return '{0:s}s'.format(name)
+
+    if (name[-1] in ('s', 'x', 'z') or (
+        name[-1] == 'h'  and name[-2] in ('c', 's'))):
+      return '{0:s}es'.format(name)
+
+    if name[-1] == 'y':
+      return '{0:s}ies'.format(name[:-1])
+
+    return '{0:s}s'.format(name)
+
+  def _GetSequenceType(self, python_function_prototype):
+    """Determines if the function prototype implies a sequence type.
+
+    Args:
+      python_function_prototype (PythonTypeObjectFunctionPrototype): Python
+          type object function prototype.
+
+    Returns:
+      tuple: contains:
+        str: sequence type name or None.
+        bool: True if the sequence type is an object type or None.
+    """
+    if not python_function_prototype.arguments:
+      return None, None
+
+    if python_function_prototype.function_type not in (
+        definitions.FUNCTION_TYPE_GET,
+        definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
+        definitions.FUNCTION_TYPE_GET_BY_INDEX,
+        definitions.FUNCTION_TYPE_GET_BY_NAME,
+        definitions.FUNCTION_TYPE_GET_BY_PATH):
+      return None, None
+
+    if python_function_prototype.data_type == definitions.DATA_TYPE_OBJECT:
+      return python_function_prototype.object_type, True
+
+    elif python_function_prototype.data_type == definitions.DATA_TYPE_STRING:
+      return python_function_prototype.value_name, False
+
+    return None, None
+
+  def _GetTemplateMappings(self, project_configuration):
+    """Retrieves the template mappings.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      dict[str, str]: string template mappings, where the key maps to the name
+          of a template variable.
+    """
+    template_mappings = super(
+        PythonModuleSourceFileGenerator, self)._GetTemplateMappings(
+            project_configuration,
+            authors_separator=',\n *                          ')
+
+    # TODO: have source formatter take care of the alignment.
+    # Used to align source in pyyal/pyyal_file_object_io_handle.c
+    alignment_padding = len(project_configuration.library_name) - 6
+    template_mappings['alignment_padding'] = ' ' * alignment_padding
+
+    return template_mappings
+
+  def Generate(self, project_configuration, output_writer):
+    """Generates Python module source files.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      output_writer (OutputWriter): output writer.
+    """
+    # TODO: pycaes add support for object without parent and file_io_handle
+    # TODO: add tests configuration e.g. test data, libfwnt or use in-line
+    # generator hints
+    # TODO: add support for get_object_by_type
+    # TODO: add support for get_object_by_identifier
+    # TODO: add support for copy from
+    # TODO: add support for definitions without "definition prefix"
+    # TODO: add support for pyolecf_property_value
+    # TODO: sequence object rename ${type_name}_index to item_index
+    # TODO: generate non type files.
+    # TODO: generate pyyal/Makefile.am
+    # TODO: generate pyyal-python2/Makefile.am
+    # TODO: generate pyyal-python3/Makefile.am
+
+    if not project_configuration.HasPythonModule():
+      return
+
+    template_mappings = self._GetTemplateMappings(project_configuration)
+
+    for directory_entry in self._ListDirectory(self._template_directory):
+      if not directory_entry.startswith('pyyal_'):
+        continue
+
+      template_filename = os.path.join(
+          self._template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      force_create = False
+
+      output_filename = '{0:s}_{1:s}'.format(
+          project_configuration.python_module_name, directory_entry[6:])
+      output_filename = os.path.join(
+          project_configuration.python_module_name, output_filename)
+      if not force_create and not self._PathExists(output_filename):
+        continue
+
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
+
+      if directory_entry == 'pyyal_file_object_io_handle.c':
+        self._PostProcessOutputFile(output_filename, [
+            line_stages.SortVariableDeclarationsStage()])
+
+    library_include_header_file = self._GetLibraryIncludeHeaderFile(
+        project_configuration)
+
+    python_module_types = []
+
+    if not library_include_header_file:
+      logging.warning((
+          'Missing: {0:s} skipping generation of Python type object '
+          'source and header files.').format(
+              self._library_include_header_path))
+    else:
+      api_types, api_types_with_input = (
+          library_include_header_file.GetAPITypeTestGroups())
+
+      api_pseudo_types = (
+          library_include_header_file.GetAPIPseudoTypeTestGroups())
+
+      api_types.extend(api_types_with_input)
+      python_module_types.extend(api_types)
+      api_types.extend(api_pseudo_types)
+
+      types_with_sequence_types = set([])
+
+      # The tasks only fill in output documents, which are written to
+      # the output writer by WriteOutputFiles, hence the output writer is not
+      # passed to the worker processes.
+      type_tasks = [
+          (project_configuration, template_mappings, type_name, None,
+           type_name in api_pseudo_types)
+          for type_name in api_types]
+
+      for sequence_types in self._RunTasks('_GenerateType', type_tasks):
+        if sequence_types:
+          types_with_sequence_types.update(sequence_types)
+
+      for sequence_type_name, type_is_object in types_with_sequence_types:
+        self._SetTypeNameInTemplateMappings(
+            template_mappings, sequence_type_name)
+
+        self._GenerateSequenceTypeSourceFile(
+            project_configuration, template_mappings, sequence_type_name,
+            output_writer, type_is_object=type_is_object)
+
+        self._GenerateSequenceTypeHeaderFile(
+            project_configuration, template_mappings, sequence_type_name,
+            output_writer)
+
+        module_type_name = self._GetSequenceName(sequence_type_name)
+        python_module_types.append(module_type_name)
+
+    definitions_include_header_file = self._GetDefinitionsIncludeHeaderFile(
+        project_configuration)
+
+    if not definitions_include_header_file:
+      logging.warning((
+          'Missing: {0:s} skipping generation of Python definitions object '
+          'source and header files.').format(
+              self._definitions_include_header_path))
+    else:
+      definitions_name_prefix = '{0:s}_'.format(
+          project_configuration.library_name)
+      definitions_name_prefix_length = len(definitions_name_prefix)
+
+      for enum_declaration in definitions_include_header_file.enum_declarations:
+        definitions_name = enum_declaration.name.lower()
+        if not definitions_name.startswith(definitions_name_prefix):
+          continue
+
+        # TODO: skip flags definitions
+        definitions_name = definitions_name[definitions_name_prefix_length:]
+        if definitions_name in ('access_flags', 'endian'):
+          continue
+
+        self._GenerateDefinitionsSourceFile(
+            project_configuration, template_mappings, definitions_name,
+            enum_declaration, output_writer)
+
+        self._GenerateDefinitionsHeaderFile(
+            project_configuration, template_mappings, definitions_name,
+            enum_declaration, output_writer)
+
+        python_module_types.append(definitions_name)
+
+    self._GenerateModuleHeaderFile(
+        project_configuration, template_mappings, library_include_header_file,
+        output_writer)
+
+    self._GenerateModuleSourceFile(
+        project_configuration, template_mappings, library_include_header_file,
+        python_module_types, output_writer)
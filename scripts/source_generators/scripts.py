@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""The scripts generator."""
+
+from __future__ import unicode_literals
+
+import os
+
+from source_generators import interface
+
+
+class ScriptFileGenerator(interface.SourceFileGenerator):
+  """Script files generator."""
+
+  def Generate(self, project_configuration, output_writer):
+    """Generates script files.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      output_writer (OutputWriter): output writer.
+    """
+    makefile_am_file = self._GetMainMakefileAM(project_configuration)
+
+    template_mappings = self._GetTemplateMappings(project_configuration)
+    template_mappings['local_libs'] = ' '.join(
+        sorted(makefile_am_file.libraries))
+    template_mappings['shared_libs'] = ' '.join(makefile_am_file.libraries)
+
+    for directory_entry in self._ListDirectory(self._template_directory):
+      template_filename = os.path.join(
+          self._template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      output_filename = directory_entry
+
+      if (not self._PathExists(output_filename) and directory_entry in (
+          'syncbzip2.ps1', 'syncwinflexbison.ps1', 'synczlib.ps1')):
+        continue
+
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
+
+      if output_filename.endswith('.sh'):
+        # Set x-bit for .sh scripts.
+        self._SetOutputFileExecutable(output_filename)
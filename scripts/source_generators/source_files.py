@@ -0,0 +1,1084 @@
+# -*- coding: utf-8 -*-
+"""Source files that the source generators read."""
+
+from __future__ import unicode_literals
+
+import collections
+import os
+import re
+
+import sources
+
+from source_generators import tokenizer
+
+
+class DefinitionsIncludeHeaderFile(object):
+  """Definitions include header file.
+
+  Attributes:
+    enum_declarations (list[EnumDeclaration]): enumeration type declarations.
+  """
+
+  # Version of the parsed representation used by the parse cache.
+  PARSER_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a definitions include header file.
+
+    Args:
+      path (str): path of the include header file.
+    """
+    super(DefinitionsIncludeHeaderFile, self).__init__()
+    self._path = path
+
+    self.definitions = []
+
+  def Read(self, project_configuration):
+    """Reads the include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self.enum_declarations = []
+
+    enum_prefix = b'enum '.format(
+        project_configuration.library_name.upper())
+    enum_prefix_length = len(enum_prefix)
+
+    in_enum = False
+    enum_declaration = None
+
+    with open(self._path, 'rb') as file_object:
+      for line in file_object.readlines():
+        line = line.strip()
+
+        if in_enum:
+          if line.startswith(b'};'):
+            in_enum = False
+
+            self.enum_declarations.append(enum_declaration)
+            enum_declaration = None
+
+          elif not line.startswith(b'{'):
+            definition, _, value = line.partition(b'=')
+
+            definition = definition.strip()
+            definition = definition.rstrip(b',')
+
+            value = value.strip()
+            value = value.rstrip(b',')
+
+            enum_declaration.constants[definition] = value
+
+        if line.startswith(enum_prefix):
+          in_enum = True
+          enum_declaration = sources.EnumDeclaration(line[enum_prefix_length:])
+
+
+class FunctionNameTrie(object):
+  """Trie of function names.
+
+  The function names are split into segments on "_", such that the trie
+  can determine in a single walk if a section contains a function of which
+  the name starts with a prefix, such as "libyal_file_".
+  """
+
+  def __init__(self):
+    """Initializes a function name trie."""
+    super(FunctionNameTrie, self).__init__()
+    # A node maps the next segments to their nodes and None to the names of
+    # the sections of the functions of which the name continues after
+    # the node.
+    self._root = {}
+
+  def Add(self, function_name, section_name):
+    """Adds a function name.
+
+    Args:
+      function_name (str): function name.
+      section_name (str): name of the section that contains the function.
+    """
+    node = self._root
+    for segment in function_name.split('_'):
+      node.setdefault(None, set()).add(section_name)
+      node = node.setdefault(segment, {})
+
+  def HasPrefix(self, prefix, section_name):
+    """Determines if a section contains a function with a name prefix.
+
+    Args:
+      prefix (str): name prefix, which ends with "_".
+      section_name (str): name of the section.
+
+    Returns:
+      bool: True if the section contains a function of which the name starts
+          with the prefix.
+
+    Raises:
+      ValueError: if the prefix does not end with "_".
+    """
+    if not prefix.endswith('_'):
+      raise ValueError('Unsupported prefix: {0:s}'.format(prefix))
+
+    node = self._root
+    for segment in prefix[:-1].split('_'):
+      node = node.get(segment, None)
+      if node is None:
+        return False
+
+    return section_name in node.get(None, set())
+
+
+class LibraryHeaderFile(object):
+  """Library header file.
+
+  Attributes:
+    functions_per_name (dict[str, list[FunctionPrototype]]): function
+        prototypes per name.
+    have_internal_functions (bool): True if the header defines internal, non
+        extern, functions.
+    path (str): path of the header file.
+    struct_declarations (dict[str, StructDeclaration]): structure type
+        declarations per name.
+    types (list[str]): type names.
+  """
+
+  # Version of the parsed representation used by the parse cache.
+  PARSER_VERSION = 2
+
+  _FEATURE_GUARD_RE = re.compile(
+      r'(!\s*)?defined\(\s*(HAVE_[A-Za-z0-9_]*)\s*\)')
+
+  _FUNCTION_POINTER_MEMBER_RE = re.compile(
+      r'\(\s*\*\s*([A-Za-z_][A-Za-z0-9_]*)\s*\)')
+
+  _MEMBER_NAME_RE = re.compile(
+      r'([A-Za-z_][A-Za-z0-9_]*)\s*(?:\[[^\]]*\]\s*)*$')
+
+  def __init__(self, path):
+    """Initializes a library header file.
+
+    Args:
+      path (str): path of the header file.
+    """
+    super(LibraryHeaderFile, self).__init__()
+    self._library_name = None
+    self.functions_per_name = collections.OrderedDict()
+    self.have_internal_functions = False
+    self.path = path
+    self.struct_declarations = collections.OrderedDict()
+    self.types = []
+
+  def _GetFeatureGuards(self, feature_guards_stack):
+    """Retrieves the feature guards of the current preprocessor block.
+
+    Args:
+      feature_guards_stack (list[list[str]]): names of the feature macros
+          per nested preprocessor conditional.
+
+    Returns:
+      list[str]: names of the feature macros.
+    """
+    feature_guards = []
+    for names in feature_guards_stack:
+      for name in names:
+        if name not in feature_guards:
+          feature_guards.append(name)
+
+    return feature_guards
+
+  def _ParseStructMember(self, declaration):
+    """Parses a structure member declaration.
+
+    Args:
+      declaration (str): structure member declaration without the trailing
+          ";".
+
+    Returns:
+      tuple[str, str]: name and data type of the structure member or
+          (None, None) if the declaration is not supported, such as a bit
+          field or a declaration of multiple members.
+    """
+    declaration = ' '.join(declaration.split())
+
+    match = self._FUNCTION_POINTER_MEMBER_RE.search(declaration)
+    if not match:
+      if ',' in declaration:
+        return None, None
+
+      match = self._MEMBER_NAME_RE.search(declaration)
+      if not match:
+        return None, None
+
+    name = match.group(1)
+    data_type = '{0:s}{1:s}'.format(
+        declaration[:match.start(1)], declaration[match.end(1):])
+
+    return name, data_type.strip()
+
+  def _UpdateFeatureGuards(self, feature_guards_stack, line):
+    """Updates the feature guards with a preprocessor directive.
+
+    Only the HAVE_ feature macros that are tested to be defined are
+    considered feature guards.
+
+    Args:
+      feature_guards_stack (list[list[str]]): names of the feature macros
+          per nested preprocessor conditional.
+      line (bytes): preprocessor directive.
+    """
+    directive = line[1:].lstrip().decode('ascii')
+
+    if directive.startswith('ifdef'):
+      names = [
+          name for name in directive[5:].split()[:1]
+          if name.startswith('HAVE_')]
+      feature_guards_stack.append(names)
+
+    elif directive.startswith('ifndef'):
+      feature_guards_stack.append([])
+
+    elif directive.startswith('if'):
+      names = [
+          name for negation, name in self._FEATURE_GUARD_RE.findall(directive)
+          if not negation]
+      feature_guards_stack.append(names)
+
+    elif not feature_guards_stack:
+      return
+
+    elif directive.startswith('elif'):
+      feature_guards_stack[-1] = [
+          name for negation, name in self._FEATURE_GUARD_RE.findall(directive)
+          if not negation]
+
+    elif directive.startswith('else'):
+      feature_guards_stack[-1] = []
+
+    elif directive.startswith('endif'):
+      feature_guards_stack.pop()
+
+  def GetTypeFunction(self, type_name, type_function):
+    """Retrieves the function prototype of a specific type function.
+
+    Args:
+      type_name (str): type name.
+      type_function (str): type function.
+
+    Returns:
+      FunctionPrototype: function prototype of the type function or None
+          if no such function.
+    """
+    function_name = '{0:s}_{1:s}_{2:s}'.format(
+        self._library_name, type_name, type_function)
+    return self.functions_per_name.get(function_name, None)
+
+  def Read(self, project_configuration):
+    """Reads the header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Raises:
+      IOError: if the header file cannot be read.
+    """
+    # TODO: use .h.in or run configure?
+    if not os.path.exists(self.path):
+      raise IOError('Missing include header file: {0:s}'.format(self.path))
+
+    with open(self.path, 'rb') as file_object:
+      self.ReadLines(file_object.readlines(), project_configuration)
+
+  def ReadLines(self, lines, project_configuration):
+    """Reads the lines of the header file.
+
+    Args:
+      lines (iterable[bytes]): lines of the header file.
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self._library_name = project_configuration.library_name
+
+    self.functions_per_name = collections.OrderedDict()
+    self.struct_declarations = collections.OrderedDict()
+    self.types = []
+
+    define_extern = b'{0:s}_EXTERN'.format(self._library_name.upper())
+
+    define_have_debug_output = b'#if defined( HAVE_DEBUG_OUTPUT )'
+
+    define_have_wide_character_type = (
+        b'#if defined( HAVE_WIDE_CHARACTER_TYPE )')
+
+    function_argument = None
+    function_prototype = None
+    have_extern = False
+    have_debug_output = False
+    have_wide_character_type = False
+    in_function_prototype = False
+
+    feature_guards_stack = []
+    in_struct_comment = False
+    struct_declaration = None
+    struct_member = []
+
+    for line in lines:
+      line = line.strip()
+
+      # The structure type declarations and feature guards are tracked
+      # independently of the function prototypes.
+      if line.startswith(b'#'):
+        self._UpdateFeatureGuards(feature_guards_stack, line)
+
+      elif struct_declaration:
+        if in_struct_comment:
+          in_struct_comment = b'*/' not in line
+
+        elif line.startswith(b'}'):
+          self.struct_declarations[struct_declaration.name] = (
+              struct_declaration)
+          struct_declaration = None
+          struct_member = []
+
+        elif line and line != b'{':
+          line_without_comment, separator, comment = line.partition(b'/*')
+          if separator:
+            in_struct_comment = b'*/' not in comment
+
+          if line_without_comment:
+            struct_member.append(line_without_comment.decode('ascii'))
+
+          if line_without_comment.rstrip().endswith(b';'):
+            declaration = ' '.join(struct_member).rstrip()[:-1]
+            name, data_type = self._ParseStructMember(declaration)
+            if name:
+              struct_declaration.members[name] = data_type
+
+            struct_member = []
+
+      elif (not in_function_prototype and line.startswith(b'struct ') and
+            not line.endswith(b';')):
+        struct_name = line.split()[1]
+        struct_declaration = sources.StructDeclaration(struct_name)
+
+      if in_function_prototype:
+        line = line.decode('ascii')
+
+        # Check if we have a callback function argument.
+        if line.endswith('('):
+          argument_string = '{0:s} '.format(line)
+          function_argument = sources.FunctionArgument(argument_string)
+
+        else:
+          if line.endswith(' );'):
+            argument_string = line[:-3]
+
+          else:
+            # Get the part of the line before the ','.
+            argument_string, _, _ = line.partition(',')
+
+          if not function_argument:
+            function_prototype.AddArgumentString(argument_string)
+
+          else:
+            function_argument.AddArgumentString(argument_string)
+
+        if function_argument and line.endswith(' ),'):
+          function_prototype.AddArgument(function_argument)
+          function_argument = None
+
+        elif line.endswith(' );'):
+          self.functions_per_name[function_prototype.name] = (
+              function_prototype)
+
+          function_prototype = None
+          in_function_prototype = False
+          have_extern = False
+
+      elif line.endswith(b'('):
+        # Get the part of the line before the library name.
+        data_type, _, _ = line.partition(self._library_name)
+
+        # Get the part of the line after the data type.
+        line = line[len(data_type):]
+        data_type = data_type.strip()
+
+        # Get the part of the remainder of the line before the '('.
+        name, _, _ = line.partition('(')
+
+        function_prototype = sources.FunctionPrototype(name, data_type)
+        function_prototype.feature_guards = self._GetFeatureGuards(
+            feature_guards_stack)
+        function_prototype.have_extern = have_extern
+        function_prototype.have_debug_output = have_debug_output
+        function_prototype.have_wide_character_type = (
+            have_wide_character_type)
+
+        if not have_extern:
+          self.have_internal_functions = True
+
+        in_function_prototype = True
+
+      elif line.startswith(define_extern):
+        have_extern = True
+
+      elif line.startswith(define_have_debug_output):
+        have_debug_output = True
+
+      elif line.startswith(define_have_wide_character_type):
+        have_wide_character_type = True
+
+      elif line.startswith(b'#endif'):
+        have_debug_output = False
+        have_wide_character_type = False
+
+      elif line.startswith(b'typedef struct '):
+        type_name = line.split(b' ')[2]
+        self.types.append(type_name)
+
+    self.types = sorted(self.types)
+
+
+class LibraryIncludeHeaderFile(object):
+  """Library include header file.
+
+  The include header file is tokenized and the prototypes of the functions
+  that are declared with <LIBRARY>_EXTERN are parsed from the tokens, hence
+  arguments can span multiple lines, such as callback function arguments.
+
+  Attributes:
+    functions_per_name (dict[str, list[FunctionPrototype]]): function
+        prototypes per name.
+    functions_per_section (dict[str, list[FunctionPrototype]]): function
+        prototypes per section.
+    have_bfio (bool): True if the include header supports libbfio.
+    have_wide_character_type (bool): True if the include header supports
+        the wide character type.
+    name (str): name.
+    section_names (list[str]): section names.
+  """
+
+  # Version of the parsed representation used by the parse cache.
+  PARSER_VERSION = 2
+
+  # Separator of the parts of a function prototype, which does not occur
+  # in C source.
+  _SEPARATOR = '\x00'
+
+  _IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*$')
+
+  # Whitespace that spans multiple lines.
+  _LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+  _SECTION_MARKER = (
+      '/* -------------------------------------------------------------'
+      '------------')
+
+  _SIGNATURE_TYPES = ('container', 'file', 'handle', 'store', 'volume')
+
+  def __init__(self, path):
+    """Initializes a library include header file.
+
+    Args:
+      path (str): path library include header file.
+    """
+    super(LibraryIncludeHeaderFile, self).__init__()
+    self._api_functions_group = {}
+    self._api_functions_with_input_group = {}
+    self._api_pseudo_types_group = {}
+    self._api_types_group = {}
+    self._api_types_with_input_group = {}
+    self._check_signature_type = None
+    self._function_name_trie = FunctionNameTrie()
+    self._library_name = None
+    self._path = path
+
+    self.functions_per_name = collections.OrderedDict()
+    self.functions_per_section = {}
+    self.have_bfio = False
+    self.have_wide_character_type = False
+    self.name = os.path.basename(path)
+    self.section_names = []
+
+  def _AnalyzeFunctionGroups(self):
+    """Analyzes the library include header file for function groups."""
+    self._api_functions_group = {}
+    self._api_functions_with_input_group = {}
+    self._api_pseudo_types_group = {}
+    self._api_types_group = {}
+    self._api_types_with_input_group = {}
+
+    for section_name, functions in self.functions_per_section.items():
+      if not functions:
+        continue
+
+      group_name = section_name.replace(' ', '_')
+      group_name = group_name.replace('-', '_')
+      group_name = group_name.lower()
+      if '(' in group_name and ')' in group_name:
+        prefix, _, suffix = group_name.partition('(')
+        _, _, suffix = group_name.rpartition(')')
+        group_name = ''.join([prefix[:-1], suffix])
+
+      group_name, _, _ = group_name.rpartition('_functions')
+
+      function_name_prefix = '{0:s}_{1:s}_'.format(
+          self._library_name, group_name)
+
+      # Ignore the section header if it is just informative.
+      if not self._function_name_trie.HasPrefix(
+          function_name_prefix, section_name):
+        if group_name == 'support':
+          signature_type = self.GetCheckSignatureType()
+          if signature_type:
+            self._api_functions_with_input_group[group_name] = section_name
+          else:
+            self._api_functions_group[group_name] = section_name
+
+        else:
+          function_name_prefix = '{0:s}_{1:s}_'.format(
+              self._library_name, section_name)
+
+          if self._function_name_trie.HasPrefix(
+              function_name_prefix, section_name):
+            # TODO: improve pseudo type detection.
+            if group_name.endswith('_item'):
+              group_name = group_name[:-5]
+
+            self._api_pseudo_types_group[group_name] = section_name
+
+      elif self._library_name != 'libcerror' and group_name == 'error':
+        self._api_functions_group[group_name] = section_name
+
+      elif (not self.HasTypeFunction(group_name, 'create') and
+            not self.HasTypeFunction(group_name, 'free')):
+        self._api_functions_group[group_name] = section_name
+
+      elif not self.HasTypeFunction(group_name, 'open'):
+        self._api_types_group[group_name] = section_name
+
+      else:
+        self._api_types_with_input_group[group_name] = section_name
+
+  def _GetSectionName(self, comment):
+    """Retrieves the section name from a comment.
+
+    Args:
+      comment (str): comment.
+
+    Returns:
+      str: section name or None if the comment is not a section header.
+    """
+    lines = comment.split('\n')
+    if lines[0].strip() != self._SECTION_MARKER:
+      return None
+
+    for line in lines[1:]:
+      line = line.strip()
+      if line.startswith('* '):
+        return line[2:]
+
+    return None
+
+  def _GetText(self, tokens):
+    """Retrieves the text of tokens.
+
+    Whitespace that spans multiple lines and comments are replaced by
+    a single space.
+
+    Args:
+      tokens (list[str]): tokens.
+
+    Returns:
+      str: text of the tokens.
+    """
+    text = ''.join(tokens)
+    if '/' in text:
+      text = ''.join([
+          ' ' if token.startswith('/*') or token.startswith('//') else token
+          for token in tokens])
+
+    # An escaped newline is whitespace that spans multiple lines.
+    text = text.replace('\\\n', '\n')
+    return self._LINE_BREAK_RE.sub(' ', text)
+
+  def _ParseFunctionPrototype(self, tokens):
+    """Parses a function prototype.
+
+    Args:
+      tokens (list[str]): tokens of the declaration, without
+          the <LIBRARY>_EXTERN and the terminating ";".
+
+    Returns:
+      FunctionPrototype: function prototype or None if the declaration does
+          not declare a function, such as a variable declaration.
+    """
+    try:
+      arguments_index = tokens.index('(')
+    except ValueError:
+      return None
+
+    # The name is the last identifier before the arguments.
+    name_index = arguments_index - 1
+    while name_index >= 0 and not tokens[name_index].strip():
+      name_index -= 1
+
+    if name_index < 0 or not self._IDENTIFIER_RE.match(tokens[name_index]):
+      return None
+
+    argument_tokens = tokens[arguments_index + 1:]
+
+    # An argument ends at a "," that is not nested in parenthesis, such as
+    # those of a callback function argument.
+    if '(' not in argument_tokens:
+      if ')' in argument_tokens:
+        argument_tokens = argument_tokens[:argument_tokens.index(')')]
+
+      argument_separator = ','
+
+    else:
+      nesting_level = 0
+      for index, token in enumerate(argument_tokens):
+        if token == '(':
+          nesting_level += 1
+
+        elif token == ')':
+          if nesting_level == 0:
+            argument_tokens = argument_tokens[:index]
+            break
+          nesting_level -= 1
+
+        elif token == ',' and nesting_level == 0:
+          argument_tokens[index] = self._SEPARATOR
+
+      argument_separator = self._SEPARATOR
+
+    # The text of the return type and the arguments is determined at once.
+    text = self._GetText(
+        tokens[:name_index] + [self._SEPARATOR] + argument_tokens)
+    return_type, _, text = text.partition(self._SEPARATOR)
+
+    function_prototype = sources.FunctionPrototype(
+        tokens[name_index], return_type.strip())
+
+    argument_strings = text.split(argument_separator)
+    for argument_string in argument_strings[:-1]:
+      function_prototype.AddArgumentString(argument_string.strip())
+
+    argument_string = argument_strings[-1].strip()
+    if argument_string:
+      function_prototype.AddArgumentString(argument_string)
+
+    return function_prototype
+
+  def GetAPIFunctionTestGroups(self):
+    """Determines the API function test groups.
+
+    Returns:
+      tuple: contains:
+        list[str]: names of API function groups without test data.
+        list[str]: names of API function groups with test data.
+    """
+    return (
+        self._api_functions_group.keys(),
+        self._api_functions_with_input_group.keys())
+
+  def GetAPIPseudoTypeTestGroups(self):
+    """Determines the API pseudo type test groups.
+
+    Returns:
+      list[str]: names of API pseudo type groups without test data.
+    """
+    return self._api_pseudo_types_group.keys()
+
+  def GetAPITypeTestGroups(self):
+    """Determines the API type test groups.
+
+    Returns:
+      tuple: contains:
+        list[str]: names of API type groups without test data.
+        list[str]: names of API type groups with test data.
+    """
+    return self._api_types_group.keys(), self._api_types_with_input_group.keys()
+
+  def GetCheckSignatureType(self):
+    """Determines the check signature function type.
+
+    Returns:
+      str: check signature function type of None if no check signature function
+          was found.
+    """
+    if not self._check_signature_type:
+      for signature_type in self._SIGNATURE_TYPES:
+        function_name = '{0:s}_check_{1:s}_signature'.format(
+            self._library_name, signature_type)
+
+        if function_name in self.functions_per_name:
+          self._check_signature_type = signature_type
+          break
+
+    return self._check_signature_type
+
+  def GetFunctionGroup(self, group_name):
+    """Retrieves a function group.
+
+    Args:
+      group_name (str): group name.
+
+    Returns:
+      list[FunctionPrototype]: function prototypes of the functions in
+          the group.
+    """
+    section_name = self._api_functions_group.get(group_name, None)
+    if not section_name:
+      section_name = self._api_functions_with_input_group.get(group_name, None)
+    if not section_name:
+      section_name = self._api_types_group.get(group_name, None)
+    if not section_name:
+      section_name = self._api_types_with_input_group.get(group_name, None)
+    if not section_name:
+      return []
+
+    return self.functions_per_section.get(section_name, [])
+
+  def HasErrorArgument(self, group_name):
+    """Determines if a function group has functions with an error argument.
+
+    Args:
+      group_name (str): group name.
+
+    Returns:
+      bool: True if there ar functions with an error argument defined,
+          False otherwise.
+    """
+    error_type = '{0:s}_error_t '.format(self._library_name)
+
+    functions = self.GetFunctionGroup(group_name)
+    for function_prototype in functions:
+      if not function_prototype.arguments:
+        continue
+
+      function_argument = function_prototype.arguments[-1]
+      function_argument_string = function_argument.CopyToString()
+      if function_argument_string.startswith(error_type):
+        return True
+
+    return False
+
+  def HasFunction(self, function_name):
+    """Determines if the include header defines a specific function.
+
+    Args:
+      function_name (str): function name.
+
+    Returns:
+      bool: True if function is defined, False otherwise.
+    """
+    function_name = '{0:s}_{1:s}'.format(self._library_name, function_name)
+    return function_name in self.functions_per_name
+
+  def HasTypeFunction(self, type_name, type_function):
+    """Determines if the include header defines a specific type function.
+
+    Args:
+      type_name (str): type name.
+      type_function (str): type function.
+
+    Returns:
+      bool: True if function is defined, False otherwise.
+    """
+    function_name = '{0:s}_{1:s}_{2:s}'.format(
+        self._library_name, type_name, type_function)
+    return function_name in self.functions_per_name
+
+  def Read(self, project_configuration):
+    """Reads the include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self._check_signature_type = None
+    self._function_name_trie = FunctionNameTrie()
+    self._library_name = project_configuration.library_name
+
+    self.functions_per_name = collections.OrderedDict()
+    self.functions_per_section = {}
+    self.have_bfio = False
+    self.have_wide_character_type = False
+    self.section_names = []
+
+    define_deprecated = '{0:s}_DEPRECATED'.format(self._library_name.upper())
+
+    define_extern = '{0:s}_EXTERN'.format(self._library_name.upper())
+
+    define_have_bfio = '#if defined( {0:s}_HAVE_BFIO )'.format(
+        self._library_name.upper())
+
+    define_have_debug_output = '#if defined( HAVE_DEBUG_OUTPUT )'
+
+    define_have_wide_character_type = (
+        '#if defined( {0:s}_HAVE_WIDE_CHARACTER_TYPE )').format(
+            self._library_name.upper())
+
+    have_bfio = False
+    have_debug_output = False
+    have_wide_character_type = False
+    in_define_deprecated = False
+    section_name = None
+
+    with open(self._path, 'rb') as file_object:
+      source = file_object.read().decode('utf-8', 'replace')
+
+    tokens = tokenizer.CTokenizer.Tokenize(source)
+    number_of_tokens = len(tokens)
+
+    token_index = 0
+    while token_index < number_of_tokens:
+      token = tokens[token_index]
+      token_index += 1
+
+      if token == define_extern:
+        try:
+          end_index = tokens.index(';', token_index)
+        except ValueError:
+          break
+
+        # A declaration without arguments, such as a variable declaration,
+        # is ignored.
+        function_prototype = self._ParseFunctionPrototype(
+            tokens[token_index:end_index])
+        token_index = end_index + 1
+
+        if not function_prototype:
+          continue
+
+        function_prototype.have_bfio = have_bfio
+        function_prototype.have_extern = True
+        function_prototype.have_debug_output = have_debug_output
+        function_prototype.have_wide_character_type = (
+            have_wide_character_type)
+
+        if have_bfio:
+          self.have_bfio = True
+        if have_wide_character_type:
+          self.have_wide_character_type = True
+
+        if not in_define_deprecated:
+          self.functions_per_name[function_prototype.name] = (
+              function_prototype)
+
+          if section_name is not None:
+            self.functions_per_section[section_name].append(
+                function_prototype)
+            self._function_name_trie.Add(
+                function_prototype.name, section_name)
+
+        in_define_deprecated = False
+
+      elif token == define_deprecated:
+        in_define_deprecated = True
+
+      elif token.startswith('/*'):
+        comment_section_name = self._GetSectionName(token)
+        if comment_section_name is not None:
+          section_name = comment_section_name
+          self.section_names.append(section_name)
+          self.functions_per_section[section_name] = []
+
+      elif token.startswith('#'):
+        if token.startswith(define_have_bfio):
+          have_bfio = True
+
+        elif token.startswith(define_have_debug_output):
+          have_debug_output = True
+
+        elif token.startswith(define_have_wide_character_type):
+          have_wide_character_type = True
+
+        elif token.startswith('#endif'):
+          have_bfio = False
+          have_debug_output = False
+          have_wide_character_type = False
+
+    # The function groups are analyzed once, hence the parse cache stores
+    # the function groups with the parsed include header file.
+    self._AnalyzeFunctionGroups()
+
+
+class LibraryMakefileAMFile(object):
+  """Library Makefile.am file.
+
+  Attributes:
+    cppflags (list[str]): C preprocess flags.
+    libraries (list[str]): library names.
+    sources (list[str]): source and header file paths.
+  """
+
+  # Version of the parsed representation used by the parse cache.
+  PARSER_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a library Makefile.am file.
+
+    Args:
+      path (str): path of the Makefile.am file.
+    """
+    super(LibraryMakefileAMFile, self).__init__()
+    self._library_name = None
+    self._path = path
+    self.cppflags = []
+    self.libraries = []
+    self.sources = []
+
+  def Read(self, project_configuration):
+    """Reads the Makefile.am file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self._library_name = project_configuration.library_name
+
+    self.cppflags = []
+    self.libraries = []
+    self.sources = []
+
+    library_sources = b'{0:s}_la_SOURCES'.format(self._library_name)
+    library_libadd = b'{0:s}_la_LIBADD'.format(self._library_name)
+
+    in_section = None
+
+    with open(self._path, 'rb') as file_object:
+      for line in file_object.readlines():
+        line = line.strip()
+
+        if in_section:
+          if not line:
+            in_section = None
+            continue
+
+          if line.endswith(b'\\'):
+            line = line[:-1].strip()
+
+          if (in_section == 'cppflags' and line.startswith(b'@') and
+              line.endswith(b'_CPPFLAGS@')):
+            self.cppflags.append(line[1:-10].lower())
+
+          elif (in_section == 'libadd' and line.startswith(b'@') and
+                line.endswith(b'_LIBADD@')):
+            self.libraries.append(line[1:-8].lower())
+
+          elif in_section == 'sources':
+            sources = line.split(b' ')
+            self.sources.extend(sources)
+
+        elif line == b'AM_CPPFLAGS = \\':
+          in_section = 'cppflags'
+
+        elif line.startswith(library_libadd):
+          in_section = 'libadd'
+
+        elif line.startswith(library_sources):
+          in_section = 'sources'
+
+
+class MainMakefileAMFile(object):
+  """Main Makefile.am file.
+
+  Attributes:
+    libraries (list[str]): library names.
+    library_dependencies (list[str]): names of the dependencies of the main
+        library.
+    tools_dependencies (list[str]): names of the dependencies of the tools.
+  """
+
+  # Version of the parsed representation used by the parse cache.
+  PARSER_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a main Makefile.am file.
+
+    Args:
+      path (str): path of the Makefile.am file.
+    """
+    super(MainMakefileAMFile, self).__init__()
+    self._library_name = None
+    self._path = path
+    self.libraries = []
+    self.library_dependencies = []
+    self.tools_dependencies = []
+
+  def Read(self, project_configuration):
+    """Reads the Makefile.am file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self._library_name = project_configuration.library_name
+
+    in_subdirs = False
+    in_library_dependencies = True
+
+    with open(self._path, 'rb') as file_object:
+      for line in file_object.readlines():
+        line = line.strip()
+
+        if in_subdirs:
+          if line.endswith(b'\\'):
+            line = line[:-1].strip()
+
+          if not line:
+            in_subdirs = False
+
+          elif line.startswith(b'lib'):
+            if line == self._library_name:
+              in_library_dependencies = False
+            else:
+              self.libraries.append(line)
+
+              if in_library_dependencies:
+                self.library_dependencies.append(line)
+              else:
+                self.tools_dependencies.append(line)
+
+        elif line.startswith(b'SUBDIRS'):
+          in_subdirs = True
+
+
+class TypesIncludeHeaderFile(object):
+  """Types include header file.
+
+  Attributes:
+    types (list[str]): type names.
+  """
+
+  # Version of the parsed representation used by the parse cache.
+  PARSER_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a types include header file.
+
+    Args:
+      path (str): path of the include header file.
+    """
+    super(TypesIncludeHeaderFile, self).__init__()
+    self._library_name = None
+    self._path = path
+    self.types = []
+
+  def Read(self, project_configuration):
+    """Reads the include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self._library_name = project_configuration.library_name
+
+    self.types = []
+
+    typedef_prefix = b'typedef intptr_t {0:s}_'.format(self._library_name)
+    typedef_prefix_length = len(typedef_prefix)
+
+    with open(self._path, 'rb') as file_object:
+      for line in file_object.readlines():
+        line = line.strip()
+        if line.startswith(typedef_prefix) and line.endswith(b'_t;'):
+          self.types.append(line[typedef_prefix_length:-3])
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+"""The project symbol table."""
+
+from __future__ import unicode_literals
+
+import collections
+import hashlib
+import logging
+import mmap
+import multiprocessing
+import os
+import threading
+
+from multiprocessing import pool as multiprocessing_pool
+
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle
+
+import parse_cache
+
+from source_generators import source_files
+
+
+class ProjectSymbolTable(object):
+  """Project symbol table.
+
+  The symbol table contains the symbols of the headers in the library
+  directory, such as the types, the function prototypes including their
+  feature guards and the structure type declarations including their members.
+  The symbols are kept per header file, hence a changed header file can be
+  scanned again without scanning the other header files.
+
+  The symbol table is shared and should not be changed.
+
+  Attributes:
+    library_name (str): name of the library.
+    library_path (str): path of the library directory.
+  """
+
+  def __init__(self, library_path, library_name):
+    """Initializes a project symbol table.
+
+    Args:
+      library_path (str): path of the library directory.
+      library_name (str): name of the library.
+    """
+    super(ProjectSymbolTable, self).__init__()
+    self._file_identifiers = {}
+    self._header_files = collections.OrderedDict()
+    self._type_header_names = {}
+    self.library_name = library_name
+    self.library_path = library_path
+
+  def AddHeaderFile(self, name, header_file, file_identifier):
+    """Adds the symbols of a header file.
+
+    Args:
+      name (str): name of the header file, such as "libyal_file.h".
+      header_file (LibraryHeaderFile): header file.
+      file_identifier (tuple[float, int]): modification time and size of
+          the header file, which are used to determine if the header file
+          changed.
+    """
+    self._file_identifiers[name] = file_identifier
+    self._header_files[name] = header_file
+
+    for type_name in header_file.types:
+      self._type_header_names.setdefault(type_name, name)
+
+  def GetFileIdentifier(self, name):
+    """Retrieves the file identifier of a header file.
+
+    Args:
+      name (str): name of the header file.
+
+    Returns:
+      tuple[float, int]: modification time and size of the header file or
+          None if no such header file.
+    """
+    return self._file_identifiers.get(name, None)
+
+  def GetHeaderFile(self, name):
+    """Retrieves a header file.
+
+    Args:
+      name (str): name of the header file, such as "libyal_file.h".
+
+    Returns:
+      LibraryHeaderFile: header file or None if no such header file.
+    """
+    return self._header_files.get(name, None)
+
+  def GetHeaderFileNames(self):
+    """Retrieves the names of the header files.
+
+    Returns:
+      list[str]: names of the header files in alphabetical order.
+    """
+    return list(self._header_files.keys())
+
+  def GetTypeHeaderFile(self, type_name):
+    """Retrieves the header file that defines a type.
+
+    Args:
+      type_name (str): name of the type, such as "libyal_internal_file".
+
+    Returns:
+      LibraryHeaderFile: header file or None if no header file defines
+          the type.
+    """
+    name = self._type_header_names.get(type_name, None)
+    if not name:
+      return None
+
+    return self._header_files[name]
+
+  def GetTypes(self):
+    """Retrieves the types.
+
+    Returns:
+      list[str]: names of the structure types defined with typedef, in
+          alphabetical order.
+    """
+    return sorted(self._type_header_names.keys())
+
+
+class ProjectIndexer(object):
+  """Project indexer.
+
+  The indexer scans the headers in the library directory of a project into
+  a symbol table. The headers are read using mmap and scanned concurrently
+  by a pool of threads.
+
+  The symbol tables are kept in memory and, if the parse cache has a cache
+  directory, on disk so that subsequent runs only need to scan the headers
+  that changed.
+
+  Attributes:
+    number_of_reused_files (int): number of header files that did not need
+        to be scanned again.
+    number_of_scanned_files (int): number of header files that needed to be
+        scanned.
+  """
+
+  _FORMAT_VERSION = 1
+
+  def __init__(self, maximum_number_of_threads=None):
+    """Initializes a project indexer.
+
+    Args:
+      maximum_number_of_threads (Optional[int]): maximum number of threads
+          to scan header files with, where None represents a number based on
+          the number of CPUs.
+    """
+    if not maximum_number_of_threads:
+      # Reading the header files is I/O bound, hence more threads than CPUs
+      # are used.
+      maximum_number_of_threads = min(32, multiprocessing.cpu_count() + 4)
+
+    super(ProjectIndexer, self).__init__()
+    self._lock = threading.Lock()
+    self._maximum_number_of_threads = maximum_number_of_threads
+    self._symbol_tables = {}
+    self.number_of_reused_files = 0
+    self.number_of_scanned_files = 0
+
+  def _GetSymbolTableFilePath(self, library_path, library_name):
+    """Determines the path of the symbol table file in the cache directory.
+
+    Args:
+      library_path (str): path of the library directory.
+      library_name (str): name of the library.
+
+    Returns:
+      str: path of the symbol table file or None if there is no cache
+          directory.
+    """
+    cache_directory = parse_cache.GetParseCache().GetDirectory()
+    if not cache_directory:
+      return None
+
+    key_string = '\n'.join([
+        '{0:d}'.format(self._FORMAT_VERSION),
+        '{0:d}'.format(source_files.LibraryHeaderFile.PARSER_VERSION),
+        library_path,
+        library_name])
+
+    hash_context = hashlib.sha256()
+    hash_context.update(key_string.encode('utf-8'))
+
+    return os.path.join(cache_directory, 'symbols-{0:s}.pickle'.format(
+        hash_context.hexdigest()))
+
+  def _IndexLibrary(self, library_path, project_configuration, symbol_table):
+    """Indexes the headers in a library directory.
+
+    Args:
+      library_path (str): path of the library directory.
+      project_configuration (ProjectConfiguration): project configuration.
+      symbol_table (ProjectSymbolTable): symbol table of a previous scan or
+          None if not available.
+
+    Returns:
+      tuple: contains:
+        ProjectSymbolTable: symbol table.
+        bool: True if the symbol table differs from the previous symbol
+            table.
+    """
+    try:
+      names = sorted([
+          name for name in os.listdir(library_path) if name.endswith('.h')])
+    except OSError:
+      names = []
+
+    header_files = {}
+    scan_names = []
+    for name in names:
+      path = os.path.join(library_path, name)
+
+      try:
+        stat_object = os.stat(path)
+      except OSError:
+        continue
+
+      file_identifier = (stat_object.st_mtime, stat_object.st_size)
+
+      if (symbol_table and
+          symbol_table.GetFileIdentifier(name) == file_identifier):
+        header_files[name] = (
+            symbol_table.GetHeaderFile(name), file_identifier)
+      else:
+        scan_names.append((name, file_identifier))
+
+    number_of_reused_files = len(header_files)
+
+    if len(scan_names) > 1 and self._maximum_number_of_threads > 1:
+      number_of_threads = min(len(scan_names), self._maximum_number_of_threads)
+      thread_pool = multiprocessing_pool.ThreadPool(number_of_threads)
+      try:
+        scanned_header_files = thread_pool.map(
+            lambda values: self._ScanHeaderFile(
+                os.path.join(library_path, values[0]), project_configuration),
+            scan_names)
+      finally:
+        thread_pool.close()
+        thread_pool.join()
+
+    else:
+      scanned_header_files = [
+          self._ScanHeaderFile(
+              os.path.join(library_path, name), project_configuration)
+          for name, _ in scan_names]
+
+    for (name, file_identifier), header_file in zip(
+        scan_names, scanned_header_files):
+      if header_file:
+        header_files[name] = (header_file, file_identifier)
+
+    self.number_of_reused_files += number_of_reused_files
+    self.number_of_scanned_files += len(scan_names)
+
+    is_changed = bool(scan_names) or not symbol_table or (
+        symbol_table.GetHeaderFileNames() != sorted(header_files.keys()))
+
+    if not is_changed:
+      return symbol_table, False
+
+    symbol_table = ProjectSymbolTable(
+        library_path, project_configuration.library_name)
+    for name in sorted(header_files.keys()):
+      header_file, file_identifier = header_files[name]
+      symbol_table.AddHeaderFile(name, header_file, file_identifier)
+
+    return symbol_table, True
+
+  def _ReadSymbolTableFile(self, path):
+    """Reads a symbol table from the cache directory.
+
+    Args:
+      path (str): path of the symbol table file.
+
+    Returns:
+      ProjectSymbolTable: symbol table or None if not available.
+    """
+    try:
+      with open(path, 'rb') as file_object:
+        serialized_data = file_object.read()
+
+    except IOError:
+      return None
+
+    try:
+      symbol_table = pickle.loads(serialized_data)
+    except Exception:  # pylint: disable=broad-except
+      # A corrupt or outdated symbol table file is scanned again.
+      return None
+
+    if not isinstance(symbol_table, ProjectSymbolTable):
+      return None
+
+    return symbol_table
+
+  def _ScanHeaderFile(self, path, project_configuration):
+    """Scans a header file.
+
+    Args:
+      path (str): path of the header file.
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      LibraryHeaderFile: header file or None if the header file cannot be
+          read.
+    """
+    header_file = source_files.LibraryHeaderFile(path)
+
+    try:
+      with open(path, 'rb') as file_object:
+        # An empty file cannot be mapped.
+        if not os.fstat(file_object.fileno()).st_size:
+          header_file.ReadLines([], project_configuration)
+          return header_file
+
+        mapped_file = mmap.mmap(
+            file_object.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+          header_file.ReadLines(
+              iter(mapped_file.readline, b''), project_configuration)
+        finally:
+          mapped_file.close()
+
+    except (IOError, OSError, mmap.error) as exception:
+      logging.warning((
+          'Unable to read header file: {0:s} with error: {1!s}').format(
+              path, exception))
+      return None
+
+    return header_file
+
+  def _WriteSymbolTableFile(self, path, symbol_table):
+    """Writes a symbol table to the cache directory.
+
+    Args:
+      path (str): path of the symbol table file.
+      symbol_table (ProjectSymbolTable): symbol table.
+    """
+    serialized_data = pickle.dumps(symbol_table, pickle.HIGHEST_PROTOCOL)
+
+    cache_directory = os.path.dirname(path)
+    temporary_path = '{0:s}.{1:d}'.format(path, os.getpid())
+
+    try:
+      if not os.path.isdir(cache_directory):
+        os.makedirs(cache_directory)
+
+      with open(temporary_path, 'wb') as file_object:
+        file_object.write(serialized_data)
+
+      # On Windows rename fails if the symbol table file exists.
+      if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+
+      os.rename(temporary_path, path)
+
+    except (IOError, OSError) as exception:
+      logging.warning((
+          'Unable to write symbol table file: {0:s} with error: '
+          '{1!s}').format(path, exception))
+
+  def Empty(self):
+    """Empties the in-memory symbol tables."""
+    with self._lock:
+      self._symbol_tables = {}
+      self.number_of_reused_files = 0
+      self.number_of_scanned_files = 0
+
+  def GetSymbolTable(self, library_path, project_configuration):
+    """Retrieves the symbol table of a library directory.
+
+    The header files that changed since the symbol table was last retrieved
+    are scanned again.
+
+    Args:
+      library_path (str): path of the library directory.
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      ProjectSymbolTable: symbol table.
+    """
+    library_path = os.path.abspath(library_path)
+    library_name = project_configuration.library_name
+
+    lookup_key = (library_path, library_name)
+
+    symbol_table_file_path = self._GetSymbolTableFilePath(
+        library_path, library_name)
+
+    with self._lock:
+      symbol_table = self._symbol_tables.get(lookup_key, None)
+      if not symbol_table and symbol_table_file_path:
+        symbol_table = self._ReadSymbolTableFile(symbol_table_file_path)
+
+      symbol_table, is_changed = self._IndexLibrary(
+          library_path, project_configuration, symbol_table)
+
+      self._symbol_tables[lookup_key] = symbol_table
+
+    if is_changed and symbol_table_file_path:
+      self._WriteSymbolTableFile(symbol_table_file_path, symbol_table)
+
+    return symbol_table
+
+
+_PROJECT_INDEXER = ProjectIndexer()
+
+
+def GetProjectIndexer():
+  """Retrieves the project indexer shared within the process.
+
+  Returns:
+    ProjectIndexer: project indexer.
+  """
+  return _PROJECT_INDEXER
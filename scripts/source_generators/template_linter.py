@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""The template linter."""
+
+from __future__ import unicode_literals
+
+import ast
+import inspect
+
+
+class TemplateLinter(object):
+  """Template linter.
+
+  The placeholders of the templates of a source file generator are checked
+  against the template mappings the generator provides. The template mappings
+  are determined statically, from the source of the generator class and its
+  base classes, where a template mapping is provided by:
+  * an assignment to an item of template mappings, such as
+    template_mappings['type_name'] = type_name;
+  * a dictionary assigned to template mappings, such as
+    function_template_mappings = {'function_name': name};
+  * a dictionary passed as the mappings argument, such as
+    TemplateMappings(mappings={'authors': authors});
+  * a template mapping every generator provides, such as the derived
+    template mappings.
+  """
+
+  # The string types of the keys, which are str or unicode in Python 2.
+  _STRING_TYPES = (str, type(''))
+
+  def __init__(self, template_index, mapping_keys=None):
+    """Initializes a template linter.
+
+    Args:
+      template_index (TemplateIndex): template index.
+      mapping_keys (Optional[list[str]]): keys of the template mappings every
+          generator provides, such as "type_name_upper_case".
+    """
+    super(TemplateLinter, self).__init__()
+    self._mapping_keys = frozenset(mapping_keys or [])
+    self._mapping_keys_per_path = {}
+    self._template_index = template_index
+
+  def _GetDictionaryKeys(self, node):
+    """Retrieves the string keys of a dictionary.
+
+    Args:
+      node (ast.AST): node of the syntax tree.
+
+    Returns:
+      list[str]: string keys or an empty list if the node is not
+          a dictionary.
+    """
+    if not isinstance(node, ast.Dict):
+      return []
+
+    return [key.s for key in node.keys if isinstance(key, ast.Str)]
+
+  def _GetMappingKeysFromSourceFile(self, path):
+    """Retrieves the template mapping keys provided in a source file.
+
+    Args:
+      path (str): path of the Python source file.
+
+    Returns:
+      set[str]: template mapping keys.
+    """
+    mapping_keys = self._mapping_keys_per_path.get(path, None)
+    if mapping_keys is not None:
+      return mapping_keys
+
+    with open(path, 'rb') as file_object:
+      syntax_tree = ast.parse(file_object.read(), path)
+
+    mapping_keys = set()
+    for node in ast.walk(syntax_tree):
+      if isinstance(node, ast.Assign):
+        for target in node.targets:
+          if isinstance(target, ast.Subscript):
+            if not self._IsTemplateMappings(target.value):
+              continue
+
+            # The subscript is an index of which the value is a string node
+            # in Python 2 and 3.8, and a constant of which the value is
+            # the key itself in Python 3.9 and later.
+            key = getattr(target.slice, 'value', target.slice)
+            if isinstance(key, ast.Str):
+              key = key.s
+
+            if isinstance(key, self._STRING_TYPES):
+              mapping_keys.add(key)
+
+          elif self._IsTemplateMappings(target):
+            mapping_keys.update(self._GetDictionaryKeys(node.value))
+
+      elif isinstance(node, ast.Call):
+        for keyword in node.keywords:
+          if keyword.arg == 'mappings':
+            mapping_keys.update(self._GetDictionaryKeys(keyword.value))
+
+    self._mapping_keys_per_path[path] = mapping_keys
+    return mapping_keys
+
+  def _IsTemplateMappings(self, node):
+    """Determines if a node refers to template mappings.
+
+    Args:
+      node (ast.AST): node of the syntax tree.
+
+    Returns:
+      bool: True if the node is a variable or attribute of which the name
+          ends with "template_mappings".
+    """
+    if isinstance(node, ast.Name):
+      name = node.id
+    elif isinstance(node, ast.Attribute):
+      name = node.attr
+    else:
+      return False
+
+    return name.endswith('template_mappings')
+
+  def GetMappingKeys(self, generator_class):
+    """Retrieves the template mapping keys a generator provides.
+
+    Args:
+      generator_class (type): source file generator class.
+
+    Returns:
+      set[str]: template mapping keys.
+    """
+    mapping_keys = set(self._mapping_keys)
+
+    for base_class in inspect.getmro(generator_class):
+      if base_class is object:
+        continue
+
+      path = inspect.getsourcefile(base_class)
+      mapping_keys.update(self._GetMappingKeysFromSourceFile(path))
+
+    return mapping_keys
+
+  def LintDirectory(self, template_directory, mapping_keys):
+    """Checks the indexed templates in a directory.
+
+    Args:
+      template_directory (str): path of the directory that contains
+          the templates.
+      mapping_keys (set[str]): template mapping keys that are provided.
+
+    Returns:
+      list[tuple[str, str]]: path of the template file and description of
+          every problem.
+    """
+    problems = []
+    for template_path in self._template_index.GetTemplatePaths(
+        template_directory):
+      error = self._template_index.GetError(template_path)
+      if error:
+        problems.append((template_path, error))
+
+      unknown_placeholders = self._template_index.GetPlaceholders(
+          template_path).difference(mapping_keys)
+      if unknown_placeholders:
+        problems.append((template_path, 'Unknown placeholders: {0:s}'.format(
+            ', '.join(sorted(unknown_placeholders)))))
+
+    return problems
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Tokenizer of C source files."""
+
+from __future__ import unicode_literals
+
+import re
+
+
+class CTokenizer(object):
+  """Tokenizer of C source files.
+
+  The tokenizer splits C source into tokens, which are comments, identifiers,
+  literals, preprocessor directives, punctuation and whitespace. A token is
+  a string, hence the tokens can be searched with list methods, such as
+  index(";"), and the kind of a token is determined by its first characters:
+  * a comment starts with "/*" or "//";
+  * an identifier starts with a letter or "_";
+  * a literal starts with a digit or a quote;
+  * a preprocessor directive starts with "#" and includes its continuation
+    lines;
+  * whitespace consists of whitespace characters and escaped newlines, such
+    as after "LIBYAL_EXTERN \\";
+  * punctuation is a single character.
+
+  Concatenating the tokens results in the source.
+  """
+
+  # The most common tokens, identifiers and whitespace, are matched first.
+  _TOKEN_RE = re.compile((
+      r'[A-Za-z_][A-Za-z0-9_]*|'
+      r'\s+(?:\\\n\s*)*|\\\n(?:\s|\\\n)*|'
+      r'/\*.*?\*/|//[^\n]*|'
+      r'\#(?:\\\n|[^\n])*|'
+      r'[0-9][A-Za-z0-9_.]*|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|'
+      r'.'), re.DOTALL)
+
+  @classmethod
+  def Tokenize(cls, source):
+    """Tokenizes C source.
+
+    Args:
+      source (str): C source.
+
+    Returns:
+      list[str]: tokens.
+    """
+    return cls._TOKEN_RE.findall(source)
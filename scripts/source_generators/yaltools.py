@@ -0,0 +1,959 @@
+# -*- coding: utf-8 -*-
+"""The tools source files generator."""
+
+from __future__ import unicode_literals
+
+import os
+import textwrap
+
+import line_stages
+
+from source_generators import interface
+
+
+class ToolsSourceFileGenerator(interface.SourceFileGenerator):
+  """Tools source files generator."""
+
+  def _GenerateGetoptString(self, tool_options):
+    """Generates a getopt string.
+
+    Args:
+      tool_options (list[tuple[str, str, st]])): tool options.
+
+    Returns:
+      str: getopt string.
+    """
+    getopt_string_segments = []
+
+    for option, argument, _ in tool_options:
+      getopt_string = option
+      if argument:
+        getopt_string = '{0:s}:'.format(getopt_string)
+
+      getopt_string_segments.append(getopt_string)
+
+    return ''.join(getopt_string_segments)
+
+  def _GenerateGetoptSwitch(self, project_configuration, tool_options):
+    """Generates a getopt switch.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      tool_options (list[tuple[str, str, st]])): tool options.
+
+    Returns:
+      str: getopt switch.
+    """
+    largest_argument_length = 0
+    for _, argument, _ in tool_options:
+      largest_argument_length = max(largest_argument_length, len(argument))
+
+    # TODO: move getopt_switch into templates.
+    getopt_switch = []
+    for option, argument, _ in tool_options:
+      if getopt_switch:
+        getopt_switch.append('')
+
+      if argument:
+        getopt_switch.extend([
+            '\t\t\tcase (system_integer_t) \'{0:s}\':'.format(option),
+            '\t\t\t\toption_{0:s} = optarg;'.format(argument),
+            '',
+            '\t\t\t\tbreak;'])
+
+      elif option == 'h':
+        getopt_switch.extend([
+            '\t\t\tcase (system_integer_t) \'{0:s}\':'.format(option),
+            '\t\t\t\tusage_fprint(',
+            '\t\t\t\t stdout );',
+            '',
+            '\t\t\t\treturn( EXIT_SUCCESS );'])
+
+      elif option == 'v':
+        getopt_switch.extend([
+            '\t\t\tcase (system_integer_t) \'{0:s}\':'.format(option),
+            '\t\t\t\tverbose = 1;',
+            '',
+            '\t\t\t\tbreak;'])
+
+      elif option == 'V':
+        getopt_switch.extend([
+            '\t\t\tcase (system_integer_t) \'{0:s}\':'.format(option),
+            '\t\t\t\t{0:s}_output_copyright_fprint('.format(
+                project_configuration.tools_directory),
+            '\t\t\t\t stdout );',
+            '',
+            '\t\t\t\treturn( EXIT_SUCCESS );'])
+
+    return '\n'.join(getopt_switch)
+
+  def _GenerateInfoHandleHeaderFile(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates an info handle header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'info_handle')
+
+    template_filename = os.path.join(template_directory, 'header.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_mappings['info_tool_source_type'] = (
+        project_configuration.info_tool_source_type)
+
+    for template_name in (
+        'struct.h', 'initialize.h', 'free.h', 'signal_abort.h'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: add condition
+    template_filename = os.path.join(template_directory, 'set_ascii_codepage.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    for template_name in ('open.h', 'close.h'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'footer.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateInfoHandleSourceFile(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates an info handle source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'info_handle')
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_mappings['info_tool_source_type'] = (
+        project_configuration.info_tool_source_type)
+
+    for template_name in ('initialize.c', 'free.c', 'signal_abort.c'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: add condition
+    template_filename = os.path.join(template_directory, 'set_ascii_codepage.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    for template_name in ('open.c', 'close.c'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+  def _GenerateInfoTool(
+      self, project_configuration, template_mappings, output_writer):
+    """Generates an info tool.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+    """
+    info_tool_name = '{0:s}info'.format(
+        project_configuration.library_name_suffix)
+
+    info_tool_filename = '{0:s}.c'.format(info_tool_name)
+    info_tool_filename = os.path.join(
+        project_configuration.tools_directory, info_tool_filename)
+
+    if self._PathExists(info_tool_filename):
+      output_filename = os.path.join(
+          project_configuration.tools_directory, 'info_handle.h')
+      self._GenerateInfoHandleHeaderFile(
+          project_configuration, template_mappings, output_writer,
+          output_filename)
+
+      output_filename = os.path.join(
+          project_configuration.tools_directory, 'info_handle.c')
+      self._GenerateInfoHandleSourceFile(
+          project_configuration, template_mappings, output_writer,
+          output_filename)
+
+      self._GenerateInfoToolSourceFile(
+          project_configuration, template_mappings, info_tool_name,
+          output_writer, info_tool_filename)
+
+  def _GenerateInfoToolSourceFile(
+      self, project_configuration, template_mappings, info_tool_name,
+      output_writer, output_filename):
+    """Generates an info tool source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      info_tool_name (str): name of the info tool.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'yalinfo')
+
+    info_tool_options = self._GetInfoToolOptions(
+        project_configuration, info_tool_name)
+
+    template_mappings['info_tool_name'] = info_tool_name
+    template_mappings['info_tool_source_description'] = (
+        project_configuration.info_tool_source_description)
+    template_mappings['info_tool_source_type'] = (
+        project_configuration.info_tool_source_type)
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    self._GenerateInfoToolSourceUsageFunction(
+        project_configuration, template_mappings, info_tool_name,
+        info_tool_options, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'signal_handler.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    self._GenerateInfoToolSourceMainFunction(
+        project_configuration, template_mappings, info_tool_name,
+        info_tool_options, output_writer, output_filename)
+
+    self._PostProcessOutputFile(output_filename, [
+        self._GetSortIncludeHeadersStage(project_configuration),
+        line_stages.SortVariableDeclarationsStage()])
+
+  def _GenerateInfoToolSourceMainFunction(
+      self, project_configuration, template_mappings, info_tool_name,
+      info_tool_options, output_writer, output_filename):
+    """Generates an info tool source main function.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      info_tool_name (str): name of the info tool.
+      info_tool_options (list[tuple[str, str, st]])): info tool options.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'yalinfo')
+
+    variable_declarations = self._GenerateMainFunctionVariableDeclarations(
+        info_tool_options)
+    getopt_string = self._GenerateGetoptString(info_tool_options)
+    getopt_switch = self._GenerateGetoptSwitch(
+        project_configuration, info_tool_options)
+
+    template_mappings['info_tool_getopt_string'] = getopt_string
+    template_mappings['info_tool_options_switch'] = getopt_switch
+    template_mappings['info_tool_options_variable_declarations'] = (
+        variable_declarations)
+
+    template_filename = os.path.join(template_directory, 'main-start.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    # TODO: add condition
+    template_filename = os.path.join(
+        template_directory, 'main-option_codepage.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'main-end.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateInfoToolSourceUsageFunction(
+      self, project_configuration, template_mappings, info_tool_name,
+      info_tool_options, output_writer, output_filename):
+    """Generates an info tool source usage function.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      info_tool_name (str): name of the info tool.
+      info_tool_options (list[tuple[str, str, st]])): info tool options.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'yalinfo')
+
+    alignment_padding = '          '
+    width = 80 - len(alignment_padding)
+    text_wrapper = textwrap.TextWrapper(width=width)
+
+    options_details = []
+    options_usage = []
+    options_without_arguments = []
+    for option, argument, description in info_tool_options:
+      description_lines = text_wrapper.wrap(description)
+
+      description_line = description_lines.pop(0)
+      details = '\tfprintf( stream, "\\t-{0:s}:{1:s}{2:s}\\n"'.format(
+          option, alignment_padding, description_line)
+
+      # TODO: determine indentation size
+      for description_line in description_lines:
+        options_details.append(details)
+        details = '\t                 "\\t   {0:s}{1:s}\\n"'.format(
+            alignment_padding, description_line)
+
+      details = '{0:s} );'.format(details)
+      options_details.append(details)
+
+      if not argument:
+        options_without_arguments.append(option)
+      else:
+        usage = '[ -{0:s} {1:s} ]'.format(option, argument)
+        options_usage.append(usage)
+
+    usage = '[ -{0:s} ]'.format(''.join(options_without_arguments))
+    options_usage.append(usage)
+
+    if project_configuration.info_tool_source_type:
+      options_usage.append(project_configuration.info_tool_source_type)
+
+    usage = 'Usage: {0:s} '.format(info_tool_name)
+    usage_length = len(usage)
+    alignment_padding = ' ' * usage_length
+    options_usage = ' '.join(options_usage)
+
+    width = 80 - usage_length
+    text_wrapper = textwrap.TextWrapper(width=width)
+
+    usage_lines = text_wrapper.wrap(options_usage)
+
+    info_tool_usage = []
+    usage_line = usage_lines.pop(0)
+    usage = '\tfprintf( stream, "{0:s}{1:s}\\n"'.format(usage, usage_line)
+
+    for usage_line in usage_lines:
+      info_tool_usage.append(usage)
+      usage = '\t                 "{0:s}{1:s}\\n"'.format(
+          alignment_padding, usage_line)
+
+    usage = '{0:s}\\n" );'.format(usage[:-1])
+    info_tool_usage.append(usage)
+
+    template_mappings['info_tool_options'] = '\n'.join(options_details)
+    template_mappings['info_tool_usage'] = '\n'.join(info_tool_usage)
+
+    template_filename = os.path.join(template_directory, 'usage.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateMainFunctionVariableDeclarations(self, tool_options):
+    """Generates the variable declarations of the main function.
+
+    Args:
+      tool_options (list[tuple[str, str, st]])): tool options.
+
+    Returns:
+      str: variable declarations.
+    """
+    largest_argument_length = 0
+    for _, argument, _ in tool_options:
+      largest_argument_length = max(largest_argument_length, len(argument))
+
+    variable_declarations = []
+    for _, argument, _ in tool_options:
+      if argument:
+        alignment_padding = ' ' * (largest_argument_length - len(argument))
+        variable_declaration = (
+            '\tsystem_character_t *option_{0:s}{1:s} = NULL;').format(
+                argument, alignment_padding)
+        variable_declarations.append(variable_declaration)
+
+    return '\n'.join(sorted(variable_declarations))
+
+  def _GenerateMountHandleHeaderFile(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates a mount handle header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'mount_handle')
+
+    template_filename = os.path.join(template_directory, 'header.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_mappings['mount_tool_source_type'] = (
+        project_configuration.mount_tool_source_type)
+
+    for template_name in (
+        'struct.h', 'initialize.h', 'free.h', 'signal_abort.h'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.mount_tool_has_keys_option:
+      template_filename = os.path.join(template_directory, 'set_keys.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.mount_tool_has_password_option:
+      template_filename = os.path.join(template_directory, 'set_password.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'open.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    # TODO: improve this check.
+    if project_configuration.library_name == 'libvhdi':
+      template_filename = os.path.join(template_directory, 'open_parent.h')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    for template_name in ('close.h', 'read.h', 'seek.h'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: split in individual functions.
+    template_filename = os.path.join(template_directory, 'body.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'footer.h')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateMountHandleSourceFile(
+      self, project_configuration, template_mappings, output_writer,
+      output_filename):
+    """Generates a mount handle source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'mount_handle')
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_mappings['mount_tool_source_type'] = (
+        project_configuration.mount_tool_source_type)
+
+    template_filename = os.path.join(template_directory, 'initialize.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.mount_tool_has_keys_option:
+      template_filename = os.path.join(template_directory, 'free_with_keys.c')
+    else:
+      template_filename = os.path.join(template_directory, 'free.c')
+
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'signal_abort.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.mount_tool_has_keys_option:
+      template_filename = os.path.join(template_directory, 'set_keys.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.mount_tool_has_password_option:
+      template_filename = os.path.join(template_directory, 'set_password.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: improve this check.
+    if project_configuration.library_name == 'libvhdi':
+      template_filename = os.path.join(template_directory, 'open_with_parent.c')
+    else:
+      template_filename = os.path.join(template_directory, 'open.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    # TODO: improve this check.
+    if project_configuration.library_name == 'libvhdi':
+      template_filename = os.path.join(template_directory, 'open_parent.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    for template_name in ('close.c', 'read.c', 'seek.c'):
+      template_filename = os.path.join(template_directory, template_name)
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    # TODO: split in individual functions.
+    template_filename = os.path.join(template_directory, 'body.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'set_basename.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateMountTool(
+      self, project_configuration, template_mappings, output_writer):
+    """Generates a mount tool.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      output_writer (OutputWriter): output writer.
+    """
+    mount_tool_name = '{0:s}mount'.format(
+        project_configuration.library_name_suffix)
+
+    mount_tool_filename = '{0:s}.c'.format(mount_tool_name)
+    mount_tool_filename = os.path.join(
+        project_configuration.tools_directory, mount_tool_filename)
+
+    if self._PathExists(mount_tool_filename):
+      output_filename = os.path.join(
+          project_configuration.tools_directory, 'mount_handle.h')
+      self._GenerateMountHandleHeaderFile(
+          project_configuration, template_mappings, output_writer,
+          output_filename)
+
+      output_filename = os.path.join(
+          project_configuration.tools_directory, 'mount_handle.c')
+      self._GenerateMountHandleSourceFile(
+          project_configuration, template_mappings, output_writer,
+          output_filename)
+
+      self._GenerateMountToolSourceFile(
+          project_configuration, template_mappings, mount_tool_name,
+          output_writer, mount_tool_filename)
+
+  def _GenerateMountToolSourceFile(
+      self, project_configuration, template_mappings, mount_tool_name,
+      output_writer, output_filename):
+    """Generates a mount tool source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      mount_tool_name (str): name of the mount tool.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'yalmount')
+
+    mount_tool_options = self._GetMountToolOptions(
+        project_configuration, mount_tool_name)
+
+    template_mappings['mount_tool_name'] = mount_tool_name
+    template_mappings['mount_tool_source_description'] = (
+        project_configuration.mount_tool_source_description)
+    template_mappings['mount_tool_source_description_long'] = (
+        project_configuration.mount_tool_source_description_long)
+    template_mappings['mount_tool_source_type'] = (
+        project_configuration.mount_tool_source_type)
+
+    template_filename = os.path.join(template_directory, 'header.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'includes.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    self._GenerateMountToolSourceUsageFunction(
+        project_configuration, template_mappings, mount_tool_name,
+        mount_tool_options, output_writer, output_filename)
+
+    template_filename = os.path.join(template_directory, 'signal_handler.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'fuse.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'dokan.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    self._GenerateMountToolSourceMainFunction(
+        project_configuration, template_mappings, mount_tool_name,
+        mount_tool_options, output_writer, output_filename)
+
+    self._PostProcessOutputFile(output_filename, [
+        self._GetSortIncludeHeadersStage(project_configuration),
+        line_stages.SortVariableDeclarationsStage()])
+
+  def _GenerateMountToolSourceMainFunction(
+      self, project_configuration, template_mappings, mount_tool_name,
+      mount_tool_options, output_writer, output_filename):
+    """Generates a mount tool source main function.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      mount_tool_name (str): name of the mount tool.
+      mount_tool_options (list[tuple[str, str, st]])): mount tool options.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'yalmount')
+
+    variable_declarations = self._GenerateMainFunctionVariableDeclarations(
+        mount_tool_options)
+    getopt_string = self._GenerateGetoptString(mount_tool_options)
+    getopt_switch = self._GenerateGetoptSwitch(
+        project_configuration, mount_tool_options)
+
+    template_mappings['mount_tool_getopt_string'] = getopt_string
+    template_mappings['mount_tool_options_switch'] = getopt_switch
+    template_mappings['mount_tool_options_variable_declarations'] = (
+        variable_declarations)
+
+    template_filename = os.path.join(template_directory, 'main-start.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    if project_configuration.mount_tool_has_keys_option:
+      template_filename = os.path.join(template_directory, 'main-option_keys.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    if project_configuration.mount_tool_has_password_option:
+      template_filename = os.path.join(
+          template_directory, 'main-option_password.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'main-open.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'main-fuse.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'main-dokan.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+    template_filename = os.path.join(template_directory, 'main-end.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GenerateMountToolSourceUsageFunction(
+      self, project_configuration, template_mappings, mount_tool_name,
+      mount_tool_options, output_writer, output_filename):
+    """Generates a mount tool source usage function.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      template_mappings (TemplateMappings): template mappings, where the key
+          maps to the name of a template variable.
+      mount_tool_name (str): name of the mount tool.
+      mount_tool_options (list[tuple[str, str, st]])): mount tool options.
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    template_mappings = template_mappings.CreateOverlay()
+
+    template_directory = os.path.join(self._template_directory, 'yalmount')
+
+    alignment_padding = '          '
+    width = 80 - len(alignment_padding)
+    text_wrapper = textwrap.TextWrapper(width=width)
+
+    options_details = []
+    options_usage = []
+    options_without_arguments = []
+    for option, argument, description in mount_tool_options:
+      description_lines = text_wrapper.wrap(description)
+
+      description_line = description_lines.pop(0)
+      details = '\tfprintf( stream, "\\t-{0:s}:{1:s}{2:s}\\n"'.format(
+          option, alignment_padding, description_line)
+
+      for description_line in description_lines:
+        options_details.append(details)
+        details = '\t                 "\\t   {0:s}{1:s}\\n"'.format(
+            alignment_padding, description_line)
+
+      details = '{0:s} );'.format(details)
+      options_details.append(details)
+
+      if not argument:
+        options_without_arguments.append(option)
+      else:
+        usage = '[ -{0:s} {1:s} ]'.format(option, argument)
+        options_usage.append(usage)
+
+    usage = '[ -{0:s} ]'.format(''.join(options_without_arguments))
+    options_usage.append(usage)
+
+    options_usage.extend([
+        project_configuration.mount_tool_source_type, 'mount_point'])
+
+    mount_tool_source_alignment = ' ' *(
+        len('mount_point') - len(project_configuration.mount_tool_source_type))
+
+    usage = 'Usage: {0:s} '.format(mount_tool_name)
+    usage_length = len(usage)
+    alignment_padding = ' ' * usage_length
+    options_usage = ' '.join(options_usage)
+
+    width = 80 - usage_length
+    text_wrapper = textwrap.TextWrapper(width=width)
+
+    usage_lines = text_wrapper.wrap(options_usage)
+
+    mount_tool_usage = []
+    usage_line = usage_lines.pop(0)
+    usage = '\tfprintf( stream, "{0:s}{1:s}\\n"'.format(usage, usage_line)
+
+    for usage_line in usage_lines:
+      mount_tool_usage.append(usage)
+      usage = '\t                 "{0:s}{1:s}\\n"'.format(
+          alignment_padding, usage_line)
+
+    usage = '{0:s}\\n" );'.format(usage[:-1])
+    mount_tool_usage.append(usage)
+
+    template_mappings['mount_tool_options'] = '\n'.join(options_details)
+    template_mappings['mount_tool_source_alignment'] = mount_tool_source_alignment
+    template_mappings['mount_tool_usage'] = '\n'.join(mount_tool_usage)
+
+    template_filename = os.path.join(template_directory, 'usage.c')
+    self._GenerateSection(
+        template_filename, template_mappings, output_writer, output_filename,
+        access_mode='ab')
+
+  def _GetInfoToolOptions(self, project_configuration, info_tool_name):
+    """Retrieves the info tool options.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      info_tool_name (str): name of the info tool.
+
+    Returns:
+      list[tuple[str, str, str]]: info tool options.
+    """
+    # TODO: sort options with lower case before upper case.
+    info_tool_options = []
+
+    # TODO: add condition
+    info_tool_options.append(
+        ('c', 'codepage', (
+            'codepage of ASCII strings, options: ascii, windows-874, '
+            'windows-932, windows-936, windows-949, windows-950, '
+            'windows-1250, windows-1251, windows-1252 (default), '
+            'windows-1253, windows-1254, windows-1255, windows-1256, '
+            'windows-1257 or windows-1258 ')))
+
+    info_tool_options.extend([
+        ('h', '', 'shows this help'),
+        ('v', '', 'verbose output to stderr'),
+        ('V', '', 'print version')])
+
+    return info_tool_options
+
+  def _GetMountToolOptions(self, project_configuration, mount_tool_name):
+    """Retrieves the mount tool options.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      mount_tool_name (str): name of the mount tool.
+
+    Returns:
+      list[tuple[str, str, str]]: mount tool options.
+    """
+    # TODO: sort options with lower case before upper case.
+    mount_tool_options = [('h', '', 'shows this help')]
+
+    if project_configuration.mount_tool_has_keys_option:
+      mount_tool_options.append(
+          ('k', 'keys', 'the key formatted in base16'))
+
+    if project_configuration.mount_tool_has_password_option:
+      mount_tool_options.append(
+          ('p', 'password', 'specify the password/passphrase'))
+
+    mount_tool_options.extend([
+        ('v', '', ('verbose output to stderr, while {0:s} will remain '
+                    'running in the foreground').format(mount_tool_name)),
+        ('V', '', 'print version'),
+        ('X', 'extended_options', 'extended options to pass to sub system')])
+
+    return mount_tool_options
+
+  def Generate(self, project_configuration, output_writer):
+    """Generates tools source files.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+      output_writer (OutputWriter): output writer.
+    """
+    tools_path = os.path.join(
+        self._projects_directory, project_configuration.library_name,
+        project_configuration.tools_directory)
+
+    library_header = 'yaltools_{0:s}.h'.format(
+        project_configuration.library_name)
+
+    if not self._PathExists(tools_path):
+      return
+
+    template_mappings = self._GetTemplateMappings(
+        project_configuration,
+        authors_separator=',\n *                          ')
+
+    # TODO: add support for ouput.[ch]
+
+    for directory_entry in self._ListDirectory(self._template_directory):
+      # Ignore yaltools_library.h in favor of yaltools_libyal.h
+      if directory_entry == library_header:
+        continue
+
+      template_filename = os.path.join(
+          self._template_directory, directory_entry)
+      if not os.path.isfile(template_filename):
+        continue
+
+      if directory_entry == 'yaltools_libyal.h':
+        output_filename = '{0:s}tools_{1:s}.h'.format(
+            project_configuration.library_name_suffix,
+            project_configuration.library_name)
+
+      else:
+        output_filename = '{0:s}_{1:s}'.format(
+            project_configuration.tools_directory, directory_entry[9:])
+
+      output_filename = os.path.join(
+          project_configuration.tools_directory, output_filename)
+
+      if not self._PathExists(output_filename):
+        continue
+
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename)
+
+    self._GenerateInfoTool(
+        project_configuration, template_mappings, output_writer)
+
+    self._GenerateMountTool(
+        project_configuration, template_mappings, output_writer)
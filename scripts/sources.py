@@ -75,6 +75,8 @@ class FunctionPrototype(object):
         defined.
     have_debug_output (bool): True if the function prototype is defined if
         debug output is defined.
+    feature_guards (list[str]): names of the feature macros, such as
+        HAVE_DEBUG_OUTPUT, the function prototype is conditionally defined by.
     have_extern (bool): True if the function prototype is defined as
         externally available (API).
     have_wide_character_type (bool): True if the function prototype is
@@ -92,6 +94,7 @@ class FunctionPrototype(object):
     """
     super(FunctionPrototype, self).__init__()
     self.arguments = []
+    self.feature_guards = []
     self.have_bfio = False
     self.have_debug_output = False
     self.have_extern = False
@@ -505,3 +508,24 @@ class PythonTypeObjectFunctionPrototype(object):
         return value_name, value_name_prefix
 
     return self.value_name, None
+
+
+class StructDeclaration(object):
+  """Structure type declaration.
+
+  Attributes:
+    members (dict[str, str]): data types per member name, where the data type
+        is the member declaration without the member name, such as
+        "uint8_t *" or "int (*)( intptr_t *io_handle )".
+    name (str): name.
+  """
+
+  def __init__(self, name):
+    """Initializes a structure type declaration.
+
+    Args:
+      name (str): name.
+    """
+    super(StructDeclaration, self).__init__()
+    self.members = collections.OrderedDict()
+    self.name = name
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""Synthetic libyal-style project to benchmark the source generators."""
+
+from __future__ import unicode_literals
+
+import os
+
+
+class SyntheticProject(object):
+  """Synthetic libyal-style project.
+
+  The project consists of the files the source generators read, such as
+  the source generation configuration, the library include header, the
+  Makefile.am files and the type headers, where the number of types and
+  the number of functions per type determine the size of the project.
+
+  Attributes:
+    library_name (str): name of the library, such as "libfoo".
+    number_of_functions (int): number of functions per type.
+    number_of_types (int): number of types.
+  """
+
+  def __init__(self, library_name, number_of_types, number_of_functions):
+    """Initializes a synthetic project.
+
+    Args:
+      library_name (str): name of the library, such as "libfoo".
+      number_of_types (int): number of types.
+      number_of_functions (int): number of functions per type.
+    """
+    super(SyntheticProject, self).__init__()
+    self._library_name_upper_case = library_name.upper()
+    self._library_name_suffix = library_name[3:]
+    self.library_name = library_name
+    self.number_of_functions = number_of_functions
+    self.number_of_types = number_of_types
+
+  def _GetFunctionPrototype(self, function_name, arguments, error_type):
+    """Retrieves the lines of a function prototype.
+
+    Args:
+      function_name (str): name of the function.
+      arguments (list[str]): arguments of the function, without the error
+          argument.
+      error_type (str): type of the error argument, such as
+          "libfoo_error_t".
+
+    Returns:
+      list[str]: lines of the function prototype.
+    """
+    lines = [
+        '{0:s}_EXTERN \\'.format(self._library_name_upper_case),
+        'int {0:s}('.format(function_name)]
+
+    for argument in arguments:
+      lines.append('     {0:s},'.format(argument))
+
+    lines.extend([
+        '     {0:s} **error );'.format(error_type),
+        ''])
+
+    return lines
+
+  def _GetSectionHeader(self, description):
+    """Retrieves the lines of a section header of the library include header.
+
+    Args:
+      description (str): description of the section, such as "File".
+
+    Returns:
+      list[str]: lines of the section header.
+    """
+    return [
+        '/* -------------------------------------------------------------------'
+        '------',
+        ' * {0:s} functions'.format(description),
+        ' * -------------------------------------------------------------------'
+        '------ */',
+        '']
+
+  def _GetTypeFunctions(self, type_name):
+    """Retrieves the names and arguments of the functions of a type.
+
+    Args:
+      type_name (str): name of the type.
+
+    Returns:
+      list[tuple[str, list[str]]]: names and arguments of the functions.
+    """
+    type_argument = '{0:s}_{1:s}_t *{1:s}'.format(
+        self.library_name, type_name)
+    type_reference_argument = '{0:s}_{1:s}_t **{1:s}'.format(
+        self.library_name, type_name)
+
+    if type_name == 'file':
+      type_functions = [
+          ('initialize', [type_reference_argument]),
+          ('free', [type_reference_argument]),
+          ('open', [
+              type_argument, 'const char *filename', 'int access_flags']),
+          ('close', [type_argument])]
+    else:
+      type_functions = [('free', [type_reference_argument])]
+
+    for function_index in range(self.number_of_functions):
+      type_functions.append((
+          'get_value{0:d}'.format(function_index), [
+              type_argument, 'uint32_t *value{0:d}'.format(function_index)]))
+
+    return type_functions
+
+  def _WriteFile(self, path, lines):
+    """Writes a file.
+
+    Args:
+      path (str): path of the file.
+      lines (list[str]): lines of the file.
+    """
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+      os.makedirs(directory)
+
+    data = '\n'.join(lines)
+    with open(path, 'wb') as file_object:
+      file_object.write(data.encode('utf-8'))
+
+  def _WriteIncludeFiles(self, project_path):
+    """Writes the headers in the library include directory.
+
+    Args:
+      project_path (str): path of the project directory.
+    """
+    include_path = os.path.join(project_path, 'include', self.library_name)
+
+    lines = [
+        '#if !defined( _{0:s}_DEFINITIONS_H )'.format(
+            self._library_name_upper_case),
+        '#define _{0:s}_DEFINITIONS_H'.format(self._library_name_upper_case),
+        '',
+        'enum {0:s}_ACCESS_FLAGS'.format(self._library_name_upper_case),
+        '{',
+        '\t{0:s}_ACCESS_FLAG_READ\t= 0x01,'.format(
+            self._library_name_upper_case),
+        '};',
+        '',
+        '#endif',
+        '']
+    self._WriteFile(os.path.join(include_path, 'definitions.h.in'), lines)
+
+    lines = [
+        'typedef intptr_t {0:s}_{1:s}_t;'.format(self.library_name, type_name)
+        for type_name in self.GetTypeNames()]
+    lines.append('')
+    self._WriteFile(os.path.join(include_path, 'types.h.in'), lines)
+
+    self._WriteFile(
+        os.path.join(include_path, 'error.h'), ['/* error */', ''])
+    self._WriteFile(
+        os.path.join(include_path, 'extern.h'), ['/* extern */', ''])
+
+  def _WriteIncludeHeader(self, project_path):
+    """Writes the library include header.
+
+    Args:
+      project_path (str): path of the project directory.
+    """
+    lines = [
+        '#if !defined( _{0:s}_H )'.format(self._library_name_upper_case),
+        '#define _{0:s}_H'.format(self._library_name_upper_case),
+        '',
+        '#include <{0:s}/definitions.h>'.format(self.library_name),
+        '#include <{0:s}/extern.h>'.format(self.library_name),
+        '',
+        '#include <stdio.h>',
+        '']
+
+    lines.extend(self._GetSectionHeader('Support'))
+    lines.extend([
+        '/* Returns the library version',
+        ' */',
+        '{0:s}_EXTERN \\'.format(self._library_name_upper_case),
+        'const char *{0:s}_get_version('.format(self.library_name),
+        '             void );',
+        '',
+        '/* Determines if a file contains a signature',
+        ' */'])
+    lines.extend(self._GetFunctionPrototype(
+        '{0:s}_check_file_signature'.format(self.library_name),
+        ['const char *filename'],
+        '{0:s}_error_t'.format(self.library_name)))
+
+    lines.extend(self._GetSectionHeader('Error'))
+    lines.extend([
+        '{0:s}_EXTERN \\'.format(self._library_name_upper_case),
+        'void {0:s}_error_free('.format(self.library_name),
+        '      {0:s}_error_t **error );'.format(self.library_name),
+        ''])
+
+    error_type = '{0:s}_error_t'.format(self.library_name)
+    for type_name in self.GetTypeNames():
+      lines.extend(self._GetSectionHeader(type_name.title()))
+
+      for function_name, arguments in self._GetTypeFunctions(type_name):
+        function_name = '{0:s}_{1:s}_{2:s}'.format(
+            self.library_name, type_name, function_name)
+        lines.extend(self._GetFunctionPrototype(
+            function_name, arguments, error_type))
+
+    lines.extend(['#endif', ''])
+
+    path = os.path.join(
+        project_path, 'include', '{0:s}.h.in'.format(self.library_name))
+    self._WriteFile(path, lines)
+
+  def _WriteLibraryFiles(self, project_path):
+    """Writes the Makefile.am and type headers of the library.
+
+    Args:
+      project_path (str): path of the project directory.
+    """
+    library_path = os.path.join(project_path, self.library_name)
+
+    source_files = []
+    for type_name in self.GetTypeNames():
+      source_files.append('{0:s}_{1:s}.c {0:s}_{1:s}.h'.format(
+          self.library_name, type_name))
+
+    source_files.extend([
+        '{0:s}_definitions.h'.format(self.library_name),
+        '{0:s}_libcerror.h'.format(self.library_name)])
+
+    lines = [
+        'AM_CPPFLAGS = \\',
+        '\t-I$(top_srcdir)/include \\',
+        '\t@LIBCERROR_CPPFLAGS@ \\',
+        '\t@LIBBFIO_CPPFLAGS@',
+        '',
+        'lib_LTLIBRARIES = {0:s}.la'.format(self.library_name),
+        '',
+        '{0:s}_la_SOURCES = \\'.format(self.library_name)]
+
+    lines.extend([
+        '\t{0:s} \\'.format(source_file) for source_file in source_files[:-1]])
+    lines.extend([
+        '\t{0:s}'.format(source_files[-1]),
+        '',
+        '{0:s}_la_LIBADD = \\'.format(self.library_name),
+        '\t@LIBCERROR_LIBADD@ \\',
+        '\t@LIBBFIO_LIBADD@',
+        ''])
+
+    self._WriteFile(os.path.join(library_path, 'Makefile.am'), lines)
+
+    error_type = 'libcerror_error_t'
+    for type_name in self.GetTypeNames():
+      type_name_upper_case = type_name.upper()
+
+      lines = [
+          '#if !defined( _{0:s}_{1:s}_H )'.format(
+              self._library_name_upper_case, type_name_upper_case),
+          '#define _{0:s}_{1:s}_H'.format(
+              self._library_name_upper_case, type_name_upper_case),
+          '',
+          'typedef struct {0:s}_internal_{1:s} {0:s}_internal_{1:s}_t;'.format(
+              self.library_name, type_name),
+          '',
+          'struct {0:s}_internal_{1:s}'.format(self.library_name, type_name),
+          '{',
+          '\tint dummy;',
+          '};',
+          '']
+
+      for function_name, arguments in self._GetTypeFunctions(type_name):
+        function_name = '{0:s}_{1:s}_{2:s}'.format(
+            self.library_name, type_name, function_name)
+        lines.extend(self._GetFunctionPrototype(
+            function_name, arguments, error_type))
+
+      lines.extend(['#endif', ''])
+
+      path = os.path.join(library_path, '{0:s}_{1:s}.h'.format(
+          self.library_name, type_name))
+      self._WriteFile(path, lines)
+
+    for filename in ('definitions.h', 'libcerror.h'):
+      path = os.path.join(library_path, '{0:s}_{1:s}'.format(
+          self.library_name, filename))
+      self._WriteFile(path, [''])
+
+  def _WriteProjectFiles(self, project_path):
+    """Writes the source generation configuration and main Makefile.am.
+
+    Args:
+      project_path (str): path of the project directory.
+    """
+    public_types = ', '.join([
+        '"{0:s}"'.format(type_name) for type_name in self.GetTypeNames()])
+
+    lines = [
+        '[project]',
+        'name: "{0:s}"'.format(self.library_name),
+        'status: "alpha"',
+        'year_of_creation: "2010"',
+        'features: ["debug_output"]',
+        '',
+        '[library]',
+        'description: "Library to access the synthetic format"',
+        'public_types: [{0:s}]'.format(public_types),
+        '',
+        '[tools]',
+        'description: "Several tools for reading synthetic files"',
+        'names: ["{0:s}info"]'.format(self._library_name_suffix),
+        '',
+        '[info_tool]',
+        'source_description: "a synthetic file"',
+        'source_type: "file"',
+        '',
+        '[tests]',
+        'profiles: ["{0:s}", "py{1:s}"]'.format(
+            self.library_name, self._library_name_suffix),
+        'example_filename1: "test1"',
+        'example_filename2: "test2"',
+        '',
+        '[development]',
+        'main_object: "file"',
+        'main_object_filename: "test.raw"',
+        '']
+    self._WriteFile(os.path.join(project_path, 'source.conf'), lines)
+
+    lines = [
+        'ACLOCAL_AMFLAGS = -I m4',
+        '',
+        'SUBDIRS = \\',
+        '\tinclude \\',
+        '\tcommon \\',
+        '\t{0:s} \\'.format(self.library_name),
+        '\t{0:s}tools \\'.format(self._library_name_suffix),
+        '\tpy{0:s} \\'.format(self._library_name_suffix),
+        '\tmanuals \\',
+        '\ttests',
+        '']
+    self._WriteFile(os.path.join(project_path, 'Makefile.am'), lines)
+
+    # Source files that the generators update instead of write.
+    for path_segments in (
+        ('manuals', '{0:s}.3'.format(self.library_name)),
+        ('tests', 'Makefile.am'),
+        ('tests', 'test_library.sh')):
+      path = os.path.join(project_path, *path_segments)
+      self._WriteFile(path, [''])
+
+  def GetTypeNames(self):
+    """Retrieves the names of the types.
+
+    Returns:
+      list[str]: names of the types, where the first type is "file".
+    """
+    type_names = ['file']
+    for type_index in range(1, self.number_of_types):
+      type_names.append('type{0:d}'.format(type_index))
+
+    return type_names
+
+  def Write(self, projects_directory):
+    """Writes the project.
+
+    Args:
+      projects_directory (str): path of the projects directory.
+
+    Returns:
+      str: path of the project directory.
+    """
+    project_path = os.path.join(projects_directory, self.library_name)
+
+    for directory in (
+        'common', os.path.join('dpkg', 'source'), 'm4', 'manuals', 'msvscpp',
+        'ossfuzz', 'po', 'py{0:s}'.format(self._library_name_suffix),
+        '{0:s}tools'.format(self._library_name_suffix), 'tests'):
+      path = os.path.join(project_path, directory)
+      if not os.path.isdir(path):
+        os.makedirs(path)
+
+    self._WriteProjectFiles(project_path)
+    self._WriteIncludeHeader(project_path)
+    self._WriteIncludeFiles(project_path)
+    self._WriteLibraryFiles(project_path)
+
+    return project_path
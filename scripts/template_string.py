@@ -1,7 +1,427 @@
 # -*- coding: utf-8 -*-
 """Template string generator."""
 
+import hashlib
+import logging
+import os
 import string
+import threading
+
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle
+
+
+class CompiledTemplate(object):
+  """Compiled template string.
+
+  The template string is compiled once into a format string, where the
+  literal segments are escaped and the placeholders are replaced by mapping
+  keys, so that a substitution is a single format operation instead of
+  a regular expression scan of the template string.
+
+  The template string uses the syntax of string.Template, where "$$" is
+  an escaped "$" and "$identifier" and "${identifier}" are placeholders.
+
+  Attributes:
+    error (str): error of an invalid placeholder or None if the placeholders
+        are valid.
+    placeholders (frozenset[str]): names of the placeholders.
+  """
+
+  def __init__(self, format_string, placeholders, error=None):
+    """Initializes a compiled template string.
+
+    Args:
+      format_string (str): format string.
+      placeholders (list[str]): names of the placeholders.
+      error (Optional[str]): error of an invalid placeholder or None if
+          the placeholders are valid.
+    """
+    super(CompiledTemplate, self).__init__()
+    self._format_string = format_string
+    self.error = error
+    self.placeholders = frozenset(placeholders)
+
+  @classmethod
+  def Compile(cls, template_data):
+    """Compiles a template string.
+
+    Args:
+      template_data (str): template string.
+
+    Returns:
+      CompiledTemplate: compiled template string.
+    """
+    segments = []
+    placeholders = set()
+    error = None
+    last_offset = 0
+
+    for match in string.Template.pattern.finditer(template_data):
+      segments.append(template_data[last_offset:match.start()].replace(
+          '%', '%%'))
+      last_offset = match.end()
+
+      if match.group('escaped') is not None:
+        segments.append('$')
+        continue
+
+      name = match.group('named') or match.group('braced')
+      if name is not None:
+        segments.append('%({0:s})s'.format(name))
+        placeholders.add(name)
+        continue
+
+      # The error is formatted the same as by string.Template.substitute.
+      offset = match.start('invalid')
+      lines = template_data[:offset].splitlines(True)
+      if not lines:
+        line_number = 1
+        column_number = 1
+      else:
+        line_number = len(lines)
+        column_number = offset - len(''.join(lines[:-1]))
+
+      error = 'Invalid placeholder in string: line {0:d}, col {1:d}'.format(
+          line_number, column_number)
+      break
+
+    segments.append(template_data[last_offset:].replace('%', '%%'))
+
+    return cls(''.join(segments), sorted(placeholders), error=error)
+
+  def GetState(self):
+    """Retrieves the state of the compiled template string.
+
+    Returns:
+      tuple[str, list[str], str]: format string, names of the placeholders
+          and error, which can be passed to the initializer.
+    """
+    return self._format_string, sorted(self.placeholders), self.error
+
+  def GetMappings(self, template_mappings):
+    """Retrieves the template mappings of the placeholders.
+
+    Reducing the template mappings to the placeholders of the template
+    string determines all missing placeholders at once.
+
+    Args:
+      template_mappings (dict[str, str]): template mappings, where the key
+          maps to the name of a placeholder.
+
+    Returns:
+      dict[str, str]: template mappings of the placeholders.
+
+    Raises:
+      KeyError: if placeholders are missing in the template mappings.
+    """
+    placeholder_mappings = {}
+    missing_placeholders = []
+    for name in self.placeholders:
+      try:
+        placeholder_mappings[name] = template_mappings[name]
+      except KeyError:
+        missing_placeholders.append(name)
+
+    if missing_placeholders:
+      raise KeyError(', '.join(sorted(missing_placeholders)))
+
+    return placeholder_mappings
+
+  def Substitute(self, template_mappings):
+    """Substitutes the placeholders.
+
+    Args:
+      template_mappings (dict[str, str]): template mappings, where the key
+          maps to the name of a placeholder.
+
+    Returns:
+      str: template string with the placeholders substituted.
+
+    Raises:
+      KeyError: if a placeholder is missing in the template mappings.
+      ValueError: if the template string contains an invalid placeholder.
+    """
+    if self.error:
+      raise ValueError(self.error)
+
+    return self._format_string % template_mappings
+
+
+class TemplateFileCache(object):
+  """Template file cache.
+
+  The cache is keyed by the path of the template file. A cached template
+  string is only reused when the modification time and size of the template
+  file have not changed since the template file was read.
+
+  The compiled template strings are kept in memory and, if a cache directory
+  is set, on disk, keyed by the content of the template file, so that
+  subsequent runs do not need to compile them again.
+
+  Attributes:
+    number_of_hits (int): number of template reads that were served from
+        the cache.
+    number_of_misses (int): number of template reads that required reading
+        the template file.
+  """
+
+  _FORMAT_VERSION = 1
+
+  def __init__(self):
+    """Initializes a template file cache."""
+    super(TemplateFileCache, self).__init__()
+    self._directory = None
+    self._lock = threading.Lock()
+    self._templates = {}
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def _GetCacheKey(self, template_data):
+    """Determines the cache key of a template file.
+
+    Args:
+      template_data (bytes): content of the template file.
+
+    Returns:
+      str: cache key.
+    """
+    hash_context = hashlib.sha256()
+    hash_context.update('{0:d}\n'.format(self._FORMAT_VERSION))
+    hash_context.update(template_data)
+    return hash_context.hexdigest()
+
+  def _ReadCacheFile(self, cache_key):
+    """Reads a compiled template string from the cache directory.
+
+    Args:
+      cache_key (str): cache key.
+
+    Returns:
+      CompiledTemplate: compiled template string or None if not available.
+    """
+    if not self._directory:
+      return None
+
+    cache_file_path = os.path.join(
+        self._directory, '{0:s}.pickle'.format(cache_key))
+
+    try:
+      with open(cache_file_path, 'rb') as file_object:
+        state = pickle.loads(file_object.read())
+
+      return CompiledTemplate(*state)
+
+    except IOError:
+      return None
+
+    except Exception:  # pylint: disable=broad-except
+      # A corrupt cache file is compiled again.
+      return None
+
+  def _WriteCacheFile(self, cache_key, compiled_template):
+    """Writes a compiled template string to the cache directory.
+
+    Args:
+      cache_key (str): cache key.
+      compiled_template (CompiledTemplate): compiled template string.
+    """
+    if not self._directory:
+      return
+
+    cache_file_path = os.path.join(
+        self._directory, '{0:s}.pickle'.format(cache_key))
+    temporary_path = '{0:s}.{1:d}'.format(cache_file_path, os.getpid())
+
+    serialized_data = pickle.dumps(
+        compiled_template.GetState(), pickle.HIGHEST_PROTOCOL)
+
+    try:
+      if not os.path.isdir(self._directory):
+        os.makedirs(self._directory)
+
+      with open(temporary_path, 'wb') as file_object:
+        file_object.write(serialized_data)
+
+      # Since the cache file is named after its content, an existing cache
+      # file can be left as-is.
+      if os.path.exists(cache_file_path):
+        os.remove(temporary_path)
+      else:
+        os.rename(temporary_path, cache_file_path)
+
+    except (IOError, OSError) as exception:
+      logging.warning((
+          'Unable to write template cache file: {0:s} with error: '
+          '{1!s}').format(cache_file_path, exception))
+
+  def Empty(self):
+    """Empties the in-memory cache."""
+    with self._lock:
+      self._templates = {}
+      self.number_of_hits = 0
+      self.number_of_misses = 0
+
+  def GetTemplate(self, path):
+    """Retrieves the compiled template string of a template file.
+
+    Args:
+      path (str): path of the file containing the template string.
+
+    Returns:
+      CompiledTemplate: compiled template string.
+    """
+    stat_object = os.stat(path)
+    file_identifier = (stat_object.st_mtime, stat_object.st_size)
+
+    with self._lock:
+      cached_file_identifier, template_string = self._templates.get(
+          path, (None, None))
+      if cached_file_identifier == file_identifier:
+        self.number_of_hits += 1
+        return template_string
+
+    with open(path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    cache_key = self._GetCacheKey(file_data)
+
+    template_string = self._ReadCacheFile(cache_key)
+    if not template_string:
+      template_string = CompiledTemplate.Compile(file_data)
+      self._WriteCacheFile(cache_key, template_string)
+
+    with self._lock:
+      self._templates[path] = (file_identifier, template_string)
+      self.number_of_misses += 1
+
+    return template_string
+
+  def SetDirectory(self, directory):
+    """Sets the cache directory.
+
+    Args:
+      directory (str): path of the cache directory or None to only cache in
+          memory.
+    """
+    self._directory = directory
+
+
+_TEMPLATE_FILE_CACHE = TemplateFileCache()
+
+
+def GetTemplateFileCache():
+  """Retrieves the template file cache shared within the process.
+
+  Returns:
+    TemplateFileCache: template file cache.
+  """
+  return _TEMPLATE_FILE_CACHE
+
+
+class TemplateIndex(object):
+  """Index of the placeholders of template files.
+
+  The index is built once, at startup, from the directories that contain
+  the template files, such as data/source. The template files are compiled
+  by the template file cache, hence generating afterwards does not need to
+  read them again.
+  """
+
+  def __init__(self):
+    """Initializes a template index."""
+    super(TemplateIndex, self).__init__()
+    self._templates = {}
+
+  def AddDirectory(self, path):
+    """Adds the template files in a directory and its subdirectories.
+
+    Hidden files and directories are ignored.
+
+    Args:
+      path (str): path of the directory.
+    """
+    for directory_path, directory_names, file_names in os.walk(path):
+      directory_names[:] = sorted([
+          directory_name for directory_name in directory_names
+          if not directory_name.startswith('.')])
+
+      for file_name in sorted(file_names):
+        if file_name.startswith('.'):
+          continue
+
+        template_path = os.path.abspath(
+            os.path.join(directory_path, file_name))
+        self._templates[template_path] = _TEMPLATE_FILE_CACHE.GetTemplate(
+            template_path)
+
+  def Empty(self):
+    """Empties the index."""
+    self._templates = {}
+
+  def GetError(self, path):
+    """Retrieves the error of an invalid placeholder in a template file.
+
+    Args:
+      path (str): path of the template file.
+
+    Returns:
+      str: error of an invalid placeholder or None if the placeholders are
+          valid or the template file is not indexed.
+    """
+    template_string_object = self._templates.get(os.path.abspath(path), None)
+    if not template_string_object:
+      return None
+
+    return template_string_object.error
+
+  def GetPlaceholders(self, path):
+    """Retrieves the names of the placeholders in a template file.
+
+    Args:
+      path (str): path of the template file.
+
+    Returns:
+      frozenset[str]: names of the placeholders or None if the template file
+          is not indexed.
+    """
+    template_string_object = self._templates.get(os.path.abspath(path), None)
+    if not template_string_object:
+      return None
+
+    return template_string_object.placeholders
+
+  def GetTemplatePaths(self, directory=None):
+    """Retrieves the paths of the indexed template files.
+
+    Args:
+      directory (Optional[str]): path of the directory that contains
+          the template files, where None represents all template files.
+
+    Returns:
+      list[str]: absolute paths of the template files.
+    """
+    if not directory:
+      return sorted(self._templates.keys())
+
+    directory = os.path.join(os.path.abspath(directory), '')
+    return sorted([
+        template_path for template_path in self._templates.keys()
+        if template_path.startswith(directory)])
+
+
+_TEMPLATE_INDEX = TemplateIndex()
+
+
+def GetTemplateIndex():
+  """Retrieves the template index shared within the process.
+
+  Returns:
+    TemplateIndex: template index.
+  """
+  return _TEMPLATE_INDEX
 
 
 class TemplateStringGenerator(object):
@@ -14,12 +434,9 @@ class TemplateStringGenerator(object):
       filename (str): name of the file containing the template string.
 
     Returns:
-      string.Template: template string.
+      CompiledTemplate: compiled template string.
     """
-    with open(filename, 'rb') as file_object:
-      file_data = file_object.read()
-
-    return string.Template(file_data)
+    return _TEMPLATE_FILE_CACHE.GetTemplate(filename)
 
   def Generate(self, template_filename, template_mappings):
     """Generates output based on the template string.
@@ -38,7 +455,7 @@ class TemplateStringGenerator(object):
     template_string = self._ReadTemplateFile(template_filename)
 
     try:
-      return template_string.substitute(template_mappings)
+      return template_string.Substitute(template_mappings)
 
     except (KeyError, ValueError) as exception:
       raise RuntimeError(
@@ -7,12 +7,13 @@ from __future__ import unicode_literals
 
 import abc
 import argparse
-import string
+import logging
 import os
 import re
 import sys
 
 import configuration
+import template_string
 
 
 class WikiPageGenerator(object):
@@ -37,8 +38,21 @@ class WikiPageGenerator(object):
           the key maps to the name of a template variable.
       output_writer (OutputWriter): output writer.
     """
-    template_string = self._ReadTemplateFile(template_filename)
-    output_data = template_string.substitute(template_mappings)
+    template_string_object = self._ReadTemplateFile(template_filename)
+
+    try:
+      output_data = template_string_object.Substitute(template_mappings)
+    except KeyError as exception:
+      logging.error((
+          'Unable to format template: {0:s} with missing placeholder: '
+          '{1!s}').format(template_filename, exception.args[0]))
+      return
+    except ValueError as exception:
+      logging.error(
+          'Unable to format template: {0:s} with error: {1!s}'.format(
+              template_filename, exception))
+      return
+
     output_writer.Write(output_data)
 
   def _GetCygwinBuildDependencies(self, project_configuration):
@@ -819,13 +833,11 @@ class WikiPageGenerator(object):
       filename (str): path of the file containing the template string.
 
     Returns:
-      string.Template: template string.
+      CompiledTemplate: compiled template string.
     """
     path = os.path.join(self._template_directory, filename)
-    file_object = open(path, 'rb')
-    file_data = file_object.read()
-    file_object.close()
-    return string.Template(file_data)
+    template_file_cache = template_string.GetTemplateFileCache()
+    return template_file_cache.GetTemplate(path)
 
   @abc.abstractmethod
   def Generate(self, project_configuration, output_writer):
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Tests for the line stream stages."""
+
+import unittest
+
+from scripts import line_stages
+
+from tests import test_lib
+
+
+class LineStagesTest(test_lib.BaseTestCase):
+  """Line stream stages tests."""
+
+  def testProcessLines(self):
+    """Tests the ProcessLines function."""
+    lines = [
+        b'#include "libyal_type.h"\n',
+        b'#include "libyal_definitions.h"\n',
+        b'\n',
+        b'/* Creates a item\n',
+        b' */\n',
+        b'int function(\n',
+        b'     void )\n',
+        b'{\n',
+        b'\tint result = 0;\n',
+        b'\tuint8_t byte_value = 0;\n',
+        b'\n',
+        b'\tresult = function(\n',
+        b'\t          argument );\n',
+        b'}\n']
+
+    stages = [
+        line_stages.CorrectDescriptionSpellingStage(['item']),
+        line_stages.SortIncludeHeadersStage([b'#include "libyal_']),
+        line_stages.SortVariableDeclarationsStage()]
+
+    expected_lines = [
+        b'#include "libyal_definitions.h"\n',
+        b'#include "libyal_type.h"\n',
+        b'\n',
+        b'/* Creates an item\n',
+        b' */\n',
+        b'int function(\n',
+        b'     void )\n',
+        b'{\n',
+        b'\tuint8_t byte_value = 0;\n',
+        b'\tint result         = 0;\n',
+        b'\n',
+        b'\tresult = function(\n',
+        b'\t          argument );\n',
+        b'}\n']
+
+    processed_lines = list(line_stages.ProcessLines(lines, stages))
+    self.assertEqual(processed_lines, expected_lines)
+
+  def testVerticalAlignAssignmentStatementsStage(self):
+    """Tests the VerticalAlignAssignmentStatementsStage."""
+    lines = [
+        b'\tvalue = 1;\n',
+        b'\tlong_value = 2;\n',
+        b'\n']
+
+    expected_lines = [
+        b'\tvalue      = 1;\n',
+        b'\tlong_value = 2;\n',
+        b'\n']
+
+    stage = line_stages.VerticalAlignAssignmentStatementsStage()
+    self.assertEqual(list(stage.Process(lines)), expected_lines)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source generation manifest."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts import manifest
+
+from tests import test_lib
+
+
+class DependencyGraphTest(test_lib.BaseTestCase):
+  """Dependency graph tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testAddGenerator(self):
+    """Tests the AddGenerator function."""
+    generator_inputs = manifest.GeneratorInputs()
+    generator_inputs.AddFile('include.h')
+    generator_inputs.AddFile('input.c')
+    generator_inputs.AddFile('/templates/header.c', output_path='input.c')
+    generator_inputs.AddFile('/templates/header.py', output_path='output.py')
+
+    dependency_graph = manifest.DependencyGraph(os.getcwd())
+    dependency_graph.AddGenerator(
+        generator_inputs, ['input.c', 'output.py'],
+        input_paths=[os.path.abspath('source.conf')])
+
+    self.assertEqual(dependency_graph.GetDependencies(), {
+        'input.c': ['/templates/header.c', 'include.h', 'source.conf'],
+        'output.py': ['/templates/header.py', 'include.h', 'source.conf']})
+
+  def testWriteMakefile(self):
+    """Tests the WriteMakefile function."""
+    generator_inputs = manifest.GeneratorInputs()
+    generator_inputs.AddFile('my input.h')
+
+    dependency_graph = manifest.DependencyGraph(os.getcwd())
+    dependency_graph.AddGenerator(generator_inputs, ['output.c'])
+
+    path = os.path.join(self._temporary_directory, 'dependencies.mk')
+    dependency_graph.WriteMakefile(path)
+
+    with open(path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    self.assertEqual(file_data, (
+        b'# Generated by source-generate.py, do not edit.\n'
+        b'\n'
+        b'output.c: \\\n'
+        b'\tmy\\ input.h\n'
+        b'\n'
+        b'my\\ input.h:\n'))
+
+
+class GeneratorInputsTest(test_lib.BaseTestCase):
+  """Generator inputs tests."""
+
+  def testMerge(self):
+    """Tests the Merge function."""
+    generator_inputs = manifest.GeneratorInputs()
+    generator_inputs.AddFile('input.h')
+    generator_inputs.AddPath('output.c', False)
+
+    task_inputs = manifest.GeneratorInputs()
+    task_inputs.AddDirectory('tests', ['input'])
+    task_inputs.AddFile('type.h')
+    task_inputs.AddFile('template.c', output_path='output.c')
+
+    generator_inputs.Merge(task_inputs)
+
+    self.assertEqual(generator_inputs.directories, {'tests': ['input']})
+    self.assertEqual(
+        generator_inputs.files, set(['input.h', 'template.c', 'type.h']))
+    self.assertEqual(
+        generator_inputs.output_files, {'output.c': set(['template.c'])})
+    self.assertEqual(generator_inputs.paths, {'output.c': False})
+
+
+class GenerationManifestTest(test_lib.BaseTestCase):
+  """Source generation manifest tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _WriteFile(self, path, data):
+    """Writes data to a file.
+
+    Args:
+      path (str): path of the file.
+      data (bytes): data to write.
+    """
+    with open(path, 'wb') as file_object:
+      file_object.write(data)
+
+  def testGetPaths(self):
+    """Tests the GetPaths function."""
+    generator_inputs = manifest.GeneratorInputs()
+    generator_inputs.AddFile('input.h')
+    generator_inputs.AddGlob('tests/*.c', [])
+    generator_inputs.AddPath('optional.h', False)
+
+    manifest_path = os.path.join(self._temporary_directory, 'manifest')
+    generation_manifest = manifest.GenerationManifest(manifest_path)
+    generation_manifest.Update('tests', 'key', generator_inputs, [])
+
+    self.assertEqual(
+        generation_manifest.GetPaths(),
+        set(['input.h', 'optional.h', 'tests']))
+
+  def testIsUpToDate(self):
+    """Tests the IsUpToDate function."""
+    input_path = os.path.join(self._temporary_directory, 'input.h')
+    output_path = os.path.join(self._temporary_directory, 'output.c')
+    manifest_path = os.path.join(self._temporary_directory, 'manifest')
+
+    self._WriteFile(input_path, b'input')
+    self._WriteFile(output_path, b'output')
+
+    generator_inputs = manifest.GeneratorInputs()
+    generator_inputs.AddFile(input_path)
+
+    generation_manifest = manifest.GenerationManifest(manifest_path)
+    self.assertFalse(generation_manifest.IsUpToDate('tests', 'key'))
+
+    generation_manifest.Update('tests', 'key', generator_inputs, [output_path])
+    generation_manifest.Write()
+
+    generation_manifest = manifest.GenerationManifest(manifest_path)
+    generation_manifest.Read()
+    self.assertTrue(generation_manifest.IsUpToDate('tests', 'key'))
+    self.assertFalse(generation_manifest.IsUpToDate('tests', 'other'))
+
+    self._WriteFile(input_path, b'changed input')
+    self.assertFalse(generation_manifest.IsUpToDate('tests', 'key'))
+
+    self._WriteFile(input_path, b'input')
+    self._WriteFile(output_path, b'changed output')
+    self.assertFalse(generation_manifest.IsUpToDate('tests', 'key'))
+
+
+if __name__ == '__main__':
+  unittest.main()
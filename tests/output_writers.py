@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Tests for the output writers of the source generation."""
+
+import os
+import shutil
+import stat
+import struct
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from scripts import output_writers
+
+from tests import test_lib
+
+
+class FileWriterTest(test_lib.BaseTestCase):
+  """File output writer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _ReadFile(self, path):
+    """Reads the data of a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      bytes: data of the file.
+    """
+    with open(path, 'rb') as file_object:
+      return file_object.read()
+
+  def testWriteFile(self):
+    """Tests the WriteFile and Flush functions."""
+    output_writer = output_writers.FileWriter(self._temporary_directory)
+
+    output_writer.WriteFile(os.path.join('src', 'file.c'), b'data')
+    output_writer.WriteFile(
+        os.path.join('src', 'file.c'), b' appended', access_mode='ab')
+    output_writer.WriteFile('script.sh', b'#!/bin/sh\n', executable=True)
+
+    path = os.path.join(self._temporary_directory, 'src', 'file.c')
+    self.assertFalse(os.path.exists(path))
+
+    output_writer.Flush()
+
+    self.assertEqual(self._ReadFile(path), b'data appended')
+    self.assertEqual(os.listdir(os.path.dirname(path)), ['file.c'])
+
+    path = os.path.join(self._temporary_directory, 'script.sh')
+    self.assertTrue(os.stat(path).st_mode & stat.S_IEXEC)
+
+    output_writer.Close()
+
+  def testWriteFileUnchanged(self):
+    """Tests the WriteFile function with unchanged data."""
+    path = os.path.join(self._temporary_directory, 'file.c')
+    with open(path, 'wb') as file_object:
+      file_object.write(b'data')
+
+    os.utime(path, (0, 0))
+
+    output_writer = output_writers.FileWriter(self._temporary_directory)
+    output_writer.WriteFile('file.c', b'data')
+    output_writer.Close()
+
+    self.assertEqual(os.stat(path).st_mtime, 0)
+
+    output_writer = output_writers.FileWriter(self._temporary_directory)
+    output_writer.WriteFile('file.c', b'changed')
+    output_writer.Close()
+
+    self.assertEqual(self._ReadFile(path), b'changed')
+
+  def testWriteFileWithBackground(self):
+    """Tests the WriteFile function with a background thread."""
+    output_writer = output_writers.FileWriter(
+        self._temporary_directory, background=True)
+
+    for index in range(100):
+      output_writer.WriteFile(
+          'file{0:d}.c'.format(index), b'data{0:d}'.format(index))
+
+    output_writer.Close()
+
+    self.assertEqual(len(os.listdir(self._temporary_directory)), 100)
+
+    path = os.path.join(self._temporary_directory, 'file99.c')
+    self.assertEqual(self._ReadFile(path), b'data99')
+
+  def testWriteFileWithBackgroundError(self):
+    """Tests the WriteFile function with an error in the background thread."""
+    path = os.path.join(self._temporary_directory, 'file.c')
+    with open(path, 'wb') as file_object:
+      file_object.write(b'data')
+
+    output_writer = output_writers.FileWriter(
+        self._temporary_directory, background=True)
+
+    # The parent directory of the file is a file.
+    output_writer.WriteFile(os.path.join('file.c', 'file.h'), b'data')
+    output_writer.WriteFile('file.h', b'data')
+
+    with self.assertRaises(OSError):
+      output_writer.Close()
+
+    self.assertEqual(os.listdir(self._temporary_directory), ['file.c'])
+
+
+class StreamWriterTest(test_lib.BaseTestCase):
+  """Length-prefixed stream output writer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testWriteFile(self):
+    """Tests the WriteFile function."""
+    path = os.path.join(self._temporary_directory, 'output.stream')
+
+    output_writer = output_writers.StreamWriter(path=path)
+    output_writer.WriteFile(os.path.join('src', 'file.c'), b'data')
+    output_writer.WriteFile('script.sh', b'#!/bin/sh\n', executable=True)
+
+    with self.assertRaises(ValueError):
+      output_writer.WriteFile('file.c', b'data', access_mode='ab')
+
+    output_writer.Close()
+
+    with open(path, 'rb') as file_object:
+      stream_data = file_object.read()
+
+    self.assertEqual(stream_data[:16], struct.pack('>IIQ', 10, 0o644, 4))
+    self.assertEqual(stream_data[16:30], b'src/file.cdata')
+    self.assertEqual(stream_data[30:46], struct.pack('>IIQ', 9, 0o755, 10))
+    self.assertEqual(len(stream_data), 65)
+
+
+class TarWriterTest(test_lib.BaseTestCase):
+  """Tar archive output writer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testWriteFile(self):
+    """Tests the WriteFile function."""
+    path = os.path.join(self._temporary_directory, 'output.tar.gz')
+
+    output_writer = output_writers.TarWriter(path=path, compression='gz')
+    output_writer.WriteFile(os.path.join('.', 'src', 'file.c'), b'data')
+    output_writer.WriteFile('script.sh', b'#!/bin/sh\n', executable=True)
+    output_writer.Close()
+
+    tar_file = tarfile.open(path, 'r:gz')
+    try:
+      self.assertEqual(tar_file.getnames(), ['src/file.c', 'script.sh'])
+      self.assertEqual(tar_file.extractfile('src/file.c').read(), b'data')
+      self.assertEqual(tar_file.getmember('script.sh').mode, 0o755)
+    finally:
+      tar_file.close()
+
+
+class ZipWriterTest(test_lib.BaseTestCase):
+  """Zip archive output writer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testWriteFile(self):
+    """Tests the WriteFile function."""
+    path = os.path.join(self._temporary_directory, 'output.zip')
+
+    output_writer = output_writers.ZipWriter(path)
+    output_writer.WriteFile(os.path.join('src', 'file.c'), b'data')
+    output_writer.WriteFile('script.sh', b'#!/bin/sh\n', executable=True)
+    output_writer.Close()
+
+    zip_file = zipfile.ZipFile(path, 'r')
+    try:
+      self.assertEqual(zip_file.namelist(), ['src/file.c', 'script.sh'])
+      self.assertEqual(zip_file.read('src/file.c'), b'data')
+
+      zip_info = zip_file.getinfo('script.sh')
+      self.assertEqual(zip_info.external_attr >> 16, stat.S_IFREG | 0o755)
+    finally:
+      zip_file.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Tests for the parse cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts import parse_cache
+
+from tests import test_lib
+
+
+class TestProjectConfiguration(object):
+  """Project configuration for testing."""
+
+  def __init__(self):
+    """Initializes a project configuration for testing."""
+    super(TestProjectConfiguration, self).__init__()
+    self.library_name = 'libtest'
+
+
+class TestSourceFile(object):
+  """Source file parser for testing."""
+
+  PARSER_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a source file parser for testing.
+
+    Args:
+      path (str): path of the source file.
+    """
+    super(TestSourceFile, self).__init__()
+    self._path = path
+    self.lines = []
+
+  def Read(self, project_configuration):
+    """Reads the source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    with open(self._path, 'rb') as file_object:
+      self.lines = file_object.read().split(b'\n')
+
+
+class ParseCacheTest(test_lib.BaseTestCase):
+  """Parse cache tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testReadFile(self):
+    """Tests the ReadFile function."""
+    cache_directory = os.path.join(self._temporary_directory, 'cache')
+    path = os.path.join(self._temporary_directory, 'source.h')
+    project_configuration = TestProjectConfiguration()
+
+    with open(path, 'wb') as file_object:
+      file_object.write(b'first\nsecond')
+
+    test_parse_cache = parse_cache.ParseCache()
+    test_parse_cache.SetDirectory(cache_directory)
+
+    source_file = test_parse_cache.ReadFile(
+        TestSourceFile, path, project_configuration)
+    self.assertEqual(source_file.lines, [b'first', b'second'])
+    self.assertEqual(test_parse_cache.number_of_misses, 1)
+
+    source_file = test_parse_cache.ReadFile(
+        TestSourceFile, path, project_configuration)
+    self.assertEqual(source_file.lines, [b'first', b'second'])
+    self.assertEqual(test_parse_cache.number_of_hits, 1)
+
+    # A new cache reuses the parsed source file stored on disk.
+    test_parse_cache = parse_cache.ParseCache()
+    test_parse_cache.SetDirectory(cache_directory)
+
+    source_file = test_parse_cache.ReadFile(
+        TestSourceFile, path, project_configuration)
+    self.assertEqual(source_file.lines, [b'first', b'second'])
+    self.assertEqual(test_parse_cache.number_of_hits, 1)
+    self.assertEqual(test_parse_cache.number_of_misses, 0)
+
+    with open(path, 'wb') as file_object:
+      file_object.write(b'changed')
+
+    source_file = test_parse_cache.ReadFile(
+        TestSourceFile, path, project_configuration)
+    self.assertEqual(source_file.lines, [b'changed'])
+    self.assertEqual(test_parse_cache.number_of_misses, 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
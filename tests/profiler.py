@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for the generation profiler."""
+
+import json
+import unittest
+
+from scripts import profiler
+
+from tests import test_lib
+
+
+class GenerationProfilerTest(test_lib.BaseTestCase):
+  """Generation profiler tests."""
+
+  def testGetJSONReport(self):
+    """Tests the GetJSONReport function."""
+    generation_profiler = profiler.GenerationProfiler()
+    generation_profiler.enabled = True
+
+    generation_profiler.Record(
+        'TestsSourceFileGenerator', output_filename='tests/Makefile.am',
+        template_filename='tests/Makefile.am', substitutions=1)
+
+    measurements = json.loads(generation_profiler.GetJSONReport())
+    self.assertEqual(measurements, {
+        'generators': {'TestsSourceFileGenerator': {'substitutions': 1}},
+        'output_files': {'tests/Makefile.am': {'substitutions': 1}},
+        'templates': {'tests/Makefile.am': {'substitutions': 1}}})
+
+  def testGetTextReport(self):
+    """Tests the GetTextReport function."""
+    generation_profiler = profiler.GenerationProfiler()
+    generation_profiler.enabled = True
+
+    generation_profiler.Record('CommonSourceFileGenerator', wall_time=0.5)
+    generation_profiler.Record('TestsSourceFileGenerator', wall_time=1.5)
+
+    lines = generation_profiler.GetTextReport().split('\n')
+    self.assertEqual(lines[:5], [
+        'Generators (2 of 2):',
+        '  TestsSourceFileGenerator',
+        '    wall time: 1.500s',
+        '  CommonSourceFileGenerator',
+        '    wall time: 0.500s'])
+
+  def testMerge(self):
+    """Tests the Merge function."""
+    generation_profiler = profiler.GenerationProfiler()
+    generation_profiler.enabled = True
+
+    generation_profiler.Record(
+        'TestsSourceFileGenerator', output_filename='tests/Makefile.am',
+        file_opens=1)
+
+    other_generation_profiler = profiler.GenerationProfiler()
+    other_generation_profiler.enabled = True
+
+    other_generation_profiler.Record(
+        'TestsSourceFileGenerator', output_filename='tests/Makefile.am',
+        file_opens=2)
+
+    generation_profiler.Merge(other_generation_profiler.GetMeasurements())
+
+    measurements = generation_profiler.GetMeasurements()
+    self.assertEqual(
+        measurements['output_files']['tests/Makefile.am'], {'file_opens': 3})
+
+  def testRecord(self):
+    """Tests the Record function."""
+    generation_profiler = profiler.GenerationProfiler()
+
+    generation_profiler.Record('TestsSourceFileGenerator', substitutions=1)
+
+    measurements = generation_profiler.GetMeasurements()
+    self.assertEqual(measurements['generators'], {})
+
+    generation_profiler.enabled = True
+    generation_profiler.Record('TestsSourceFileGenerator', substitutions=1)
+    generation_profiler.Record('TestsSourceFileGenerator', substitutions=1)
+
+    measurements = generation_profiler.GetMeasurements()
+    self.assertEqual(measurements['generators'], {
+        'TestsSourceFileGenerator': {'substitutions': 2}})
+    self.assertEqual(measurements['output_files'], {})
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Tests for the project model."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts import project_model
+
+from tests import test_lib
+
+
+class TestProjectConfiguration(object):
+  """Project configuration for testing."""
+
+  def __init__(self):
+    """Initializes a project configuration for testing."""
+    super(TestProjectConfiguration, self).__init__()
+    self.library_name = 'libtest'
+
+
+class TestSourceFile(object):
+  """Source file parser for testing."""
+
+  PARSER_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes a source file parser for testing.
+
+    Args:
+      path (str): path of the source file.
+    """
+    super(TestSourceFile, self).__init__()
+    self._path = path
+    self.data = None
+
+  def Read(self, project_configuration):
+    """Reads the source file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    with open(self._path, 'rb') as file_object:
+      self.data = file_object.read()
+
+
+class ProjectModelTest(test_lib.BaseTestCase):
+  """Project model tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetSourceFile(self):
+    """Tests the GetSourceFile and Invalidate functions."""
+    path = os.path.join(self._temporary_directory, 'Makefile.am')
+    project_configuration = TestProjectConfiguration()
+
+    with open(path, 'wb') as file_object:
+      file_object.write(b'SUBDIRS = include')
+
+    test_project_model = project_model.ProjectModel()
+
+    source_file = test_project_model.GetSourceFile(
+        TestSourceFile, path, project_configuration)
+    self.assertEqual(source_file.data, b'SUBDIRS = include')
+    self.assertEqual(test_project_model.number_of_misses, 1)
+
+    cached_source_file = test_project_model.GetSourceFile(
+        TestSourceFile, path, project_configuration)
+    self.assertIs(cached_source_file, source_file)
+    self.assertEqual(test_project_model.number_of_bytes_saved, 17)
+    self.assertEqual(test_project_model.number_of_hits, 1)
+
+    test_project_model.Invalidate(path)
+
+    cached_source_file = test_project_model.GetSourceFile(
+        TestSourceFile, path, project_configuration)
+    self.assertIsNot(cached_source_file, source_file)
+    self.assertEqual(test_project_model.number_of_misses, 2)
+
+    with self.assertRaises(OSError):
+      test_project_model.GetSourceFile(
+          TestSourceFile, os.path.join(self._temporary_directory, 'missing'),
+          project_configuration)
+
+
+if __name__ == '__main__':
+  unittest.main()
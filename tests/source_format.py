@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source formatting script."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from tests import test_lib
+
+
+class SourceFormatTest(test_lib.BaseTestCase):
+  """Tests for the source formatting script."""
+
+  _SCRIPT_PATH = os.path.join(test_lib.SCRIPTS_DIRECTORY, 'source-format.py')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _RunScript(self, paths):
+    """Runs the script.
+
+    Args:
+      paths (list[str]): paths to format.
+
+    Returns:
+      tuple[int, bytes, bytes]: return code, output and error output of
+          the script.
+    """
+    process = subprocess.Popen(
+        [sys.executable, self._SCRIPT_PATH] + paths,
+        stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    output, error_output = process.communicate()
+
+    return process.returncode, output, error_output
+
+  def testRun(self):
+    """Tests running the script on a C source file."""
+    path = os.path.join(self._temporary_directory, 'libyal_type.c')
+    with open(path, 'wb') as file_object:
+      file_object.write(b''.join([
+          b'int function(\n',
+          b'     void )\n',
+          b'{\n',
+          b'\tint result = 0;\n',
+          b'\tuint8_t byte_value = 0;\n',
+          b'\n',
+          b'\treturn( 1 );\n',
+          b'}\n']))
+
+    return_code, output, error_output = self._RunScript([path])
+
+    self.assertEqual(return_code, 0)
+    self.assertEqual(output, b'')
+    self.assertIn(b'[INFO] Formatted: ', error_output)
+    self.assertIn(b'[INFO] Formatted 1 of 1 files.', error_output)
+
+    with open(path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    self.assertEqual(file_data, b''.join([
+        b'int function(\n',
+        b'     void )\n',
+        b'{\n',
+        b'\tuint8_t byte_value = 0;\n',
+        b'\tint result         = 0;\n',
+        b'\n',
+        b'\treturn( 1 );\n',
+        b'}\n']))
+
+  def testRunWithMissingPath(self):
+    """Tests running the script on a path that does not exist."""
+    path = os.path.join(self._temporary_directory, 'bogus.c')
+
+    return_code, _, error_output = self._RunScript([path])
+
+    self.assertEqual(return_code, 1)
+    self.assertIn(b'[ERROR] Unable to read file: ', error_output)
+
+
+if __name__ == '__main__':
+  unittest.main()
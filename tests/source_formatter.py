@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source formatter."""
+
+import io
+import unittest
+
+from scripts import source_formatter
+
+from tests import test_lib
+
+
+class RuleEngineTest(test_lib.BaseTestCase):
+  """Rule engine tests."""
+
+  # pylint: disable=protected-access
+
+  def testModifyLines(self):
+    """Tests the ModifyLines function."""
+    lines = [
+        b'#if defined( HAVE_DEBUG_OUTPUT )\n',
+        b'\tint result = 0;\n',
+        b'\tuint8_t *data = NULL;\n',
+        b'#endif\n',
+        b'\tuint8_t values[ 2 ] = {\n',
+        b'\t\t1, 2 };\n',
+        b'\tint value_index = 0;\n']
+
+    expected_lines = [
+        b'#if defined( HAVE_DEBUG_OUTPUT )\n',
+        b'\tuint8_t *data   = NULL;\n',
+        b'\tint result      = 0;\n',
+        b'#endif\n',
+        b'\tuint8_t values[ 2 ] = {\n',
+        b'\t\t1, 2 };\n',
+        b'\tint value_index = 0;\n']
+
+    rule_engine = source_formatter.RuleEngine(
+        group_modifiers=[
+            source_formatter.InitializerBlockGroupModifier(),
+            source_formatter.VariableDeclarationsGroupModifier()],
+        line_modifiers=[source_formatter.EqualSignsLineModifier()])
+
+    modified_lines = rule_engine.ModifyLines(lines)
+    self.assertEqual(modified_lines, expected_lines)
+
+  def testGetDispatchTable(self):
+    """Tests the _GetDispatchTable function."""
+    line_modifier = source_formatter.LineModifier()
+    line_modifier.FIRST_BYTES = [b'#']
+
+    other_line_modifier = source_formatter.EqualSignsLineModifier()
+
+    rule_engine = source_formatter.RuleEngine()
+    modifiers_per_first_byte, other_modifiers = (
+        rule_engine._GetDispatchTable([line_modifier, other_line_modifier]))
+
+    self.assertEqual(modifiers_per_first_byte, {b'#': [
+        (line_modifier, None, None), (other_line_modifier, b'=', None)]})
+    self.assertEqual(other_modifiers, [(other_line_modifier, b'=', None)])
+
+
+class SourceFormatterTest(test_lib.BaseTestCase):
+  """Source formatter tests."""
+
+  def testFormatSource(self):
+    """Tests the FormatSource function."""
+    lines = [
+        b'\tint result = 0;\n',
+        b'\tuint8_t *data = NULL;\n',
+        b'\tlibyal_file_t *file = NULL;\n',
+        b'\tsize_t data_size = 0;\n']
+
+    expected_lines = [
+        b'\tlibyal_file_t *file = NULL;\n',
+        b'\tuint8_t *data       = NULL;\n',
+        b'\tsize_t data_size    = 0;\n',
+        b'\tint result          = 0;\n']
+
+    formatter = source_formatter.SourceFormatter()
+    formatted_lines = formatter.FormatSource(lines)
+    self.assertEqual(formatted_lines, expected_lines)
+
+  def testFormatSourceData(self):
+    """Tests the FormatSourceData function."""
+    lines = [
+        b'\tint result = 0;\n',
+        b'\tuint8_t *data = NULL;\n',
+        b'#if defined( HAVE_DEBUG_OUTPUT )\n',
+        b'\tsize_t data_size = 0;\n',
+        b'\tlibyal_item_t item;\n',
+        b'#endif\n',
+        b'\tuint8_t values[ 2 ] = {\n',
+        b'\t\t1, 2 };\n',
+        b'\tint index = 0;']
+
+    formatter = source_formatter.SourceFormatter()
+
+    # The buffer is formatted in the same way as the lines.
+    expected_data = b''.join(formatter.FormatSource(lines))
+    formatted_data = formatter.FormatSourceData(b''.join(lines))
+    self.assertEqual(formatted_data, expected_data)
+
+    self.assertEqual(formatted_data.split(b'\n')[:2], [
+        b'\tuint8_t *data    = NULL;', b'\tint result       = 0;'])
+
+  def testFormatSourceStream(self):
+    """Tests the FormatSourceStream function."""
+    lines = [
+        b'int function1(\n',
+        b'     void )\n',
+        b'{\n',
+        b'\tint result = 0;\n',
+        b'\tlibyal_file_t *file = NULL;\n',
+        b'\n',
+        b'\tresult = function2( file );\n',
+        b'}\n',
+        b'\n',
+        b'int function2(\n',
+        b'     libyal_file_t *file )\n',
+        b'{\n',
+        b'\tint result = 0;\n',
+        b'\tuint8_t *data = NULL;\n',
+        b'\n',
+        b'\treturn( 1 );\n',
+        b'}\n']
+
+    expected_lines = list(lines)
+    expected_lines[3:5] = [
+        b'\tlibyal_file_t *file = NULL;\n',
+        b'\tint result          = 0;\n']
+    expected_lines[12:14] = [
+        b'\tuint8_t *data = NULL;\n',
+        b'\tint result    = 0;\n']
+
+    formatter = source_formatter.SourceFormatter()
+
+    file_object = io.BytesIO(b''.join(lines))
+    formatted_lines = list(formatter.FormatSourceStream(file_object))
+    self.assertEqual(formatted_lines, expected_lines)
+
+    # Declaration blocks larger than the maximum block size are not formatted.
+    formatted_lines = list(formatter.FormatSourceStream(
+        iter(lines), maximum_block_size=2))
+    self.assertEqual(formatted_lines, lines)
+
+  def testGetVariableDeclarationSortKey(self):
+    """Tests the GetVariableDeclarationSortKey function."""
+    declarations = [
+        b'\tint value = 0;', b'\tchar *string = NULL;', b'\tsize_t size = 0;',
+        b'\tlibyal_item_t item;', b'\tint count = 0;']
+
+    formatter = source_formatter.SourceFormatter()
+    sorted_declarations = sorted(
+        declarations, key=formatter.GetVariableDeclarationSortKey)
+
+    self.assertEqual(sorted_declarations, [
+        b'\tchar *string = NULL;', b'\tlibyal_item_t item;',
+        b'\tsize_t size = 0;', b'\tint count = 0;', b'\tint value = 0;'])
+
+    # The sort key ranks in the same way as the comparison function.
+    sorted_declarations = sorted(
+        declarations, cmp=formatter.CompareVariableDeclarations)
+    self.assertEqual(sorted_declarations, [
+        b'\tchar *string = NULL;', b'\tlibyal_item_t item;',
+        b'\tsize_t size = 0;', b'\tint count = 0;', b'\tint value = 0;'])
+
+
+if __name__ == '__main__':
+  unittest.main()
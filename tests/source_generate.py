@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source generation script."""
+
+import imp
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+
+from scripts import synthetic_project
+
+from tests import test_lib
+
+
+with test_lib.ScriptModules():
+  source_generate = imp.load_source(
+      'source_generate_script',
+      os.path.join(test_lib.SCRIPTS_DIRECTORY, 'source-generate.py'))
+
+
+class GenerateProjectTest(test_lib.BaseTestCase):
+  """Tests for the GenerateProject function."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+    self._working_directory = os.getcwd()
+
+    project = synthetic_project.SyntheticProject('libsyn', 3, 2)
+    self._project_path = project.Write(self._temporary_directory)
+
+    self._generated_categories = []
+    self._output_writers = []
+
+    self._generate_category = source_generate._GenerateCategory
+    source_generate._GenerateCategory = self._GenerateCategory
+
+    os.chdir(self._project_path)
+
+    self._script_modules = test_lib.ScriptModules()
+    self._script_modules.__enter__()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._script_modules.__exit__(None, None, None)
+
+    os.chdir(self._working_directory)
+
+    source_generate._GenerateCategory = self._generate_category
+
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _GenerateCategory(self, source_generator_class, *args, **kwargs):
+    """Generates the source files of a category and records the generator.
+
+    Args:
+      source_generator_class (type): source file generator class.
+      args (list[object]): positional arguments.
+      kwargs (dict[str, object]): keyword arguments.
+
+    Returns:
+      tuple[MemoryWriter, GeneratorInputs, list[str]]: generated files,
+          inputs and paths of the output files of the category.
+    """
+    self._generated_categories.append(source_generator_class.__name__)
+    self._output_writers.append(kwargs.get('output_writer', None))
+    return self._generate_category(source_generator_class, *args, **kwargs)
+
+  def testGenerateProjectIncremental(self):
+    """Tests the GenerateProject function in incremental mode."""
+    source_generate.GenerateProject(
+        'source.conf', self._temporary_directory, incremental=True,
+        output_directory='.')
+
+    self.assertEqual(len(self._generated_categories), 10)
+
+    self._generated_categories = []
+
+    source_generate.GenerateProject(
+        'source.conf', self._temporary_directory, incremental=True,
+        output_directory='.')
+
+    self.assertEqual(self._generated_categories, [])
+
+  def testGenerateProjectIncrementalWithOutputDirectory(self):
+    """Tests the GenerateProject function in incremental mode."""
+    output_directory = os.path.join(self._temporary_directory, 'output')
+    os.mkdir(output_directory)
+
+    with self.assertRaises(ValueError):
+      source_generate.GenerateProject(
+          'source.conf', self._temporary_directory, incremental=True,
+          output_directory=output_directory)
+
+    self.assertEqual(self._generated_categories, [])
+    self.assertEqual(os.listdir(output_directory), [])
+
+  def testGenerateProjectTar(self):
+    """Tests the GenerateProject function with the tar output format."""
+    output_file = os.path.join(self._temporary_directory, 'libsyn.tar')
+
+    source_generate.GenerateProject(
+        'source.conf', self._temporary_directory, output_file=output_file,
+        output_format='tar')
+
+    # The source files are written directly to the archive.
+    self.assertEqual(len(self._output_writers), 10)
+    for output_writer in self._output_writers:
+      self.assertIsInstance(
+          output_writer, source_generate.output_writers.TarWriter)
+
+    with tarfile.open(output_file) as tar_file:
+      archive_paths = tar_file.getnames()
+
+    self.assertIn('common/Makefile.am', archive_paths)
+    self.assertIn('libsyn/libsyn.c', archive_paths)
+
+
+class MainTest(test_lib.BaseTestCase):
+  """Tests for running the source generation script."""
+
+  _SCRIPT_PATH = os.path.join(test_lib.SCRIPTS_DIRECTORY, 'source-generate.py')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    project = synthetic_project.SyntheticProject('libsyn', 3, 2)
+    self._project_path = project.Write(self._temporary_directory)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testRunWithJobsAndBackgroundWrites(self):
+    """Tests running the script with worker processes and background writes.
+
+    The type tests are generated by tasks that run in the worker processes
+    and the files are written by a background thread.
+    """
+    process = subprocess.Popen(
+        [sys.executable, self._SCRIPT_PATH, '-j', '2', '--background-writes',
+         '--no-parse-cache', '--no-template-cache', '-o', '.',
+         '-p', self._temporary_directory, 'source.conf'],
+        cwd=self._project_path, stderr=subprocess.PIPE,
+        stdout=subprocess.PIPE)
+    _, error_output = process.communicate()
+
+    self.assertEqual(process.returncode, 0)
+    self.assertNotIn(b'Traceback', error_output)
+
+    for path_segments in (
+        ('pysyn', 'pysyn_type1.c'),
+        ('tests', 'pysyn_test_type1.py'),
+        ('tests', 'syn_test_type1.c')):
+      path = os.path.join(self._project_path, *path_segments)
+      self.assertTrue(os.path.isfile(path), msg=path)
+
+
+if __name__ == '__main__':
+  unittest.main()
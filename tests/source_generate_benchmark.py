@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source generators benchmark script."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from tests import test_lib
+
+
+class SourceGenerateBenchmarkTest(test_lib.BaseTestCase):
+  """Tests for the source generators benchmark script."""
+
+  _SCRIPT_PATH = os.path.join('scripts', 'source-generate-benchmark.py')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testRun(self):
+    """Tests running the benchmark on the smallest synthetic project."""
+    output_file = os.path.join(self._temporary_directory, 'results.json')
+
+    # The script is run by a relative path, since the benchmark changes
+    # the working directory to the synthetic project.
+    process = subprocess.Popen(
+        [sys.executable, self._SCRIPT_PATH, '-r', '1', '-s', '1x1',
+         '-o', output_file],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    _, error_output = process.communicate()
+
+    self.assertEqual(process.returncode, 0)
+    self.assertEqual(error_output, b'')
+
+    with open(output_file, 'rb') as file_object:
+      output_data = json.loads(file_object.read().decode('utf-8'))
+
+    # Every category is timed with a cold and a warm cache.
+    self.assertEqual(len(output_data['results']), 20)
+
+    for result in output_data['results']:
+      self.assertEqual(result['number_of_types'], 1)
+      self.assertEqual(result['number_of_functions'], 1)
+      self.assertEqual(len(result['times']), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source generators manager."""
+
+import os
+import unittest
+
+from scripts.source_generators import manager
+
+from tests import test_lib
+
+
+class SourceGeneratorsManagerTest(test_lib.BaseTestCase):
+  """Source generators manager tests."""
+
+  def testGetCategories(self):
+    """Tests the GetCategories function."""
+    categories = manager.SourceGeneratorsManager.GetCategories()
+    self.assertEqual(categories[0], 'common')
+    self.assertEqual(categories[-1], 'libyal.3')
+    self.assertIn('include', categories)
+
+  def testGetTemplateDirectory(self):
+    """Tests the GetTemplateDirectory function."""
+    path = manager.SourceGeneratorsManager.GetTemplateDirectory(
+        'libyal.3', os.path.join('data', 'source'))
+    self.assertEqual(path, os.path.join('data', 'source', 'manuals', 'libyal.3'))
+
+    with self.assertRaises(KeyError):
+      manager.SourceGeneratorsManager.GetTemplateDirectory(
+          'bogus', os.path.join('data', 'source'))
+
+
+if __name__ == '__main__':
+  unittest.main()
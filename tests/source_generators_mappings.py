@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Tests for the layered template mappings."""
+
+import pickle
+import unittest
+
+from scripts.source_generators import mappings
+
+from tests import test_lib
+
+
+class TemplateMappingsTest(test_lib.BaseTestCase):
+  """Layered template mappings tests."""
+
+  def testCreateOverlay(self):
+    """Tests the CreateOverlay function."""
+    template_mappings = mappings.TemplateMappings(mappings={
+        'library_name': 'libyal', 'type_name': 'file'})
+    template_mappings.Freeze()
+
+    overlay = template_mappings.CreateOverlay()
+    overlay['type_name'] = 'file_entry'
+    overlay['value_name'] = 'size'
+    del overlay['library_name']
+
+    self.assertEqual(overlay['type_name'], 'file_entry')
+    self.assertEqual(overlay['value_name'], 'size')
+    self.assertNotIn('library_name', overlay)
+
+    self.assertEqual(template_mappings['type_name'], 'file')
+    self.assertEqual(template_mappings['library_name'], 'libyal')
+    self.assertNotIn('value_name', template_mappings)
+
+    with self.assertRaises(TypeError):
+      template_mappings['type_name'] = 'file_entry'
+
+    with self.assertRaises(KeyError):
+      del overlay['library_name']
+
+  def testGetDerivedKeys(self):
+    """Tests the GetDerivedKeys function."""
+    derived_keys = mappings.TemplateMappings.GetDerivedKeys()
+    self.assertIn('type_name_upper_case', derived_keys)
+    self.assertNotIn('type_name', derived_keys)
+
+  def testGetItemWithDerivedMappings(self):
+    """Tests the __getitem__ function with derived mappings."""
+    template_mappings = mappings.TemplateMappings(mappings={
+        'type_name': 'file', 'type_name_upper_case': 'EXPLICIT'})
+
+    overlay = template_mappings.CreateOverlay()
+    overlay['type_name'] = 'file_entry'
+
+    self.assertEqual(overlay['type_description'], 'file entry')
+    self.assertEqual(overlay['type_name_camel_case'], 'FileEntry')
+    self.assertEqual(overlay['type_name_upper_case'], 'FILE_ENTRY')
+    self.assertEqual(template_mappings['type_name_upper_case'], 'EXPLICIT')
+
+    overlay['type_name'] = 'file'
+    self.assertEqual(overlay['type_name_upper_case'], 'FILE')
+
+    with self.assertRaises(KeyError):
+      overlay['value_name_upper_case']  # pylint: disable=pointless-statement
+
+  def testPickle(self):
+    """Tests pickling template mappings."""
+    template_mappings = mappings.TemplateMappings(mappings={
+        'library_name': 'libyal'})
+    template_mappings.Freeze()
+
+    overlay = template_mappings.CreateOverlay()
+    del overlay['library_name']
+
+    overlay = pickle.loads(pickle.dumps(overlay, pickle.HIGHEST_PROTOCOL))
+    self.assertNotIn('library_name', overlay)
+
+  def testSubstitute(self):
+    """Tests substituting template mappings in a format string."""
+    template_mappings = mappings.TemplateMappings(mappings={
+        'library_name': 'libyal'})
+
+    overlay = template_mappings.CreateOverlay()
+    overlay['type_name'] = 'file'
+
+    output_data = b'%(library_name)s_%(type_name_upper_case)s' % overlay
+    self.assertEqual(output_data, b'libyal_FILE')
+
+
+if __name__ == '__main__':
+  unittest.main()
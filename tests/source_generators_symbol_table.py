@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""Tests for the project symbol table."""
+
+import mmap
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests import test_lib
+
+with test_lib.ScriptModules():
+  # pylint: disable=import-error
+  import parse_cache
+
+  from source_generators import source_files
+  from source_generators import symbol_table
+
+
+_FILE_HEADER_DATA = b'\n'.join([
+    b'#if !defined( _LIBTEST_FILE_H )',
+    b'#define _LIBTEST_FILE_H',
+    b'',
+    b'#include <common.h>',
+    b'#include <types.h>',
+    b'',
+    b'#if defined( __cplusplus )',
+    b'extern "C" {',
+    b'#endif',
+    b'',
+    b'typedef struct libtest_internal_file libtest_internal_file_t;',
+    b'',
+    b'struct libtest_internal_file',
+    b'{',
+    b'\t/* The IO handle',
+    b'\t */',
+    b'\tlibtest_io_handle_t *io_handle;',
+    b'',
+    b'\t/* The data',
+    b'\t */',
+    b'\tuint8_t data[ 16 ];',
+    b'',
+    b'#if defined( HAVE_LIBTEST_MULTI_THREAD_SUPPORT )',
+    b'\t/* The read/write lock',
+    b'\t */',
+    b'\tlibcthreads_read_write_lock_t *read_write_lock;',
+    b'#endif',
+    b'};',
+    b'',
+    b'LIBTEST_EXTERN \\',
+    b'int libtest_file_initialize(',
+    b'     libtest_file_t **file,',
+    b'     libcerror_error_t **error );',
+    b'',
+    b'LIBTEST_EXTERN \\',
+    b'int libtest_file_open(',
+    b'     libtest_file_t *file,',
+    b'     const char *filename,',
+    b'     int access_flags,',
+    b'     libcerror_error_t **error );',
+    b'',
+    b'#if defined( HAVE_WIDE_CHARACTER_TYPE )',
+    b'',
+    b'LIBTEST_EXTERN \\',
+    b'int libtest_file_open_wide(',
+    b'     libtest_file_t *file,',
+    b'     const wchar_t *filename,',
+    b'     int access_flags,',
+    b'     libcerror_error_t **error );',
+    b'',
+    b'#endif /* defined( HAVE_WIDE_CHARACTER_TYPE ) */',
+    b'',
+    b'int libtest_internal_file_read_data(',
+    b'     libtest_internal_file_t *internal_file,',
+    b'     int (*read_callback)(',
+    b'            intptr_t *io_handle,',
+    b'            libcerror_error_t **error ),',
+    b'     libcerror_error_t **error );',
+    b'',
+    b'#if defined( HAVE_DEBUG_OUTPUT )',
+    b'',
+    b'int libtest_internal_file_debug_print(',
+    b'     libtest_internal_file_t *internal_file,',
+    b'     libcerror_error_t **error );',
+    b'',
+    b'#endif /* defined( HAVE_DEBUG_OUTPUT ) */',
+    b'',
+    b'#if defined( __cplusplus )',
+    b'}',
+    b'#endif',
+    b'',
+    b'#endif /* !defined( _LIBTEST_FILE_H ) */',
+    b''])
+
+_IO_HANDLE_HEADER_DATA = b'\n'.join([
+    b'typedef struct libtest_io_handle libtest_io_handle_t;',
+    b'',
+    b'struct libtest_io_handle',
+    b'{',
+    b'\t/* The format version',
+    b'\t */',
+    b'\tuint32_t format_version;',
+    b'};',
+    b'',
+    b'int libtest_io_handle_initialize(',
+    b'     libtest_io_handle_t **io_handle,',
+    b'     libcerror_error_t **error );',
+    b''])
+
+
+class TestProjectConfiguration(object):
+  """Project configuration for testing."""
+
+  def __init__(self):
+    """Initializes a project configuration for testing."""
+    super(TestProjectConfiguration, self).__init__()
+    self.library_name = 'libtest'
+
+
+class LibraryHeaderFileTest(test_lib.BaseTestCase):
+  """Library header file tests."""
+
+  # The attributes of the function prototypes in the header as read before
+  # parsing moved into ReadLines, where the values are the return type,
+  # have_extern, have_debug_output, have_wide_character_type and
+  # the argument strings.
+  _EXPECTED_FUNCTION_PROTOTYPES = [
+      ('libtest_file_initialize', 'int', True, False, False, [
+          ['libtest_file_t **file'],
+          ['libcerror_error_t **error']]),
+      ('libtest_file_open', 'int', True, False, False, [
+          ['libtest_file_t *file'],
+          ['const char *filename'],
+          ['int access_flags'],
+          ['libcerror_error_t **error']]),
+      ('libtest_file_open_wide', 'int', True, False, True, [
+          ['libtest_file_t *file'],
+          ['const wchar_t *filename'],
+          ['int access_flags'],
+          ['libcerror_error_t **error']]),
+      ('libtest_internal_file_read_data', 'int', False, False, False, [
+          ['libtest_internal_file_t *internal_file'],
+          ['int (*read_callback)( ', 'intptr_t *io_handle',
+           'libcerror_error_t **error )'],
+          ['libcerror_error_t **error']]),
+      ('libtest_internal_file_debug_print', 'int', False, True, False, [
+          ['libtest_internal_file_t *internal_file'],
+          ['libcerror_error_t **error']])]
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+    self._path = os.path.join(self._temporary_directory, 'libtest_file.h')
+
+    with open(self._path, 'wb') as file_object:
+      file_object.write(_FILE_HEADER_DATA)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _CheckHeaderFile(self, header_file):
+    """Checks the attributes of the header file.
+
+    Args:
+      header_file (LibraryHeaderFile): header file.
+    """
+    self.assertEqual(header_file.types, ['libtest_internal_file'])
+    self.assertTrue(header_file.have_internal_functions)
+
+    function_prototypes = []
+    for name, function_prototype in header_file.functions_per_name.items():
+      self.assertEqual(function_prototype.name, name)
+
+      arguments = [
+          function_argument._strings  # pylint: disable=protected-access
+          for function_argument in function_prototype.arguments]
+
+      function_prototypes.append((
+          name, function_prototype.return_type,
+          function_prototype.have_extern,
+          function_prototype.have_debug_output,
+          function_prototype.have_wide_character_type, arguments))
+
+    self.assertEqual(function_prototypes, self._EXPECTED_FUNCTION_PROTOTYPES)
+
+  def testRead(self):
+    """Tests the Read function."""
+    header_file = source_files.LibraryHeaderFile(self._path)
+    header_file.Read(TestProjectConfiguration())
+
+    self._CheckHeaderFile(header_file)
+
+  def testReadLines(self):
+    """Tests the ReadLines function."""
+    header_file = source_files.LibraryHeaderFile(self._path)
+    header_file.ReadLines(
+        _FILE_HEADER_DATA.splitlines(True), TestProjectConfiguration())
+
+    self._CheckHeaderFile(header_file)
+
+  def testReadLinesFromMappedFile(self):
+    """Tests the ReadLines function with the lines of a mapped file."""
+    header_file = source_files.LibraryHeaderFile(self._path)
+
+    with open(self._path, 'rb') as file_object:
+      mapped_file = mmap.mmap(
+          file_object.fileno(), 0, access=mmap.ACCESS_READ)
+      try:
+        header_file.ReadLines(
+            iter(mapped_file.readline, b''), TestProjectConfiguration())
+      finally:
+        mapped_file.close()
+
+    self._CheckHeaderFile(header_file)
+
+
+class ProjectIndexerTest(test_lib.BaseTestCase):
+  """Project indexer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    self._library_path = os.path.join(self._temporary_directory, 'libtest')
+    os.mkdir(self._library_path)
+
+    self._WriteHeaderFile('libtest_empty.h', b'')
+    self._WriteHeaderFile('libtest_file.h', _FILE_HEADER_DATA)
+    self._WriteHeaderFile('libtest_io_handle.h', _IO_HANDLE_HEADER_DATA)
+
+    self._parse_cache_directory = parse_cache.GetParseCache().GetDirectory()
+    parse_cache.GetParseCache().SetDirectory(
+        os.path.join(self._temporary_directory, 'cache'))
+
+    # The symbol table is pickled by the name of its module.
+    self._script_modules = test_lib.ScriptModules()
+    self._script_modules.__enter__()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._script_modules.__exit__(None, None, None)
+
+    parse_cache.GetParseCache().SetDirectory(self._parse_cache_directory)
+
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _WriteHeaderFile(self, name, data):
+    """Writes a header file to the library directory.
+
+    Args:
+      name (str): name of the header file.
+      data (bytes): data of the header file.
+    """
+    path = os.path.join(self._library_path, name)
+    with open(path, 'wb') as file_object:
+      file_object.write(data)
+
+  def testGetSymbolTable(self):
+    """Tests the GetSymbolTable function."""
+    project_indexer = symbol_table.ProjectIndexer()
+
+    project_symbol_table = project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self.assertEqual(project_indexer.number_of_reused_files, 0)
+    self.assertEqual(project_indexer.number_of_scanned_files, 3)
+
+    self.assertEqual(project_symbol_table.library_name, 'libtest')
+    self.assertEqual(project_symbol_table.GetHeaderFileNames(), [
+        'libtest_empty.h', 'libtest_file.h', 'libtest_io_handle.h'])
+
+    # The empty header file is not mapped.
+    header_file = project_symbol_table.GetHeaderFile('libtest_empty.h')
+    self.assertIsNotNone(header_file)
+    self.assertEqual(header_file.types, [])
+    self.assertEqual(header_file.functions_per_name, {})
+
+    self.assertEqual(project_symbol_table.GetTypes(), [
+        'libtest_internal_file', 'libtest_io_handle'])
+
+    header_file = project_symbol_table.GetTypeHeaderFile(
+        'libtest_internal_file')
+    self.assertEqual(
+        header_file, project_symbol_table.GetHeaderFile('libtest_file.h'))
+
+    self.assertIsNone(project_symbol_table.GetTypeHeaderFile('bogus'))
+
+    feature_guards = [
+        (function_prototype.name, function_prototype.feature_guards)
+        for function_prototype in header_file.functions_per_name.values()]
+    self.assertEqual(feature_guards, [
+        ('libtest_file_initialize', []),
+        ('libtest_file_open', []),
+        ('libtest_file_open_wide', ['HAVE_WIDE_CHARACTER_TYPE']),
+        ('libtest_internal_file_read_data', []),
+        ('libtest_internal_file_debug_print', ['HAVE_DEBUG_OUTPUT'])])
+
+    struct_declaration = header_file.struct_declarations.get(
+        'libtest_internal_file', None)
+    self.assertIsNotNone(struct_declaration)
+    self.assertEqual(list(struct_declaration.members.items()), [
+        ('io_handle', 'libtest_io_handle_t *'),
+        ('data', 'uint8_t [ 16 ]'),
+        ('read_write_lock', 'libcthreads_read_write_lock_t *')])
+
+    header_file = project_symbol_table.GetTypeHeaderFile('libtest_io_handle')
+    self.assertEqual(
+        header_file, project_symbol_table.GetHeaderFile('libtest_io_handle.h'))
+
+  def testGetSymbolTableReuse(self):
+    """Tests the GetSymbolTable function reusing a previous scan."""
+    project_indexer = symbol_table.ProjectIndexer(maximum_number_of_threads=1)
+
+    project_symbol_table = project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self.assertEqual(project_indexer.number_of_scanned_files, 3)
+
+    # The symbol table is reused from memory.
+    reused_symbol_table = project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self.assertIs(reused_symbol_table, project_symbol_table)
+    self.assertEqual(project_indexer.number_of_reused_files, 3)
+    self.assertEqual(project_indexer.number_of_scanned_files, 3)
+
+    # The symbol table is reused from the cache directory.
+    project_indexer = symbol_table.ProjectIndexer(maximum_number_of_threads=1)
+
+    reused_symbol_table = project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self.assertIsNot(reused_symbol_table, project_symbol_table)
+    self.assertEqual(project_indexer.number_of_reused_files, 3)
+    self.assertEqual(project_indexer.number_of_scanned_files, 0)
+
+    self.assertEqual(
+        reused_symbol_table.GetHeaderFileNames(),
+        project_symbol_table.GetHeaderFileNames())
+    self.assertEqual(
+        reused_symbol_table.GetTypes(), project_symbol_table.GetTypes())
+
+    header_file = reused_symbol_table.GetHeaderFile('libtest_file.h')
+    function_prototype = header_file.functions_per_name.get(
+        'libtest_file_open_wide', None)
+    self.assertEqual(
+        function_prototype.feature_guards, ['HAVE_WIDE_CHARACTER_TYPE'])
+
+  def testGetSymbolTableChangedHeaderFile(self):
+    """Tests the GetSymbolTable function after a header file changed."""
+    project_indexer = symbol_table.ProjectIndexer()
+
+    project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self._WriteHeaderFile('libtest_empty.h', b'\n'.join([
+        b'typedef struct libtest_volume libtest_volume_t;',
+        b'']))
+
+    project_symbol_table = project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self.assertEqual(project_indexer.number_of_reused_files, 2)
+    self.assertEqual(project_indexer.number_of_scanned_files, 4)
+
+    self.assertEqual(project_symbol_table.GetTypes(), [
+        'libtest_internal_file', 'libtest_io_handle', 'libtest_volume'])
+
+  def testGetSymbolTableDeletedHeaderFile(self):
+    """Tests the GetSymbolTable function after a header file was deleted."""
+    project_indexer = symbol_table.ProjectIndexer()
+
+    project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    os.remove(os.path.join(self._library_path, 'libtest_io_handle.h'))
+
+    project_symbol_table = project_indexer.GetSymbolTable(
+        self._library_path, TestProjectConfiguration())
+
+    self.assertEqual(project_indexer.number_of_reused_files, 2)
+    self.assertEqual(project_indexer.number_of_scanned_files, 3)
+
+    self.assertEqual(project_symbol_table.GetHeaderFileNames(), [
+        'libtest_empty.h', 'libtest_file.h'])
+    self.assertEqual(project_symbol_table.GetTypes(), [
+        'libtest_internal_file'])
+    self.assertIsNone(
+        project_symbol_table.GetHeaderFile('libtest_io_handle.h'))
+    self.assertIsNone(
+        project_symbol_table.GetTypeHeaderFile('libtest_io_handle'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Tests for the template linter."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts import template_string
+from scripts.source_generators import template_linter
+
+from tests import test_lib
+
+
+class TestSourceFileGenerator(object):
+  """Source file generator for testing."""
+
+  def _GenerateSection(self, template_mappings, type_name):
+    """Generates a section.
+
+    Args:
+      template_mappings (TemplateMappings): template mappings.
+      type_name (str): name of the type.
+    """
+    template_mappings['type_name'] = type_name
+
+    function_template_mappings = {'function_name': type_name}
+    self.template_mappings = function_template_mappings
+
+
+class TemplateLinterTest(test_lib.BaseTestCase):
+  """Template linter tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetMappingKeys(self):
+    """Tests the GetMappingKeys function."""
+    template_index = template_string.TemplateIndex()
+    linter = template_linter.TemplateLinter(
+        template_index, mapping_keys=['type_name_upper_case'])
+
+    mapping_keys = linter.GetMappingKeys(TestSourceFileGenerator)
+    self.assertIn('function_name', mapping_keys)
+    self.assertIn('type_name', mapping_keys)
+    self.assertIn('type_name_upper_case', mapping_keys)
+    self.assertNotIn('function_template_mappings', mapping_keys)
+
+  def testLintDirectory(self):
+    """Tests the LintDirectory function."""
+    for file_name, template_data in (
+        ('invalid.txt', b'${type_name} $ 1'),
+        ('unknown.txt', b'${type_name} ${value_name}'),
+        ('valid.txt', b'${type_name_upper_case}')):
+      path = os.path.join(self._temporary_directory, file_name)
+      with open(path, 'wb') as file_object:
+        file_object.write(template_data)
+
+    template_index = template_string.TemplateIndex()
+    template_index.AddDirectory(self._temporary_directory)
+
+    linter = template_linter.TemplateLinter(
+        template_index, mapping_keys=['type_name_upper_case'])
+    mapping_keys = linter.GetMappingKeys(TestSourceFileGenerator)
+
+    problems = linter.LintDirectory(self._temporary_directory, mapping_keys)
+    self.assertEqual(len(problems), 2)
+
+    path, description = problems[0]
+    self.assertEqual(os.path.basename(path), 'invalid.txt')
+    self.assertTrue(description.startswith('Invalid placeholder'))
+
+    path, description = problems[1]
+    self.assertEqual(os.path.basename(path), 'unknown.txt')
+    self.assertEqual(description, 'Unknown placeholders: value_name')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Tests for the tokenizer of C source files."""
+
+import unittest
+
+from scripts.source_generators import tokenizer
+
+from tests import test_lib
+
+
+class CTokenizerTest(test_lib.BaseTestCase):
+  """Tokenizer of C source files tests."""
+
+  def testTokenize(self):
+    """Tests the Tokenize function."""
+    source = (
+        '#if defined( HAVE_DEBUG_OUTPUT ) \\\n'
+        '  && 1\n'
+        '/* Comment\n */\n'
+        'LIBYAL_EXTERN \\\n'
+        'int libyal_file_open(\n'
+        '     int (*callback)(\n'
+        '            intptr_t *data ),\n'
+        '     const char *filename = "a,b" );\n')
+
+    tokens = tokenizer.CTokenizer.Tokenize(source)
+    self.assertEqual(''.join(tokens), source)
+
+    self.assertEqual(tokens[:4], [
+        '#if defined( HAVE_DEBUG_OUTPUT ) \\\n  && 1', '\n',
+        '/* Comment\n */', '\n'])
+    self.assertEqual(tokens[4:10], [
+        'LIBYAL_EXTERN', ' \\\n', 'int', ' ', 'libyal_file_open', '('])
+    self.assertIn('"a,b"', tokens)
+    self.assertEqual(tokens.count(','), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Tests for the synthetic project."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts import synthetic_project
+
+from tests import test_lib
+
+
+class SyntheticProjectTest(test_lib.BaseTestCase):
+  """Synthetic project tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetTypeNames(self):
+    """Tests the GetTypeNames function."""
+    project = synthetic_project.SyntheticProject('libsyn', 3, 2)
+
+    self.assertEqual(project.GetTypeNames(), ['file', 'type1', 'type2'])
+
+  def testWrite(self):
+    """Tests the Write function."""
+    project = synthetic_project.SyntheticProject('libsyn', 3, 2)
+
+    project_path = project.Write(self._temporary_directory)
+    self.assertEqual(
+        project_path, os.path.join(self._temporary_directory, 'libsyn'))
+
+    path = os.path.join(project_path, 'include', 'libsyn.h.in')
+    with open(path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    self.assertIn(b'int libsyn_file_open(', file_data)
+    self.assertIn(b'int libsyn_type2_get_value1(', file_data)
+    self.assertNotIn(b'int libsyn_type2_get_value2(', file_data)
+
+    for path_segments in (
+        ('source.conf', ), ('Makefile.am', ), ('libsyn', 'Makefile.am'),
+        ('libsyn', 'libsyn_type1.h')):
+      path = os.path.join(project_path, *path_segments)
+      self.assertTrue(os.path.isfile(path))
+
+
+if __name__ == '__main__':
+  unittest.main()
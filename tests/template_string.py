@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """Tests for the template string generator."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from scripts import template_string
@@ -8,6 +11,170 @@ from scripts import template_string
 from tests import test_lib
 
 
+class CompiledTemplateTest(test_lib.BaseTestCase):
+  """Compiled template string tests."""
+
+  def testCompile(self):
+    """Tests the Compile function."""
+    compiled_template = template_string.CompiledTemplate.Compile(
+        b'${prefix}_$name = $$value; // 100%')
+    self.assertEqual(compiled_template.placeholders, frozenset([
+        'name', 'prefix']))
+
+    format_string, placeholders, error = compiled_template.GetState()
+    self.assertEqual(format_string, b'%(prefix)s_%(name)s = $value; // 100%%')
+    self.assertEqual(placeholders, ['name', 'prefix'])
+    self.assertIsNone(error)
+
+  def testGetMappings(self):
+    """Tests the GetMappings function."""
+    compiled_template = template_string.CompiledTemplate.Compile(
+        b'${prefix}_$name = $value;')
+
+    placeholder_mappings = compiled_template.GetMappings({
+        'name': 'size', 'prefix': 'libyal', 'unused': 'unused',
+        'value': '0'})
+    self.assertEqual(placeholder_mappings, {
+        'name': 'size', 'prefix': 'libyal', 'value': '0'})
+
+    with self.assertRaises(KeyError) as context_manager:
+      compiled_template.GetMappings({'name': 'size'})
+
+    self.assertEqual(context_manager.exception.args[0], 'prefix, value')
+
+  def testSubstitute(self):
+    """Tests the Substitute function."""
+    compiled_template = template_string.CompiledTemplate.Compile(
+        b'${prefix}_$name = $$value; // 100%')
+
+    output_data = compiled_template.Substitute({
+        'name': 'size', 'prefix': 'libyal', 'unused': 'unused'})
+    self.assertEqual(output_data, b'libyal_size = $value; // 100%')
+
+    with self.assertRaises(KeyError):
+      compiled_template.Substitute({'name': 'size'})
+
+    compiled_template = template_string.CompiledTemplate.Compile(
+        b'$name\n$ 1')
+    with self.assertRaises(ValueError):
+      compiled_template.Substitute({'name': 'size'})
+
+
+class TemplateFileCacheTest(test_lib.BaseTestCase):
+  """Template file cache tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetTemplate(self):
+    """Tests the GetTemplate function."""
+    path = os.path.join(self._temporary_directory, 'template.txt')
+    with open(path, 'wb') as file_object:
+      file_object.write(b'${value}')
+
+    template_file_cache = template_string.TemplateFileCache()
+
+    template_string_object = template_file_cache.GetTemplate(path)
+    self.assertIsNotNone(template_string_object)
+    self.assertEqual(template_file_cache.number_of_hits, 0)
+    self.assertEqual(template_file_cache.number_of_misses, 1)
+
+    cached_template_string_object = template_file_cache.GetTemplate(path)
+    self.assertIs(cached_template_string_object, template_string_object)
+    self.assertEqual(template_file_cache.number_of_hits, 1)
+    self.assertEqual(template_file_cache.number_of_misses, 1)
+
+    with open(path, 'wb') as file_object:
+      file_object.write(b'${value} changed')
+
+    template_string_object = template_file_cache.GetTemplate(path)
+    self.assertIsNot(template_string_object, cached_template_string_object)
+    self.assertEqual(template_file_cache.number_of_hits, 1)
+    self.assertEqual(template_file_cache.number_of_misses, 2)
+
+    template_file_cache.Empty()
+    self.assertEqual(template_file_cache.number_of_hits, 0)
+    self.assertEqual(template_file_cache.number_of_misses, 0)
+
+  def testGetTemplateWithDirectory(self):
+    """Tests the GetTemplate function with a cache directory."""
+    path = os.path.join(self._temporary_directory, 'template.txt')
+    with open(path, 'wb') as file_object:
+      file_object.write(b'${value}')
+
+    cache_directory = os.path.join(self._temporary_directory, 'cache')
+
+    template_file_cache = template_string.TemplateFileCache()
+    template_file_cache.SetDirectory(cache_directory)
+
+    template_string_object = template_file_cache.GetTemplate(path)
+    self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+    template_file_cache.Empty()
+
+    cached_template_string_object = template_file_cache.GetTemplate(path)
+    self.assertIsNot(cached_template_string_object, template_string_object)
+    self.assertEqual(
+        cached_template_string_object.GetState(),
+        template_string_object.GetState())
+
+
+class TemplateIndexTest(test_lib.BaseTestCase):
+  """Template index tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testAddDirectory(self):
+    """Tests the AddDirectory function."""
+    template_directory = os.path.join(self._temporary_directory, 'include')
+    os.mkdir(template_directory)
+
+    for file_name, template_data in (
+        ('.template.txt.swp', b'$ 1'),
+        ('invalid.txt', b'${name} $ 1'),
+        ('valid.txt', b'${prefix}_$name')):
+      path = os.path.join(template_directory, file_name)
+      with open(path, 'wb') as file_object:
+        file_object.write(template_data)
+
+    template_index = template_string.TemplateIndex()
+    template_index.AddDirectory(self._temporary_directory)
+
+    valid_path = os.path.join(template_directory, 'valid.txt')
+    invalid_path = os.path.join(template_directory, 'invalid.txt')
+
+    self.assertEqual(
+        template_index.GetTemplatePaths(), [invalid_path, valid_path])
+    self.assertEqual(
+        template_index.GetTemplatePaths(template_directory),
+        [invalid_path, valid_path])
+    self.assertEqual(template_index.GetTemplatePaths(
+        os.path.join(self._temporary_directory, 'inc')), [])
+
+    self.assertEqual(
+        template_index.GetPlaceholders(valid_path),
+        frozenset(['name', 'prefix']))
+    self.assertIsNone(template_index.GetError(valid_path))
+    self.assertIsNotNone(template_index.GetError(invalid_path))
+
+    self.assertIsNone(template_index.GetPlaceholders(
+        os.path.join(template_directory, 'bogus.txt')))
+
+    template_index.Empty()
+    self.assertEqual(template_index.GetTemplatePaths(), [])
+
+
 class TemplateStringGeneratorTest(test_lib.BaseTestCase):
   """Template string generator tests."""
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Shared test case."""
 
+import contextlib
 import os
 import sys
 import unittest
@@ -9,6 +10,62 @@ from dtfabric import reader
 from dtfabric import registry
 
 
+SCRIPTS_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+
+# The scripts import the modules in the scripts directory by name, such as
+# "manifest", which are also the names of the test modules. The modules of
+# the scripts are therefore only in sys.modules within ScriptModules.
+_SCRIPT_MODULES = {}
+
+
+def _GetScriptModuleNames():
+  """Retrieves the names of the modules in the scripts directory.
+
+  Returns:
+    set[str]: names of the modules and packages in the scripts directory.
+  """
+  module_names = set()
+  for file_name in os.listdir(SCRIPTS_DIRECTORY):
+    module_name, extension = os.path.splitext(file_name)
+    if extension == '.py' or os.path.isfile(os.path.join(
+        SCRIPTS_DIRECTORY, file_name, '__init__.py')):
+      module_names.add(module_name)
+
+  return module_names
+
+
+@contextlib.contextmanager
+def ScriptModules():
+  """Context manager in which the modules of the scripts can be imported.
+
+  The modules in the scripts directory can be imported by name, such as
+  "parse_cache" or "source_generators.symbol_table", the same way
+  the scripts import them.
+  """
+  script_module_names = _GetScriptModuleNames()
+
+  saved_modules = {}
+  for module_name in script_module_names:
+    if module_name in sys.modules:
+      saved_modules[module_name] = sys.modules.pop(module_name)
+
+  sys.modules.update(_SCRIPT_MODULES)
+  sys.path.insert(0, SCRIPTS_DIRECTORY)
+
+  try:
+    yield
+
+  finally:
+    sys.path.remove(SCRIPTS_DIRECTORY)
+
+    for module_name in list(sys.modules.keys()):
+      if module_name.split('.')[0] in script_module_names:
+        _SCRIPT_MODULES[module_name] = sys.modules.pop(module_name)
+
+    sys.modules.update(saved_modules)
+
+
 def skipUnlessHasTestFile(path_segments):
   """Decorator to skip a test if the test file does not exist.
 
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Tests for the wiki generation script."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from scripts import synthetic_project
+
+from tests import test_lib
+
+
+class WikiGenerateTest(test_lib.BaseTestCase):
+  """Tests for the wiki generation script."""
+
+  _SCRIPT_PATH = os.path.join(
+      os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts',
+      'wiki-generate.py')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testRun(self):
+    """Tests running the script on the configuration of a project."""
+    project = synthetic_project.SyntheticProject('libsyn', 1, 1)
+    project_path = project.Write(self._temporary_directory)
+
+    # The Building page requires the project to provide a rpm spec file.
+    spec_file_path = os.path.join(project_path, 'libsyn.spec.in')
+    with open(spec_file_path, 'wb') as file_object:
+      file_object.write(b'')
+
+    output_directory = os.path.join(self._temporary_directory, 'wiki')
+    os.mkdir(output_directory)
+
+    process = subprocess.Popen(
+        [sys.executable, self._SCRIPT_PATH, '-o', output_directory,
+         os.path.join(project_path, 'source.conf')],
+        stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    _, error_output = process.communicate()
+
+    self.assertEqual(process.returncode, 0)
+    self.assertEqual(error_output, b'')
+
+    self.assertEqual(sorted(os.listdir(output_directory)), [
+        'Building.md', 'C development.md', 'Development.md', 'Home.md',
+        'Python development.md', 'Testing.md', 'Troubleshooting.md'])
+
+    with open(os.path.join(output_directory, 'Home.md'), 'rb') as file_object:
+      output_data = file_object.read()
+
+    self.assertIn(b'https://github.com/libyal/libsyn/wiki/Building', output_data)
+
+
+if __name__ == '__main__':
+  unittest.main()